@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: Clash YAML subscription parsing throughput."""
+
+import argparse
+
+import yaml
+from harness import print_results, run_case
+
+from sboxmgr.subscription.models import ParsedServer
+from sboxmgr.subscription.parsers.clash_parser import ClashParser
+
+
+def make_payload(proxies: int, rules: int) -> bytes:
+    """Build a Clash config shaped like large provider feeds."""
+    lines = ["port: 7890", "mode: rule", "dns:", "  enable: true", "proxies:"]
+    for i in range(proxies):
+        if i % 2:
+            lines.append(
+                f"  - {{name: '🇩🇪 DE {i}', type: ss, server: de{i}.example.com, "
+                f"port: 8388, cipher: aes-256-gcm, password: pass{i}, udp: true}}"
+            )
+        else:
+            lines.extend(
+                [
+                    f"  - name: 🇳🇱 NL {i}",
+                    "    type: vless",
+                    f"    server: nl{i}.example.com",
+                    "    port: 443",
+                    "    uuid: 00000000-0000-0000-0000-000000000000",
+                    "    network: tcp",
+                    "    tls: true",
+                    "    servername: example.com",
+                    "    reality-opts:",
+                    "      public-key: key",
+                    "      short-id: abcd",
+                ]
+            )
+    lines.append("proxy-groups:")
+    lines.append("  - name: Proxy")
+    lines.append("    type: select")
+    lines.append("    proxies:")
+    lines.extend(f"      - node {i}" for i in range(proxies))
+    lines.append("rules:")
+    lines.extend(f"  - DOMAIN-SUFFIX,site{i}.example,Proxy" for i in range(rules))
+    lines.append("  - MATCH,DIRECT")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def parse_reference(raw: bytes) -> list:
+    """Reference path: full safe_load plus validated model construction."""
+    data = yaml.safe_load(raw.decode("utf-8"))
+    return [
+        ParsedServer(
+            type=p.get("type", "unknown"),
+            address=p.get("server", ""),
+            port=int(p.get("port", 0)),
+            security=p.get("cipher", None),
+            meta=p,
+        )
+        for p in data["proxies"]
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--proxies", type=int, default=5_000)
+    parser.add_argument("--rules", type=int, default=50_000)
+    args = parser.parse_args()
+
+    raw = make_payload(args.proxies, args.rules)
+    clash = ClashParser()
+    results = [
+        run_case("yaml.safe_load (full)", lambda: parse_reference(raw), args.proxies),
+        run_case("ClashParser.parse", lambda: clash.parse(raw), args.proxies),
+    ]
+    print_results(
+        f"Clash parsing, {args.proxies} proxies, {len(raw) // 1024} KiB",
+        results,
+        "proxies",
+    )
+
+
+if __name__ == "__main__":
+    main()
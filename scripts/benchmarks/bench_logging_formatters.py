@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: log records formatted per second for each formatter."""
+
+import argparse
+import logging
+
+from harness import print_results, run_case
+
+from sboxmgr.logging.formatters import (
+    CompactFormatter,
+    HumanFormatter,
+    JSONFormatter,
+    orjson,
+)
+
+
+def make_records(count: int) -> list:
+    """Build debug records shaped like per-server pipeline logs."""
+    records = []
+    for i in range(count):
+        record = logging.LogRecord(
+            name="sboxmgr.subscription.middleware.logging",
+            level=logging.DEBUG,
+            pathname=__file__,
+            lineno=i,
+            msg="Server %d: %s:%d",
+            args=(i, f"node{i}.example.com", 443),
+            exc_info=None,
+        )
+        record.trace_id = "bench123"
+        record.server_type = "vless"
+        records.append(record)
+    return records
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    formatters = [
+        ("HumanFormatter", HumanFormatter(show_trace_id=True)),
+        ("CompactFormatter", CompactFormatter()),
+        ("JSONFormatter (json)", JSONFormatter(use_orjson=False)),
+    ]
+    if orjson is not None:
+        formatters.append(("JSONFormatter (orjson)", JSONFormatter(use_orjson=True)))
+
+    results = []
+    for name, formatter in formatters:
+        fmt = formatter.format
+        results.append(
+            run_case(name, lambda fmt=fmt: [fmt(r) for r in records], len(records))
+        )
+
+    print_results("Formatter throughput", results, unit="records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-server evaluate_all() vs. PolicyEngine.evaluate_batch()."""
+
+import argparse
+import logging
+
+from harness import print_results, run_case
+
+from sboxmgr.policies import PolicyContext, PolicyEngine
+from sboxmgr.policies.geo_policy import ASNPolicy, CountryPolicy
+from sboxmgr.policies.security_policy import (
+    AuthenticationPolicy,
+    EncryptionPolicy,
+    ProtocolPolicy,
+)
+from sboxmgr.subscription.models import ParsedServer
+
+PROTOCOLS = ["vless", "trojan", "shadowsocks", "vmess", "hysteria2"]
+COUNTRIES = ["DE", "NL", "US", "GB", "FR", "JP"]
+
+
+def make_servers(count: int) -> list:
+    """Build servers with geo and security metadata."""
+    return [
+        ParsedServer(
+            type=PROTOCOLS[i % len(PROTOCOLS)],
+            address=f"node{i}.example.com",
+            port=443,
+            security="tls",
+            meta={"country": COUNTRIES[i % len(COUNTRIES)], "uuid": f"uuid-{i:08d}"},
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servers", type=int, default=20_000)
+    args = parser.parse_args()
+
+    logging.getLogger("sboxmgr.policies").setLevel(logging.WARNING)
+
+    engine = PolicyEngine()
+    for policy in (
+        ProtocolPolicy(),
+        EncryptionPolicy(),
+        AuthenticationPolicy(),
+        CountryPolicy(allowed_countries=["DE", "NL", "US"]),
+        ASNPolicy(blocked_asns=[12345]),
+    ):
+        engine.register(policy)
+
+    servers = make_servers(args.servers)
+    results = [
+        run_case(
+            "evaluate_all per server",
+            lambda: [engine.evaluate_all(PolicyContext(server=s)) for s in servers],
+            len(servers),
+        ),
+        run_case(
+            "evaluate_batch", lambda: engine.evaluate_batch(servers), len(servers)
+        ),
+    ]
+    print_results("Policy evaluation throughput", results, unit="servers")
+    for name, seconds in engine.last_batch_timings.items():
+        print(f"  {name:<24} {seconds * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
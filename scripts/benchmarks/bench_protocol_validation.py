@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-server vs. batched protocol-specific validation."""
+
+import argparse
+
+from harness import print_results, run_case
+
+from sboxmgr.subscription.models import ParsedServer, PipelineContext
+from sboxmgr.subscription.validators.protocol_models import validate_protocol_config
+from sboxmgr.subscription.validators.protocol_validator import (
+    ProtocolSpecificValidator,
+)
+
+
+def make_servers(count: int) -> list:
+    """Build a mix of valid Shadowsocks and invalid VMess/Trojan servers."""
+    servers = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            servers.append(
+                ParsedServer(
+                    type="ss",
+                    address=f"node{i}.example.com",
+                    port=8388,
+                    security="aes-256-gcm",
+                    meta={"password": f"secret-{i}"},
+                )
+            )
+        elif kind == 1:
+            servers.append(
+                ParsedServer(
+                    type="vmess",
+                    address=f"node{i}.example.com",
+                    port=443,
+                    meta={"uuid": f"uuid-{i:08d}"},
+                )
+            )
+        else:
+            servers.append(
+                ParsedServer(
+                    type="trojan",
+                    address=f"node{i}.example.com",
+                    port=443,
+                    meta={"password": f"secret-{i}"},
+                )
+            )
+    return servers
+
+
+def validate_per_server(validator, servers: list) -> list:
+    """Reference loop: one model validation and exception per server."""
+    errors = []
+    for idx, server in enumerate(servers):
+        try:
+            validate_protocol_config(
+                validator._parsed_server_to_dict(server), server.type
+            )
+        except Exception as e:
+            errors.append(f"Server[{idx}] ({server.type}): {e}")
+    return errors
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servers", type=int, default=20_000)
+    args = parser.parse_args()
+
+    validator = ProtocolSpecificValidator()
+    context = PipelineContext(mode="strict")
+    servers = make_servers(args.servers)
+    results = [
+        run_case(
+            "per-server validate_protocol_config",
+            lambda: validate_per_server(validator, servers),
+            len(servers),
+        ),
+        run_case(
+            "ProtocolSpecificValidator (batched)",
+            lambda: validator.validate(servers, context),
+            len(servers),
+        ),
+    ]
+    print_results(f"Protocol validation, {len(servers)} servers", results, "servers")
+
+
+if __name__ == "__main__":
+    main()
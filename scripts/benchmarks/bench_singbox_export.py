@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: sing-box outbound conversion and v2 export throughput."""
+
+import argparse
+import logging
+
+from harness import print_results, run_case
+
+from sboxmgr.subscription.exporters.singbox_exporter import (
+    export_outbounds,
+    process_single_server,
+)
+from sboxmgr.subscription.exporters.singbox_exporter_v2 import (
+    SingboxExporterV2,
+    convert_parsed_server_to_outbound,
+    convert_parsed_servers_to_outbounds,
+)
+from sboxmgr.subscription.models import ParsedServer
+
+PROTOCOLS = ["vless", "vmess", "trojan", "ss", "hysteria2", "tuic", "wireguard"]
+
+
+def make_servers(count: int) -> list:
+    """Build mixed-protocol servers with the fields each converter needs."""
+    return [
+        ParsedServer(
+            type=PROTOCOLS[i % len(PROTOCOLS)],
+            address=f"node{i}.example.com",
+            port=443,
+            security="aes-256-gcm" if PROTOCOLS[i % len(PROTOCOLS)] == "ss" else "tls",
+            password="secretpass",  # pragma: allowlist secret
+            uuid="00000000-0000-0000-0000-000000000000",
+            private_key="key",
+            peer_public_key="peer",
+            local_address=["10.0.0.2/32"],
+            meta={"uuid": "00000000-0000-0000-0000-000000000000", "name": f"n{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servers", type=int, default=100_000)
+    parser.add_argument("--v2-servers", type=int, default=20_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    servers = make_servers(args.servers)
+    v2_servers = servers[: args.v2_servers]
+    results = [
+        run_case(
+            "legacy process_single_server",
+            lambda: [process_single_server(s) for s in servers],
+            len(servers),
+        ),
+        run_case(
+            "legacy export_outbounds",
+            lambda: export_outbounds(servers),
+            len(servers),
+        ),
+        run_case(
+            "v2 per-server convert",
+            lambda: [convert_parsed_server_to_outbound(s) for s in v2_servers],
+            len(v2_servers),
+        ),
+        run_case(
+            "v2 batch convert",
+            lambda: convert_parsed_servers_to_outbounds(v2_servers),
+            len(v2_servers),
+        ),
+        run_case(
+            "v2 full export",
+            lambda: SingboxExporterV2().export(v2_servers),
+            len(v2_servers),
+        ),
+    ]
+    print_results("sing-box outbound conversion", results, unit="servers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: sing-box JSON/JSONC subscription parsing throughput."""
+
+import argparse
+import json
+
+from harness import print_results, run_case
+
+from sboxmgr.subscription.parsers.jsonc import strip_jsonc
+from sboxmgr.subscription.parsers.singbox_parser import SingBoxParser
+
+
+def make_config(count: int) -> dict:
+    """Build a sing-box config with proxy outbounds and a route section."""
+    outbounds = [
+        {
+            "type": "vless",
+            "tag": f"node-{i}",
+            "server": f"node{i}.example.com",
+            "server_port": 443,
+            "uuid": "00000000-0000-0000-0000-000000000000",
+            "tls": {"enabled": True, "server_name": "example.com"},
+            "transport": {"type": "ws", "path": "/ws?ed=2048#x"},
+        }
+        for i in range(count)
+    ]
+    outbounds.append({"type": "direct", "tag": "direct"})
+    rules = [
+        {"domain_suffix": [f"site{i}.example"], "outbound": "direct"}
+        for i in range(1000)
+    ]
+    return {"outbounds": outbounds, "route": {"rules": rules}}
+
+
+def to_jsonc(config: dict) -> str:
+    """Serialize with comments and trailing commas, as some providers do."""
+    text = json.dumps(config, indent=2)
+    text = text.replace('"server_port": 443,', '"server_port": 443, // TLS port')
+    return "// provider header\n" + text.replace("\n    }", ",\n    }")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--outbounds", type=int, default=50_000)
+    args = parser.parse_args()
+
+    config = make_config(args.outbounds)
+    plain = json.dumps(config, indent=2).encode("utf-8")
+    jsonc = to_jsonc(config)
+    singbox = SingBoxParser()
+    count = args.outbounds
+
+    def stream():
+        chunks = (plain[i : i + 65536] for i in range(0, len(plain), 65536))
+        return list(singbox.parse_stream(chunks))
+
+    results = [
+        run_case("strip_jsonc (JSONC)", lambda: strip_jsonc(jsonc), count),
+        run_case("SingBoxParser.parse (JSON)", lambda: singbox.parse(plain), count),
+        run_case("SingBoxParser.parse_stream (JSON)", stream, count),
+        run_case(
+            "SingBoxParser.parse (JSONC)",
+            lambda: singbox.parse(jsonc.encode("utf-8")),
+            count,
+        ),
+    ]
+    print_results(
+        f"sing-box parsing, {count} outbounds, {len(plain) // 1024} KiB",
+        results,
+        "outbounds",
+    )
+
+
+if __name__ == "__main__":
+    main()
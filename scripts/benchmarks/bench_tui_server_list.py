@@ -0,0 +1,85 @@
+"""Micro-benchmark: server list screen driven headlessly with Textual's pilot."""
+
+import argparse
+import asyncio
+from types import SimpleNamespace
+
+from harness import print_results, run_case
+from textual.app import App
+from textual.widgets import Button
+
+from sboxmgr.subscription.models import ParsedServer
+from sboxmgr.tui.screens.server_list import ServerListScreen
+
+
+def make_servers(count: int) -> list:
+    """Build servers with the metadata shown by the list."""
+    return [
+        ParsedServer(
+            type="vless",
+            address=f"node{i}.example.com",
+            port=443,
+            meta={"name": f"node-{i}", "country": ("DE", "NL", "US")[i % 3]},
+        )
+        for i in range(count)
+    ]
+
+
+class BenchApp(App):
+    """Headless app exposing the state the screen reads."""
+
+    def __init__(self, servers: list):
+        """Initialize with a fixed server list."""
+        super().__init__()
+        self.state = SimpleNamespace(
+            servers=servers, excluded_servers=[], set_exclusions=lambda ids: None
+        )
+
+
+async def session(servers: list, keys: tuple = (), presses: tuple = ()) -> None:
+    """Mount the screen, then press keys and buttons."""
+    app = BenchApp(servers)
+    async with app.run_test(size=(120, 40)) as pilot:
+        await app.push_screen(ServerListScreen())
+        await pilot.pause()
+        if keys:
+            await pilot.press(*keys)
+        for selector in presses:
+            app.screen.query_one(selector, Button).press()
+            await pilot.pause()
+        await pilot.pause()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servers", type=int, default=10_000)
+    args = parser.parse_args()
+
+    servers = make_servers(args.servers)
+    keys = ("down",) * 20 + ("space",)
+
+    def run(**kwargs):
+        return lambda: asyncio.run(session(servers, **kwargs))
+
+    def search():
+        # Focus the filter input, then type "node 99"
+        keys = ("shift+tab", *"node", "space", "9", "9")
+        return asyncio.run(session(servers, keys=keys))
+
+    results = [
+        run_case("mount", run(), args.servers, repeat=1),
+        run_case("mount + 20 moves + toggle", run(keys=keys), args.servers, repeat=1),
+        run_case(
+            "mount + select none + select all",
+            run(presses=("#select_none", "#select_all")),
+            args.servers,
+            repeat=1,
+        ),
+        run_case("mount + type filter", search, args.servers, repeat=1),
+    ]
+    print_results(f"Server list screen, {args.servers} servers", results, "servers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Minimal micro-benchmark harness shared by the scripts in this directory.
+
+Each benchmark script builds its inputs, calls ``run_case`` for every
+variant, and prints the collected results with ``print_results``.
+Run scripts directly, e.g. ``python scripts/benchmarks/bench_logging_formatters.py``.
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+# Allow running from a source checkout without installation
+_SRC = Path(__file__).resolve().parents[2] / "src"
+if _SRC.is_dir() and str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+
+@dataclass
+class BenchResult:
+    """Timing of one benchmark case."""
+
+    name: str
+    items: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Items processed per second."""
+        return self.items / self.seconds if self.seconds else float("inf")
+
+
+def run_case(
+    name: str, func: Callable[[], object], items: int, repeat: int = 3
+) -> BenchResult:
+    """Time ``func`` and keep the best of ``repeat`` runs.
+
+    Args:
+        name: Case name shown in the report
+        func: Callable processing ``items`` items per call
+        items: Number of items processed by one call
+        repeat: Number of timed runs
+
+    Returns:
+        BenchResult: Best (fastest) run
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return BenchResult(name, items, best)
+
+
+def print_results(title: str, results: List[BenchResult], unit: str = "items") -> None:
+    """Print a results table relative to the first case.
+
+    Args:
+        title: Report title
+        results: Results to print, first one is the baseline
+        unit: Name of the processed items
+
+    """
+    print(f"\n{title}")
+    print("-" * len(title))
+    baseline = results[0].rate if results else 0
+    for result in results:
+        speedup = result.rate / baseline if baseline else 0
+        print(
+            f"{result.name:<40} {result.rate:>14,.0f} {unit}/s"
+            f"  {result.seconds * 1000:>9.1f} ms  x{speedup:.2f}"
+        )
@@ -14,6 +14,7 @@ from .protocol import (
     InstallRequest,
     ValidationRequest,
 )
+from .validation_cache import ValidationCache
 
 __all__ = [
     "AgentBridge",
@@ -25,4 +26,5 @@ __all__ = [
     "InstallRequest",
     "ClientType",
     "AgentCommand",
+    "ValidationCache",
 ]
@@ -11,7 +11,6 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..events import EventPriority, EventType, emit_event
-from .event_sender import ping_agent, send_event
 from .protocol import (
     CheckRequest,
     CheckResponse,
@@ -21,6 +20,7 @@ from .protocol import (
     ValidationRequest,
     ValidationResponse,
 )
+from .validation_cache import ValidationCache, agent_identity, config_digest
 
 
 def _get_logger():
@@ -47,6 +47,44 @@ def _get_trace_id():
     return get_trace_id()
 
 
+def _ping_agent() -> bool:
+    """Ping the agent over its socket.
+
+    The IPC client is imported lazily; without it the socket is treated as
+    unreachable and callers fall back to the agent binary.
+
+    Returns:
+        True if the agent answered on its socket.
+
+    """
+    try:
+        from .event_sender import ping_agent
+    except ImportError as e:
+        _get_logger().debug(f"Agent socket client unavailable: {e}")
+        return False
+    return ping_agent()
+
+
+def _send_event(event_type: str, event_data: Dict[str, Any], source: str) -> bool:
+    """Send an event to the agent over its socket, if the IPC client is available.
+
+    Args:
+        event_type: Type of event
+        event_data: Event data
+        source: Event source
+
+    Returns:
+        True if the event was sent.
+
+    """
+    try:
+        from .event_sender import send_event
+    except ImportError as e:
+        _get_logger().debug(f"Agent socket client unavailable: {e}")
+        return False
+    return send_event(event_type, event_data, source=source)
+
+
 class AgentError(Exception):
     """Base exception for agent communication errors."""
 
@@ -69,6 +107,8 @@ class AgentBridge:
     Args:
         agent_path: Path to sboxagent executable (auto-detected if None)
         timeout: Timeout for agent operations in seconds
+        validation_cache: Optional cache of successful validations; unchanged
+            configurations are then not sent to the agent again
 
     Example:
         >>> bridge = AgentBridge()
@@ -78,16 +118,23 @@ class AgentBridge:
 
     """
 
-    def __init__(self, agent_path: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        agent_path: Optional[str] = None,
+        timeout: int = 30,
+        validation_cache: Optional[ValidationCache] = None,
+    ):
         """Initialize the agent bridge.
 
         Args:
             agent_path: Path to sboxagent executable
             timeout: Timeout for operations in seconds
+            validation_cache: Optional cache of successful validations
 
         """
         self.agent_path = agent_path or self._find_agent()
         self.timeout = timeout
+        self.validation_cache = validation_cache
         self._available: Optional[bool] = None  # Cache availability check
 
     def _find_agent(self) -> Optional[str]:
@@ -113,7 +160,7 @@ class AgentBridge:
 
         if not self.agent_path:
             # Try socket connection as fallback
-            if ping_agent():
+            if _ping_agent():
                 self._available = True
                 return True
             self._available = False
@@ -121,7 +168,7 @@ class AgentBridge:
 
         try:
             # First try socket connection (faster)
-            if ping_agent():
+            if _ping_agent():
                 self._available = True
                 return True
 
@@ -140,13 +187,18 @@ class AgentBridge:
         config_path: Path,
         client_type: Optional[ClientType] = None,
         strict: bool = True,
+        use_cache: bool = True,
     ) -> ValidationResponse:
         """Validate configuration file using sboxagent.
 
+        With a ``validation_cache``, a configuration whose content already
+        passed validation by the same agent binary is not sent to the agent.
+
         Args:
             config_path: Path to configuration file
             client_type: Optional client type hint
             strict: Whether to perform strict validation
+            use_cache: Whether to consult and update the validation cache
 
         Returns:
             ValidationResponse with validation results
@@ -162,6 +214,16 @@ class AgentBridge:
             ...     print(f"Errors: {response.errors}")
 
         """
+        cache_key = (
+            self._validation_cache_key(config_path, client_type, strict)
+            if use_cache
+            else None
+        )
+        if cache_key is not None:
+            cached = self.validation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         if not self.is_available():
             raise AgentNotAvailableError("sboxagent is not available")
 
@@ -178,7 +240,7 @@ class AgentBridge:
         )
 
         # Send event to agent via socket
-        send_event(
+        _send_event(
             "validation_started",
             {
                 "config_path": str(config_path),
@@ -217,7 +279,7 @@ class AgentBridge:
             )
 
             # Send completion event to agent via socket
-            send_event(
+            _send_event(
                 "validation_completed",
                 {
                     "success": response.success,
@@ -232,6 +294,9 @@ class AgentBridge:
                 source="sboxmgr.bridge",
             )
 
+            if cache_key is not None:
+                self.validation_cache.put(cache_key, response)
+
             return response
 
         except Exception as e:
@@ -252,6 +317,36 @@ class AgentBridge:
             )
             raise AgentError(f"Validation failed: {e}") from e
 
+    def _validation_cache_key(
+        self,
+        config_path: Path,
+        client_type: Optional[ClientType],
+        strict: bool,
+    ) -> Optional[str]:
+        """Build the validation cache key of a configuration file.
+
+        Args:
+            config_path: Path to configuration file
+            client_type: Client type hint
+            strict: Whether validation is strict
+
+        Returns:
+            Cache key, or None if caching is disabled or not possible
+
+        """
+        if self.validation_cache is None or not self.agent_path:
+            return None
+        try:
+            return ValidationCache.key(
+                config_digest(config_path),
+                client_type,
+                strict,
+                agent_identity(self.agent_path),
+            )
+        except OSError:
+            # Unreadable config or agent: validate without the cache
+            return None
+
     def install(
         self,
         client_type: ClientType,
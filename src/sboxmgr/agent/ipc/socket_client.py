@@ -39,6 +39,21 @@ class SocketClient:
         self.sock: Optional[socket.socket] = None
         self.protocol = FramedJSONProtocol()
 
+    @classmethod
+    def from_socket(cls, sock: socket.socket) -> "SocketClient":
+        """Wrap an already connected socket, e.g. one accepted by a server.
+
+        Args:
+            sock: Connected Unix socket.
+
+        Returns:
+            SocketClient using the socket.
+
+        """
+        client = cls(sock.getsockname() or "", timeout=sock.gettimeout() or 0)
+        client.sock = sock
+        return client
+
     def connect(self) -> None:
         """Connect to the Unix socket."""
         self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
@@ -0,0 +1,227 @@
+"""Persistent cache of successful agent validations.
+
+Validating a configuration through sboxagent runs the external client and
+can take seconds, while exports often rewrite an identical configuration.
+``ValidationCache`` remembers successful ``ValidationResponse`` objects keyed
+by a hash of the configuration content, the client type, the validation mode
+and the identity of the agent binary, so an unchanged configuration is not
+validated again. Failures are never cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ..utils.env import get_cache_dir
+from ..utils.file import atomic_write_json
+from .protocol import ClientType, ValidationResponse
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+_READ_CHUNK_BYTES = 1024 * 1024
+
+# In-memory entry: (response, last seen unix time)
+_Entry = Tuple[ValidationResponse, int]
+
+
+def config_digest(config_path: Union[str, Path]) -> str:
+    """Hash the content of a configuration file.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Hex digest of the file content
+
+    Raises:
+        OSError: If the file cannot be read
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(config_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def agent_identity(agent_path: str) -> str:
+    """Identify an agent binary without running it.
+
+    The resolved path, size and modification time change whenever the agent
+    is upgraded, so they stand in for its version.
+
+    Args:
+        agent_path: Path to sboxagent executable
+
+    Returns:
+        Identity string of the binary
+
+    Raises:
+        OSError: If the binary cannot be found
+
+    """
+    real_path = os.path.realpath(agent_path)
+    stat = os.stat(real_path)
+    return f"{real_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ValidationCache:
+    """Successful agent validations persisted as a JSON file.
+
+    Entries not used for ``ttl`` seconds are pruned on save; the TTL also
+    bounds how long a result survives upgrades of the validated client,
+    which the key does not cover.
+
+    Example:
+        >>> bridge = AgentBridge(validation_cache=ValidationCache())
+        >>> bridge.validate(Path("config.json"))  # agent runs
+        >>> bridge.validate(Path("config.json"))  # served from the cache
+
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: int = 7 * 24 * 3600,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Cache file path (default: ``<cache dir>/agent_validations.json``);
+                pass an empty string to keep the cache in memory only
+            ttl: Seconds an unused entry survives before being pruned
+
+        """
+        if path is None:
+            path = get_cache_dir() / "agent_validations.json"
+        self.path: Optional[Path] = Path(path) if path else None
+        self.ttl = ttl
+        self._entries: Dict[str, _Entry] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(
+        content_digest: str,
+        client_type: Optional[ClientType],
+        strict: bool,
+        agent: str,
+    ) -> str:
+        """Build the cache key of a validation.
+
+        Args:
+            content_digest: Digest from ``config_digest``
+            client_type: Client type hint sent to the agent
+            strict: Whether validation is strict
+            agent: Identity from ``agent_identity``
+
+        Returns:
+            Hex digest identifying the validation
+
+        """
+        client = client_type.value if client_type else ""
+        text = f"{content_digest}|{client}|{int(strict)}|{agent}"
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[ValidationResponse]:
+        """Look up a cached validation.
+
+        Args:
+            key: Key from ``key``
+
+        Returns:
+            Cached successful response or None
+
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = int(time.time())
+            if entry[1] < now - self.ttl:
+                del self._entries[key]
+                return None
+            self._entries[key] = (entry[0], now)
+            return entry[0].model_copy(deep=True)
+
+    def put(self, key: str, response: ValidationResponse) -> None:
+        """Store a validation result and persist the cache.
+
+        Unsuccessful responses are not stored.
+
+        Args:
+            key: Key from ``key``
+            response: Response returned by the agent
+
+        """
+        if not response.success:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = (response.model_copy(deep=True), int(time.time()))
+            self.save()
+
+    def clear(self) -> None:
+        """Drop all entries and persist the empty cache."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self.save()
+
+    def save(self) -> None:
+        """Prune expired entries and write the cache file atomically."""
+        with self._lock:
+            self._ensure_loaded()
+            cutoff = int(time.time()) - self.ttl
+            self._entries = {
+                key: entry for key, entry in self._entries.items() if entry[1] >= cutoff
+            }
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_json(self._serialize(), str(self.path))
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Failed to save agent validation cache: {e}")
+
+    def _ensure_loaded(self) -> None:
+        """Load the cache file on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = self._deserialize(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable agent validation cache: {e}")
+            self._entries = {}
+
+    def _serialize(self) -> Dict[str, Any]:
+        """Convert entries into the on-disk format."""
+        return {
+            "version": CACHE_FORMAT_VERSION,
+            "entries": {
+                key: [response.model_dump(mode="json"), seen]
+                for key, (response, seen) in self._entries.items()
+            },
+        }
+
+    @staticmethod
+    def _deserialize(data: Dict[str, Any]) -> Dict[str, _Entry]:
+        """Rebuild entries from the on-disk format."""
+        if data.get("version") != CACHE_FORMAT_VERSION:
+            return {}
+        return {
+            key: (ValidationResponse(**response), seen)
+            for key, (response, seen) in data.get("entries", {}).items()
+        }
@@ -0,0 +1,115 @@
+"""CLI commands for the sboxmgr daemon (`sboxctl daemon`).
+
+While a daemon is running, `sboxctl export` and `sboxctl list-servers` are
+served by it from warm caches; set SBOXMGR_NO_DAEMON=1 to bypass it.
+"""
+
+import signal
+import time
+from typing import Optional
+
+import typer
+
+from sboxmgr.daemon.client import DaemonClient
+from sboxmgr.daemon.protocol import DaemonError, DaemonUnavailableError
+
+app = typer.Typer(name="daemon", help="Run and control the sboxmgr daemon")
+
+
+@app.command()
+def start(
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Control socket path (default: SBOXMGR_DAEMON_SOCKET)"
+    ),
+    refresh_interval: int = typer.Option(
+        1800,
+        "--refresh-interval",
+        min=0,
+        help="Default seconds between background refreshes (0 to disable)",
+    ),
+):
+    """Run the daemon in the foreground until stopped."""
+    from sboxmgr.daemon.server import SboxmgrDaemon
+
+    daemon = SboxmgrDaemon(socket_path, refresh_interval=refresh_interval)
+    try:
+        daemon.start()
+    except (DaemonError, OSError) as e:
+        typer.echo(f"❌ Failed to start daemon: {e}", err=True)
+        raise typer.Exit(1)
+
+    def _stop(signum, frame):
+        daemon.request_stop()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    typer.echo(f"✅ Daemon listening on {daemon.socket_path}")
+    daemon.serve_forever()
+
+
+@app.command()
+def status(
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Control socket path"
+    ),
+):
+    """Show whether the daemon is running and which sources it keeps warm."""
+    try:
+        info = DaemonClient(socket_path, timeout=5).ping()
+    except DaemonError as e:
+        typer.echo(f"Daemon not running ({e})")
+        raise typer.Exit(1)
+
+    typer.echo(f"Daemon running (pid {info['pid']}, up {int(info['uptime'])}s)")
+    typer.echo(f"Refresh interval: {info['refresh_interval']}s")
+    for source in info["sources"]:
+        refreshed = source["refreshed_at"]
+        age = f"{int(time.time() - refreshed)}s ago" if refreshed else "never"
+        line = f"  {source['url']} ({source['source_type']}), refreshed {age}"
+        next_refresh = source.get("next_refresh_at")
+        if next_refresh:
+            line += f", next in {max(0, int(next_refresh - time.time()))}s"
+        if source.get("failures"):
+            line += f" ({source['failures']} failed attempts)"
+        typer.echo(line)
+
+
+@app.command()
+def refresh(
+    url: Optional[str] = typer.Option(
+        None, "-u", "--url", help="Only refresh this subscription"
+    ),
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Control socket path"
+    ),
+):
+    """Refresh subscriptions kept by the daemon now."""
+    try:
+        result = DaemonClient(socket_path).refresh(url)
+    except DaemonError as e:
+        typer.echo(f"❌ Refresh failed: {e}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"✅ Refreshed {len(result['refreshed'])} subscriptions")
+    for failed_url, error in result["failed"].items():
+        typer.echo(f"  ⚠️  {failed_url}: {error}", err=True)
+    if result["failed"]:
+        raise typer.Exit(1)
+
+
+@app.command()
+def stop(
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Control socket path"
+    ),
+):
+    """Stop a running daemon."""
+    try:
+        DaemonClient(socket_path, timeout=5).shutdown()
+    except DaemonUnavailableError:
+        typer.echo("Daemon not running")
+        return
+    except DaemonError as e:
+        typer.echo(f"❌ Failed to stop daemon: {e}", err=True)
+        raise typer.Exit(1)
+    typer.echo("✅ Daemon stopping")
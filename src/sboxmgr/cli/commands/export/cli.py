@@ -44,7 +44,7 @@ def export(
         help="Output file path (ignored in dry-run and agent-check modes)",
     ),
     format: str = typer.Option(
-        "json", "--format", help="Output format: json, toml, auto"
+        "json", "--format", help="Output format: json, toml, yaml, auto"
     ),
     export_format: str = typer.Option(
         "singbox", "--export-format", help="Export format: singbox, clash"
@@ -5,6 +5,8 @@ from typing import List, Optional
 
 import typer
 
+from sboxmgr.daemon.client import connect_to_daemon
+from sboxmgr.daemon.protocol import DaemonError
 from sboxmgr.export.export_manager import ExportManager
 from sboxmgr.i18n.t import t
 from sboxmgr.subscription.manager import SubscriptionManager
@@ -55,6 +57,18 @@ def generate_config_from_subscription(
     # source_type должен определяться по содержимому, а не по формату вывода
     source_type = "file" if url.startswith("file://") else "url"
 
+    # Profiles are not sent over the socket, so only plain exports use the daemon
+    if profile is None and client_profile is None:
+        config = _export_via_daemon(
+            url,
+            source_type,
+            user_agent if not no_user_agent else None,
+            export_format,
+            debug,
+        )
+        if config is not None:
+            return config
+
     source = SubscriptionSource(
         url=url,
         source_type=source_type,
@@ -89,6 +103,51 @@ def generate_config_from_subscription(
         raise typer.Exit(1)
 
 
+def _export_via_daemon(
+    url: str,
+    source_type: str,
+    user_agent: Optional[str],
+    export_format: str,
+    debug: int,
+) -> Optional[dict]:
+    """Export through a running sboxmgr daemon.
+
+    Args:
+        url: Subscription URL
+        source_type: Subscription source type
+        user_agent: User-Agent header, None for the default
+        export_format: Export format
+        debug: Debug level
+
+    Returns:
+        Generated configuration, or None to export in-process (no daemon,
+        or the daemon could not handle the request)
+
+    Raises:
+        typer.Exit: If the subscription pipeline failed in the daemon
+    """
+    client = connect_to_daemon()
+    if client is None:
+        return None
+    try:
+        result = client.export(
+            url,
+            source_type=source_type,
+            user_agent=user_agent,
+            export_format=export_format,
+            debug=debug,
+        )
+    except DaemonError:
+        return None
+
+    if not result["success"]:
+        typer.echo(f"❌ {t('cli.error.subscription_processing_failed')}", err=True)
+        for error in result["errors"]:
+            typer.echo(f"  - {error}", err=True)
+        raise typer.Exit(1)
+    return result["config"]
+
+
 def generate_profile_from_cli(
     postprocessors: Optional[List[str]] = None,
     middleware: Optional[List[str]] = None,
@@ -45,7 +45,7 @@ VALID_TUN_STACKS = ["system", "gvisor", "mixed"]
 VALID_DNS_MODES = ["system", "tunnel", "off"]
 
 # Output format types
-VALID_OUTPUT_FORMATS = ["json", "toml", "auto"]
+VALID_OUTPUT_FORMATS = ["json", "toml", "yaml", "auto"]
 
 # Export format types
 VALID_EXPORT_FORMATS = ["singbox", "clash"]
@@ -17,15 +17,17 @@ def determine_output_format(output_file: str, format_flag: str) -> str:
 
     Args:
         output_file: Output file path
-        format_flag: Format flag value (json, toml, auto)
+        format_flag: Format flag value (json, toml, yaml, auto)
 
     Returns:
-        Determined format (json or toml)
+        Determined format (json, toml or yaml)
     """
     if format_flag == "auto":
         ext = Path(output_file).suffix.lower()
         if ext == ".toml":
             return "toml"
+        elif ext in (".yaml", ".yml"):
+            return "yaml"
         else:
             return "json"
     return format_flag
@@ -60,7 +62,7 @@ def write_config_to_file(
     Args:
         config_data: Configuration data to write
         output_file: Output file path
-        output_format: Output format (json or toml)
+        output_format: Output format (json, toml or yaml)
 
     Raises:
         typer.Exit: If writing fails
@@ -75,6 +77,12 @@ def write_config_to_file(
             import toml
 
             config_content = toml.dumps(config_data)
+        elif output_format == "yaml":
+            from sboxmgr.subscription.exporters.clashexporter import (
+                dump_clash_yaml,
+            )
+
+            config_content = dump_clash_yaml(config_data)
         else:
             config_content = json.dumps(config_data, indent=2, ensure_ascii=False)
 
@@ -8,7 +8,12 @@ from typing import Optional
 
 import typer
 
-from sboxmgr.agent import AgentBridge, AgentNotAvailableError, ClientType
+from sboxmgr.agent import (
+    AgentBridge,
+    AgentNotAvailableError,
+    ClientType,
+    ValidationCache,
+)
 from sboxmgr.config.validation import validate_config_file
 from sboxmgr.i18n.t import t
 from sboxmgr.subscription.models import ClientProfile
@@ -45,12 +50,8 @@ def run_agent_check(config_file: str, agent_check: bool) -> bool:
         return True
 
     try:
-        bridge = AgentBridge()
-        if not bridge.is_available():
-            typer.echo(
-                "ℹ️  sboxagent not available - skipping external validation", err=True
-            )
-            return True
+        # Unchanged configs that already passed are not validated again
+        bridge = AgentBridge(validation_cache=ValidationCache())
 
         # Validate config with agent
         response = bridge.validate(Path(config_file), client_type=ClientType.SING_BOX)
@@ -15,7 +15,7 @@ from .constants import (
 )
 
 # Valid format values
-VALID_OUTPUT_FORMATS = {"json", "toml", "auto"}
+VALID_OUTPUT_FORMATS = {"json", "toml", "yaml", "auto"}
 VALID_EXPORT_FORMATS = {"singbox", "clash", "v2ray"}
 
 
@@ -5,10 +5,12 @@ and displays available server configurations. This is the only remaining
 command in this module after the CLI reorganization.
 """
 
-from typing import List
+from typing import List, Optional
 
 import typer
 
+from sboxmgr.daemon.client import connect_to_daemon
+from sboxmgr.daemon.protocol import DaemonError
 from sboxmgr.i18n.t import t
 from sboxmgr.server.exclusions import load_exclusions
 from sboxmgr.subscription.manager import SubscriptionManager
@@ -75,6 +77,33 @@ def _format_policy_details(context: PipelineContext, server_tag: str) -> str:
     return " | ".join(details) if details else "✅ ALLOWED"
 
 
+def _list_via_daemon(
+    url: str, source_type: str, user_agent: Optional[str], debug: int
+) -> Optional[dict]:
+    """Build the listed configuration through a running sboxmgr daemon.
+
+    Args:
+        url: Subscription URL
+        source_type: Subscription source type
+        user_agent: User-Agent header ("" to send none, None for the default)
+        debug: Debug level
+
+    Returns:
+        Configuration dictionary, or None to run the pipeline in-process
+    """
+    client = connect_to_daemon()
+    if client is None:
+        return None
+    try:
+        result = client.list_servers(
+            url, source_type=source_type, user_agent=user_agent, debug=debug
+        )
+    except DaemonError:
+        return None
+    # Failed pipelines are repeated in-process for the usual diagnostics
+    return result["config"] if result["success"] else None
+
+
 def list_servers(
     url: str = typer.Option(
         ...,
@@ -142,14 +171,20 @@ def list_servers(
             # Автоопределение - используем универсальный fetcher
             source_type = "url"
 
-        source = SubscriptionSource(url=url, source_type=source_type, user_agent=ua)
-        mgr = SubscriptionManager(source)
-        exclusions = load_exclusions(dry_run=True)
-        context = PipelineContext(mode="default", debug_level=debug)
-        user_routes: List[str] = []
-        config = mgr.export_config(
-            exclusions=exclusions, user_routes=user_routes, context=context
+        # Policy details need the pipeline context, only available in-process
+        config_data = (
+            None if policy_details else _list_via_daemon(url, source_type, ua, debug)
         )
+        if config_data is None:
+            source = SubscriptionSource(url=url, source_type=source_type, user_agent=ua)
+            mgr = SubscriptionManager(source)
+            exclusions = load_exclusions(dry_run=True)
+            context = PipelineContext(mode="default", debug_level=debug)
+            user_routes: List[str] = []
+            config = mgr.export_config(
+                exclusions=exclusions, user_routes=user_routes, context=context
+            )
+            config_data = config.config
 
         # Проверяем политики ДО проверки config.config
         if policy_details:
@@ -205,15 +240,15 @@ def list_servers(
                             typer.echo(f"  ℹ️ INFO by {i['policy']}: {i['reason']}")
 
                 # Если нет валидной конфигурации из-за политик, завершаем с кодом 2
-                if not config.config or not isinstance(config.config, dict):
+                if not config_data or not isinstance(config_data, dict):
                     raise typer.Exit(2)
 
-        if not config.config or not isinstance(config.config, dict):
+        if not config_data or not isinstance(config_data, dict):
             typer.echo("[Error] No valid config generated from subscription.", err=True)
             raise typer.Exit(1)
 
         # Получаем все outbounds и фильтруем служебные
-        all_outbounds = config.config.get("outbounds", [])
+        all_outbounds = config_data.get("outbounds", [])
         servers = [s for s in all_outbounds if not _is_service_outbound(s)]
 
         # Выводим статистику политик если включены детали и есть сервера
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 
 from sboxmgr.cli import plugin_template
 from sboxmgr.cli.commands.config import app as new_config_app
+from sboxmgr.cli.commands.daemon import app as daemon_app
 from sboxmgr.cli.commands.exclusions import exclusions
 from sboxmgr.cli.commands.export import export
 from sboxmgr.cli.commands.policy import app as policy_app
@@ -199,6 +200,9 @@ app.command("export", help="Export configurations in standardized formats")(expo
 # Регистрируем команды политик
 app.add_typer(policy_app)
 
+# Регистрируем команды демона
+app.add_typer(daemon_app, name="daemon")
+
 
 @app.command("tui")
 def tui_cmd(
@@ -39,11 +39,15 @@ def validate_temp_config_json(config_json: str) -> None:
     validate_singbox_config_structure(config_data)
 
 
-def validate_singbox_config_structure(config_data: Dict[str, Any]) -> None:
+def validate_singbox_config_structure(
+    config_data: Dict[str, Any], outbounds_validated: bool = False
+) -> None:
     """Validate sing-box configuration structure and semantics.
 
     Args:
         config_data: Configuration dictionary to validate
+        outbounds_validated: Skip per-outbound checks because the outbounds
+            were already validated while being built
 
     Raises:
         ConfigValidationError: If configuration structure is invalid
@@ -67,8 +71,9 @@ def validate_singbox_config_structure(config_data: Dict[str, Any]) -> None:
         raise ConfigValidationError("Configuration must contain at least one outbound")
 
     # Validate each outbound
-    for i, outbound in enumerate(outbounds):
-        validate_outbound_config(outbound, i)
+    if not outbounds_validated:
+        for i, outbound in enumerate(outbounds):
+            validate_outbound_config(outbound, i)
 
     # Validate optional fields if present
     if "inbounds" in config_data:
@@ -2,11 +2,43 @@
 
 Implements CONFIG-02 from ADR-0009: Hybrid auto-detection for service mode.
 Provides reliable detection of systemd, container, and service environments.
+
+Detection only inspects environment variables and well-known paths under
+``/run`` and ``/proc``; no processes are spawned, so it is cheap enough to
+run on every CLI startup.
 """
 
+import importlib.util
 import os
+import shutil
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+# Native journal socket, present whenever journald is running
+JOURNALD_SOCKET = "/run/systemd/journal/socket"
+
+# Common syslog socket locations
+SYSLOG_SOCKETS = ("/dev/log", "/var/run/syslog", "/var/run/log")
+
+
+@dataclass(frozen=True)
+class EnvironmentProbe:
+    """Systemd and journald availability detected for the current process.
+
+    Attributes:
+        systemd: Whether systemd is the running init system
+        journald: Whether journald accepts messages and can be written to
+            (via python-systemd or the systemd-cat tool)
+
+    """
+
+    systemd: bool
+    journald: bool
+
+
+_environment_probe: Optional[EnvironmentProbe] = None
 
 
 def detect_service_mode() -> bool:
@@ -138,24 +170,57 @@ def detect_systemd_environment() -> bool:
         bool: True if systemd environment is detected
 
     """
-    # Check for systemd runtime directory
+    # Check for systemd runtime directory (what sd_booted() checks)
     if os.path.exists("/run/systemd/system"):
         return True
 
     # Check for systemd in process tree
-    if os.getenv("INVOCATION_ID") or os.getenv("SYSTEMD_EXEC_PID"):
+    return bool(os.getenv("INVOCATION_ID") or os.getenv("SYSTEMD_EXEC_PID"))
+
+
+def detect_journald_environment() -> bool:
+    """Detect if journald is running and a journald handler can be created.
+
+    Returns:
+        bool: True if the journal socket exists and either python-systemd or
+            the systemd-cat tool is available
+
+    """
+    if not os.path.exists(JOURNALD_SOCKET):
+        return False
+    if importlib.util.find_spec("systemd") is not None:
         return True
+    return shutil.which("systemd-cat") is not None
 
-    # Check if systemctl is available and working
-    try:
-        import subprocess
 
-        result = subprocess.run(
-            ["systemctl", "--version"], capture_output=True, timeout=2
+def detect_syslog_environment() -> bool:
+    """Detect if a syslog socket is available.
+
+    Returns:
+        bool: True if one of the common syslog sockets exists
+
+    """
+    return any(os.path.exists(path) for path in SYSLOG_SOCKETS)
+
+
+def probe_environment(refresh: bool = False) -> EnvironmentProbe:
+    """Return systemd and journald availability, probing once per process.
+
+    Args:
+        refresh: Probe again instead of returning the memoized result
+
+    Returns:
+        EnvironmentProbe: Detected sink availability
+
+    """
+    global _environment_probe
+    if _environment_probe is None or refresh:
+        systemd = detect_systemd_environment()
+        _environment_probe = EnvironmentProbe(
+            systemd=systemd,
+            journald=systemd and detect_journald_environment(),
         )
-        return result.returncode == 0
-    except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    return _environment_probe
 
 
 def detect_development_environment() -> bool:
@@ -221,6 +286,7 @@ def get_environment_info() -> dict:
         "file_indicators": {
             "/.dockerenv": os.path.exists("/.dockerenv"),
             "/run/systemd/system": os.path.exists("/run/systemd/system"),
+            JOURNALD_SOCKET: os.path.exists(JOURNALD_SOCKET),
             "/proc/1/cgroup": os.path.exists("/proc/1/cgroup"),
         },
     }
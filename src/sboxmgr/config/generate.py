@@ -14,7 +14,7 @@ from logging import error, info
 from typing import List
 
 from ..events import EventPriority, EventType, emit_event
-from .config_validator import validate_temp_config_json
+from .config_validator import validate_singbox_config_structure
 from .validation import ConfigValidationError
 
 
@@ -76,20 +76,20 @@ def generate_config(outbounds, template_file, config_file, backup_file, excluded
                 info("Configuration has not changed. Skipping update.")
                 return False
 
+    try:
+        # Validate sing-box semantics on the built dict, the serialized
+        # output is never parsed back
+        validate_singbox_config_structure(template)
+        info("Configuration validated successfully")
+    except (ValueError, ConfigValidationError) as e:
+        error(f"Configuration is invalid: {e}")
+        raise
+
     with tempfile.NamedTemporaryFile("w", delete=False, suffix=".json") as tmp:
         temp_config_file = tmp.name
         tmp.write(config)
     info(f"Temporary configuration written to {temp_config_file}")
 
-    try:
-        # Comprehensive validation - check JSON syntax and sing-box semantics
-        validate_temp_config_json(config)
-        info("Temporary configuration validated successfully")
-    except (ValueError, ConfigValidationError) as e:
-        error(f"Temporary configuration is invalid: {e}")
-        os.unlink(temp_config_file)
-        raise
-
     if os.path.exists(config_file):
         os.rename(config_file, backup_file)
         info(f"Created backup: {backup_file}")
@@ -53,6 +53,35 @@ class LoggingConfig(BaseSettings):
         default=5, description="Number of backup log files to keep"
     )
 
+    # Asynchronous logging settings
+    async_mode: bool = Field(
+        default=False,
+        description="Route records through a background queue listener",
+    )
+    queue_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum queued records in async mode (overflow is dropped)",
+    )
+    file_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Records written before flushing the file sink in async mode",
+    )
+
+    # High-volume debug controls
+    debug_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of DEBUG records kept (1.0 keeps all)",
+    )
+    debug_rate_limit: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum DEBUG records per logger per second (0 = unlimited)",
+    )
+
     # Advanced settings
     enable_trace_id: bool = Field(
         default=True, description="Enable trace ID generation and propagation"
@@ -1,7 +1,8 @@
 """Core sboxmgr architecture components.
 
-This package provides the central orchestration layer and dependency
-injection infrastructure for sboxmgr operations.
+This package provides the central orchestration layer, dependency
+injection infrastructure and subscription refresh scheduling for sboxmgr
+operations.
 """
 
 from .factory import (
@@ -15,11 +16,15 @@ from .interfaces import (
     SubscriptionManagerInterface,
 )
 from .orchestrator import Orchestrator, OrchestratorConfig, OrchestratorError
+from .scheduler import RefreshError, RefreshOutcome, RefreshScheduler
 
 __all__ = [
     "Orchestrator",
     "OrchestratorConfig",
     "OrchestratorError",
+    "RefreshError",
+    "RefreshOutcome",
+    "RefreshScheduler",
     "ManagerFactory",
     "create_default_exclusion_manager",
     "create_default_export_manager",
@@ -0,0 +1,535 @@
+"""Refresh scheduler for subscription sources.
+
+``RefreshScheduler`` refreshes every registered ``SubscriptionSource`` on its
+own interval. Start times are jittered so sources registered together do not
+hit their providers at the same moment, failures back off exponentially with
+a base delay chosen by error category (``ErrorType``), and ``Retry-After`` /
+``Cache-Control: max-age`` response headers from providers are honored as
+lower bounds for the next refresh. Every completed refresh emits a
+``SUBSCRIPTION_REFRESHED`` event.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from sboxmgr.events import EventPriority, EventType, emit_event
+from sboxmgr.subscription.errors import ErrorType
+from sboxmgr.subscription.models import SubscriptionSource
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 30 * 60
+
+# Fraction of a delay added or removed at random when scheduling
+DEFAULT_JITTER = 0.1
+
+# Upper bound for failure backoff
+DEFAULT_MAX_BACKOFF = 6 * 3600
+
+# Largest doubling applied to a backoff base; far beyond any max_backoff,
+# and keeps base * 2**n from overflowing a float after many failures
+MAX_BACKOFF_EXPONENT = 32
+
+# Upper bound for delays requested by providers through response headers
+MAX_PROVIDER_DELAY = 24 * 3600
+
+# First retry delay after a failure by error category; None means the
+# source's regular interval. Network errors are usually transient, while a
+# provider serving data we cannot parse or validate rarely fixes it quickly.
+DEFAULT_BACKOFF_BASE: Dict[ErrorType, Optional[float]] = {
+    ErrorType.FETCH: 60.0,
+    ErrorType.PARSE: None,
+    ErrorType.VALIDATION: None,
+    ErrorType.PLUGIN: None,
+    ErrorType.INTERNAL: 300.0,
+}
+
+# (url, source_type, user_agent)
+SourceKey = Tuple[str, str, Optional[str]]
+
+# Refreshes a source, returning the provider's response headers (or None)
+RefreshFunc = Callable[[SubscriptionSource], Optional[Mapping[str, str]]]
+
+
+class RefreshError(Exception):
+    """Refresh failure with its error category and provider response headers.
+
+    Args:
+        message: Error description
+        error_type: Error category selecting the backoff policy
+        headers: Response headers of the failed request, if any
+
+    """
+
+    def __init__(
+        self,
+        message: str,
+        error_type: ErrorType = ErrorType.FETCH,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        """Initialize the refresh error.
+
+        Args:
+            message: Error description
+            error_type: Error category selecting the backoff policy
+            headers: Response headers of the failed request, if any
+
+        """
+        super().__init__(message)
+        self.error_type = error_type
+        self.headers = headers
+
+
+@dataclass
+class RefreshOutcome:
+    """Result of one scheduled refresh.
+
+    Attributes:
+        source: Refreshed source
+        success: Whether the refresh succeeded
+        error: Error message of a failed refresh
+        error_type: Error category of a failed refresh
+        failures: Consecutive failures including this one
+        next_refresh_at: Time of the next refresh (epoch seconds)
+
+    """
+
+    source: SubscriptionSource
+    success: bool
+    error: Optional[str] = None
+    error_type: Optional[ErrorType] = None
+    failures: int = 0
+    next_refresh_at: float = 0.0
+
+
+@dataclass
+class _Job:
+    """Scheduling state of one source."""
+
+    source: SubscriptionSource
+    interval: float
+    next_due: float
+    failures: int = 0
+    last_refresh_at: Optional[float] = None
+    last_error: Optional[str] = None
+    running: bool = False
+    # Renewed whenever next_due changes, invalidating older heap entries
+    generation: int = 0
+
+
+def source_key(source: SubscriptionSource) -> SourceKey:
+    """Return the key identifying a source in the scheduler."""
+    return (source.url, source.source_type, source.user_agent)
+
+
+def classify_error(error: BaseException) -> ErrorType:
+    """Map a refresh exception to an error category.
+
+    Args:
+        error: Exception raised by the refresh function
+
+    Returns:
+        ErrorType of the failure
+
+    """
+    if isinstance(error, RefreshError):
+        return error.error_type
+    try:
+        import requests
+
+        if isinstance(error, requests.RequestException):
+            return ErrorType.FETCH
+    except ImportError:
+        pass
+    if isinstance(error, (OSError, TimeoutError)):
+        return ErrorType.FETCH
+    if isinstance(error, ValueError):
+        return ErrorType.VALIDATION
+    return ErrorType.INTERNAL
+
+
+def response_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+    """Return provider response headers carried by a refresh exception."""
+    if isinstance(error, RefreshError):
+        return error.headers
+    response = getattr(error, "response", None)
+    return getattr(response, "headers", None)
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Parse a ``Retry-After`` header into seconds from now.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current time (default: ``time.time()``)
+
+    Returns:
+        Non-negative delay in seconds, or None if missing or malformed
+
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def parse_max_age(value: Optional[str]) -> Optional[float]:
+    """Parse the ``max-age`` directive of a ``Cache-Control`` header.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Freshness lifetime in seconds, or None if absent or malformed
+
+    """
+    if not value:
+        return None
+    for directive in value.split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            argument = argument.strip().strip('"')
+            return float(argument) if argument.isdigit() else None
+    return None
+
+
+def provider_delay(
+    headers: Optional[Mapping[str, str]], now: Optional[float] = None
+) -> Optional[float]:
+    """Return the minimum delay before the next refresh requested by a provider.
+
+    Args:
+        headers: Response headers of the last request
+        now: Current time (default: ``time.time()``)
+
+    Returns:
+        Delay in seconds capped at ``MAX_PROVIDER_DELAY``, or None
+
+    """
+    if not headers:
+        return None
+    lowered = {str(k).lower(): v for k, v in headers.items()}
+    delays = [
+        delay
+        for delay in (
+            parse_retry_after(lowered.get("retry-after"), now),
+            parse_max_age(lowered.get("cache-control")),
+        )
+        if delay is not None
+    ]
+    if not delays:
+        return None
+    return min(max(delays), MAX_PROVIDER_DELAY)
+
+
+class RefreshScheduler:
+    """Refresh subscription sources on per-source schedules.
+
+    Args:
+        refresh: Function refreshing a source; returns the provider's
+            response headers or None, raises on failure
+        default_interval: Interval for sources without ``refresh_interval``
+        jitter: Fraction of every delay randomized in both directions
+        max_backoff: Upper bound for failure backoff delays
+        backoff_base: First retry delay by error category
+        clock: Time source (epoch seconds)
+        rng: Random generator used for jitter
+
+    Example:
+        >>> scheduler = RefreshScheduler(lambda source: fetch(source))
+        >>> scheduler.add(SubscriptionSource(url=url, source_type="url"))
+        >>> scheduler.start()
+
+    """
+
+    def __init__(
+        self,
+        refresh: RefreshFunc,
+        default_interval: float = DEFAULT_REFRESH_INTERVAL,
+        jitter: float = DEFAULT_JITTER,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        backoff_base: Optional[Mapping[ErrorType, Optional[float]]] = None,
+        clock: Callable[[], float] = time.time,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            refresh: Function refreshing a source
+            default_interval: Interval for sources without their own
+            jitter: Fraction of every delay randomized
+            max_backoff: Upper bound for failure backoff delays
+            backoff_base: First retry delay by error category
+            clock: Time source
+            rng: Random generator used for jitter
+
+        """
+        self._refresh = refresh
+        self.default_interval = default_interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.backoff_base = dict(DEFAULT_BACKOFF_BASE)
+        if backoff_base:
+            self.backoff_base.update(backoff_base)
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._jobs: Dict[SourceKey, _Job] = {}
+        # Heap of (next_due, generation, key); stale entries are skipped
+        self._queue: List[Tuple[float, int, SourceKey]] = []
+        self._generations = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def add(
+        self,
+        source: SubscriptionSource,
+        interval: Optional[float] = None,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Schedule a source; sources already scheduled are left unchanged.
+
+        Args:
+            source: Source to refresh
+            interval: Seconds between refreshes (default: the source's
+                ``refresh_interval`` or ``default_interval``)
+            delay: Seconds until the first refresh, jittered (default:
+                random within one interval, spreading out sources added
+                together)
+
+        """
+        interval = interval or source.refresh_interval or self.default_interval
+        key = source_key(source)
+        with self._lock:
+            if key in self._jobs:
+                return
+            if delay is None:
+                delay = self._rng.uniform(0, interval)
+            else:
+                delay = self._jittered(delay)
+            job = _Job(source=source, interval=interval, next_due=0.0)
+            self._jobs[key] = job
+            self._reschedule(key, job, delay)
+
+    def remove(self, source: SubscriptionSource) -> None:
+        """Stop refreshing a source."""
+        with self._lock:
+            self._jobs.pop(source_key(source), None)
+
+    def __contains__(self, source: SubscriptionSource) -> bool:
+        """Return whether a source is scheduled."""
+        with self._lock:
+            return source_key(source) in self._jobs
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Return scheduling state of every source."""
+        with self._lock:
+            return [
+                {
+                    "url": job.source.url,
+                    "source_type": job.source.source_type,
+                    "interval": job.interval,
+                    "next_refresh_at": job.next_due,
+                    "last_refresh_at": job.last_refresh_at,
+                    "failures": job.failures,
+                    "last_error": job.last_error,
+                }
+                for job in self._jobs.values()
+            ]
+
+    def next_due(self) -> Optional[float]:
+        """Return when the earliest scheduled refresh is due, if any."""
+        with self._lock:
+            self._drop_stale()
+            return self._queue[0][0] if self._queue else None
+
+    def run_pending(self) -> List[RefreshOutcome]:
+        """Refresh every source that is due now.
+
+        Returns:
+            Outcomes of the refreshes performed
+
+        """
+        now = self._clock()
+        due: List[SourceKey] = []
+        with self._lock:
+            while True:
+                self._drop_stale()
+                if not self._queue or self._queue[0][0] > now:
+                    break
+                due.append(heapq.heappop(self._queue)[2])
+        return [outcome for outcome in map(self._run_job, due) if outcome is not None]
+
+    def refresh_now(
+        self, predicate: Optional[Callable[[SubscriptionSource], bool]] = None
+    ) -> List[RefreshOutcome]:
+        """Refresh sources immediately, outside of their schedule.
+
+        Args:
+            predicate: Only refresh sources it accepts (default: all)
+
+        Returns:
+            Outcomes of the refreshes performed
+
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, job in self._jobs.items()
+                if predicate is None or predicate(job.source)
+            ]
+        return [outcome for outcome in map(self._run_job, keys) if outcome is not None]
+
+    def start(self) -> None:
+        """Run scheduled refreshes in a background thread."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="sboxmgr-refresh-scheduler", daemon=True
+            )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the background thread after the refresh in progress."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._wakeup.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """Sleep until the next refresh is due and run it, until stopped."""
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                self._drop_stale()
+                timeout = self._queue[0][0] - self._clock() if self._queue else None
+                if timeout is None or timeout > 0:
+                    self._wakeup.wait(timeout)
+                    continue
+            self.run_pending()
+
+    def _run_job(self, key: SourceKey) -> Optional[RefreshOutcome]:
+        """Refresh one source and schedule its next refresh."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.running:
+                return None
+            job.running = True
+        try:
+            headers = self._refresh(job.source)
+        except Exception as e:
+            error_type = classify_error(e)
+            headers = response_headers(e)
+            with self._lock:
+                job.running = False
+                if self._jobs.get(key) is not job:
+                    return None
+                job.failures += 1
+                job.last_error = str(e)
+                delay = self._backoff(job, error_type)
+                outcome = self._complete(key, job, delay, headers)
+            outcome.error = str(e)
+            outcome.error_type = error_type
+            logger.warning(
+                f"Refresh of {job.source.url} failed ({error_type.value}), "
+                f"retrying in {int(outcome.next_refresh_at - self._clock())}s: {e}"
+            )
+        else:
+            with self._lock:
+                job.running = False
+                # Removed by the refresh function, e.g. an evicted source
+                if self._jobs.get(key) is not job:
+                    return None
+                job.failures = 0
+                job.last_error = None
+                job.last_refresh_at = self._clock()
+                outcome = self._complete(key, job, job.interval, headers)
+            outcome.success = True
+        self._emit(outcome)
+        return outcome
+
+    def _complete(
+        self,
+        key: SourceKey,
+        job: _Job,
+        delay: float,
+        headers: Optional[Mapping[str, str]],
+    ) -> RefreshOutcome:
+        """Schedule the next refresh of a finished job (lock held)."""
+        requested = provider_delay(headers, self._clock())
+        if requested is not None:
+            delay = max(delay, requested)
+        self._reschedule(key, job, self._jittered(delay))
+        return RefreshOutcome(
+            source=job.source,
+            success=False,
+            failures=job.failures,
+            next_refresh_at=job.next_due,
+        )
+
+    def _backoff(self, job: _Job, error_type: ErrorType) -> float:
+        """Return the retry delay after the job's consecutive failures."""
+        base = self.backoff_base.get(error_type)
+        if base is None:
+            base = job.interval
+        exponent = min(job.failures - 1, MAX_BACKOFF_EXPONENT)
+        return min(base * 2**exponent, max(self.max_backoff, base))
+
+    def _jittered(self, delay: float) -> float:
+        """Randomize a delay by up to ``jitter`` of its length."""
+        return max(0.0, delay * (1 + self._rng.uniform(-self.jitter, self.jitter)))
+
+    def _reschedule(self, key: SourceKey, job: _Job, delay: float) -> None:
+        """Set the next due time of a job and wake the runner (lock held)."""
+        job.next_due = self._clock() + delay
+        job.generation = next(self._generations)
+        heapq.heappush(self._queue, (job.next_due, job.generation, key))
+        self._wakeup.notify_all()
+
+    def _drop_stale(self) -> None:
+        """Pop heap entries of removed or rescheduled jobs (lock held)."""
+        while self._queue:
+            _, generation, key = self._queue[0]
+            job = self._jobs.get(key)
+            if job is not None and job.generation == generation:
+                return
+            heapq.heappop(self._queue)
+
+    @staticmethod
+    def _emit(outcome: RefreshOutcome) -> None:
+        """Emit the completion event of a refresh."""
+        emit_event(
+            EventType.SUBSCRIPTION_REFRESHED,
+            {
+                "url": outcome.source.url,
+                "source_type": outcome.source.source_type,
+                "success": outcome.success,
+                "error": outcome.error,
+                "error_type": outcome.error_type.value if outcome.error_type else None,
+                "failures": outcome.failures,
+                "next_refresh_at": outcome.next_refresh_at,
+            },
+            source="core.scheduler",
+            priority=EventPriority.NORMAL if outcome.success else EventPriority.HIGH,
+        )
@@ -0,0 +1,21 @@
+"""Daemon mode for sboxmgr.
+
+``SboxmgrDaemon`` keeps subscription pipelines and caches warm in a
+long-lived process and serves export, list and refresh requests over a Unix
+socket using the framed JSON protocol shared with sboxagent. CLI commands
+use a running daemon through ``DaemonClient`` and fall back to in-process
+execution otherwise.
+"""
+
+from .client import DaemonClient, connect_to_daemon
+from .protocol import DaemonCommand, DaemonError, DaemonUnavailableError
+from .server import SboxmgrDaemon
+
+__all__ = [
+    "DaemonClient",
+    "DaemonCommand",
+    "DaemonError",
+    "DaemonUnavailableError",
+    "SboxmgrDaemon",
+    "connect_to_daemon",
+]
@@ -0,0 +1,232 @@
+"""Client for the sboxmgr daemon control socket.
+
+CLI commands call ``connect_to_daemon`` first and fall back to running the
+pipeline in-process when it returns None or a request raises
+``DaemonUnavailableError``. Subscriptions from local files are always
+processed in-process.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..utils.env import get_daemon_socket_path
+from .protocol import (
+    DaemonCommand,
+    DaemonError,
+    DaemonUnavailableError,
+    check_private_dir,
+    command_message,
+    is_local_source,
+    peer_uid,
+)
+
+logger = logging.getLogger(__name__)
+
+# Exports of large subscriptions can take a while on a cold source
+DEFAULT_TIMEOUT = 120.0
+
+
+class DaemonClient:
+    """Send requests to a running sboxmgr daemon.
+
+    Each request uses its own connection, so a client can be shared by
+    threads.
+
+    Args:
+        socket_path: Control socket path (default: ``get_daemon_socket_path()``)
+        timeout: Seconds to wait for a response
+
+    Example:
+        >>> client = DaemonClient()
+        >>> config = client.export("https://example.com/sub")["config"]
+
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Union[str, Path]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Initialize the client.
+
+        Args:
+            socket_path: Control socket path
+            timeout: Seconds to wait for a response
+
+        """
+        self.socket_path = Path(socket_path or get_daemon_socket_path())
+        self.timeout = timeout
+
+    def request(self, command: DaemonCommand, **params: Any) -> Dict[str, Any]:
+        """Send a command and return its result data.
+
+        Args:
+            command: Command to execute
+            **params: Command parameters
+
+        Returns:
+            Result data of the command
+
+        Raises:
+            DaemonUnavailableError: If no daemon answers on the socket
+            DaemonError: If the daemon reports an error
+
+        """
+        try:
+            from ..agent.ipc.socket_client import SocketClient
+
+            client = SocketClient(str(self.socket_path), self.timeout)
+            client.connect()
+            uid = peer_uid(client.sock)
+        except (ImportError, OSError) as e:
+            raise DaemonUnavailableError(f"sboxmgr daemon not reachable: {e}") from e
+        if uid is not None and uid != os.getuid():
+            client.close()
+            raise DaemonUnavailableError(
+                f"Socket {self.socket_path} is served by uid {uid}, not by this user"
+            )
+
+        try:
+            client.send_message(command_message(command.value, params))
+            message = client.recv_message()
+        except (ConnectionError, OSError, RuntimeError) as e:
+            raise DaemonUnavailableError(f"sboxmgr daemon not reachable: {e}") from e
+        finally:
+            client.close()
+
+        response = message.get("response") or {}
+        if message.get("type") != "response":
+            raise DaemonError(f"Unexpected daemon message: {message.get('type')}")
+        if response.get("status") != "success":
+            error = response.get("error") or {}
+            raise DaemonError(
+                error.get("message", "Unknown daemon error"),
+                code=error.get("code", "internal_error"),
+            )
+        return response.get("data") or {}
+
+    def ping(self) -> Dict[str, Any]:
+        """Return daemon status (pid, uptime, known sources)."""
+        return self.request(DaemonCommand.PING)
+
+    def export(
+        self,
+        url: str,
+        source_type: str = "url",
+        user_agent: Optional[str] = None,
+        export_format: str = "singbox",
+        debug: int = 0,
+    ) -> Dict[str, Any]:
+        """Export a subscription through the daemon.
+
+        Args:
+            url: Subscription URL
+            source_type: Subscription source type
+            user_agent: User-Agent override
+            export_format: Export format
+            debug: Debug level
+
+        Returns:
+            Dictionary with ``success``, ``config`` and ``errors``
+
+        Raises:
+            DaemonError: For local file subscriptions, which are not sent to
+                the daemon
+
+        """
+        self._check_remote(url)
+        return self.request(
+            DaemonCommand.EXPORT,
+            url=url,
+            source_type=source_type,
+            user_agent=user_agent,
+            export_format=export_format,
+            debug=debug,
+        )
+
+    def list_servers(
+        self,
+        url: str,
+        source_type: str = "url",
+        user_agent: Optional[str] = None,
+        debug: int = 0,
+    ) -> Dict[str, Any]:
+        """Build the configuration listed by ``list-servers`` through the daemon.
+
+        Args:
+            url: Subscription URL
+            source_type: Subscription source type
+            user_agent: User-Agent override
+            debug: Debug level
+
+        Returns:
+            Dictionary with ``success``, ``config`` and ``errors``
+
+        Raises:
+            DaemonError: For local file subscriptions, which are not sent to
+                the daemon
+
+        """
+        self._check_remote(url)
+        return self.request(
+            DaemonCommand.LIST,
+            url=url,
+            source_type=source_type,
+            user_agent=user_agent,
+            debug=debug,
+        )
+
+    def refresh(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """Refresh sources known to the daemon.
+
+        Args:
+            url: Only refresh this subscription (default: all)
+
+        Returns:
+            Dictionary with refreshed URLs and errors by URL
+
+        """
+        return self.request(DaemonCommand.REFRESH, url=url)
+
+    def shutdown(self) -> Dict[str, Any]:
+        """Ask the daemon to stop."""
+        return self.request(DaemonCommand.SHUTDOWN)
+
+    @staticmethod
+    def _check_remote(url: str) -> None:
+        """Refuse to send a local file subscription to the daemon."""
+        if is_local_source(url):
+            raise DaemonError(
+                "Local subscription files are read in-process", code="local_source"
+            )
+
+
+def connect_to_daemon(
+    socket_path: Optional[Union[str, Path]] = None,
+) -> Optional[DaemonClient]:
+    """Return a client if a daemon socket exists and use is not disabled.
+
+    Only checks for the socket file in a directory private to the current
+    user, so the caller still has to handle ``DaemonUnavailableError`` for
+    a socket left behind by a dead daemon.
+
+    Args:
+        socket_path: Control socket path (default: ``get_daemon_socket_path()``)
+
+    Returns:
+        DaemonClient or None
+
+    """
+    if os.getenv("SBOXMGR_NO_DAEMON"):
+        return None
+    client = DaemonClient(socket_path)
+    if not client.socket_path.exists():
+        return None
+    try:
+        check_private_dir(client.socket_path.parent)
+    except (DaemonError, OSError) as e:
+        logger.warning(f"Not using sboxmgr daemon: {e}")
+        return None
+    return client
@@ -0,0 +1,181 @@
+"""Messages exchanged with the sboxmgr daemon.
+
+The daemon speaks the framed JSON protocol used for sboxagent (see
+``sboxmgr.agent.ipc``) with the same envelopes as ``EventSender``: a client
+sends one ``command`` message per request and receives a ``response``
+message carrying either ``data`` or an ``error``.
+
+Both ends only talk to processes of the same user: the socket directory
+must be private to the user and peers are checked with ``SO_PEERCRED``
+where the platform supports it.
+"""
+
+import os
+import socket
+import stat
+import struct
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class DaemonCommand(str, Enum):
+    """Commands served by the daemon."""
+
+    PING = "ping"
+    EXPORT = "export"
+    LIST = "list"
+    REFRESH = "refresh"
+    SHUTDOWN = "shutdown"
+
+
+class DaemonError(Exception):
+    """Raised when the daemon rejects or fails a request."""
+
+    def __init__(self, message: str, code: str = "internal_error"):
+        """Initialize the error.
+
+        Args:
+            message: Error description
+            code: Machine-readable error code
+
+        """
+        super().__init__(message)
+        self.code = code
+
+
+class DaemonUnavailableError(DaemonError):
+    """Raised when no daemon is listening on the control socket."""
+
+    def __init__(self, message: str):
+        """Initialize the error.
+
+        Args:
+            message: Error description
+
+        """
+        super().__init__(message, code="unavailable")
+
+
+def _timestamp() -> str:
+    """Return the current UTC time in the protocol format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def command_message(command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a command message.
+
+    Args:
+        command: Command name (see ``DaemonCommand``)
+        params: Command parameters
+
+    Returns:
+        Message dictionary
+
+    """
+    return {
+        "id": str(uuid.uuid4()),
+        "type": "command",
+        "timestamp": _timestamp(),
+        "command": {"command": command, "params": params},
+    }
+
+
+def response_message(
+    request_id: Optional[str],
+    data: Optional[Dict[str, Any]] = None,
+    error: Optional[DaemonError] = None,
+) -> Dict[str, Any]:
+    """Create a response message.
+
+    Args:
+        request_id: ID of the command message answered
+        data: Result data of a successful command
+        error: Error of a failed command
+
+    Returns:
+        Message dictionary
+
+    """
+    if error is not None:
+        response: Dict[str, Any] = {
+            "status": "error",
+            "error": {"code": error.code, "message": str(error)},
+        }
+    else:
+        response = {"status": "success", "data": data or {}}
+    return {
+        "id": str(uuid.uuid4()),
+        "type": "response",
+        "timestamp": _timestamp(),
+        "correlation_id": request_id,
+        "response": response,
+    }
+
+
+def is_local_source(url: str) -> bool:
+    """Check whether a subscription URL names a local file.
+
+    Local files are read in-process: a relative path would be resolved in
+    the daemon's working directory, and the daemon would keep serving the
+    file's cached content after it changes.
+
+    Args:
+        url: Subscription URL
+
+    Returns:
+        True for ``file://`` URLs
+
+    """
+    return url.startswith("file://")
+
+
+def check_private_dir(path: Union[str, Path]) -> None:
+    """Ensure a socket directory is accessible to the current user only.
+
+    The directory itself is checked, not a symlink to it, so another user
+    cannot pre-create it (e.g. in a shared temp directory) and plant a
+    socket there.
+
+    Args:
+        path: Directory of the control socket
+
+    Raises:
+        DaemonError: If the directory is a symlink, is not owned by the
+            current user or is accessible to group or others
+
+    """
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        problem = "is not a directory"
+    elif st.st_uid != os.getuid():
+        problem = f"is owned by uid {st.st_uid}"
+    elif st.st_mode & 0o077:
+        problem = f"has mode {stat.S_IMODE(st.st_mode):o}, expected 700"
+    else:
+        return
+    raise DaemonError(
+        f"Insecure daemon socket directory {path}: {problem}",
+        code="insecure_socket",
+    )
+
+
+def peer_uid(sock: socket.socket) -> Optional[int]:
+    """Return the user ID of the process on the other end of a Unix socket.
+
+    Args:
+        sock: Connected Unix socket
+
+    Returns:
+        Peer user ID, or None if the platform has no ``SO_PEERCRED``
+
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid
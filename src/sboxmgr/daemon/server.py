@@ -0,0 +1,410 @@
+"""Long-lived sboxmgr daemon serving requests over a Unix socket.
+
+A CLI invocation pays interpreter start, imports, plugin discovery and cold
+caches before it fetches anything. ``SboxmgrDaemon`` keeps one
+``SubscriptionManager`` per subscription source alive, together with the
+process-wide caches (fetched payloads, GeoIP reader, latency history,
+server fingerprints), and serves export, list and refresh requests from
+them. Known sources are refreshed in the background by a
+``RefreshScheduler``, so requests are answered from warm data.
+"""
+
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from ..core.scheduler import (
+    DEFAULT_REFRESH_INTERVAL,
+    RefreshError,
+    RefreshScheduler,
+    source_key,
+)
+from ..subscription.errors import ErrorType
+from ..subscription.models import PipelineContext, PipelineResult, SubscriptionSource
+from ..utils.env import get_daemon_socket_path
+from .protocol import (
+    DaemonCommand,
+    DaemonError,
+    check_private_dir,
+    is_local_source,
+    peer_uid,
+    response_message,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sources not requested for this long are dropped instead of refreshed
+SOURCE_IDLE_TTL = 24 * 3600
+
+# (url, source_type, user_agent)
+_SourceKey = Tuple[str, str, Optional[str]]
+
+
+@dataclass
+class _WarmSource:
+    """Subscription manager kept alive for one source."""
+
+    manager: Any
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    last_used: float = field(default_factory=time.time)
+    refreshed_at: Optional[float] = None
+
+
+class _ControlServer(socketserver.ThreadingUnixStreamServer):
+    """Socket server dispatching framed JSON requests to the daemon."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: "SboxmgrDaemon"):
+        self.sboxmgr_daemon = daemon
+        super().__init__(socket_path, _ControlHandler)
+
+
+class _ControlHandler(socketserver.BaseRequestHandler):
+    """Answer every command message received on a connection."""
+
+    def handle(self) -> None:
+        from ..agent.ipc.socket_client import SocketClient
+
+        uid = peer_uid(self.request)
+        if uid is not None and uid != os.getuid():
+            logger.warning(f"Rejected daemon connection from uid {uid}")
+            return
+        connection = SocketClient.from_socket(self.request)
+        while True:
+            try:
+                message = connection.recv_message()
+            except (ConnectionError, OSError, RuntimeError, ValueError):
+                return
+            connection.send_message(self.server.sboxmgr_daemon.handle(message))
+
+
+class SboxmgrDaemon:
+    """Daemon keeping subscription pipelines warm between CLI calls.
+
+    Args:
+        socket_path: Control socket path (default: ``get_daemon_socket_path()``)
+        refresh_interval: Default seconds between background refreshes of
+            known sources; 0 disables background refreshes
+        idle_ttl: Seconds after which a source not requested is dropped
+
+    Example:
+        >>> daemon = SboxmgrDaemon()
+        >>> daemon.serve_forever()  # until SIGTERM or a shutdown request
+
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Union[str, Path]] = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        idle_ttl: float = SOURCE_IDLE_TTL,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Control socket path
+            refresh_interval: Default seconds between background refreshes
+            idle_ttl: Seconds after which an unused source is dropped
+
+        """
+        self.socket_path = Path(socket_path or get_daemon_socket_path())
+        self.refresh_interval = refresh_interval
+        self.idle_ttl = idle_ttl
+        self.started_at: Optional[float] = None
+        self._sources: Dict[_SourceKey, _WarmSource] = {}
+        self._sources_lock = threading.Lock()
+        self.scheduler = RefreshScheduler(
+            self._refresh_scheduled,
+            default_interval=refresh_interval or DEFAULT_REFRESH_INTERVAL,
+        )
+        self._server: Optional[_ControlServer] = None
+        self._threads: List[threading.Thread] = []
+        self._stop_requested = threading.Event()
+
+    def start(self) -> None:
+        """Bind the control socket and serve requests in background threads.
+
+        Raises:
+            DaemonError: If another daemon is listening on the socket, or
+                the socket directory is not private to the current user
+
+        """
+        self._prepare_socket_path()
+        self._server = _ControlServer(str(self.socket_path), self)
+        os.chmod(self.socket_path, 0o600)
+        self.started_at = time.time()
+        self._stop_requested.clear()
+        self._threads = [
+            threading.Thread(
+                target=self._server.serve_forever,
+                name="sboxmgr-daemon-server",
+                daemon=True,
+            )
+        ]
+        for thread in self._threads:
+            thread.start()
+        if self.refresh_interval > 0:
+            self.scheduler.start()
+        logger.info(f"sboxmgr daemon listening on {self.socket_path}")
+
+    def serve_forever(self) -> None:
+        """Serve requests until ``request_stop`` is called, then clean up."""
+        if self._server is None:
+            self.start()
+        try:
+            # Wake up periodically so signal handlers run in the main thread
+            while not self._stop_requested.wait(1.0):
+                pass
+        finally:
+            self.stop()
+
+    def request_stop(self) -> None:
+        """Ask ``serve_forever`` to return; safe to call from signal handlers."""
+        self._stop_requested.set()
+
+    def stop(self) -> None:
+        """Stop serving and remove the control socket."""
+        self._stop_requested.set()
+        server, self._server = self._server, None
+        if server is None:
+            return
+        self.scheduler.stop()
+        server.shutdown()
+        server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        logger.info("sboxmgr daemon stopped")
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a command message and build the response message.
+
+        Args:
+            message: Command message from a client
+
+        Returns:
+            Response message
+
+        """
+        request_id = message.get("id")
+        command = message.get("command") or {}
+        try:
+            if message.get("type") != "command":
+                raise DaemonError("Expected a command message", code="bad_request")
+            try:
+                name = DaemonCommand(command.get("command"))
+            except ValueError:
+                raise DaemonError(
+                    f"Unknown command: {command.get('command')}", code="bad_request"
+                ) from None
+            params = command.get("params") or {}
+            handler = getattr(self, f"_command_{name.value}")
+            return response_message(request_id, data=handler(params))
+        except DaemonError as e:
+            return response_message(request_id, error=e)
+        except Exception as e:
+            logger.exception(f"Daemon command {command.get('command')} failed")
+            return response_message(request_id, error=DaemonError(str(e)))
+
+    def refresh(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch known sources again and rebuild their cached results.
+
+        A source whose fetch fails keeps serving its previous data. The
+        refreshed sources are rescheduled as after a scheduled refresh.
+
+        Args:
+            url: Only refresh sources with this URL (default: all)
+
+        Returns:
+            Dictionary with refreshed URLs and errors by URL
+
+        """
+        outcomes = self.scheduler.refresh_now(
+            lambda source: url is None or source.url == url
+        )
+        return {
+            "refreshed": [o.source.url for o in outcomes if o.success],
+            "failed": {o.source.url: o.error for o in outcomes if not o.success},
+        }
+
+    def _command_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Report daemon status."""
+        schedule = {
+            (job["url"], job["source_type"]): job for job in self.scheduler.status()
+        }
+        with self._sources_lock:
+            sources = [
+                {
+                    "url": key[0],
+                    "source_type": key[1],
+                    "refreshed_at": s.refreshed_at,
+                    "next_refresh_at": schedule.get(key[:2], {}).get("next_refresh_at"),
+                    "failures": schedule.get(key[:2], {}).get("failures", 0),
+                }
+                for key, s in self._sources.items()
+            ]
+        return {
+            "pong": True,
+            "pid": os.getpid(),
+            "uptime": time.time() - (self.started_at or time.time()),
+            "refresh_interval": self.refresh_interval,
+            "sources": sources,
+        }
+
+    def _command_export(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Export a subscription like ``sboxctl export`` without profiles."""
+        from ..export.export_manager import ExportManager
+
+        source = self._get_source(params)
+        export_manager = ExportManager(
+            export_format=params.get("export_format", "singbox")
+        )
+        context = PipelineContext(
+            debug_level=params.get("debug", 0), source=params["url"]
+        )
+        with source.lock:
+            result = source.manager.export_config(
+                export_manager=export_manager, context=context
+            )
+        return self._config_result(result)
+
+    def _command_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the configuration listed by ``sboxctl list-servers``."""
+        from ..server.exclusions import load_exclusions
+
+        source = self._get_source(params)
+        context = PipelineContext(mode="default", debug_level=params.get("debug", 0))
+        with source.lock:
+            result = source.manager.export_config(
+                exclusions=load_exclusions(dry_run=True),
+                user_routes=[],
+                context=context,
+            )
+        return self._config_result(result)
+
+    def _command_refresh(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Refresh known sources on request."""
+        return self.refresh(params.get("url"))
+
+    def _command_shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Stop the daemon after answering."""
+        self.request_stop()
+        return {"stopping": True}
+
+    def _get_source(self, params: Dict[str, Any]) -> _WarmSource:
+        """Return the warm manager of the requested source, creating it once."""
+        url = params.get("url")
+        if not url:
+            raise DaemonError("Missing subscription url", code="bad_request")
+        if is_local_source(url):
+            raise DaemonError(
+                "Local subscription files are read in-process", code="bad_request"
+            )
+        key: _SourceKey = (
+            url,
+            params.get("source_type") or "url",
+            params.get("user_agent"),
+        )
+        with self._sources_lock:
+            source = self._sources.get(key)
+            if source is None:
+                from ..subscription.manager import SubscriptionManager
+
+                subscription = SubscriptionSource(
+                    url=key[0], source_type=key[1], user_agent=key[2]
+                )
+                source = self._sources[key] = _WarmSource(
+                    SubscriptionManager(subscription)
+                )
+                # Just requested, so due one (jittered) interval from now
+                self.scheduler.add(subscription, delay=self.scheduler.default_interval)
+            source.last_used = time.time()
+        return source
+
+    def _refresh_scheduled(
+        self, subscription: SubscriptionSource
+    ) -> Optional[Mapping[str, str]]:
+        """Refresh a source for the scheduler, dropping it once idle."""
+        key = source_key(subscription)
+        with self._sources_lock:
+            source = self._sources.get(key)
+            if source is not None and source.last_used < time.time() - self.idle_ttl:
+                del self._sources[key]
+                source = None
+            if source is None:
+                self.scheduler.remove(subscription)
+                return None
+        return self._refresh_source(source)
+
+    @staticmethod
+    def _refresh_source(source: _WarmSource) -> Dict[str, str]:
+        """Fetch a source again and warm its pipeline result.
+
+        Returns:
+            Response headers of the provider
+
+        Raises:
+            RefreshError: If the refetched data fails in the pipeline
+
+        """
+        with source.lock:
+            # Replaces the cached payload; raises and keeps it on failure
+            fetcher = source.manager.fetcher
+            fetcher.fetch(force_reload=True)
+            headers = dict(getattr(fetcher, "response_headers", None) or {})
+            source.manager.cache_manager.clear_cache()
+            result = source.manager.get_servers()
+            if not result.success and result.errors:
+                error = result.errors[0]
+                raise RefreshError(
+                    getattr(error, "message", str(error)),
+                    error_type=getattr(error, "type", ErrorType.INTERNAL),
+                    headers=headers,
+                )
+            source.refreshed_at = time.time()
+            return headers
+
+    @staticmethod
+    def _config_result(result: PipelineResult) -> Dict[str, Any]:
+        """Convert a pipeline result into response data."""
+        return {
+            "success": result.success,
+            "config": result.config if result.success else None,
+            "errors": [getattr(e, "message", str(e)) for e in result.errors],
+        }
+
+    def _prepare_socket_path(self) -> None:
+        """Create the socket directory and remove a stale socket.
+
+        Raises:
+            DaemonError: If another daemon is listening on the socket, or
+                the socket directory is not private to the current user
+
+        """
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        check_private_dir(self.socket_path.parent)
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            # Left behind by a daemon that did not shut down cleanly
+            self.socket_path.unlink()
+        else:
+            raise DaemonError(
+                f"sboxmgr daemon already running on {self.socket_path}",
+                code="already_running",
+            )
+        finally:
+            probe.close()
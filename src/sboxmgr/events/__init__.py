@@ -8,6 +8,7 @@ and asynchronous event handling with filtering and error handling.
 from .core import Event, EventHandler, EventManager, emit_event, get_event_manager
 from .decorators import async_event_handler, event_handler
 from .filters import CompositeFilter, EventFilter, SourceFilter, TypeFilter
+from .routing import HandlerRoute, RoutingIndex
 from .types import EventData, EventPriority, EventType
 
 __all__ = [
@@ -23,6 +24,8 @@ __all__ = [
     "TypeFilter",
     "SourceFilter",
     "CompositeFilter",
+    "HandlerRoute",
+    "RoutingIndex",
     "emit_event",
     "get_event_manager",
 ]
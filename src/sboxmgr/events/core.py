@@ -3,11 +3,14 @@
 import asyncio
 import threading
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from datetime import datetime
 from typing import Any, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .filters import EventFilter
+from .routing import HandlerRoute, RoutingIndex
 from .types import EventData, EventPayload, EventPriority, EventType
 
 
@@ -65,6 +68,26 @@ class EventHandler(ABC):
         """
         pass
 
+    def get_route(self) -> Optional[HandlerRoute]:
+        """Describe the events this handler accepts for indexed dispatch.
+
+        Handlers returning None are treated as opaque and ``can_handle`` is
+        called for every event. Handlers keeping an ``EventFilter`` in their
+        ``filter`` attribute are indexed by the filter's route; since
+        ``can_handle`` may check more than the filter, it is still called
+        for candidate events. Override to describe other handlers.
+
+        Returns:
+            Declarative route or None
+
+        """
+        event_filter = getattr(self, "filter", None)
+        if isinstance(event_filter, EventFilter):
+            route = event_filter.to_route()
+            if route is not None:
+                return replace(route, exact=False)
+        return None
+
     @property
     def is_async(self) -> bool:
         """Check if this handler is asynchronous.
@@ -153,6 +176,7 @@ class EventManager:
         self._enabled = True
         self._event_history: List[Event] = []
         self._max_history = 1000
+        self._index: Optional[RoutingIndex] = None
 
     def register_handler(self, handler: EventHandler) -> None:
         """Register an event handler.
@@ -172,6 +196,7 @@ class EventManager:
                 raise ValueError("Handler already registered")
 
             self._handlers.append(handler)
+            self._index = None
 
     def unregister_handler(self, handler: EventHandler) -> bool:
         """Unregister an event handler.
@@ -186,6 +211,7 @@ class EventManager:
         with self._lock:
             try:
                 self._handlers.remove(handler)
+                self._index = None
                 return True
             except ValueError:
                 return False
@@ -294,15 +320,23 @@ class EventManager:
             if event_type is None:
                 return self._handlers.copy()
 
-            # Create dummy event data for filtering
-            dummy_data = EventData(
-                event_type=event_type,
-                payload={},
-                source="filter",
-                timestamp=datetime.now(),
-            )
-
-            return [h for h in self._handlers if h.can_handle(dummy_data)]
+            # Dummy event data is only needed for handlers the index
+            # cannot decide on its own
+            dummy_data: Optional[EventData] = None
+            handlers = []
+            for handler, needs_check in self._get_index().lookup(event_type, "filter"):
+                if needs_check:
+                    if dummy_data is None:
+                        dummy_data = EventData(
+                            event_type=event_type,
+                            payload={},
+                            source="filter",
+                            timestamp=datetime.now(),
+                        )
+                    if not handler.can_handle(dummy_data):
+                        continue
+                handlers.append(handler)
+            return handlers
 
     def enable(self) -> None:
         """Enable event processing."""
@@ -316,6 +350,7 @@ class EventManager:
         """Remove all registered handlers."""
         with self._lock:
             self._handlers.clear()
+            self._index = None
 
     def get_event_history(self, limit: Optional[int] = None) -> List[Event]:
         """Get event processing history.
@@ -400,7 +435,23 @@ class EventManager:
     def _get_applicable_handlers(self, event_data: EventData) -> List[EventHandler]:
         """Get handlers that can process the given event."""
         with self._lock:
-            return [h for h in self._handlers if h.can_handle(event_data)]
+            candidates = self._get_index().lookup(
+                event_data.event_type, event_data.source
+            )
+        return [
+            handler
+            for handler, needs_check in candidates
+            if not needs_check or handler.can_handle(event_data)
+        ]
+
+    def _get_index(self) -> RoutingIndex:
+        """Get the routing index, rebuilding it after handler changes.
+
+        Must be called with ``self._lock`` held.
+        """
+        if self._index is None:
+            self._index = RoutingIndex(self._handlers)
+        return self._index
 
     def _create_cancelled_event(
         self, event_type: EventType, payload: EventPayload, source: str
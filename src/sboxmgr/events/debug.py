@@ -2,6 +2,7 @@
 
 from .core import EventHandler, get_event_manager
 from .decorators import event_handler
+from .routing import HandlerRoute
 from .types import EventData, EventType
 
 
@@ -18,6 +19,10 @@ class EventStatistics(EventHandler):
         """Check if event can be handled for statistics collection."""
         return True
 
+    def get_route(self) -> HandlerRoute:
+        """Accept every event without calling ``can_handle``."""
+        return HandlerRoute()
+
     def handle(self, event_data: EventData) -> None:
         """Collect statistics from the event."""
         event_type = event_data.event_type.value
@@ -4,6 +4,7 @@ import functools
 from typing import Any, Callable, Optional, Set
 
 from .core import EventHandler, get_event_manager
+from .routing import HandlerRoute
 from .types import EventData, EventType
 
 
@@ -41,6 +42,13 @@ class DecoratedEventHandler(EventHandler):
 
         return True
 
+    def get_route(self) -> Optional[HandlerRoute]:
+        """Describe the event types and source filter as a route."""
+        return HandlerRoute(
+            event_types=frozenset(self.event_types),
+            sources=frozenset((self.source_filter,)) if self.source_filter else None,
+        )
+
     def handle(self, event_data: EventData) -> Any:
         """Handle the event by calling the wrapped function."""
         return self.func(event_data)
@@ -2,10 +2,14 @@
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Pattern, Set
+from typing import Any, Optional, Pattern, Set, Tuple
 
+from .routing import HandlerRoute
 from .types import EventData, EventType
 
+# Characters that end the literal prefix of an anchored source pattern
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
 
 class EventFilter(ABC):
     """Abstract base class for event filters.
@@ -27,6 +31,16 @@ class EventFilter(ABC):
         """
         pass
 
+    def to_route(self) -> Optional[HandlerRoute]:
+        """Describe this filter as a declarative route for indexing.
+
+        Returns:
+            Route accepting a superset of matching events, or None if the
+            filter cannot be expressed as a route
+
+        """
+        return None
+
 
 class TypeFilter(EventFilter):
     """Filter events by type."""
@@ -52,6 +66,10 @@ class TypeFilter(EventFilter):
         """
         return event_data.event_type in self.event_types
 
+    def to_route(self) -> Optional[HandlerRoute]:
+        """Describe the accepted event types as a route."""
+        return HandlerRoute(event_types=frozenset(self.event_types))
+
 
 class SourceFilter(EventFilter):
     """Filter events by source."""
@@ -86,6 +104,79 @@ class SourceFilter(EventFilter):
         else:
             return bool(self.pattern and self.pattern.search(event_data.source))
 
+    def to_route(self) -> Optional[HandlerRoute]:
+        """Describe the source constraint as a route.
+
+        Exact sources map directly. Regex sources are routable only when
+        anchored with ``^``; their literal prefix is used for the prefix
+        trie and ``matches`` is still called unless the pattern is purely
+        literal.
+        """
+        if self.exact_match:
+            return HandlerRoute(sources=frozenset((self.source,)))
+
+        prefix, literal = _anchored_literal_prefix(self.source)
+        if prefix is None:
+            return None
+        return HandlerRoute(source_prefixes=frozenset((prefix,)), exact=literal)
+
+
+def _anchored_literal_prefix(pattern: str) -> Tuple[Optional[str], bool]:
+    """Extract the literal prefix of a ``^``-anchored regex.
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        Tuple of (prefix or None if not anchored, whether the whole pattern
+        is that literal prefix)
+
+    """
+    # "^abc|xyz" is anchored in its first branch only
+    if not pattern.startswith("^") or _has_top_level_alternation(pattern):
+        return None, False
+
+    body = pattern[1:]
+    end = 0
+    while end < len(body) and body[end] not in _REGEX_META:
+        end += 1
+
+    prefix = body[:end]
+    # A quantifier makes the preceding character optional
+    if end < len(body) and body[end] in "*?{" and prefix:
+        prefix = prefix[:-1]
+    return prefix, end == len(body)
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Check whether a regex has an unescaped ``|`` outside groups and sets."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
 
 class PayloadFilter(EventFilter):
     """Filter events by payload content."""
@@ -172,6 +263,43 @@ class CompositeFilter(EventFilter):
 
         return False
 
+    def to_route(self) -> Optional[HandlerRoute]:
+        """Combine child routes according to the logical operation.
+
+        AND keeps the narrowest routable children (opaque children only
+        make the result non-exact), OR requires every child to be routable,
+        and NOT is never routable.
+        """
+        if not self.filters:
+            return HandlerRoute()
+        if self.operation == "NOT":
+            return None
+
+        routes = [f.to_route() for f in self.filters]
+
+        if self.operation == "OR":
+            if any(r is None for r in routes):
+                return None
+            combined = routes[0]
+            for route in routes[1:]:
+                combined = combined.union(route)
+            return combined
+
+        known = [r for r in routes if r is not None]
+        if not known:
+            return None
+        combined = known[0]
+        for route in known[1:]:
+            combined = combined.intersect(route)
+        if len(known) != len(routes):
+            combined = HandlerRoute(
+                event_types=combined.event_types,
+                sources=combined.sources,
+                source_prefixes=combined.source_prefixes,
+                exact=False,
+            )
+        return combined
+
 
 class PriorityFilter(EventFilter):
     """Filter events by priority level."""
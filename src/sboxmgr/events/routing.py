@@ -0,0 +1,300 @@
+"""Indexed handler routing for the event system.
+
+Handlers and filters may describe which events they accept through a
+declarative ``HandlerRoute``. The ``RoutingIndex`` turns those routes into an
+``EventType -> handlers`` map with a per-type source prefix trie, so dispatch
+only touches handlers that can possibly match. Handlers without a route
+(opaque handlers) are still checked with ``can_handle`` on every event.
+"""
+
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .types import EventType
+
+if TYPE_CHECKING:
+    from .core import EventHandler
+
+
+@dataclass(frozen=True)
+class HandlerRoute:
+    """Declarative description of the events a handler accepts.
+
+    A ``None`` constraint means "any". Source constraints are satisfied when
+    the event source is one of ``sources`` or starts with one of
+    ``source_prefixes``.
+
+    Attributes:
+        event_types: Accepted event types, or None for all types.
+        sources: Accepted exact event sources, or None.
+        source_prefixes: Accepted event source prefixes, or None.
+        exact: Whether the route fully describes ``can_handle``. When False
+            the route is only a pre-filter and ``can_handle`` is still called
+            for candidate events.
+
+    """
+
+    event_types: Optional[FrozenSet[EventType]] = None
+    sources: Optional[FrozenSet[str]] = None
+    source_prefixes: Optional[FrozenSet[str]] = None
+    exact: bool = True
+
+    @property
+    def any_source(self) -> bool:
+        """Check if the route places no constraint on the event source."""
+        return self.sources is None and self.source_prefixes is None
+
+    def matches(self, event_type: EventType, source: str) -> bool:
+        """Check if an event type and source satisfy this route.
+
+        Args:
+            event_type: Event type to check
+            source: Event source to check
+
+        Returns:
+            True if the event passes the route constraints
+
+        """
+        if self.event_types is not None and event_type not in self.event_types:
+            return False
+        if self.any_source:
+            return True
+        if self.sources and source in self.sources:
+            return True
+        if self.source_prefixes:
+            return any(source.startswith(p) for p in self.source_prefixes)
+        return False
+
+    def intersect(self, other: "HandlerRoute") -> "HandlerRoute":
+        """Combine two routes with logical AND.
+
+        Type constraints are intersected exactly. Only one source constraint
+        is kept, so combining two source-constrained routes yields a
+        non-exact pre-filter.
+
+        Args:
+            other: Route to combine with
+
+        Returns:
+            Route accepting a superset of events matched by both routes
+
+        """
+        if self.event_types is None:
+            event_types = other.event_types
+        elif other.event_types is None:
+            event_types = self.event_types
+        else:
+            event_types = self.event_types & other.event_types
+
+        exact = self.exact and other.exact
+        if self.any_source:
+            source_route = other
+        elif other.any_source:
+            source_route = self
+        else:
+            source_route = self
+            exact = False
+
+        return HandlerRoute(
+            event_types=event_types,
+            sources=source_route.sources,
+            source_prefixes=source_route.source_prefixes,
+            exact=exact,
+        )
+
+    def union(self, other: "HandlerRoute") -> "HandlerRoute":
+        """Combine two routes with logical OR.
+
+        The result is exact only when both routes are exact and constrain the
+        same single dimension (types only or sources only).
+
+        Args:
+            other: Route to combine with
+
+        Returns:
+            Route accepting a superset of events matched by either route
+
+        """
+        if self.event_types is None or other.event_types is None:
+            event_types = None
+        else:
+            event_types = self.event_types | other.event_types
+
+        if self.any_source or other.any_source:
+            sources = None
+            source_prefixes = None
+        else:
+            sources = _union_optional(self.sources, other.sources)
+            source_prefixes = _union_optional(
+                self.source_prefixes, other.source_prefixes
+            )
+
+        types_only = self.any_source and other.any_source
+        sources_only = self.event_types is None and other.event_types is None
+        exact = self.exact and other.exact and (types_only or sources_only)
+
+        return HandlerRoute(
+            event_types=event_types,
+            sources=sources,
+            source_prefixes=source_prefixes,
+            exact=exact,
+        )
+
+
+def _union_optional(
+    left: Optional[FrozenSet[str]], right: Optional[FrozenSet[str]]
+) -> Optional[FrozenSet[str]]:
+    """Union two optional sets, treating None as empty."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return left | right
+
+
+# Entry stored in the index: (registration order, handler, needs can_handle)
+_RouteEntry = Tuple[int, "EventHandler", bool]
+
+
+class _SourceTrie:
+    """Prefix trie mapping source prefixes to route entries."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_SourceTrie"] = {}
+        self.entries: List[_RouteEntry] = []
+
+    def insert(self, prefix: str, entry: _RouteEntry) -> None:
+        node = self
+        for char in prefix:
+            node = node.children.setdefault(char, _SourceTrie())
+        node.entries.append(entry)
+
+    def collect(self, source: str, out: Dict[int, _RouteEntry]) -> None:
+        node = self
+        for entry in node.entries:
+            out[entry[0]] = entry
+        for char in source:
+            node = node.children.get(char)
+            if node is None:
+                return
+            for entry in node.entries:
+                out[entry[0]] = entry
+
+
+class _SourceBucket:
+    """Handlers sharing an event type, indexed by source constraint."""
+
+    __slots__ = ("any_source", "exact_sources", "prefixes")
+
+    def __init__(self) -> None:
+        self.any_source: List[_RouteEntry] = []
+        self.exact_sources: Dict[str, List[_RouteEntry]] = {}
+        self.prefixes: Optional[_SourceTrie] = None
+
+    def add(self, route: HandlerRoute, entry: _RouteEntry) -> None:
+        if route.any_source:
+            self.any_source.append(entry)
+            return
+        for source in route.sources or ():
+            self.exact_sources.setdefault(source, []).append(entry)
+        for prefix in route.source_prefixes or ():
+            if self.prefixes is None:
+                self.prefixes = _SourceTrie()
+            self.prefixes.insert(prefix, entry)
+
+    def collect(self, source: str, out: Dict[int, _RouteEntry]) -> None:
+        for entry in self.any_source:
+            out[entry[0]] = entry
+        for entry in self.exact_sources.get(source, ()):
+            out[entry[0]] = entry
+        if self.prefixes is not None:
+            self.prefixes.collect(source, out)
+
+
+class RoutingIndex:
+    """Index of event handlers keyed by event type and source.
+
+    The index is immutable once built; ``EventManager`` rebuilds it lazily
+    after handlers are registered or removed. Lookups return candidates in
+    registration order together with a flag telling whether ``can_handle``
+    must still be consulted.
+
+    Example:
+        >>> index = RoutingIndex(handlers)
+        >>> for handler, needs_check in index.lookup(EventType.CONFIG_UPDATED, "cli"):
+        ...     ...
+
+    """
+
+    def __init__(self, handlers: Iterable["EventHandler"], cache_size: int = 256):
+        """Build the index from handlers.
+
+        Args:
+            handlers: Handlers in registration order
+            cache_size: Maximum number of cached (type, source) lookups
+
+        """
+        self._by_type: Dict[EventType, _SourceBucket] = {}
+        self._any_type = _SourceBucket()
+        self._opaque: List[_RouteEntry] = []
+        self._cache: Dict[Tuple[EventType, str], List[Tuple["EventHandler", bool]]] = {}
+        self._cache_size = cache_size
+
+        for order, handler in enumerate(handlers):
+            route = handler.get_route()
+            if route is None:
+                self._opaque.append((order, handler, True))
+                continue
+
+            entry = (order, handler, not route.exact)
+            if route.event_types is None:
+                self._any_type.add(route, entry)
+                continue
+            for event_type in route.event_types:
+                bucket = self._by_type.get(event_type)
+                if bucket is None:
+                    bucket = self._by_type[event_type] = _SourceBucket()
+                bucket.add(route, entry)
+
+    def lookup(
+        self, event_type: EventType, source: str
+    ) -> List[Tuple["EventHandler", bool]]:
+        """Find candidate handlers for an event.
+
+        Args:
+            event_type: Event type to route
+            source: Event source to route
+
+        Returns:
+            ``(handler, needs_check)`` pairs in registration order
+
+        """
+        key = (event_type, source)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        found: Dict[int, _RouteEntry] = {}
+        bucket = self._by_type.get(event_type)
+        if bucket is not None:
+            bucket.collect(source, found)
+        self._any_type.collect(source, found)
+        for entry in self._opaque:
+            found[entry[0]] = entry
+
+        result = [(found[order][1], found[order][2]) for order in sorted(found)]
+
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
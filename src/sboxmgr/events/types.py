@@ -24,6 +24,7 @@ class EventType(str, Enum):
     SUBSCRIPTION_FETCHED = "subscription.fetched"
     SUBSCRIPTION_PARSED = "subscription.parsed"
     SUBSCRIPTION_FILTERED = "subscription.filtered"
+    SUBSCRIPTION_REFRESHED = "subscription.refreshed"
 
     # Service events
     SERVICE_STARTED = "service.started"
@@ -12,7 +12,9 @@ Phase 4 enhancements:
 - Backward compatibility with existing export workflows
 """
 
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sboxmgr.configs.models import FullProfile
 from sboxmgr.logging import get_logger
@@ -21,6 +23,7 @@ from sboxmgr.subscription.exporters.singbox_exporter import singbox_export
 from sboxmgr.subscription.middleware import BaseMiddleware
 from sboxmgr.subscription.models import ClientProfile, ParsedServer, PipelineContext
 from sboxmgr.subscription.postprocessors import PostProcessorChain
+from sboxmgr.utils.file import atomic_write_many
 
 from .routing.default_router import DefaultRouter
 
@@ -37,6 +40,13 @@ EXPORTER_REGISTRY = {
     # В будущем: "v2ray": v2ray_export и т.д.
 }
 
+# export_many() format prefix for outputs wrapped by JSONExporter
+JSON_FORMAT_PREFIX = "json:"
+JSON_CLIENT_TYPES = {
+    "singbox": "sing-box",
+    "clash": "clash",
+}
+
 
 class ExportManager:
     """Manages configuration export for various proxy clients with middleware integration.
@@ -121,12 +131,157 @@ class ExportManager:
             Dictionary containing exported configuration.
 
         """
-        # Convert context to PipelineContext if needed
+        context = self._normalize_context(context)
+        processed_servers, routes = self._prepare_servers(
+            servers, exclusions, user_routes, context, profile
+        )
+        return self._render(
+            self.export_format,
+            processed_servers,
+            routes,
+            context,
+            client_profile or self.client_profile,
+        )
+
+    def export_many(
+        self,
+        servers: List[ParsedServer],
+        formats: List[str],
+        exclusions: Optional[List[str]] = None,
+        user_routes: Optional[List[Dict]] = None,
+        context: Union[Dict[str, Any], PipelineContext] = None,
+        client_profile: Optional[ClientProfile] = None,
+        profile: Optional[FullProfile] = None,
+        output_paths: Optional[Dict[str, Union[str, Path]]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Dict]:
+        """Export the same servers to several formats in one pass.
+
+        Exclusions, routing, middleware and postprocessors run once; every
+        format is then rendered from the same frozen server set. A format
+        named ``json:<format>`` renders ``<format>`` and wraps it in the
+        standardized JSON export envelope (see JSONExporter); the wrapped
+        config is the one just rendered, so it is not validated again.
+
+        Args:
+            servers: List of server configurations to export.
+            formats: Export formats, e.g. ``["singbox", "clash", "json:singbox"]``.
+            exclusions: List of server identifiers to exclude.
+            user_routes: Optional user-defined routing rules.
+            context: Pipeline context or dictionary with context data.
+            client_profile: Optional client configuration profile.
+            profile: Optional profile for processing.
+            output_paths: Optional mapping of format to output file. All
+                files are written atomically once every format rendered.
+            max_workers: Render formats in this many threads when above 1.
+
+        Returns:
+            Dictionary mapping each requested format to its configuration.
+
+        Raises:
+            ValueError: If ``output_paths`` names a format not in ``formats``.
+
+        """
+        unknown = sorted(set(output_paths or {}) - set(formats))
+        if unknown:
+            raise ValueError(
+                f"output_paths formats not requested in formats: {', '.join(unknown)}"
+            )
+
+        context = self._normalize_context(context)
+        processed_servers, routes = self._prepare_servers(
+            servers, exclusions, user_routes, context, profile
+        )
+        frozen_servers = tuple(processed_servers)
+        client_profile = client_profile or self.client_profile
+
+        base_formats = list(
+            dict.fromkeys(
+                fmt[len(JSON_FORMAT_PREFIX) :]
+                if fmt.startswith(JSON_FORMAT_PREFIX)
+                else fmt
+                for fmt in formats
+            )
+        )
+
+        def render(fmt: str) -> Dict:
+            return self._render(
+                fmt, list(frozen_servers), routes, context, client_profile
+            )
+
+        if max_workers and max_workers > 1 and len(base_formats) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                rendered = dict(zip(base_formats, executor.map(render, base_formats)))
+        else:
+            rendered = {fmt: render(fmt) for fmt in base_formats}
+
+        results: Dict[str, Dict] = {}
+        json_exporter = None
+        for fmt in formats:
+            if fmt.startswith(JSON_FORMAT_PREFIX):
+                if json_exporter is None:
+                    from sboxmgr.json_export import JSONExporter
+
+                    json_exporter = JSONExporter(validate=False)
+                base_format = fmt[len(JSON_FORMAT_PREFIX) :]
+                results[fmt] = json_exporter.export_config(
+                    JSON_CLIENT_TYPES.get(base_format, base_format),
+                    rendered[base_format],
+                )
+            else:
+                results[fmt] = rendered[fmt]
+
+        if output_paths:
+            atomic_write_many(
+                {str(path): results[fmt] for fmt, path in output_paths.items()}
+            )
+            _get_logger().info(
+                f"Exported {len(output_paths)} formats from {len(frozen_servers)} servers"
+            )
+
+        return results
+
+    def _normalize_context(
+        self, context: Union[Dict[str, Any], PipelineContext, None]
+    ) -> PipelineContext:
+        """Convert a context argument to PipelineContext.
+
+        Args:
+            context: Pipeline context, dictionary with context data or None.
+
+        Returns:
+            PipelineContext instance.
+
+        """
         if isinstance(context, dict):
-            context = PipelineContext(**context)
-        elif context is None:
-            context = PipelineContext(mode="direct_export")
+            return PipelineContext(**context)
+        if context is None:
+            return PipelineContext(mode="direct_export")
+        return context
+
+    def _prepare_servers(
+        self,
+        servers: List[ParsedServer],
+        exclusions: Optional[List[str]],
+        user_routes: Optional[List[Dict]],
+        context: PipelineContext,
+        profile: Optional[FullProfile],
+    ) -> Tuple[List[ParsedServer], List[Dict]]:
+        """Run the format-independent part of the export pipeline.
+
+        Applies exclusions, routing, middleware and the postprocessor chain.
+
+        Args:
+            servers: List of server configurations to export.
+            exclusions: List of server identifiers to exclude.
+            user_routes: Optional user-defined routing rules.
+            context: Pipeline context.
+            profile: Optional profile for processing.
 
+        Returns:
+            Tuple of processed servers and routing rules.
+
+        """
         # Apply exclusions
         filtered_servers = servers
         if exclusions:
@@ -178,15 +333,38 @@ class ExportManager:
             except Exception as e:
                 _get_logger().warning(f"PostProcessor chain failed: {e}")
 
+        return processed_servers, routes
+
+    def _render(
+        self,
+        export_format: str,
+        processed_servers: List[ParsedServer],
+        routes: List[Dict],
+        context: PipelineContext,
+        client_profile: Optional[ClientProfile],
+    ) -> Dict:
+        """Render processed servers with a format-specific exporter.
+
+        Args:
+            export_format: Target export format.
+            processed_servers: Servers after middleware and postprocessors.
+            routes: Routing rules.
+            context: Pipeline context.
+            client_profile: Optional client configuration profile.
+
+        Returns:
+            Dictionary containing exported configuration.
+
+        """
         # Export with format-specific handling
-        exporter_func = EXPORTER_REGISTRY.get(self.export_format)
+        exporter_func = EXPORTER_REGISTRY.get(export_format)
         if not exporter_func:
             _get_logger().warning(
-                f"Unknown export format: {self.export_format}, falling back to singbox"
+                f"Unknown export format: {export_format}, falling back to singbox"
             )
             exporter_func = EXPORTER_REGISTRY.get("singbox", singbox_export)
 
-        if self.export_format == "singbox":
+        if export_format == "singbox":
             # Use middleware-aware export if middleware is configured
             if self.middleware_chain:
                 try:
@@ -197,7 +375,7 @@ class ExportManager:
                     return singbox_export_with_middleware(
                         processed_servers,
                         routes,
-                        client_profile=client_profile or self.client_profile,
+                        client_profile=client_profile,
                         context=context,
                     )
                 except ImportError:
@@ -208,7 +386,7 @@ class ExportManager:
             return exporter_func(
                 processed_servers,
                 routes,
-                client_profile=client_profile or self.client_profile,
+                client_profile=client_profile,
             )
         else:
             return exporter_func(processed_servers, routes)
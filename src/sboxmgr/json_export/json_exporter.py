@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ..config.config_validator import validate_temp_config_json
+from ..config.config_validator import validate_singbox_config_structure
 from ..config.validation import ConfigValidationError
 from ..logging import get_logger
 
@@ -38,6 +38,7 @@ class JSONExporter:
         subscription_url: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         validate: Optional[bool] = None,
+        outbounds_validated: bool = False,
     ) -> Dict[str, Any]:
         """Export configuration in standardized JSON format.
 
@@ -47,6 +48,8 @@ class JSONExporter:
             subscription_url: Source subscription URL
             metadata: Additional metadata
             validate: Override validation setting
+            outbounds_validated: Outbounds were validated while being built
+                (e.g. ``singbox_export(validate=True)``), skip re-checking them
 
         Returns:
             Standardized JSON configuration
@@ -70,7 +73,9 @@ class JSONExporter:
             if should_validate:
                 try:
                     self._validate_export(exported)
-                    self._validate_client_config(client_type, config_data)
+                    self._validate_client_config(
+                        client_type, config_data, outbounds_validated
+                    )
                     self.logger.info(
                         f"Configuration validation passed for {client_type}"
                     )
@@ -94,9 +99,13 @@ class JSONExporter:
         metadata: Optional[Dict[str, Any]] = None,
         pretty: bool = True,
         validate: Optional[bool] = None,
+        outbounds_validated: bool = False,
     ) -> Path:
         """Export configuration to file.
 
+        The document is encoded straight into the file; it is never
+        serialized to an intermediate string or parsed back.
+
         Args:
             client_type: Type of client
             config_data: Configuration data
@@ -105,6 +114,7 @@ class JSONExporter:
             metadata: Additional metadata
             pretty: Pretty print JSON
             validate: Override validation setting
+            outbounds_validated: Outbounds were validated while being built
 
         Returns:
             Path to created file
@@ -116,7 +126,12 @@ class JSONExporter:
 
             # Export configuration
             exported = self.export_config(
-                client_type, config_data, subscription_url, metadata, validate
+                client_type,
+                config_data,
+                subscription_url,
+                metadata,
+                validate,
+                outbounds_validated,
             )
 
             # Write to file
@@ -207,14 +222,23 @@ class JSONExporter:
         return metadata
 
     def _calculate_checksum(self, data: Dict[str, Any]) -> str:
-        """Calculate SHA256 checksum of configuration data."""
-        # Create a copy without checksum for consistent hashing
+        """Calculate SHA256 checksum of configuration data.
+
+        The canonical (sorted keys) encoding is hashed chunk by chunk as it
+        is produced, so the serialized document is never held in memory.
+        """
+        # Hash a shallow copy without checksum for consistent hashing
         data_copy = data.copy()
         if "metadata" in data_copy and "checksum" in data_copy["metadata"]:
-            del data_copy["metadata"]["checksum"]
+            data_copy["metadata"] = {
+                k: v for k, v in data_copy["metadata"].items() if k != "checksum"
+            }
 
-        json_str = json.dumps(data_copy, sort_keys=True, ensure_ascii=False)
-        return f"sha256:{hashlib.sha256(json_str.encode('utf-8')).hexdigest()}"
+        digest = hashlib.sha256()
+        encoder = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+        for chunk in encoder.iterencode(data_copy):
+            digest.update(chunk.encode("utf-8"))
+        return f"sha256:{digest.hexdigest()}"
 
     def _get_version(self) -> str:
         """Get sboxmgr version from package metadata."""
@@ -263,23 +287,26 @@ class JSONExporter:
             raise ConfigValidationError("'metadata' field must be a dictionary")
 
     def _validate_client_config(
-        self, client_type: str, config_data: Dict[str, Any]
+        self,
+        client_type: str,
+        config_data: Dict[str, Any],
+        outbounds_validated: bool = False,
     ) -> None:
         """Validate client-specific configuration.
 
         Args:
             client_type: Type of client
             config_data: Configuration data
+            outbounds_validated: Skip per-outbound checks for sing-box
 
         Raises:
             ConfigValidationError: If validation fails
 
         """
         if client_type == "sing-box":
-            # Use internal sing-box validator
+            # Use internal sing-box validator directly on the dict
             try:
-                config_json = json.dumps(config_data)
-                validate_temp_config_json(config_json)
+                validate_singbox_config_structure(config_data, outbounds_validated)
             except Exception as e:
                 raise ConfigValidationError(
                     f"Sing-box configuration validation failed: {e}"
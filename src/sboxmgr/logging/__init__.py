@@ -14,6 +14,7 @@ from .core import (
     initialize_logging,
     reconfigure_logging,
 )
+from .filters import RateLimitFilter, SamplingFilter
 from .formatters import create_formatter, get_default_formatter
 from .sinks import LogSink, detect_available_sinks
 from .trace import (
@@ -44,4 +45,6 @@ __all__ = [
     "detect_available_sinks",
     "create_formatter",
     "get_default_formatter",
+    "SamplingFilter",
+    "RateLimitFilter",
 ]
@@ -4,13 +4,22 @@ Implements ADR-0010 Logging Core Architecture with automatic sink detection,
 structured logging, and trace ID propagation.
 """
 
+import atexit
 import logging
 import logging.config
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..config.models import LoggingConfig
+from .filters import RateLimitFilter, SamplingFilter
 from .formatters import create_formatter
-from .sinks import LogSink, create_handler, detect_available_sinks
+from .sinks import (
+    BatchingQueueListener,
+    BoundedQueueHandler,
+    LogSink,
+    create_handler,
+    create_queue_handler,
+    detect_available_sinks,
+)
 from .trace import get_trace_id
 
 
@@ -33,6 +42,8 @@ class LoggingCore:
         self._configured = False
         self._handlers: Dict[str, logging.Handler] = {}
         self._root_logger = logging.getLogger("sboxmgr")
+        self._queue_handler: Optional[BoundedQueueHandler] = None
+        self._listener: Optional[BatchingQueueListener] = None
 
     def configure(self) -> None:
         """Configure logging system based on configuration.
@@ -97,23 +108,63 @@ class LoggingCore:
         self._configured = False
         self.configure()
 
+    def shutdown(self) -> None:
+        """Stop the async listener, draining queued records to the sinks.
+
+        Safe to call in synchronous mode and multiple times.
+        """
+        listener = self._listener
+        self._listener = None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            atexit.unregister(listener.stop)
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """Get async logging queue statistics.
+
+        Returns:
+            Dict[str, Any]: ``async`` flag, current queue depth, and dropped
+            record counters (total and per level)
+
+        """
+        queue_handler = self._queue_handler
+        if queue_handler is None:
+            return {"async": False, "queued": 0, "dropped": 0, "dropped_by_level": {}}
+
+        return {
+            "async": True,
+            "queued": queue_handler.queue.qsize(),
+            "dropped": queue_handler.dropped,
+            "dropped_by_level": dict(queue_handler.dropped_by_level),
+        }
+
     def _clear_existing_handlers(self) -> None:
         """Clear existing handlers from root logger."""
+        self.shutdown()
+
         for handler in self._root_logger.handlers[:]:
             self._root_logger.removeHandler(handler)
             handler.close()
 
         self._handlers.clear()
+        self._queue_handler = None
 
     def _setup_sinks(self) -> None:
-        """Set up logging sinks based on configuration."""
+        """Set up logging sinks based on configuration.
+
+        In async mode the sink handlers are owned by a background queue
+        listener and only a bounded queue handler is attached to the logger.
+        """
         sinks_to_setup = self._determine_sinks()
 
         for sink_name, sink_config in sinks_to_setup.items():
             try:
                 handler = self._create_sink_handler(sink_name, sink_config)
                 self._handlers[sink_name] = handler
-                self._root_logger.addHandler(handler)
+                if not self.config.async_mode:
+                    self._root_logger.addHandler(handler)
             except Exception as e:
                 # Log error but continue with other sinks
                 # Use stderr directly since logging may not be fully initialized
@@ -123,6 +174,40 @@ class LoggingCore:
                     f"Warning: Failed to setup {sink_name} sink: {e}", file=sys.stderr
                 )
 
+        volume_filters = self._create_volume_filters()
+
+        if self.config.async_mode and self._handlers:
+            queue_handler, listener = create_queue_handler(
+                list(self._handlers.values()), self.config
+            )
+            # Drop sampled-out records before they are queued
+            for volume_filter in volume_filters:
+                queue_handler.addFilter(volume_filter)
+            self._root_logger.addHandler(queue_handler)
+            listener.start()
+            # Drain queued records on interpreter exit
+            atexit.register(listener.stop)
+            self._queue_handler = queue_handler
+            self._listener = listener
+        else:
+            for handler in self._handlers.values():
+                for volume_filter in volume_filters:
+                    handler.addFilter(volume_filter)
+
+    def _create_volume_filters(self) -> List[logging.Filter]:
+        """Create DEBUG sampling and rate limiting filters from configuration.
+
+        Returns:
+            List[logging.Filter]: Filters to attach to sink handlers
+
+        """
+        volume_filters: List[logging.Filter] = []
+        if self.config.debug_sample_rate < 1.0:
+            volume_filters.append(SamplingFilter(self.config.debug_sample_rate))
+        if self.config.debug_rate_limit > 0:
+            volume_filters.append(RateLimitFilter(self.config.debug_rate_limit))
+        return volume_filters
+
     def _determine_sinks(self) -> Dict[str, Dict]:
         """Determine which sinks to set up based on configuration.
 
@@ -0,0 +1,138 @@
+"""Volume controls for high-frequency debug logging.
+
+Provides deterministic sampling and per-logger rate limiting for low-level
+records (DEBUG by default). Records above the controlled level always pass.
+Decisions are stored on the record so the same record gets the same verdict
+from every handler the filter is attached to.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Tuple
+
+# Record attribute holding the keep/drop decision shared between handlers
+_DECISION_ATTR = "_sboxmgr_volume_keep"
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fixed fraction of low-level records.
+
+    Sampling is deterministic (credit based), so a rate of 0.25 keeps
+    exactly every fourth record rather than a random quarter.
+
+    Example:
+        >>> handler.addFilter(SamplingFilter(rate=0.1))
+
+    """
+
+    def __init__(self, rate: float, max_level: int = logging.DEBUG):
+        """Initialize sampling filter.
+
+        Args:
+            rate: Fraction of records to keep (0.0 - 1.0)
+            max_level: Highest level subject to sampling
+
+        Raises:
+            ValueError: If rate is outside 0.0 - 1.0
+
+        """
+        super().__init__()
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Sample rate must be between 0 and 1, got {rate}")
+        self.rate = rate
+        self.max_level = max_level
+        self.dropped = 0
+        self._credit = 0.0
+        self._lock = threading.Lock()
+        self._attr = f"{_DECISION_ATTR}_{id(self)}"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep the record.
+
+        Args:
+            record: Log record to check
+
+        Returns:
+            bool: True if the record should be emitted
+
+        """
+        if record.levelno > self.max_level:
+            return True
+
+        decision = getattr(record, self._attr, None)
+        if decision is not None:
+            return decision
+
+        with self._lock:
+            self._credit += self.rate
+            keep = self._credit >= 1.0
+            if keep:
+                self._credit -= 1.0
+            else:
+                self.dropped += 1
+
+        setattr(record, self._attr, keep)
+        return keep
+
+
+class RateLimitFilter(logging.Filter):
+    """Limit low-level records per logger per one-second window.
+
+    Example:
+        >>> handler.addFilter(RateLimitFilter(max_per_second=100))
+
+    """
+
+    def __init__(self, max_per_second: int, max_level: int = logging.DEBUG):
+        """Initialize rate limit filter.
+
+        Args:
+            max_per_second: Records allowed per logger per second
+            max_level: Highest level subject to rate limiting
+
+        Raises:
+            ValueError: If max_per_second is not positive
+
+        """
+        super().__init__()
+        if max_per_second <= 0:
+            raise ValueError("max_per_second must be positive")
+        self.max_per_second = max_per_second
+        self.max_level = max_level
+        self.dropped = 0
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._attr = f"{_DECISION_ATTR}_{id(self)}"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep the record.
+
+        Args:
+            record: Log record to check
+
+        Returns:
+            bool: True if the record should be emitted
+
+        """
+        if record.levelno > self.max_level:
+            return True
+
+        decision = getattr(record, self._attr, None)
+        if decision is not None:
+            return decision
+
+        window = int(time.monotonic())
+        with self._lock:
+            start, count = self._windows.get(record.name, (window, 0))
+            if start != window:
+                start, count = window, 0
+            keep = count < self.max_per_second
+            if keep:
+                count += 1
+            else:
+                self.dropped += 1
+            self._windows[record.name] = (start, count)
+
+        setattr(record, self._attr, keep)
+        return keep
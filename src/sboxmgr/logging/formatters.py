@@ -6,12 +6,75 @@ Provides formatters for JSON, human-readable, and service mode outputs.
 
 import json
 import logging
+import math
 import os
 import sys
 from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
 from .trace import get_trace_id
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# LogRecord attributes that are never copied into JSON output as extras
+_RESERVED_RECORD_ATTRS = frozenset(
+    [
+        "name",
+        "msg",
+        "args",
+        "levelno",
+        "levelname",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "timestamp",
+        "component",
+        "op",
+        "trace_id",
+        "pid",
+    ]
+)
+
+# Keys produced by JSONFormatter itself (extras never override them)
+_JSON_OWN_KEYS = frozenset(
+    [
+        "timestamp",
+        "level",
+        "message",
+        "component",
+        "op",
+        "trace_id",
+        "pid",
+        "logger",
+        "exception",
+        "stack",
+    ]
+)
+
+
+def _dumps_stdlib(obj: Dict[str, Any]) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _dumps_orjson(obj: Dict[str, Any]) -> str:
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class StructuredFormatter(logging.Formatter):
     """Base formatter that adds structured fields to log records.
@@ -31,6 +94,9 @@ class StructuredFormatter(logging.Formatter):
         super().__init__(**kwargs)
         self.component = component
         self.pid = os.getpid()
+        # Per-logger derived fields and last formatted second (hot path caches)
+        self._op_cache: Dict[str, str] = {}
+        self._second_cache: Tuple[int, str] = (-1, "")
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with structured fields.
@@ -56,21 +122,57 @@ class StructuredFormatter(logging.Formatter):
 
         """
         # Basic structured fields from LOG-02 (UTC timestamps for structured logging)
-        record.timestamp = datetime.fromtimestamp(
-            record.created, tz=timezone.utc
-        ).isoformat()
+        record.timestamp = self._format_timestamp(record.created)
         record.component = self.component
-        record.trace_id = get_trace_id()
+        # Keep a trace ID captured at emit time (e.g. by the async queue)
+        record.trace_id = getattr(record, "trace_id", None) or get_trace_id()
         record.pid = self.pid
 
-        # Operation context (extracted from logger name)
-        record.op = self._extract_operation(record.name)
+        # Operation context (extracted from logger name, memoized per logger)
+        op = self._op_cache.get(record.name)
+        if op is None:
+            op = self._op_cache[record.name] = self._extract_operation(record.name)
+        record.op = op
 
         # Additional context from record extras
         if hasattr(record, "extra_fields"):
             for key, value in record.extra_fields.items():
                 setattr(record, key, value)
 
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record timestamp as UTC ISO 8601.
+
+        Produces the same string as ``datetime.isoformat()`` while reusing
+        the formatted date and time for records within the same second.
+
+        Args:
+            created: Record creation time (seconds since the epoch)
+
+        Returns:
+            str: ISO 8601 timestamp with ``+00:00`` offset
+
+        """
+        frac, whole = math.modf(created)
+        micros = round(frac * 1e6)
+        if micros >= 1_000_000:
+            whole += 1
+            micros -= 1_000_000
+        elif micros < 0:
+            whole -= 1
+            micros += 1_000_000
+        second = int(whole)
+
+        cached_second, base = self._second_cache
+        if cached_second != second:
+            base = datetime.fromtimestamp(second, tz=timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+            self._second_cache = (second, base)
+
+        if micros:
+            return f"{base}.{micros:06d}+00:00"
+        return f"{base}+00:00"
+
     def _extract_operation(self, logger_name: str) -> str:
         """Extract operation name from logger name.
 
@@ -95,8 +197,40 @@ class JSONFormatter(StructuredFormatter):
 
     Outputs log records as JSON objects with all structured fields.
     Ideal for service mode and log aggregation systems.
+
+    Static fields (component, pid) are serialized once into a prefix, and
+    orjson is used for the per-record part when it is installed.
     """
 
+    def __init__(
+        self,
+        component: str = "sboxmgr",
+        use_orjson: Optional[bool] = None,
+        **kwargs,
+    ):
+        """Initialize JSON formatter.
+
+        Args:
+            component: Component name for structured logging
+            use_orjson: Serialize with orjson (None uses it when available)
+            **kwargs: Additional arguments passed to parent formatter
+
+        Raises:
+            ImportError: If use_orjson is True but orjson is not installed
+
+        """
+        super().__init__(component, **kwargs)
+        if use_orjson is None:
+            use_orjson = orjson is not None
+        elif use_orjson and orjson is None:
+            raise ImportError("orjson is not installed")
+        self._dumps = _dumps_orjson if use_orjson else _dumps_stdlib
+
+        # '{"component":...,"pid":...' - completed with the per-record fields
+        self._static_prefix = self._dumps(
+            {"component": self.component, "pid": self.pid}
+        )[:-1]
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
@@ -110,15 +244,12 @@ class JSONFormatter(StructuredFormatter):
         # Add structured fields
         self._add_structured_fields(record)
 
-        # Build JSON object with structured fields using getattr for safety
         log_obj = {
-            "timestamp": getattr(record, "timestamp", ""),
+            "timestamp": record.timestamp,
             "level": record.levelname,
             "message": record.getMessage(),
-            "component": getattr(record, "component", "unknown"),
-            "op": getattr(record, "op", "unknown"),
-            "trace_id": getattr(record, "trace_id", ""),
-            "pid": getattr(record, "pid", 0),
+            "op": record.op,
+            "trace_id": record.trace_id,
         }
 
         # Add logger name if different from component
@@ -136,41 +267,19 @@ class JSONFormatter(StructuredFormatter):
         # Add extra fields
         for key, value in record.__dict__.items():
             if (
-                key not in log_obj
+                key not in _RESERVED_RECORD_ATTRS
+                and key not in _JSON_OWN_KEYS
                 and not key.startswith("_")
-                and key
-                not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "levelno",
-                    "levelname",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "getMessage",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                    "timestamp",
-                    "component",
-                    "op",
-                    "trace_id",
-                    "pid",
-                ]
             ):
                 log_obj[key] = value
 
-        return json.dumps(log_obj, ensure_ascii=False, separators=(",", ":"))
+        # Fields overridden through extra_fields can't use the static prefix
+        if record.component != self.component or record.pid != self.pid:
+            log_obj["component"] = record.component
+            log_obj["pid"] = record.pid
+            return self._dumps(log_obj)
+
+        return f"{self._static_prefix},{self._dumps(log_obj)[1:]}"
 
 
 class HumanFormatter(StructuredFormatter):
@@ -6,14 +6,16 @@ Provides automatic detection of available logging sinks and creates appropriate
 
 import logging
 import logging.handlers
-import os
+import queue
 import subprocess
 import sys
+import threading
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 
-from ..config.detection import detect_systemd_environment
+from ..config.detection import detect_syslog_environment, probe_environment
+from .trace import get_trace_id
 
 if TYPE_CHECKING:
     from ..config.models import LoggingConfig
@@ -130,22 +132,13 @@ def create_handler(
 def _is_journald_available() -> bool:
     """Check if journald is available and accessible.
 
+    The answer is memoized for the process, see ``probe_environment``.
+
     Returns:
         bool: True if journald is available
 
     """
-    # Check if systemd environment is detected
-    if not detect_systemd_environment():
-        return False
-
-    # Check if systemd-cat is available (indicates journald support)
-    try:
-        result = subprocess.run(
-            ["systemd-cat", "--version"], capture_output=True, timeout=2
-        )
-        return result.returncode == 0
-    except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    return probe_environment().journald
 
 
 def _is_syslog_available() -> bool:
@@ -155,14 +148,7 @@ def _is_syslog_available() -> bool:
         bool: True if syslog is available
 
     """
-    # Check for common syslog socket locations
-    syslog_paths = ["/dev/log", "/var/run/syslog", "/var/run/log"]
-
-    for path in syslog_paths:
-        if os.path.exists(path):
-            return True
-
-    return False
+    return detect_syslog_environment()
 
 
 def _create_journald_handler(
@@ -348,17 +334,177 @@ def _create_file_handler(
     log_file = Path(config.file_path)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create rotating file handler
-    handler = logging.handlers.RotatingFileHandler(
-        filename=str(log_file),
-        maxBytes=config.max_file_size,
-        backupCount=config.backup_count,
-    )
+    # Create rotating file handler (batched when a queue listener drives it)
+    if getattr(config, "async_mode", False):
+        handler = BatchingRotatingFileHandler(
+            filename=str(log_file),
+            maxBytes=config.max_file_size,
+            backupCount=config.backup_count,
+            batch_size=config.file_batch_size,
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            filename=str(log_file),
+            maxBytes=config.max_file_size,
+            backupCount=config.backup_count,
+        )
     handler.setLevel(level or config.level)
 
     return handler
 
 
+class BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that flushes the stream in batches.
+
+    ``StreamHandler.emit`` flushes after every record. This handler only
+    flushes after ``batch_size`` records, on ERROR and above, or when
+    ``flush()`` is called explicitly (the async queue listener does so
+    whenever its queue drains).
+    """
+
+    def __init__(self, *args, batch_size: int = 100, **kwargs):
+        """Initialize batching file handler.
+
+        Args:
+            *args: Positional arguments for RotatingFileHandler
+            batch_size: Number of records written between flushes
+            **kwargs: Keyword arguments for RotatingFileHandler
+
+        """
+        super().__init__(*args, **kwargs)
+        self.batch_size = max(1, batch_size)
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write record to the file, flushing once per batch.
+
+        Args:
+            record: Log record to write
+
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.batch_size or record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        super().flush()
+        self._pending = 0
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking on overflow.
+
+    Formatting is deferred to the listener thread; only the message and the
+    current trace ID are captured on the calling thread. Dropped records
+    are counted per level name.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        """Initialize bounded queue handler.
+
+        Args:
+            log_queue: Bounded queue shared with the listener
+
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.dropped_by_level: Dict[str, int] = {}
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Capture context that is not available on the listener thread.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            logging.LogRecord: Record safe to hand to another thread
+
+        """
+        if not getattr(record, "trace_id", None):
+            record.trace_id = get_trace_id()
+        return super().prepare(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue record without blocking, counting overflow drops.
+
+        Args:
+            record: Prepared log record
+
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+                self.dropped_by_level[record.levelname] = (
+                    self.dropped_by_level.get(record.levelname, 0) + 1
+                )
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue drains.
+
+    Combined with ``BatchingRotatingFileHandler`` this writes records in
+    batches under load while keeping latency low when logging is idle.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Dequeue a record, flushing handlers before waiting on an empty queue.
+
+        Args:
+            block: Whether to block until a record is available
+
+        Returns:
+            logging.LogRecord: Next queued record
+
+        """
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+        return self.queue.get(block)
+
+
+def create_queue_handler(
+    handlers: Sequence[logging.Handler], config: "LoggingConfig"
+) -> Tuple[BoundedQueueHandler, BatchingQueueListener]:
+    """Wrap sink handlers behind a bounded queue and background listener.
+
+    The returned listener is not started. The queue handler level is the
+    lowest level of the wrapped handlers so records no sink wants are not
+    enqueued at all.
+
+    Args:
+        handlers: Sink handlers to drive from the listener thread
+        config: Logging configuration (``queue_size``)
+
+    Returns:
+        Tuple of (queue handler for the logger, listener owning the sinks)
+
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=config.queue_size)
+    queue_handler = BoundedQueueHandler(log_queue)
+    if handlers:
+        queue_handler.setLevel(min(h.level for h in handlers))
+
+    listener = BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    return queue_handler, listener
+
+
 def _add_journald_fields(record: logging.LogRecord) -> bool:
     """Add structured fields for journald.
 
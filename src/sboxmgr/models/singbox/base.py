@@ -1,9 +1,72 @@
 """Base classes for sing-box models with smart export functionality."""
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet
 
 from pydantic import BaseModel
 
+# Protocols that support transport / TLS settings
+_TRANSPORT_SUPPORTED = frozenset(
+    ["vmess", "vless", "trojan", "tuic", "hysteria2", "shadowsocks", "shadowtls"]
+)
+_TLS_SUPPORTED = frozenset(
+    [
+        "vmess",
+        "vless",
+        "trojan",
+        "tuic",
+        "hysteria2",
+        "http",
+        "shadowtls",
+        "anytls",
+        "naive",
+    ]
+)
+
+# Protocol-specific fields to drop on top of transport/TLS support
+_NO_ENDPOINT_FIELDS = frozenset(
+    ["server", "server_port", "tls", "transport", "multiplex"]
+)
+_TYPE_DROPPED_FIELDS: Dict[str, FrozenSet[str]] = {
+    # Block/DNS/group outbounds don't need server, port, etc.
+    "block": _NO_ENDPOINT_FIELDS,
+    "dns": _NO_ENDPOINT_FIELDS,
+    "selector": _NO_ENDPOINT_FIELDS,
+    "urltest": _NO_ENDPOINT_FIELDS,
+    # Direct outbound doesn't need TLS or transport
+    "direct": frozenset(["tls", "transport"]),
+    # Shadowsocks doesn't support transport or TLS
+    "shadowsocks": frozenset(["transport", "tls"]),
+    # Inbounds without transport support
+    "mixed": frozenset(["transport"]),
+    "socks": frozenset(["transport"]),
+    "http": frozenset(["transport"]),
+    "tun": frozenset(["transport"]),
+    "redirect": frozenset(["transport"]),
+    "tproxy": frozenset(["transport"]),
+}
+
+
+@lru_cache(maxsize=None)
+def unsupported_fields(protocol_type: str) -> FrozenSet[str]:
+    """Get the fields ``smart_dump`` removes for a protocol type.
+
+    Computed once per type and cached.
+
+    Args:
+        protocol_type: Protocol type string
+
+    Returns:
+        Names of fields not supported by the protocol
+
+    """
+    fields = set(_TYPE_DROPPED_FIELDS.get(protocol_type, ()))
+    if protocol_type not in _TRANSPORT_SUPPORTED:
+        fields.add("transport")
+    if protocol_type not in _TLS_SUPPORTED:
+        fields.add("tls")
+    return frozenset(fields)
+
 
 class SingBoxModelBase(BaseModel):
     """Base class for sing-box models with smart export functionality."""
@@ -26,7 +89,11 @@ class SingBoxModelBase(BaseModel):
             Dictionary representation suitable for sing-box configuration
 
         """
-        data = self.model_dump(exclude_unset=exclude_unset, exclude_none=exclude_none)
+        # Call the compiled per-class serializer directly; model_dump adds
+        # argument handling overhead that shows up on large exports
+        data = self.__pydantic_serializer__.to_python(
+            self, exclude_unset=exclude_unset, exclude_none=exclude_none
+        )
 
         # Get the type field to determine protocol-specific cleanup
         protocol_type = data.get("type")
@@ -48,91 +115,7 @@ class SingBoxModelBase(BaseModel):
             Cleaned data dictionary
 
         """
-        # Define which protocols support transport
-        transport_supported = {
-            "vmess",
-            "vless",
-            "trojan",
-            "tuic",
-            "hysteria2",
-            "shadowsocks",
-            "shadowtls",
-        }
-
-        # Define which protocols support TLS
-        tls_supported = {
-            "vmess",
-            "vless",
-            "trojan",
-            "tuic",
-            "hysteria2",
-            "http",
-            "shadowtls",
-            "anytls",
-            "naive",
-        }
-
-        # Remove transport if not supported
-        if protocol_type not in transport_supported and "transport" in data:
-            data.pop("transport", None)
-
-        # Remove TLS if not supported
-        if protocol_type not in tls_supported and "tls" in data:
-            data.pop("tls", None)
-
-        # Protocol-specific cleanup
-        if protocol_type == "block":
-            # Block outbound doesn't need server, port, etc.
-            for field in ["server", "server_port", "tls", "transport", "multiplex"]:
-                data.pop(field, None)
-
-        elif protocol_type == "direct":
-            # Direct outbound doesn't need TLS or transport
-            for field in ["tls", "transport"]:
-                data.pop(field, None)
-
-        elif protocol_type == "dns":
-            # DNS outbound doesn't need most fields
-            for field in ["server", "server_port", "tls", "transport", "multiplex"]:
-                data.pop(field, None)
-
-        elif protocol_type == "selector":
-            # Selector outbound doesn't need most fields
-            for field in ["server", "server_port", "tls", "transport", "multiplex"]:
-                data.pop(field, None)
-
-        elif protocol_type == "urltest":
-            # URLTest outbound doesn't need most fields
-            for field in ["server", "server_port", "tls", "transport", "multiplex"]:
-                data.pop(field, None)
-
-        elif protocol_type == "mixed":
-            # Mixed inbound doesn't support transport
-            data.pop("transport", None)
-
-        elif protocol_type == "socks":
-            # SOCKS inbound doesn't support transport
-            data.pop("transport", None)
-
-        elif protocol_type == "http":
-            # HTTP inbound doesn't support transport
-            data.pop("transport", None)
-
-        elif protocol_type == "shadowsocks":
-            # Shadowsocks doesn't support transport or TLS
-            for field in ["transport", "tls"]:
-                data.pop(field, None)
-
-        elif protocol_type == "tun":
-            # TUN inbound doesn't support transport
-            data.pop("transport", None)
-
-        elif protocol_type == "redirect":
-            # Redirect inbound doesn't support transport
-            data.pop("transport", None)
-
-        elif protocol_type == "tproxy":
-            # TProxy inbound doesn't support transport
-            data.pop("transport", None)
-
+        for field in unsupported_fields(protocol_type):
+            if field in data:
+                del data[field]
         return data
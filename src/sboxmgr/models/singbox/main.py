@@ -74,16 +74,21 @@ class SingBoxConfig(BaseModel):
     def check_outbounds(cls, v):
         """Validate outbounds configuration."""
         if v:
-            # Check unique tags
-            tags = [o.tag for o in v if o.tag]
-            if len(tags) != len(set(tags)):
-                raise ValueError("Duplicate outbound tags found")
-
-            # Check unique server/port combinations
-            servers = [
-                (o.server, o.server_port) for o in v if o.server and o.server_port
-            ]
-            if len(servers) != len(set(servers)):
+            # Check unique tags and server/port combinations in one pass
+            tags = set()
+            servers = set()
+            duplicate_server = False
+            for outbound in v:
+                tag = outbound.tag
+                if tag:
+                    if tag in tags:
+                        raise ValueError("Duplicate outbound tags found")
+                    tags.add(tag)
+                if outbound.server and outbound.server_port:
+                    endpoint = (outbound.server, outbound.server_port)
+                    duplicate_server = duplicate_server or endpoint in servers
+                    servers.add(endpoint)
+            if duplicate_server:
                 raise ValueError("Duplicate server/port found")
         return v
 
@@ -11,6 +11,7 @@ from .base import (
     PolicyResult,
     PolicySeverity,
 )
+from .cache import PolicyDecisionCache
 from .engine import PolicyEngine
 
 # Global policy registry for easy access
@@ -50,6 +51,7 @@ __all__ = [
     "PolicySeverity",
     "PolicyEvaluationResult",
     "PolicyEngine",
+    "PolicyDecisionCache",
     "policy_registry",
     "IntegrityPolicy",
     "PermissionPolicy",
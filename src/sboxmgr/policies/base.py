@@ -5,10 +5,10 @@ PolicyContext, PolicyResult, and BasePolicy classes.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
 
 
 class PolicySeverity(Enum):
@@ -252,34 +252,47 @@ class PolicyContext:
             Server identifier (address, name, or string representation)
 
         """
-        if not self.server:
-            return "unknown"
+        return server_identifier(self.server)
 
-        # Handle dictionary objects
-        if isinstance(self.server, dict):
-            if "address" in self.server:
-                return str(self.server["address"])
-            if "name" in self.server:
-                return str(self.server["name"])
-            if "tag" in self.server:
-                return str(self.server["tag"])
-            return str(self.server)
 
-        # Handle object attributes
-        address = getattr(self.server, "address", None)
-        if address is not None:
-            return str(address)
+def server_identifier(server: Any) -> str:
+    """Get a consistent identifier for a server.
 
-        name = getattr(self.server, "name", None)
-        if name is not None:
-            return str(name)
+    Args:
+        server: Server object or dictionary
 
-        tag = getattr(self.server, "tag", None)
-        if tag is not None:
-            return str(tag)
+    Returns:
+        Server identifier (address, name, tag, or string representation)
 
-        # Fallback to string representation
-        return str(self.server)
+    """
+    if not server:
+        return "unknown"
+
+    # Handle dictionary objects
+    if isinstance(server, dict):
+        if "address" in server:
+            return str(server["address"])
+        if "name" in server:
+            return str(server["name"])
+        if "tag" in server:
+            return str(server["tag"])
+        return str(server)
+
+    # Handle object attributes
+    address = getattr(server, "address", None)
+    if address is not None:
+        return str(address)
+
+    name = getattr(server, "name", None)
+    if name is not None:
+        return str(name)
+
+    tag = getattr(server, "tag", None)
+    if tag is not None:
+        return str(tag)
+
+    # Fallback to string representation
+    return str(server)
 
 
 class BasePolicy(ABC):
@@ -293,6 +306,8 @@ class BasePolicy(ABC):
         description: Description of what the policy does
         enabled: Whether the policy is currently enabled
         group: Group/category of the policy (e.g., 'profile', 'geo', 'security')
+        cacheable: Whether decisions depend only on the server and the policy
+            configuration, so they may be served from a PolicyDecisionCache
 
     """
 
@@ -300,6 +315,7 @@ class BasePolicy(ABC):
     description: str = "Base policy class"
     enabled: bool = True
     group: str = "default"
+    cacheable: bool = False
 
     def __init__(self):
         """Initialize the policy with automatic name detection."""
@@ -363,6 +379,67 @@ class BasePolicy(ABC):
         """
         raise NotImplementedError
 
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyResult]:
+        """Evaluate the policy against many servers in one call.
+
+        The default implementation calls ``evaluate`` once per server with a
+        copy of ``context`` pointing at that server. Policies whose decision
+        depends on a single server attribute override this to decide each
+        distinct value once (see ``_evaluate_batch_by_value``).
+
+        Results may be shared between servers with identical decisions and
+        must be treated as read-only.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (profile, user, env); its ``server`` is
+                replaced for every evaluated server
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        base = context if context is not None else PolicyContext()
+        return [self.evaluate(replace(base, server=server)) for server in servers]
+
+    def _evaluate_batch_by_value(
+        self,
+        servers: Sequence[Any],
+        extract: Callable[[Any], Hashable],
+        decide: Callable[[Hashable], PolicyResult],
+    ) -> List[PolicyResult]:
+        """Evaluate servers by deciding each distinct extracted value once.
+
+        Args:
+            servers: Servers to evaluate
+            extract: Extracts the decision input from a server
+            decide: Builds the result for an extracted value
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        no_server: Optional[PolicyResult] = None
+        decisions: Dict[Hashable, PolicyResult] = {}
+        results: List[PolicyResult] = []
+
+        for server in servers:
+            if not server:
+                if no_server is None:
+                    no_server = PolicyResult.allow("No server to check")
+                results.append(no_server)
+                continue
+
+            value = extract(server)
+            result = decisions.get(value)
+            if result is None:
+                result = decisions[value] = decide(value)
+            results.append(result)
+
+        return results
+
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate policy configuration.
 
@@ -0,0 +1,315 @@
+"""Persistent cache of policy decisions.
+
+Server-pure policies (``BasePolicy.cacheable``) are deterministic functions
+of server attributes and policy configuration. ``PolicyDecisionCache`` stores
+their results keyed by a stable server fingerprint and a hash of the policy
+configuration, so servers that did not change between runs skip evaluation
+and their ``PolicyResult`` is rebuilt from the cache.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..utils.env import get_cache_dir
+from ..utils.file import atomic_write_json
+from ..utils.id import fingerprint_server
+from .base import BasePolicy, PolicyResult, PolicySeverity
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+# Policy attributes that do not influence decisions
+_NON_CONFIG_ATTRS = frozenset(["enabled"])
+
+
+def _stable_json(value: Any) -> str:
+    """Serialize a value deterministically for hashing."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_encode)
+
+
+def _encode(value: Any) -> Any:
+    """Encode values json does not support natively."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return repr(value)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def policy_config_hash(policy: BasePolicy) -> str:
+    """Hash the configuration of a policy.
+
+    Covers the policy class and all public instance attributes except
+    ``enabled``, so any configuration change yields a new hash.
+
+    Args:
+        policy: Policy to hash
+
+    Returns:
+        Hex digest identifying the policy configuration
+
+    """
+    config = {
+        key: value
+        for key, value in vars(policy).items()
+        if not key.startswith("_") and key not in _NON_CONFIG_ATTRS
+    }
+    cls = type(policy)
+    return _digest(f"{cls.__module__}.{cls.__qualname__}:{_stable_json(config)}")
+
+
+def server_fingerprint(server: Any) -> str:
+    """Compute a stable fingerprint of all server attributes.
+
+    Args:
+        server: ParsedServer, dictionary, or other server object
+
+    Returns:
+        Hex digest that changes whenever any server attribute changes
+
+    """
+    return fingerprint_server(server, fields=None)
+
+
+# In-memory entry: (result, last seen unix time)
+_Entry = Tuple[PolicyResult, int]
+
+
+class PolicyDecisionCache:
+    """Policy decision cache persisted as a JSON file.
+
+    Entries are grouped per ``(policy name, config hash)``. Identical
+    results are stored once per policy on disk and shared in memory.
+    Entries not seen for ``ttl`` seconds are pruned on save. A hit only
+    refreshes an entry's last-seen time once it is older than a quarter of
+    ``ttl``, so runs that only hit the cache do not rewrite the file.
+
+    Example:
+        >>> cache = PolicyDecisionCache()
+        >>> engine = PolicyEngine(decision_cache=cache)
+        >>> engine.evaluate_batch(servers)  # misses evaluated, hits rebuilt
+
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: int = 7 * 24 * 3600,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Cache file path (default: ``<cache dir>/policy_decisions.json``);
+                pass an empty string to keep the cache in memory only
+            ttl: Seconds an unseen entry survives before being pruned
+
+        """
+        if path is None:
+            path = get_cache_dir() / "policy_decisions.json"
+        self.path: Optional[Path] = Path(path) if path else None
+        self.ttl = ttl
+        # Hits newer than this keep their last-seen time (no rewrite needed)
+        self.touch_interval = max(1, ttl // 4)
+        self._entries: Dict[Tuple[str, str], Dict[str, _Entry]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def policy_key(policy: BasePolicy) -> Tuple[str, str]:
+        """Build the cache key of a policy.
+
+        Args:
+            policy: Policy to key
+
+        Returns:
+            Tuple of (policy name, configuration hash)
+
+        """
+        return policy.name, policy_config_hash(policy)
+
+    def get_many(
+        self, policy_key: Tuple[str, str], fingerprints: List[str]
+    ) -> List[Optional[PolicyResult]]:
+        """Look up cached results for many servers.
+
+        Args:
+            policy_key: Key from ``policy_key``
+            fingerprints: Server fingerprints
+
+        Returns:
+            Cached result or None per fingerprint
+
+        """
+        now = int(time.time())
+        stale = now - self.touch_interval
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._entries.get(policy_key)
+            if not entries:
+                return [None] * len(fingerprints)
+
+            results: List[Optional[PolicyResult]] = []
+            for fingerprint in fingerprints:
+                entry = entries.get(fingerprint)
+                if entry is None:
+                    results.append(None)
+                    continue
+                if entry[1] < stale:
+                    entries[fingerprint] = (entry[0], now)
+                    self._dirty = True
+                results.append(entry[0])
+            return results
+
+    def put_many(
+        self,
+        policy_key: Tuple[str, str],
+        fingerprints: List[str],
+        results: List[PolicyResult],
+    ) -> None:
+        """Store results for many servers.
+
+        Args:
+            policy_key: Key from ``policy_key``
+            fingerprints: Server fingerprints
+            results: Results in the same order as ``fingerprints``
+
+        """
+        now = int(time.time())
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._entries.setdefault(policy_key, {})
+            for fingerprint, result in zip(fingerprints, results):
+                entries[fingerprint] = (result, now)
+            self._dirty = True
+
+    def invalidate_policy(self, name: str) -> None:
+        """Drop all entries of a policy, for every configuration.
+
+        Args:
+            name: Policy name
+
+        """
+        with self._lock:
+            self._ensure_loaded()
+            for key in [k for k in self._entries if k[0] == name]:
+                del self._entries[key]
+                self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Persist the cache if it changed since the last save."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def save(self) -> None:
+        """Prune expired entries and write the cache file atomically."""
+        with self._lock:
+            self._ensure_loaded()
+            self._prune()
+            self._dirty = False
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_json(self._serialize(), str(self.path))
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Failed to save policy decision cache: {e}")
+
+    def _ensure_loaded(self) -> None:
+        """Load the cache file on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = self._deserialize(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable policy decision cache: {e}")
+            self._entries = {}
+
+    def _prune(self) -> None:
+        """Remove entries not seen within ``ttl``."""
+        cutoff = int(time.time()) - self.ttl
+        for key in list(self._entries):
+            entries = self._entries[key]
+            expired = [fp for fp, entry in entries.items() if entry[1] < cutoff]
+            for fingerprint in expired:
+                del entries[fingerprint]
+            if not entries:
+                del self._entries[key]
+
+    def _serialize(self) -> Dict[str, Any]:
+        """Convert entries into the on-disk format."""
+        policies = []
+        for (name, config_hash), entries in self._entries.items():
+            table: List[list] = []
+            index: Dict[int, int] = {}
+            servers = {}
+            for fingerprint, (result, seen) in entries.items():
+                position = index.get(id(result))
+                if position is None:
+                    position = index[id(result)] = len(table)
+                    table.append(
+                        [
+                            result.allowed,
+                            result.reason,
+                            result.severity.value,
+                            json.loads(_stable_json(result.metadata)),
+                        ]
+                    )
+                servers[fingerprint] = [position, seen]
+            policies.append(
+                {
+                    "name": name,
+                    "config_hash": config_hash,
+                    "results": table,
+                    "servers": servers,
+                }
+            )
+        return {"version": CACHE_FORMAT_VERSION, "policies": policies}
+
+    @staticmethod
+    def _deserialize(
+        data: Dict[str, Any],
+    ) -> Dict[Tuple[str, str], Dict[str, _Entry]]:
+        """Rebuild entries from the on-disk format."""
+        if data.get("version") != CACHE_FORMAT_VERSION:
+            return {}
+
+        entries: Dict[Tuple[str, str], Dict[str, _Entry]] = {}
+        for policy in data.get("policies", []):
+            results = [
+                PolicyResult(
+                    allowed=allowed,
+                    reason=reason,
+                    metadata=metadata,
+                    policy_name=policy["name"],
+                    severity=PolicySeverity(severity),
+                )
+                for allowed, reason, severity, metadata in policy["results"]
+            ]
+            entries[(policy["name"], policy["config_hash"])] = {
+                fingerprint: (results[position], seen)
+                for fingerprint, (position, seen) in policy["servers"].items()
+            }
+        return entries
@@ -5,9 +5,18 @@ a collection of policies against given contexts.
 """
 
 import logging
-from typing import List
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from .base import BasePolicy, PolicyContext, PolicyEvaluationResult, PolicyResult
+from .base import (
+    BasePolicy,
+    PolicyContext,
+    PolicyEvaluationResult,
+    PolicyResult,
+    server_identifier,
+)
+from .cache import PolicyDecisionCache, server_fingerprint
 
 
 class PolicyEngine:
@@ -19,13 +28,22 @@ class PolicyEngine:
     Attributes:
         policies: List of registered policies
         logger: Logger for policy evaluation events
+        decision_cache: Optional cache for decisions of cacheable policies
 
     """
 
-    def __init__(self):
-        """Initialize the policy engine."""
+    def __init__(self, decision_cache: Optional[PolicyDecisionCache] = None):
+        """Initialize the policy engine.
+
+        Args:
+            decision_cache: Cache used by ``evaluate_batch`` for policies
+                marked ``cacheable``
+
+        """
         self.policies: List[BasePolicy] = []
         self.logger = logging.getLogger(__name__)
+        self.decision_cache = decision_cache
+        self.last_batch_timings: Dict[str, float] = {}
 
     def register(self, policy: BasePolicy) -> None:
         """Register a policy with the engine.
@@ -49,6 +67,7 @@ class PolicyEngine:
         for p in self.policies:
             if p.name == name:
                 p.enabled = True
+                self._invalidate_cached(name)
                 return True
         return False
 
@@ -64,6 +83,7 @@ class PolicyEngine:
         for p in self.policies:
             if p.name == name:
                 p.enabled = False
+                self._invalidate_cached(name)
                 return True
         return False
 
@@ -151,6 +171,181 @@ class PolicyEngine:
 
         return evaluation_result
 
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyEvaluationResult]:
+        """Evaluate all enabled policies against a list of servers.
+
+        Each policy sees the whole server list once through
+        ``BasePolicy.evaluate_batch``. A policy whose batch evaluation fails
+        is re-run per server so only the offending servers get fail-secure
+        denials, as in ``evaluate_all``. With a ``decision_cache``, cacheable
+        policies only evaluate servers whose fingerprint is not cached.
+        Per-policy wall time is stored in ``last_batch_timings``. Only
+        summary lines are logged.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (profile, user, env) for all servers
+
+        Returns:
+            One PolicyEvaluationResult per server, in input order
+
+        """
+        servers = list(servers)
+        evaluations = [
+            PolicyEvaluationResult(server_identifier=server_identifier(server))
+            for server in servers
+        ]
+        timings: Dict[str, float] = {}
+        fingerprints: Optional[List[str]] = None
+        cache_hits = 0
+
+        for policy in self.policies:
+            if not policy.enabled:
+                continue
+
+            policy_name = getattr(policy, "name", policy.__class__.__name__)
+            start = time.perf_counter()
+            if self.decision_cache is not None and policy.cacheable and servers:
+                if fingerprints is None:
+                    fingerprints = [server_fingerprint(server) for server in servers]
+                results, hits = self._evaluate_cached(
+                    policy, servers, fingerprints, context
+                )
+                cache_hits += hits
+            else:
+                results = self._evaluate_policy_batch(policy, servers, context)
+
+            for evaluation, result in zip(evaluations, results):
+                result.policy_name = policy_name
+                evaluation.results.append(result)
+            timings[policy_name] = time.perf_counter() - start
+
+        if self.decision_cache is not None:
+            self.decision_cache.flush()
+
+        self.last_batch_timings = timings
+        denied = sum(1 for evaluation in evaluations if evaluation.has_denials)
+        self.logger.debug(
+            f"Evaluated {len(servers)} servers against {len(timings)} policies: "
+            f"{denied} denied, {cache_hits} cached decisions"
+        )
+        return evaluations
+
+    def _evaluate_policy_batch(
+        self,
+        policy: BasePolicy,
+        servers: Sequence[Any],
+        context: Optional[PolicyContext],
+    ) -> List[PolicyResult]:
+        """Evaluate a policy in batch, falling back to per-server evaluation.
+
+        Args:
+            policy: Policy to evaluate
+            servers: Servers to evaluate
+            context: Shared context for all servers
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        try:
+            results = policy.evaluate_batch(servers, context)
+            if len(results) != len(servers):
+                raise ValueError(
+                    f"returned {len(results)} results for {len(servers)} servers"
+                )
+            return results
+        except Exception as e:
+            policy_name = getattr(policy, "name", policy.__class__.__name__)
+            self.logger.error(f"Policy {policy_name} batch evaluation failed: {e}")
+            return self._evaluate_each(policy, servers, context)
+
+    def _evaluate_cached(
+        self,
+        policy: BasePolicy,
+        servers: List[Any],
+        fingerprints: List[str],
+        context: Optional[PolicyContext],
+    ) -> Tuple[List[PolicyResult], int]:
+        """Evaluate a cacheable policy, serving known servers from the cache.
+
+        Fail-secure error results are never cached.
+
+        Args:
+            policy: Cacheable policy to evaluate
+            servers: Servers to evaluate
+            fingerprints: Fingerprint of each server
+            context: Shared context for all servers
+
+        Returns:
+            Tuple of (one PolicyResult per server, number of cache hits)
+
+        """
+        cache = self.decision_cache
+        key = cache.policy_key(policy)
+        results = cache.get_many(key, fingerprints)
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results, len(servers)
+
+        fresh = self._evaluate_policy_batch(
+            policy, [servers[i] for i in misses], context
+        )
+        store_fingerprints = []
+        store_results = []
+        for i, result in zip(misses, fresh):
+            results[i] = result
+            if result.metadata.get("error_type") != "policy_exception":
+                store_fingerprints.append(fingerprints[i])
+                store_results.append(result)
+        cache.put_many(key, store_fingerprints, store_results)
+        return results, len(servers) - len(misses)
+
+    def _invalidate_cached(self, name: str) -> None:
+        """Drop cached decisions of a policy after its state changed.
+
+        Args:
+            name: Policy name
+
+        """
+        if self.decision_cache is not None:
+            self.decision_cache.invalidate_policy(name)
+
+    def _evaluate_each(
+        self,
+        policy: BasePolicy,
+        servers: Sequence[Any],
+        context: Optional[PolicyContext],
+    ) -> List[PolicyResult]:
+        """Evaluate a policy server by server with fail-secure error handling.
+
+        Args:
+            policy: Policy to evaluate
+            servers: Servers to evaluate
+            context: Shared context for all servers
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        policy_name = getattr(policy, "name", policy.__class__.__name__)
+        base = context if context is not None else PolicyContext()
+        results = []
+        for server in servers:
+            try:
+                results.append(policy.evaluate(replace(base, server=server)))
+            except Exception as e:
+                results.append(
+                    PolicyResult.deny(
+                        f"Policy evaluation error: {e}",
+                        error_type="policy_exception",
+                        policy_name=policy_name,
+                    )
+                )
+        return results
+
     def get_policies(
         self, group: str = None, enabled_only: bool = True
     ) -> List[BasePolicy]:
@@ -4,7 +4,7 @@ This module provides policies for geographic restrictions including
 country-based and ASN-based filtering.
 """
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 from .base import BasePolicy, PolicyContext, PolicyResult
 from .utils import extract_metadata_field, validate_mode
@@ -20,6 +20,7 @@ class CountryPolicy(BasePolicy):
     name = "CountryPolicy"
     description = "Restricts servers by country code"
     group = "geo"
+    cacheable = True
 
     def __init__(
         self,
@@ -59,8 +60,35 @@ class CountryPolicy(BasePolicy):
         if not server:
             return PolicyResult.allow("No server to check")
 
-        # Extract country from server
-        country = self._extract_country(server)
+        return self._decide(self._extract_country(server))
+
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyResult]:
+        """Evaluate country restrictions for many servers, once per country.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (unused, country depends on server only)
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        return self._evaluate_batch_by_value(
+            servers, self._extract_country, self._decide
+        )
+
+    def _decide(self, country: Optional[str]) -> PolicyResult:
+        """Build the result for an extracted country code.
+
+        Args:
+            country: Upper-case country code or None
+
+        Returns:
+            PolicyResult for the country
+
+        """
         if not country:
             return PolicyResult.allow("No country information available")
 
@@ -108,6 +136,7 @@ class ASNPolicy(BasePolicy):
     name = "ASNPolicy"
     description = "Restricts servers by ASN"
     group = "geo"
+    cacheable = True
 
     def __init__(
         self,
@@ -147,8 +176,33 @@ class ASNPolicy(BasePolicy):
         if not server:
             return PolicyResult.allow("No server to check")
 
-        # Extract ASN from server
-        asn = self._extract_asn(server)
+        return self._decide(self._extract_asn(server))
+
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyResult]:
+        """Evaluate ASN restrictions for many servers, once per ASN.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (unused, ASN depends on server only)
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        return self._evaluate_batch_by_value(servers, self._extract_asn, self._decide)
+
+    def _decide(self, asn: Optional[int]) -> PolicyResult:
+        """Build the result for an extracted ASN.
+
+        Args:
+            asn: ASN number or None
+
+        Returns:
+            PolicyResult for the ASN
+
+        """
         if not asn:
             return PolicyResult.allow("No ASN information available")
 
@@ -4,7 +4,7 @@ This module provides policies for security validation including
 protocol security, encryption requirements, and authentication checks.
 """
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from .base import BasePolicy, PolicyContext, PolicyResult
 from .utils import extract_metadata_field, validate_mode
@@ -20,6 +20,7 @@ class ProtocolPolicy(BasePolicy):
     name = "ProtocolPolicy"
     description = "Validates protocol security"
     group = "security"
+    cacheable = True
 
     def __init__(
         self,
@@ -69,8 +70,35 @@ class ProtocolPolicy(BasePolicy):
         if not server:
             return PolicyResult.allow("No server to check")
 
-        # Extract protocol from server
-        protocol = self._extract_protocol(server)
+        return self._decide(self._extract_protocol(server))
+
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyResult]:
+        """Evaluate protocol security for many servers, once per protocol.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (unused, protocol depends on server only)
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        return self._evaluate_batch_by_value(
+            servers, self._extract_protocol, self._decide
+        )
+
+    def _decide(self, protocol: Optional[str]) -> PolicyResult:
+        """Build the result for an extracted protocol.
+
+        Args:
+            protocol: Normalized protocol name or None
+
+        Returns:
+            PolicyResult for the protocol
+
+        """
         if not protocol:
             return PolicyResult.allow("No protocol information available")
 
@@ -118,6 +146,7 @@ class EncryptionPolicy(BasePolicy):
     name = "EncryptionPolicy"
     description = "Validates encryption strength"
     group = "security"
+    cacheable = True
 
     def __init__(
         self,
@@ -172,9 +201,35 @@ class EncryptionPolicy(BasePolicy):
         if not server:
             return PolicyResult.allow("No server to check")
 
-        # Extract encryption method from server
-        encryption = self._extract_encryption(server)
+        return self._decide(self._extract_encryption(server))
+
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyResult]:
+        """Evaluate encryption for many servers, once per encryption method.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (unused, encryption depends on server only)
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        return self._evaluate_batch_by_value(
+            servers, self._extract_encryption, self._decide
+        )
+
+    def _decide(self, encryption: Optional[str]) -> PolicyResult:
+        """Build the result for an extracted encryption method.
+
+        Args:
+            encryption: Normalized encryption method or None
+
+        Returns:
+            PolicyResult for the encryption method
 
+        """
         if not encryption:
             if self.require_encryption:
                 return PolicyResult.deny("Encryption is required but not specified")
@@ -238,6 +293,7 @@ class AuthenticationPolicy(BasePolicy):
     name = "AuthenticationPolicy"
     description = "Validates authentication methods"
     group = "security"
+    cacheable = True
 
     def __init__(
         self,
@@ -275,11 +331,54 @@ class AuthenticationPolicy(BasePolicy):
         if not server:
             return PolicyResult.allow("No server to check")
 
-        # Extract authentication info from server
-        auth_method = self._extract_auth_method(server)
-        auth_credentials = self._extract_auth_credentials(server)
+        return self._decide(self._auth_signature(server))
+
+    def evaluate_batch(
+        self, servers: Sequence[Any], context: Optional[PolicyContext] = None
+    ) -> List[PolicyResult]:
+        """Evaluate authentication for many servers, once per signature.
+
+        Decisions only depend on the auth method and credential length, so
+        servers sharing both reuse one result.
+
+        Args:
+            servers: Servers to evaluate
+            context: Shared context (unused, auth depends on server only)
+
+        Returns:
+            One PolicyResult per server, in input order
+
+        """
+        return self._evaluate_batch_by_value(
+            servers, self._auth_signature, self._decide
+        )
+
+    def _auth_signature(self, server: Any) -> Tuple[Optional[str], int]:
+        """Extract the decision inputs (method, credential length) from a server.
+
+        Args:
+            server: Server object to inspect
+
+        Returns:
+            Tuple of auth method (or None) and credential length (0 if none)
+
+        """
+        credentials = self._extract_auth_credentials(server)
+        return self._extract_auth_method(server), len(credentials or "")
+
+    def _decide(self, signature: Tuple[Optional[str], int]) -> PolicyResult:
+        """Build the result for an authentication signature.
+
+        Args:
+            signature: Auth method and credential length
+
+        Returns:
+            PolicyResult for the signature
+
+        """
+        auth_method, credential_length = signature
 
-        if not auth_method and not auth_credentials:
+        if not auth_method and not credential_length:
             if self.required_auth:
                 return PolicyResult.deny("Authentication is required but not specified")
             return PolicyResult.allow("No authentication specified (not required)")
@@ -294,11 +393,11 @@ class AuthenticationPolicy(BasePolicy):
                 )
 
         # Check credentials strength
-        if auth_credentials:
-            if len(auth_credentials) < self.min_password_length:
+        if credential_length:
+            if credential_length < self.min_password_length:
                 return PolicyResult.deny(
-                    f"Credentials too short: {len(auth_credentials)} < {self.min_password_length}",
-                    credential_length=len(auth_credentials),
+                    f"Credentials too short: {credential_length} < {self.min_password_length}",
+                    credential_length=credential_length,
                     min_length=self.min_password_length,
                 )
 
@@ -26,47 +26,53 @@ def extract_metadata_field(
     if not obj:
         return None
 
+    # Resolve accessors once; attribute lookups on models are not free
+    getter = getattr(obj, "get", None)
+    if not callable(getter):
+        getter = None
+    meta = getattr(obj, "meta", None)
+    if not isinstance(meta, dict):
+        meta = None
+
     # Try direct attribute access
-    if hasattr(obj, field_name):
-        value = getattr(obj, field_name)
-        if value is not None:
-            return value
+    value = getattr(obj, field_name, None)
+    if value is not None:
+        return value
 
     # Try dictionary access (only if object has get method)
-    if hasattr(obj, "get") and callable(getattr(obj, "get")):
-        value = obj.get(field_name)
+    if getter is not None:
+        value = getter(field_name)
         if value is not None:
             return value
 
         # Try metadata (only if object has get method)
-        metadata = obj.get("meta", {})
+        metadata = getter("meta", {})
         if isinstance(metadata, dict):
             value = metadata.get(field_name)
             if value is not None:
                 return value
 
     # Try metadata access for Pydantic models
-    if hasattr(obj, "meta") and isinstance(obj.meta, dict):
-        value = obj.meta.get(field_name)
+    if meta is not None:
+        value = meta.get(field_name)
         if value is not None:
             return value
 
     # Try fallback fields
     if fallback_fields:
         for fallback_field in fallback_fields:
-            if hasattr(obj, fallback_field):
-                value = getattr(obj, fallback_field)
-                if value is not None:
-                    return value
+            value = getattr(obj, fallback_field, None)
+            if value is not None:
+                return value
 
-            if hasattr(obj, "get") and callable(getattr(obj, "get")):
-                value = obj.get(fallback_field)
+            if getter is not None:
+                value = getter(fallback_field)
                 if value is not None:
                     return value
 
             # Try fallback fields in metadata for Pydantic models
-            if hasattr(obj, "meta") and isinstance(obj.meta, dict):
-                value = obj.meta.get(fallback_field)
+            if meta is not None:
+                value = meta.get(fallback_field)
                 if value is not None:
                     return value
 
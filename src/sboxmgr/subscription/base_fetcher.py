@@ -7,7 +7,7 @@ themselves using the @register decorator for automatic discovery.
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Mapping, Tuple
 from urllib.parse import urlparse
 
 from sboxmgr.utils.env import get_fetch_size_limit
@@ -77,6 +77,7 @@ class BaseFetcher(ABC):
         source: The subscription source configuration.
         auth_handler: Optional authentication handler.
         header_plugins: List of header processing plugins.
+        response_headers: Headers of the last HTTP response.
 
     """
 
@@ -96,6 +97,8 @@ class BaseFetcher(ABC):
         self.source = source
         self.auth_handler: BaseAuthHandler | None = None
         self.header_plugins: list[BaseHeaderPlugin] = []
+        # Headers of the last HTTP response (Retry-After, Cache-Control, ...)
+        self.response_headers: Mapping[str, str] = {}
         self.validate_url_scheme(self.source.url)
 
     @classmethod
@@ -6,11 +6,28 @@ configuration structure, proxy groups, and routing rules for seamless
 integration with Clash clients.
 """
 
-from typing import Any, Dict, List
+import io
+import json
+import re
+from typing import Any, Dict, List, Optional, TextIO
+
+import yaml
 
 from ..base_exporter import BaseExporter
 from ..models import ParsedServer
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+# Top-level sections emitted one flow mapping per line by dump_clash_yaml
+CLASH_STREAMED_KEYS = ("proxies", "proxy-groups")
+
+# Characters YAML treats as line breaks or does not allow unescaped
+_YAML_UNSAFE = re.compile("[\\x7f-\\x9f\\u2028\\u2029\\ufeff]")
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
 
 def clash_export(
     servers: List[ParsedServer], routes: List[Dict[str, Any]] = None
@@ -38,19 +55,23 @@ def clash_export(
         "rules": [],
     }
 
-    # Convert servers to Clash proxy format
+    # Convert servers to Clash proxy format, collecting group members in the
+    # same pass
+    proxies = config["proxies"]
+    proxy_names = []
     for server in servers:
         proxy = _convert_server_to_clash_proxy(server)
         if proxy:
-            config["proxies"].append(proxy)
+            proxies.append(proxy)
+            proxy_names.append(proxy["name"])
 
     # Add default proxy group
-    if config["proxies"]:
+    if proxy_names:
         config["proxy-groups"].append(
             {
                 "name": "Proxy",
                 "type": "select",
-                "proxies": [proxy["name"] for proxy in config["proxies"]],
+                "proxies": proxy_names,
             }
         )
 
@@ -66,6 +87,54 @@ def clash_export(
     return config
 
 
+def dump_clash_yaml(
+    config: Dict[str, Any], stream: Optional[TextIO] = None
+) -> Optional[str]:
+    """Serialize a Clash configuration to YAML.
+
+    The ``proxies`` and ``proxy-groups`` sections are written one item per
+    line as JSON flow mappings, which are valid YAML and produced by the C
+    JSON encoder, so large feeds avoid PyYAML's per-node emitter. Other
+    sections are dumped by PyYAML, using libyaml when available.
+
+    Args:
+        config: Clash configuration, e.g. from ``clash_export``.
+        stream: Optional text stream to write to.
+
+    Returns:
+        YAML document, or None when written to ``stream``.
+
+    """
+    out = io.StringIO() if stream is None else stream
+    for key, value in config.items():
+        if key in CLASH_STREAMED_KEYS and isinstance(value, list):
+            if not value:
+                out.write(f"{key}: []\n")
+                continue
+            out.write(f"{key}:\n")
+            out.writelines([f"- {_flow_item(item)}\n" for item in value])
+        else:
+            out.write(
+                yaml.dump(
+                    {key: value},
+                    Dumper=_YamlDumper,
+                    allow_unicode=True,
+                    sort_keys=False,
+                    default_flow_style=False,
+                )
+            )
+    return out.getvalue() if stream is None else None
+
+
+def _flow_item(item: Any) -> str:
+    """Encode one list item as a single-line YAML flow node."""
+    encoded = _encode_json(item)
+    if _YAML_UNSAFE.search(encoded):
+        # Only string contents can hold them; JSON escapes are valid YAML
+        return _YAML_UNSAFE.sub(lambda m: f"\\u{ord(m.group()):04x}", encoded)
+    return encoded
+
+
 def _convert_server_to_clash_proxy(server: ParsedServer) -> Dict[str, Any]:
     """Convert ParsedServer to Clash proxy format.
 
@@ -18,11 +18,15 @@ from .constants import (
 from .core import (
     create_modern_routing_rules,
     create_urltest_outbound,
+    export_outbounds,
+    export_proxy_outbounds,
     is_supported_protocol,
     process_single_server,
     singbox_export,
     singbox_export_with_middleware,
 )
+from .dispatch import get_dispatch_table, register_protocol_converter
+from .grouping import OutboundGrouping, group_proxies
 from .inbound_generator import generate_inbounds
 from .protocol_handlers import (
     export_anytls,
@@ -41,9 +45,14 @@ __all__ = [
     "singbox_export",
     "singbox_export_with_middleware",
     "process_single_server",
+    "export_outbounds",
+    "export_proxy_outbounds",
     "is_supported_protocol",
     "create_urltest_outbound",
     "create_modern_routing_rules",
+    # URLTest grouping
+    "OutboundGrouping",
+    "group_proxies",
     # Inbound generation
     "generate_inbounds",
     # Protocol handlers
@@ -55,6 +64,9 @@ __all__ = [
     "export_tor",
     "export_ssh",
     "get_protocol_dispatcher",
+    # Dispatch table
+    "get_dispatch_table",
+    "register_protocol_converter",
     # Config processors
     "normalize_protocol_type",
     "process_standard_server",
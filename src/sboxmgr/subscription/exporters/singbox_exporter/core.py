@@ -1,43 +1,66 @@
 """Core exporter functions for sing-box configuration."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from sboxmgr.config.config_validator import validate_outbound_config
 from sboxmgr.subscription.models import ClientProfile, ParsedServer, PipelineContext
 
-from .config_processors import normalize_protocol_type, process_standard_server
 from .constants import DEFAULT_URLTEST_CONFIG, SUPPORTED_PROTOCOLS
+from .dispatch import convert_server, convert_servers
+from .grouping import OutboundGrouping, group_proxies
 from .inbound_generator import generate_inbounds
-from .protocol_handlers import get_protocol_dispatcher
 
 logger = logging.getLogger(__name__)
 
 
-def process_single_server(server: ParsedServer) -> Optional[Dict[str, Any]]:
+def process_single_server(
+    server: ParsedServer, validate_index: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
     """Process a single server and return outbound configuration.
 
     Args:
         server: ParsedServer to process.
+        validate_index: When set, validate the produced outbound immediately,
+            reporting errors under this outbound index.
 
     Returns:
         Outbound configuration or None if server should be skipped.
+
+    Raises:
+        ConfigValidationError: If validation is requested and the outbound is invalid.
     """
-    protocol_type = normalize_protocol_type(server.type)
+    outbound = convert_server(server)  # May return None
+
+    if outbound and validate_index is not None:
+        validate_outbound_config(outbound, validate_index)
+    return outbound
+
+
+def export_outbounds(
+    servers: List[ParsedServer], validate: bool = False, start_index: int = 0
+) -> List[Dict[str, Any]]:
+    """Convert servers to outbounds in batch.
+
+    Converters come from the precomputed dispatch table, so each server costs
+    one dictionary lookup. Skipped servers are dropped; order is preserved.
 
-    # Check protocol support
-    if not is_supported_protocol(protocol_type):
-        logger.warning(
-            f"Unsupported outbound type: {server.type}, skipping {server.address}:{server.port}"
-        )
-        return None
+    Args:
+        servers: ParsedServer objects to export.
+        validate: Validate each produced outbound.
+        start_index: Outbound index of the first result, for error messages.
 
-    # Handle special protocols
-    dispatcher = get_protocol_dispatcher()
-    if protocol_type in dispatcher:
-        return dispatcher[protocol_type](server)  # May return None
+    Returns:
+        Outbound configurations in input order.
 
-    # Handle standard protocols
-    return process_standard_server(server, protocol_type)
+    Raises:
+        ConfigValidationError: If validation is requested and an outbound is invalid.
+    """
+    outbounds = [outbound for outbound in convert_servers(servers) if outbound]
+    if validate:
+        for index, outbound in enumerate(outbounds, start_index):
+            validate_outbound_config(outbound, index)
+    return outbounds
 
 
 def is_supported_protocol(protocol_type: str) -> bool:
@@ -70,6 +93,45 @@ def create_urltest_outbound(proxy_tags: List[str]) -> Dict[str, Any]:
     return urltest_config
 
 
+def export_proxy_outbounds(
+    servers: List[ParsedServer],
+    validate: bool = False,
+    grouping: Optional[OutboundGrouping] = None,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Export proxy outbounds preceded by their URLTest group(s).
+
+    Args:
+        servers: ParsedServer objects to export.
+        validate: Validate each produced proxy outbound.
+        grouping: Optional sharding and outbound limits; by default all
+            proxies are exported as members of a single ``auto`` group.
+
+    Returns:
+        Tuple of outbounds (URLTest groups first) and exported proxy tags.
+
+    Raises:
+        ConfigValidationError: If validation is requested and an outbound is invalid.
+    """
+    if grouping is None:
+        # Index 0 is reserved for the URLTest outbound
+        outbounds = export_outbounds(servers, validate=validate, start_index=1)
+        proxy_tags = [outbound["tag"] for outbound in outbounds]
+        if proxy_tags:
+            outbounds.insert(0, create_urltest_outbound(proxy_tags))
+        return outbounds, proxy_tags
+
+    proxies = [
+        (server, outbound)
+        for server, outbound in zip(servers, convert_servers(servers))
+        if outbound
+    ]
+    groups, outbounds = group_proxies(proxies, grouping)
+    if validate:
+        for index, outbound in enumerate(outbounds, len(groups)):
+            validate_outbound_config(outbound, index)
+    return groups + outbounds, [outbound["tag"] for outbound in outbounds]
+
+
 def create_modern_routing_rules(proxy_tags: List[str]) -> List[Dict[str, Any]]:
     """Create modern routing rules with rule actions.
 
@@ -102,6 +164,8 @@ def singbox_export(
     servers: List[ParsedServer],
     routes: Optional[List[Dict[str, Any]]] = None,
     client_profile: Optional[ClientProfile] = None,
+    validate: bool = False,
+    grouping: Optional[OutboundGrouping] = None,
 ) -> Dict[str, Any]:
     """Export parsed servers to sing-box configuration format (modern approach).
 
@@ -112,25 +176,16 @@ def singbox_export(
         servers: List of ParsedServer objects to export.
         routes: Routing rules configuration (optional, uses modern defaults if None).
         client_profile: Optional client profile for inbound generation.
+        validate: Validate each outbound as it is produced, so the result can
+            be exported with ``outbounds_validated=True``.
+        grouping: Optional urltest sharding and outbound limits for large
+            server lists.
 
     Returns:
         Dictionary containing complete sing-box configuration with outbounds,
         routing rules, and optional inbounds section.
     """
-    outbounds = []
-    proxy_tags = []
-
-    # Process each server
-    for server in servers:
-        outbound = process_single_server(server)
-        if outbound:
-            outbounds.append(outbound)
-            proxy_tags.append(outbound["tag"])
-
-    # Add URLTest outbound if there are proxy servers
-    if proxy_tags:
-        urltest_outbound = create_urltest_outbound(proxy_tags)
-        outbounds.insert(0, urltest_outbound)
+    outbounds, proxy_tags = export_proxy_outbounds(servers, validate, grouping)
 
     # Use provided routing rules or create modern defaults
     if routes:
@@ -159,6 +214,8 @@ def singbox_export_with_middleware(
     routes: Optional[List[Dict[str, Any]]] = None,
     client_profile: Optional[ClientProfile] = None,
     context: Optional[PipelineContext] = None,
+    validate: bool = False,
+    grouping: Optional[OutboundGrouping] = None,
 ) -> Dict[str, Any]:
     """Export parsed servers to sing-box configuration format using middleware.
 
@@ -170,25 +227,14 @@ def singbox_export_with_middleware(
         routes: Routing rules configuration (optional, uses modern defaults if None).
         client_profile: Optional client profile for inbound generation.
         context: Optional pipeline context with middleware metadata.
+        validate: Validate each outbound as it is produced.
+        grouping: Optional urltest sharding and outbound limits.
 
     Returns:
         Dictionary containing complete sing-box configuration with outbounds,
         routing rules, and optional inbounds section.
     """
-    outbounds = []
-    proxy_tags = []
-
-    # Process each server
-    for server in servers:
-        outbound = process_single_server(server)
-        if outbound:
-            outbounds.append(outbound)
-            proxy_tags.append(outbound["tag"])
-
-    # Add URLTest outbound if there are proxy servers
-    if proxy_tags:
-        urltest_outbound = create_urltest_outbound(proxy_tags)
-        outbounds.insert(0, urltest_outbound)
+    outbounds, proxy_tags = export_proxy_outbounds(servers, validate, grouping)
 
     # Use provided routing rules or create modern defaults
     if routes:
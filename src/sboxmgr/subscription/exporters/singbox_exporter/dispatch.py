@@ -0,0 +1,109 @@
+"""Precomputed protocol dispatch for the sing-box exporter.
+
+Maps every raw ``ParsedServer.type`` accepted by the exporter (including
+aliases such as ``ss``) directly to the converter producing its outbound, so
+per-server export is a single dictionary lookup. The table is built on first
+use and can be extended with ``register_protocol_converter``.
+"""
+
+import logging
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from sboxmgr.subscription.models import ParsedServer
+
+from .config_processors import normalize_protocol_type, process_standard_server
+from .constants import SUPPORTED_PROTOCOLS
+from .protocol_handlers import get_protocol_dispatcher
+
+logger = logging.getLogger(__name__)
+
+ProtocolConverter = Callable[[ParsedServer], Optional[Dict[str, Any]]]
+
+_dispatch_table: Optional[Dict[str, ProtocolConverter]] = None
+
+
+def _build_dispatch_table() -> Dict[str, ProtocolConverter]:
+    """Build the raw protocol type -> converter table."""
+    special = get_protocol_dispatcher()
+    table: Dict[str, ProtocolConverter] = {}
+    for server_type in SUPPORTED_PROTOCOLS:
+        protocol_type = normalize_protocol_type(server_type)
+        if protocol_type in special:
+            table[server_type] = special[protocol_type]
+        else:
+            table[server_type] = partial(
+                process_standard_server, protocol_type=protocol_type
+            )
+    return table
+
+
+def get_dispatch_table() -> Dict[str, ProtocolConverter]:
+    """Get the protocol dispatch table, building it on first use.
+
+    Returns:
+        Dictionary mapping raw server types to outbound converters.
+    """
+    global _dispatch_table
+    if _dispatch_table is None:
+        _dispatch_table = _build_dispatch_table()
+    return _dispatch_table
+
+
+def register_protocol_converter(server_type: str, converter: ProtocolConverter) -> None:
+    """Register or replace the converter for a server type.
+
+    Args:
+        server_type: Raw ``ParsedServer.type`` value.
+        converter: Callable returning an outbound dict or None to skip.
+    """
+    get_dispatch_table()[server_type] = converter
+
+
+def convert_server(server: ParsedServer) -> Optional[Dict[str, Any]]:
+    """Convert a server through the dispatch table.
+
+    Args:
+        server: ParsedServer to convert.
+
+    Returns:
+        Outbound configuration or None if the server should be skipped.
+    """
+    converter = get_dispatch_table().get(server.type)
+    if converter is None:
+        logger.warning(
+            f"Unsupported outbound type: {server.type}, skipping {server.address}:{server.port}"
+        )
+        return None
+    return converter(server)
+
+
+def convert_servers(servers: List[ParsedServer]) -> List[Optional[Dict[str, Any]]]:
+    """Convert many servers in one pass over the dispatch table.
+
+    The table is bound once for the whole batch and each unsupported type is
+    reported once instead of per server.
+
+    Args:
+        servers: Servers to convert.
+
+    Returns:
+        One outbound or None per server, in input order.
+    """
+    table = get_dispatch_table()
+    unsupported: Dict[str, int] = {}
+    results: List[Optional[Dict[str, Any]]] = []
+    append = results.append
+    for server in servers:
+        converter = table.get(server.type)
+        if converter is None:
+            unsupported[server.type] = unsupported.get(server.type, 0) + 1
+            append(None)
+        else:
+            append(converter(server))
+
+    for server_type, count in unsupported.items():
+        logger.warning(
+            f"Unsupported outbound type: {server_type}, skipping {count} server(s)"
+        )
+    return results
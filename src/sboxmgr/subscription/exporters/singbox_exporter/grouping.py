@@ -0,0 +1,161 @@
+"""Sharded urltest groups for large sing-box configurations.
+
+By default every proxy is a member of the single ``auto`` urltest group, so
+the client probes all of them every ``interval``. ``OutboundGrouping`` caps
+the number of exported proxies and of members per group, and can shard
+proxies into per-country or per-provider urltest groups below a top-level
+``auto`` group. Ranking uses enrichment metadata already on
+``ParsedServer.meta``: lower ``latency_ms`` first, input order otherwise.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sboxmgr.subscription.models import ParsedServer
+
+from .constants import DEFAULT_URLTEST_CONFIG
+
+# Tag of the top-level urltest group, used as the default route target
+AUTO_GROUP_TAG = "auto"
+
+# Group key used for servers without the metadata a shard relies on
+UNKNOWN_SHARD = "other"
+
+
+@dataclass(frozen=True)
+class OutboundGrouping:
+    """Export options for urltest groups and outbound limits.
+
+    Attributes:
+        shard_by: ``"country"`` or ``"provider"`` to build one urltest group
+            per shard below ``auto``, or None for a single ``auto`` group.
+        max_group_size: Maximum members per urltest group (best ranked
+            first), or None for no limit.
+        max_outbounds: Maximum exported proxy outbounds (best ranked first),
+            or None for no limit.
+    """
+
+    shard_by: Optional[str] = None
+    max_group_size: Optional[int] = None
+    max_outbounds: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Validate the options."""
+        if self.shard_by is not None and self.shard_by not in SHARD_KEYS:
+            raise ValueError(f"Unsupported shard_by: {self.shard_by}")
+        for name in ("max_group_size", "max_outbounds"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be positive, got {value}")
+
+
+def _country_key(server: ParsedServer) -> Optional[str]:
+    meta = server.meta or {}
+    geo = meta.get("geo")
+    country = geo.get("country") if isinstance(geo, dict) else None
+    return country or meta.get("country")
+
+
+def _provider_key(server: ParsedServer) -> Optional[str]:
+    meta = server.meta or {}
+    return meta.get("source") or meta.get("provider")
+
+
+SHARD_KEYS: Dict[str, Callable[[ParsedServer], Optional[str]]] = {
+    "country": _country_key,
+    "provider": _provider_key,
+}
+
+
+def server_rank(server: ParsedServer) -> float:
+    """Rank a server for group membership, lower is better.
+
+    Args:
+        server: Server to rank.
+
+    Returns:
+        Known latency in milliseconds, or infinity.
+    """
+    try:
+        return float((server.meta or {})["latency_ms"])
+    except (KeyError, TypeError, ValueError):
+        return float("inf")
+
+
+def _best(
+    indices: Sequence[int], ranks: List[float], limit: Optional[int]
+) -> List[int]:
+    """Keep the ``limit`` best ranked indices, in their original order."""
+    if limit is None or len(indices) <= limit:
+        return list(indices)
+    best = sorted(indices, key=ranks.__getitem__)[:limit]
+    return sorted(best)
+
+
+def _shard_tag(key: str, taken: set) -> str:
+    """Build a unique urltest group tag for a shard key."""
+    slug = re.sub(r"[^a-z0-9]+", "-", key.lower()).strip("-") or UNKNOWN_SHARD
+    base = f"{AUTO_GROUP_TAG}-{slug}"
+    tag = base
+    suffix = 2
+    while tag in taken:
+        tag = f"{base}-{suffix}"
+        suffix += 1
+    taken.add(tag)
+    return tag
+
+
+def _urltest(tag: str, members: List[str]) -> Dict[str, Any]:
+    group = {"type": "urltest", "tag": tag, "outbounds": members}
+    group.update(DEFAULT_URLTEST_CONFIG)
+    return group
+
+
+def group_proxies(
+    proxies: List[Tuple[ParsedServer, Any]],
+    grouping: OutboundGrouping,
+    tag_of: Callable[[Any], str] = lambda outbound: outbound["tag"],
+) -> Tuple[List[Dict[str, Any]], List[Any]]:
+    """Limit proxies and build their urltest groups.
+
+    Args:
+        proxies: ``(server, outbound)`` pairs in export order.
+        grouping: Grouping options.
+        tag_of: Returns the tag of an outbound.
+
+    Returns:
+        Tuple of urltest group configurations (top-level group first) and
+        the proxy outbounds kept, in export order.
+    """
+    ranks = [server_rank(server) for server, _ in proxies]
+    kept = _best(range(len(proxies)), ranks, grouping.max_outbounds)
+    outbounds = [proxies[i][1] for i in kept]
+    if not kept:
+        return [], outbounds
+
+    if grouping.shard_by is None:
+        members = _best(kept, ranks, grouping.max_group_size)
+        return [_urltest(AUTO_GROUP_TAG, [tag_of(proxies[i][1]) for i in members])], (
+            outbounds
+        )
+
+    shard_key = SHARD_KEYS[grouping.shard_by]
+    shards: Dict[str, List[int]] = {}
+    for i in kept:
+        key = shard_key(proxies[i][0]) or UNKNOWN_SHARD
+        shards.setdefault(str(key), []).append(i)
+
+    taken = {tag_of(outbound) for outbound in outbounds}
+    taken.add(AUTO_GROUP_TAG)
+    groups = []
+    for key, indices in shards.items():
+        members = _best(indices, ranks, grouping.max_group_size)
+        groups.append(
+            _urltest(
+                _shard_tag(key, taken),
+                [tag_of(proxies[i][1]) for i in members],
+            )
+        )
+    top = _urltest(AUTO_GROUP_TAG, [group["tag"] for group in groups])
+    return [top] + groups, outbounds
@@ -25,7 +25,12 @@ Example usage:
 """
 
 # Main conversion functions
-from .converter import convert_parsed_server_to_outbound
+from .converter import (
+    OUTBOUND_CONVERTERS,
+    convert_parsed_server_to_outbound,
+    convert_parsed_servers,
+    convert_parsed_servers_to_outbounds,
+)
 
 # Main exporter class
 from .exporter import SingboxExporterV2
@@ -57,6 +62,9 @@ from .utils import convert_tls_config, convert_transport_config
 __all__ = [
     # Main converter
     "convert_parsed_server_to_outbound",
+    "convert_parsed_servers",
+    "convert_parsed_servers_to_outbounds",
+    "OUTBOUND_CONVERTERS",
     # Protocol converters
     "convert_shadowsocks",
     "convert_vmess",
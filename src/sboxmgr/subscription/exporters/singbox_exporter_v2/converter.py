@@ -5,7 +5,7 @@ objects into appropriate sing-box outbound models using the modular Pydantic mod
 """
 
 import logging
-from typing import Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Import new sing-box models
 from sboxmgr.models.singbox import (
@@ -50,6 +50,45 @@ from .protocol_converters import (
 
 logger = logging.getLogger(__name__)
 
+# Protocol -> converter table, built once at import
+OUTBOUND_CONVERTERS: Dict[str, Callable[[ParsedServer, Dict[str, Any]], Any]] = {
+    "shadowsocks": convert_shadowsocks,
+    "vmess": convert_vmess,
+    "vless": convert_vless,
+    "trojan": convert_trojan,
+    "hysteria2": convert_hysteria2,
+    "wireguard": convert_wireguard,
+    "tuic": convert_tuic,
+    "shadowtls": convert_shadowtls,
+    "anytls": convert_anytls,
+    "tor": convert_tor,
+    "ssh": convert_ssh,
+    "http": convert_http,
+    "socks": convert_socks,
+    "direct": convert_direct,
+}
+
+# Raw server type aliases
+_PROTOCOL_ALIASES = {"ss": "shadowsocks"}
+
+
+def _base_outbound_data(server: ParsedServer, protocol_type: str) -> Dict[str, Any]:
+    """Build the fields shared by all outbound models."""
+    outbound_data = {
+        "type": protocol_type,
+        "server": server.address,
+        "server_port": server.port,
+    }
+
+    # Add tag (prioritize normalized server.tag from middleware)
+    if server.tag:
+        outbound_data["tag"] = server.tag
+    elif server.meta.get("name"):
+        outbound_data["tag"] = server.meta["name"]
+    else:
+        outbound_data["tag"] = f"{protocol_type}-{server.address}"
+    return outbound_data
+
 
 def convert_parsed_server_to_outbound(
     server: ParsedServer,
@@ -84,52 +123,62 @@ def convert_parsed_server_to_outbound(
     Returns:
         Appropriate outbound model instance or None if conversion fails
     """
-    try:
-        # Normalize protocol type
-        protocol_type = server.type
-        if protocol_type == "ss":
-            protocol_type = "shadowsocks"
-
-        # Create base outbound data
-        outbound_data = {
-            "type": protocol_type,
-            "server": server.address,
-            "server_port": server.port,
-        }
-
-        # Add tag (prioritize normalized server.tag from middleware)
-        if server.tag:
-            outbound_data["tag"] = server.tag
-        elif server.meta.get("name"):
-            outbound_data["tag"] = server.meta["name"]
-        else:
-            outbound_data["tag"] = f"{protocol_type}-{server.address}"
-
-        # Protocol-specific conversion
-        converter_map = {
-            "shadowsocks": convert_shadowsocks,
-            "vmess": convert_vmess,
-            "vless": convert_vless,
-            "trojan": convert_trojan,
-            "hysteria2": convert_hysteria2,
-            "wireguard": convert_wireguard,
-            "tuic": convert_tuic,
-            "shadowtls": convert_shadowtls,
-            "anytls": convert_anytls,
-            "tor": convert_tor,
-            "ssh": convert_ssh,
-            "http": convert_http,
-            "socks": convert_socks,
-            "direct": convert_direct,
-        }
-
-        converter = converter_map.get(protocol_type)
-        if converter:
-            return converter(server, outbound_data)
-        else:
-            logger.warning(f"Unsupported protocol type: {protocol_type}")
-            return None
+    protocol_type = _PROTOCOL_ALIASES.get(server.type, server.type)
+    converter = OUTBOUND_CONVERTERS.get(protocol_type)
+    if converter is None:
+        logger.warning(f"Unsupported protocol type: {protocol_type}")
+        return None
+    return _convert_with(converter, server, protocol_type)
+
+
+def convert_parsed_servers_to_outbounds(servers: List[ParsedServer]) -> List[Any]:
+    """Convert many ParsedServers in one pass over the converter table.
+
+    Servers that fail conversion or use unsupported protocols are dropped;
+    order is preserved and each unsupported type is reported once.
+
+    Args:
+        servers: ParsedServer objects to convert
+
+    Returns:
+        Outbound model instances in input order
+    """
+    return [outbound for outbound in convert_parsed_servers(servers) if outbound]
+
+
+def convert_parsed_servers(servers: List[ParsedServer]) -> List[Optional[Any]]:
+    """Convert many ParsedServers, keeping one result per server.
 
+    Args:
+        servers: ParsedServer objects to convert
+
+    Returns:
+        Outbound model instance, or None if conversion failed, per server
+    """
+    unsupported: Dict[str, int] = {}
+    outbounds: List[Optional[Any]] = []
+    for server in servers:
+        protocol_type = _PROTOCOL_ALIASES.get(server.type, server.type)
+        converter = OUTBOUND_CONVERTERS.get(protocol_type)
+        if converter is None:
+            unsupported[protocol_type] = unsupported.get(protocol_type, 0) + 1
+            outbounds.append(None)
+            continue
+        outbounds.append(_convert_with(converter, server, protocol_type))
+
+    for protocol_type, count in unsupported.items():
+        logger.warning(f"Unsupported protocol type: {protocol_type} ({count} servers)")
+    return outbounds
+
+
+def _convert_with(
+    converter: Callable[[ParsedServer, Dict[str, Any]], Any],
+    server: ParsedServer,
+    protocol_type: str,
+) -> Optional[Any]:
+    """Run a protocol converter, logging and swallowing conversion errors."""
+    try:
+        return converter(server, _base_outbound_data(server, protocol_type))
     except Exception as e:
         logger.error(f"Failed to convert server {server.address}:{server.port}: {e}")
         return None
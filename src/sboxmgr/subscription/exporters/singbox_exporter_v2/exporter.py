@@ -20,7 +20,8 @@ from sboxmgr.models.singbox import (
 from ...base_exporter import BaseExporter
 from ...models import ClientProfile, ParsedServer
 from ...registry import register
-from .converter import convert_parsed_server_to_outbound
+from ..singbox_exporter.grouping import OutboundGrouping, group_proxies
+from .converter import convert_parsed_servers, convert_parsed_servers_to_outbounds
 from .inbound_converter import convert_client_profile_to_inbounds
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,15 @@ class SingboxExporterV2(BaseExporter):
     from sboxmgr.models.singbox for full validation.
     """
 
+    def __init__(self, grouping: Optional[OutboundGrouping] = None):
+        """Initialize the exporter.
+
+        Args:
+            grouping: Optional urltest sharding and outbound limits; by
+                default all proxies are members of a single ``auto`` group.
+        """
+        self.grouping = grouping
+
     def export(
         self,
         servers: List[ParsedServer],
@@ -53,29 +63,38 @@ class SingboxExporterV2(BaseExporter):
             ValueError: If server data is invalid or cannot be exported
         """
         try:
-            # Convert servers to outbounds
-            outbounds = []
-            proxy_tags = []
-
-            for server in servers:
-                outbound = convert_parsed_server_to_outbound(server)
-                if outbound:
-                    outbounds.append(outbound)
-                    proxy_tags.append(outbound.tag)
-
-            # Add URLTest outbound if there are proxy servers (like legacy)
-            if proxy_tags:
-                urltest_outbound = UrlTestOutbound(
-                    type="urltest",
-                    tag="auto",
-                    outbounds=proxy_tags,
-                    url="https://www.gstatic.com/generate_204",
-                    interval="3m",
-                    tolerance=50,
-                    idle_timeout="30m",  # 30 minutes as string
-                    interrupt_exist_connections=False,
+            # Convert servers to outbounds, one per server; with grouping
+            # configured they are also split into urltest groups (else branch)
+            if self.grouping is None:
+                outbounds = convert_parsed_servers_to_outbounds(servers)
+                proxy_tags = [outbound.tag for outbound in outbounds]
+
+                # Add URLTest outbound if there are proxy servers (like legacy)
+                if proxy_tags:
+                    urltest_outbound = UrlTestOutbound(
+                        type="urltest",
+                        tag="auto",
+                        outbounds=proxy_tags,
+                        url="https://www.gstatic.com/generate_204",
+                        interval="3m",
+                        tolerance=50,
+                        idle_timeout="30m",  # 30 minutes as string
+                        interrupt_exist_connections=False,
+                    )
+                    outbounds.insert(0, urltest_outbound)
+            else:
+                proxies = [
+                    (server, outbound)
+                    for server, outbound in zip(
+                        servers, convert_parsed_servers(servers)
+                    )
+                    if outbound is not None
+                ]
+                groups, outbounds = group_proxies(
+                    proxies, self.grouping, tag_of=lambda outbound: outbound.tag
                 )
-                outbounds.insert(0, urltest_outbound)
+                proxy_tags = [outbound.tag for outbound in outbounds]
+                outbounds[:0] = [UrlTestOutbound(**group) for group in groups]
 
             # Add default outbounds
             outbounds.extend(
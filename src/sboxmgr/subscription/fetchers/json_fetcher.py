@@ -45,11 +45,7 @@ class JSONFetcher(BaseFetcher):
             requests.RequestException: Если не удалось скачать файл.
 
         """
-        key = (
-            self.source.url,
-            getattr(self.source, "user_agent", None),
-            str(getattr(self.source, "headers", None)),
-        )
+        key = self._cache_key()
         if force_reload:
             with self._cache_lock:
                 self._fetch_cache.pop(key, None)
@@ -70,29 +66,42 @@ class JSONFetcher(BaseFetcher):
                     self._fetch_cache[key] = data
                 return data
         else:
-            headers = dict(self.source.headers) if self.source.headers else {}
-            ua = self.source.user_agent
-            if ua is None:
-                ua = "ClashMeta/1.0"  # дефолтный UA
-                headers["User-Agent"] = ua
-            elif ua != "":  # Добавляем только если UA не пустой
-                headers["User-Agent"] = ua
-            print(f"[fetcher] Using User-Agent: {headers.get('User-Agent', '[none]')}")
-            resp = requests.get(
-                self.source.url, headers=headers, stream=True, timeout=30
-            )
-            resp.raise_for_status()
+            resp = self._open_url()
 
             # Используем iter_content для правильной обработки сжатых данных
-            data = b""
+            buffer = bytearray()
             for chunk in resp.iter_content(chunk_size=8192):
-                if len(data) + len(chunk) > size_limit:
+                if len(buffer) + len(chunk) > size_limit:
                     print(
                         f"[fetcher][WARN] Downloaded data exceeds limit ({size_limit} bytes), skipping."
                     )
                     raise ValueError("Downloaded data exceeds limit")
-                data += chunk
+                buffer += chunk
+            data = bytes(buffer)
 
             with self._cache_lock:
                 self._fetch_cache[key] = data
             return data
+
+    def _cache_key(self) -> Tuple[str, Optional[str], str]:
+        """Build the fetch cache key for the current source."""
+        return (
+            self.source.url,
+            getattr(self.source, "user_agent", None),
+            str(getattr(self.source, "headers", None)),
+        )
+
+    def _open_url(self) -> requests.Response:
+        """Start a streaming GET request for the source URL."""
+        headers = dict(self.source.headers) if self.source.headers else {}
+        ua = self.source.user_agent
+        if ua is None:
+            ua = "ClashMeta/1.0"  # дефолтный UA
+            headers["User-Agent"] = ua
+        elif ua != "":  # Добавляем только если UA не пустой
+            headers["User-Agent"] = ua
+        print(f"[fetcher] Using User-Agent: {headers.get('User-Agent', '[none]')}")
+        resp = requests.get(self.source.url, headers=headers, stream=True, timeout=30)
+        self.response_headers = getattr(resp, "headers", None) or {}
+        resp.raise_for_status()
+        return resp
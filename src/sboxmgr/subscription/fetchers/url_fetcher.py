@@ -98,6 +98,7 @@ class URLFetcher(BaseFetcher):
             resp = requests.get(
                 self.source.url, headers=headers, stream=True, timeout=timeout
             )
+            self.response_headers = getattr(resp, "headers", None) or {}
             resp.raise_for_status()
             data = resp.raw.read(size_limit + 1)
             if len(data) > size_limit:
@@ -8,7 +8,7 @@ from .cache import CacheManager
 from .core import SubscriptionManager
 from .data_processor import DataProcessor
 from .error_handler import ErrorHandler
-from .parser_detector import detect_parser
+from .parser_detector import SniffResult, detect_parser, sniff_parser
 from .pipeline_coordinator import PipelineCoordinator
 
 # Main exports
@@ -17,6 +17,8 @@ __all__ = [
     "SubscriptionManager",
     # Individual components
     "detect_parser",
+    "sniff_parser",
+    "SniffResult",
     "CacheManager",
     "ErrorHandler",
     "DataProcessor",
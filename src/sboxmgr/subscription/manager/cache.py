@@ -1,7 +1,7 @@
 """Cache management functionality for subscription manager."""
 
 import threading
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import PipelineContext
 
@@ -19,7 +19,12 @@ class CacheManager:
         self._get_servers_cache: Dict[Tuple, Any] = {}
 
     def create_cache_key(
-        self, mode: str, context: PipelineContext, fetcher_source
+        self,
+        mode: str,
+        context: PipelineContext,
+        fetcher_source,
+        exclusions: Optional[List[Any]] = None,
+        user_routes: Optional[List[str]] = None,
     ) -> tuple:
         """Create cache key for get_servers results.
 
@@ -30,6 +35,8 @@ class CacheManager:
             mode: Pipeline execution mode.
             context: Pipeline execution context.
             fetcher_source: Fetcher source object with URL and headers.
+            exclusions: Exclusions applied by the pipeline.
+            user_routes: User routing preferences applied by the pipeline.
 
         Returns:
             Tuple representing the unique cache key.
@@ -40,6 +47,8 @@ class CacheManager:
             str(getattr(fetcher_source, "headers", None)),
             str(getattr(context, "tag_filters", None)),
             str(mode),
+            str(exclusions or []),
+            str(user_routes or []),
         )
 
     def get_cached_result(self, cache_key: tuple) -> Any:
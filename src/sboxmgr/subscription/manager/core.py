@@ -3,12 +3,8 @@
 from typing import List, Optional
 
 from ..base_selector import DefaultSelector
-
-# Import fetchers and parsers for plugin registration
-from ..fetchers import *  # noqa: F401
 from ..middleware_base import MiddlewareChain
 from ..models import PipelineContext, PipelineResult, SubscriptionSource
-from ..parsers import *  # noqa: F401
 from ..postprocessor_base import DedupPostProcessor, PostProcessorChain
 from ..registry import get_plugin, load_entry_points
 from .cache import CacheManager
@@ -48,6 +44,7 @@ class SubscriptionManager:
         detect_parser=None,
         postprocessor_chain=None,
         middleware_chain=None,
+        policy_engine=None,
     ):
         """Initialize subscription manager with configuration.
 
@@ -56,14 +53,20 @@ class SubscriptionManager:
             detect_parser: Optional custom parser detection function.
             postprocessor_chain: Optional custom post-processor chain.
             middleware_chain: Optional custom middleware chain.
+            policy_engine: Optional PolicyEngine evaluated in one batch per
+                run (e.g. ``sboxmgr.policies.policy_registry``). The policy
+                stage is opt-in: the default registry ships example policies
+                (country allowlist, server limits) that would change the
+                servers returned, and the stage has never filtered by
+                default. ``PipelineContext.skip_policies`` disables it per run.
 
         Raises:
             ValueError: If source_type is unknown or unsupported.
         """
-        # Load plugins
+        # Register entry point plugins (once per process, from a cached manifest)
         load_entry_points()
 
-        # Initialize fetcher
+        # Initialize fetcher; built-in fetchers are imported on first use
         fetcher_cls = get_plugin(source.source_type)
         if not fetcher_cls:
             raise ValueError(f"Unknown source_type: {source.source_type}")
@@ -88,6 +91,7 @@ class SubscriptionManager:
             postprocessor=self.postprocessor,
             selector=self.selector,
             error_handler=self.error_handler,
+            policy_engine=policy_engine,
         )
 
         # Setup parser detection
@@ -136,7 +140,7 @@ class SubscriptionManager:
         # Check cache unless force_reload
         if not force_reload:
             cache_key = self.cache_manager.create_cache_key(
-                mode, context, self.fetcher.source
+                mode, context, self.fetcher.source, exclusions, user_routes
             )
             cached_result = self.cache_manager.get_cached_result(cache_key)
             if cached_result:
@@ -148,7 +152,7 @@ class SubscriptionManager:
         # Cache successful results
         if result.success and not force_reload:
             cache_key = self.cache_manager.create_cache_key(
-                mode, context, self.fetcher.source
+                mode, context, self.fetcher.source, exclusions, user_routes
             )
             self.cache_manager.set_cached_result(cache_key, result)
 
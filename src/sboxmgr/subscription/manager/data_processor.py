@@ -4,7 +4,7 @@ from typing import Any, List, Tuple
 
 from ..models import PipelineContext
 from .error_handler import ErrorHandler
-from .parser_detector import detect_parser
+from .parser_detector import sniff_parser
 
 
 class DataProcessor:
@@ -74,7 +74,8 @@ class DataProcessor:
         """
         try:
             # Detect and get parser
-            parser = detect_parser(raw_data, self.fetcher.source.source_type)
+            sniffed = sniff_parser(raw_data, self.fetcher.source.source_type)
+            parser = sniffed.parser
             if not parser:
                 err = self.error_handler.create_parse_error(
                     "No suitable parser found for data format",
@@ -83,8 +84,11 @@ class DataProcessor:
                 self.error_handler.add_error_to_context(context, err)
                 return [], False
 
-            # Parse servers
-            servers = parser.parse(raw_data)
+            # Parse servers, reusing data already decoded during detection
+            if sniffed.decoded is not None and hasattr(parser, "parse_decoded"):
+                servers = parser.parse_decoded(sniffed.decoded)
+            else:
+                servers = parser.parse(raw_data)
 
             # Debug logging
             self._log_parse_result(context, servers, parser)
@@ -1,11 +1,40 @@
-"""Parser auto-detection functionality."""
+"""Parser auto-detection functionality.
+
+Detection only inspects a bounded prefix of the payload (``SNIFF_BYTES``)
+and, for base64 feeds, decodes a small aligned sample, so its cost does not
+grow with the subscription size. Parsing the full payload is left to the
+selected parser.
+"""
 
 import base64
-import json
+import binascii
 import logging
 import re
+from dataclasses import dataclass
 from typing import Any, List, Optional, Protocol
 
+# Bytes of the payload inspected for format detection
+SNIFF_BYTES = 4096
+
+# Base64 characters decoded to look for proxy URIs (multiple of 4)
+BASE64_SAMPLE_BYTES = 1024
+
+PROXY_URI_PREFIXES = ("vless://", "vmess://", "trojan://", "ss://")
+
+CLASH_INDICATORS = (
+    "mixed-port:",
+    "proxies:",
+    "proxy-groups:",
+    "proxy-providers:",
+    "rules:",
+    "rule-providers:",
+    "dns:",
+)
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_BASE64_ALPHABET = re.compile(rb"^[A-Za-z0-9+/=\s]+$")
+_WHITESPACE = re.compile(rb"\s+")
+
 
 class ParserProtocol(Protocol):
     """Protocol for parser objects that can parse subscription data."""
@@ -15,6 +44,21 @@ class ParserProtocol(Protocol):
         ...
 
 
+@dataclass
+class SniffResult:
+    """Outcome of parser detection.
+
+    Attributes:
+        parser: Detected parser, or None if detection failed.
+        decoded: Payload already decoded in full while sniffing (small base64
+            feeds), to be handed to ``parser.parse_decoded`` instead of
+            decoding it again; None otherwise.
+    """
+
+    parser: Optional[ParserProtocol]
+    decoded: Optional[bytes] = None
+
+
 def detect_parser(raw: bytes, source_type: str) -> Optional[ParserProtocol]:
     """Auto-detect appropriate parser based on data content.
 
@@ -25,16 +69,26 @@ def detect_parser(raw: bytes, source_type: str) -> Optional[ParserProtocol]:
     Returns:
         Parser instance or None if detection fails.
     """
-    # Декодируем данные
-    text = raw.decode("utf-8", errors="ignore")
+    return sniff_parser(raw, source_type).parser
+
+
+def sniff_parser(raw: bytes, source_type: str) -> SniffResult:
+    """Detect the parser for a payload from a bounded prefix.
+
+    Args:
+        raw: Raw subscription data bytes.
+        source_type: Subscription source type hint.
 
+    Returns:
+        SniffResult with the parser and any payload decoded while sniffing.
+    """
     # Если source_type явно указан, используем соответствующий парсер
     explicit_parser = _get_explicit_parser(source_type)
     if explicit_parser:
-        return explicit_parser
+        return SniffResult(explicit_parser)
 
     # Автоопределение по содержимому (fallback)
-    return _auto_detect_parser(text)
+    return _auto_detect_parser(raw)
 
 
 def _get_explicit_parser(source_type: str) -> Optional[ParserProtocol]:
@@ -62,83 +116,72 @@ def _get_explicit_parser(source_type: str) -> Optional[ParserProtocol]:
     return None
 
 
-def _auto_detect_parser(text: str) -> ParserProtocol:
-    """Auto-detect parser based on content analysis.
+def _auto_detect_parser(raw: bytes) -> SniffResult:
+    """Auto-detect parser based on content analysis of the payload prefix.
 
     Args:
-        text: Decoded subscription data text.
+        raw: Raw subscription data bytes.
 
     Returns:
-        Parser instance (fallback to Base64Parser if detection fails).
+        SniffResult (fallback to Base64Parser if detection fails).
     """
+    head = raw[:SNIFF_BYTES]
+    if head.startswith(_UTF8_BOM):
+        head = head[len(_UTF8_BOM) :]
+    text = head.decode("utf-8", errors="ignore")
+
     # 1. Пробуем JSON (SingBox)
     json_parser = _try_json_parser(text)
     if json_parser:
-        return json_parser
+        return SniffResult(json_parser)
 
     # 2. Пробуем Clash YAML
     clash_parser = _try_clash_parser(text)
     if clash_parser:
-        return clash_parser
+        return SniffResult(clash_parser)
 
     # 3. Пробуем base64
-    base64_parser = _try_base64_parser(text)
-    if base64_parser:
-        return base64_parser
+    base64_result = _try_base64_parser(raw, head)
+    if base64_result:
+        return base64_result
 
     # 4. Пробуем plain URI list
     uri_parser = _try_uri_list_parser(text)
     if uri_parser:
-        return uri_parser
+        return SniffResult(uri_parser)
 
     # Fallback
     from ..parsers.base64_parser import Base64Parser
 
-    return Base64Parser()
+    return SniffResult(Base64Parser())
 
 
 def _try_json_parser(text: str) -> Optional[ParserProtocol]:
-    """Try to detect JSON parser.
+    """Try to detect JSON parser from the leading characters.
 
     Args:
-        text: Text to analyze.
+        text: Decoded payload prefix.
 
     Returns:
-        SingBoxParser if JSON detected, None otherwise.
+        SingBoxParser if the payload starts like JSON/JSONC, None otherwise.
     """
-    try:
+    if text.lstrip().startswith(("{", "[", "//", "/*")):
         from ..parsers.singbox_parser import SingBoxParser
 
-        parser = SingBoxParser()
-        data = parser._strip_comments_and_validate(text)[0]
-        json.loads(data)
-        return parser
-    except Exception as e:
-        logging.debug(f"JSON parser detection failed: {e}")
-        return None
+        return SingBoxParser()
+    return None
 
 
 def _try_clash_parser(text: str) -> Optional[ParserProtocol]:
     """Try to detect Clash YAML parser.
 
     Args:
-        text: Text to analyze.
+        text: Decoded payload prefix.
 
     Returns:
         ClashParser if Clash format detected, None otherwise.
     """
-    # Check for Clash YAML indicators
-    clash_indicators = [
-        "mixed-port:",
-        "proxies:",
-        "proxy-groups:",
-        "proxy-providers:",
-        "rules:",
-        "rule-providers:",
-        "dns:",
-    ]
-
-    if any(indicator in text for indicator in clash_indicators):
+    if any(indicator in text for indicator in CLASH_INDICATORS):
         from ..parsers.clash_parser import ClashParser
 
         return ClashParser()
@@ -146,49 +189,55 @@ def _try_clash_parser(text: str) -> Optional[ParserProtocol]:
     return None
 
 
-def _try_base64_parser(text: str) -> Optional[ParserProtocol]:
-    """Try to detect base64 parser.
+def _try_base64_parser(raw: bytes, head: bytes) -> Optional[SniffResult]:
+    """Try to detect base64 parser from a decoded sample.
 
     Args:
-        text: Text to analyze.
+        raw: Raw subscription data bytes.
+        head: Payload prefix without BOM.
 
     Returns:
-        Base64Parser if base64 detected, None otherwise.
+        SniffResult with Base64Parser if base64 detected, None otherwise.
     """
-    # Check if text looks like base64
-    b64_re = re.compile(r"^[A-Za-z0-9+/=\s]+$")
-    if not (b64_re.match(text) and len(text.strip()) > 100):
+    # Check if the prefix looks like base64
+    if not _BASE64_ALPHABET.match(head):
+        return None
+    whole = len(raw) <= SNIFF_BYTES
+    if whole and len(head.strip()) <= 100:
         return None
 
+    compact = _WHITESPACE.sub(b"", head)
+    sample = compact if whole else compact[:BASE64_SAMPLE_BYTES]
+    if not whole:
+        sample = sample[: len(sample) - len(sample) % 4]
     try:
-        decoded = base64.b64decode(text.strip() + "=" * (-len(text.strip()) % 4))
-        decoded_text = decoded.decode("utf-8", errors="ignore")
+        decoded = base64.b64decode(sample + b"=" * (-len(sample) % 4))
+    except (binascii.Error, ValueError) as e:
+        logging.debug(f"Base64 parser detection failed: {e}")
+        return None
 
-        # Check for proxy protocol indicators
-        proxy_protocols = ("vless://", "vmess://", "trojan://", "ss://")
-        if any(proto in decoded_text for proto in proxy_protocols):
-            from ..parsers.base64_parser import Base64Parser
+    # Check for proxy protocol indicators
+    decoded_text = decoded.decode("utf-8", errors="ignore")
+    if not any(proto in decoded_text for proto in PROXY_URI_PREFIXES):
+        return None
 
-            return Base64Parser()
-    except Exception as e:
-        logging.debug(f"Base64 parser detection failed: {e}")
+    from ..parsers.base64_parser import Base64Parser
 
-    return None
+    return SniffResult(Base64Parser(), decoded if whole else None)
 
 
 def _try_uri_list_parser(text: str) -> Optional[ParserProtocol]:
     """Try to detect URI list parser.
 
     Args:
-        text: Text to analyze.
+        text: Decoded payload prefix.
 
     Returns:
         URIListParser if URI list detected, None otherwise.
     """
     lines = text.splitlines()
-    proxy_protocols = ("vless://", "vmess://", "trojan://", "ss://")
 
-    if any(line.strip().startswith(proxy_protocols) for line in lines):
+    if any(line.strip().startswith(PROXY_URI_PREFIXES) for line in lines):
         from ..parsers.uri_list_parser import URIListParser
 
         return URIListParser()
@@ -1,6 +1,6 @@
 """Pipeline coordination functionality for subscription manager."""
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import PipelineContext, PipelineResult
 from .error_handler import ErrorHandler
@@ -19,6 +19,7 @@ class PipelineCoordinator:
         postprocessor=None,
         selector=None,
         error_handler: ErrorHandler = None,
+        policy_engine=None,
     ):
         """Initialize pipeline coordinator.
 
@@ -27,17 +28,24 @@ class PipelineCoordinator:
             postprocessor: Post-processor chain.
             selector: Server selector.
             error_handler: Optional error handler.
+            policy_engine: Optional PolicyEngine holding the policy instances
+                applied to every run (e.g. ``sboxmgr.policies.policy_registry``).
+                Without an engine the policy stage passes servers through.
         """
         self.middleware_chain = middleware_chain
         self.postprocessor = postprocessor
         self.selector = selector
         self.error_handler = error_handler or ErrorHandler()
+        self.policy_engine = policy_engine
 
     def apply_policies(self, servers: List[Any], context: PipelineContext) -> List[Any]:
         """Apply policy rules to filter servers.
 
-        Processes servers through registered policy plugins to apply
-        filtering, transformation, and validation rules.
+        Evaluates the whole server list against the coordinator's policy
+        engine in one batch. Policy instances live in the engine, so nothing
+        is instantiated per pipeline run. Denied servers are dropped;
+        denials, warnings, info results and per-policy timings are recorded
+        in ``context.metadata``.
 
         Args:
             servers: List of parsed servers to process.
@@ -46,26 +54,19 @@ class PipelineCoordinator:
         Returns:
             List of servers after policy application.
         """
-        try:
-            from ..policies.base import get_registered_policies
-
-            policies = get_registered_policies()
-
-            for policy_name, policy_class in policies.items():
-                try:
-                    policy_instance = policy_class()
-                    servers = policy_instance.apply(servers, context)
-                except Exception as e:
-                    # Log policy error but continue processing
-                    err = self.error_handler.create_internal_error(
-                        f"policy_{policy_name}",
-                        str(e),
-                        {"policy": policy_name, "server_count": len(servers)},
-                    )
-                    self.error_handler.add_error_to_context(context, err)
-
+        engine = self.policy_engine
+        if engine is None or getattr(context, "skip_policies", False) or not servers:
             return servers
 
+        try:
+            from ...policies import PolicyContext
+
+            policy_context = PolicyContext(
+                profile=getattr(context, "profile", None),
+                user=getattr(context, "user", None),
+                env=getattr(context, "env", None) or {},
+            )
+            evaluations = engine.evaluate_batch(servers, policy_context)
         except Exception as e:
             # If policy system fails, return servers unchanged
             err = self.error_handler.create_internal_error(
@@ -74,6 +75,30 @@ class PipelineCoordinator:
             self.error_handler.add_error_to_context(context, err)
             return servers
 
+        violations = context.metadata.setdefault("policy_violations", [])
+        warnings = context.metadata.setdefault("policy_warnings", [])
+        info = context.metadata.setdefault("policy_info", [])
+        context.metadata["policy_timings"] = dict(engine.last_batch_timings)
+
+        allowed = []
+        for server, evaluation in zip(servers, evaluations):
+            server_id = evaluation.server_identifier
+            if evaluation.has_denials:
+                violations.extend(
+                    _policy_entry(server_id, denial) for denial in evaluation.denials
+                )
+                continue
+
+            warnings.extend(
+                _policy_entry(server_id, warning) for warning in evaluation.warnings
+            )
+            info.extend(
+                _policy_entry(server_id, result) for result in evaluation.info_results
+            )
+            allowed.append(server)
+
+        return allowed
+
     def process_middleware(
         self, servers: List[Any], context: PipelineContext
     ) -> Tuple[List[Any], bool]:
@@ -216,3 +241,13 @@ class PipelineCoordinator:
             return PipelineResult(
                 config=None, context=context, errors=errors, success=False
             )
+
+
+def _policy_entry(server_id: str, result: Any) -> Dict[str, Any]:
+    """Build a context metadata entry for a policy result."""
+    return {
+        "server": server_id,
+        "policy": result.policy_name,
+        "reason": result.reason,
+        "metadata": result.metadata,
+    }
@@ -1,8 +1,9 @@
 """Basic enrichment functionality for server data."""
 
-import hashlib
 import time
 
+from sboxmgr.utils.id import fingerprint_server
+
 from ...models import ParsedServer, PipelineContext
 
 
@@ -35,8 +36,9 @@ class BasicEnricher:
         server.meta["trace_id"] = context.trace_id
 
         # Add server identifier hash
-        server_id = f"{server.type}://{server.address}:{server.port}"
-        server.meta["server_id"] = hashlib.sha256(server_id.encode()).hexdigest()[:8]
+        server.meta["server_id"] = fingerprint_server(
+            server, ("type", "address", "port")
+        )[:8]
 
         # Add source information
         if context.source:
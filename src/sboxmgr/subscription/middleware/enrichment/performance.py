@@ -20,7 +20,7 @@ class PerformanceEnricher:
             cache_duration: How long to cache performance data in seconds
         """
         self.cache_duration = cache_duration
-        self._cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._cache: Dict[Tuple[str, int], Tuple[Dict[str, Any], float]] = {}
 
     def enrich(self, server: ParsedServer, context: PipelineContext) -> ParsedServer:
         """Apply performance enrichment to a server.
@@ -32,7 +32,7 @@ class PerformanceEnricher:
         Returns:
             Server with performance enrichment applied
         """
-        server_key = f"{server.address}:{server.port}"
+        server_key = (server.address, server.port)
 
         # Check cache first
         if server_key in self._cache:
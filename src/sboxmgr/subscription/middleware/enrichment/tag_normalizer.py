@@ -6,6 +6,8 @@ server naming across different parsers and data sources.
 
 from typing import List
 
+from sboxmgr.utils.id import fingerprint_server
+
 from ...models import ParsedServer, PipelineContext
 
 
@@ -82,7 +84,7 @@ class EnrichmentTagNormalizer:
             return f"{server.type}-{server.address}"
 
         # Priority 6: protocol-based fallback (if address is empty or None)
-        return f"{server.type}-{id(server)}"
+        return f"{server.type}-{fingerprint_server(server)[:8]}"
 
     def _sanitize_tag(self, tag: str) -> str:
         """Sanitize a tag string.
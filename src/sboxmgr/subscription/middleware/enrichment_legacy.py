@@ -7,9 +7,10 @@ information that can be used by postprocessors and exporters.
 Implements Phase 3 architecture with profile integration.
 """
 
-import hashlib
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from sboxmgr.utils.id import fingerprint_server
 
 from ...configs.models import FullProfile
 from ..models import ParsedServer, PipelineContext
@@ -72,7 +73,9 @@ class EnrichmentMiddleware(TransformMiddleware):
 
         # Initialize caches
         self._geo_cache: Dict[str, Dict[str, Any]] = {}
-        self._performance_cache: Dict[str, Dict[str, Any]] = {}
+        self._performance_cache: Dict[
+            Tuple[str, int], Tuple[Dict[str, Any], float]
+        ] = {}
         self._security_cache: Dict[str, Dict[str, Any]] = {}
 
     def _do_process(
@@ -217,8 +220,9 @@ class EnrichmentMiddleware(TransformMiddleware):
         server.meta["trace_id"] = context.trace_id
 
         # Add server identifier hash
-        server_id = f"{server.type}://{server.address}:{server.port}"
-        server.meta["server_id"] = hashlib.sha256(server_id.encode()).hexdigest()[:8]
+        server.meta["server_id"] = fingerprint_server(
+            server, ("type", "address", "port")
+        )[:8]
 
         # Add source information
         if context.source:
@@ -361,7 +365,7 @@ class EnrichmentMiddleware(TransformMiddleware):
             Server with performance enrichment
 
         """
-        server_key = f"{server.address}:{server.port}"
+        server_key = (server.address, server.port)
 
         # Check cache first
         if server_key in self._performance_cache:
@@ -8,6 +8,8 @@ consistent server naming across all User-Agent types and parsers.
 import re
 from typing import Any, Dict, List, Optional, Set
 
+from sboxmgr.utils.id import fingerprint_server
+
 from ...configs.models import FullProfile
 from ..models import ParsedServer, PipelineContext
 from .base import BaseMiddleware
@@ -101,7 +103,7 @@ class TagNormalizer(BaseMiddleware):
             return f"{server.type}-{server.address}"
 
         # Priority 6: protocol-based fallback
-        return f"{server.type}-{id(server)}"
+        return f"{server.type}-{fingerprint_server(server)[:8]}"
 
     def _sanitize_tag(self, tag: str) -> str:
         """
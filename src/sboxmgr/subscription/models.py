@@ -24,6 +24,7 @@ class SubscriptionSource(BaseModel):
         headers: Optional HTTP headers for requests.
         label: Optional human-readable label for the source.
         user_agent: Optional custom User-Agent string.
+        refresh_interval: Optional seconds between scheduled refreshes.
 
     """
 
@@ -34,6 +35,7 @@ class SubscriptionSource(BaseModel):
     headers: Optional[Dict[str, str]] = None
     label: Optional[str] = None
     user_agent: Optional[str] = None
+    refresh_interval: Optional[int] = Field(default=None, gt=0)
 
 
 class ParsedServer(BaseModel):
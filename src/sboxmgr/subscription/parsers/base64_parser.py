@@ -50,7 +50,21 @@ class Base64Parser(BaseParser):
             lines that match the pattern "method:password@server:port".
 
         """
-        decoded = base64.b64decode(raw)
+        return self.parse_decoded(base64.b64decode(raw))
+
+    def parse_decoded(self, decoded: bytes) -> List[ParsedServer]:
+        """Parse subscription data that was already base64-decoded.
+
+        Used when parser detection decoded the whole payload while sniffing,
+        so it is not decoded twice.
+
+        Args:
+            decoded: Decoded subscription data.
+
+        Returns:
+            List of ParsedServer objects from all valid proxy URIs.
+
+        """
         lines = decoded.decode("utf-8").splitlines()
         servers = []
         debug_level = get_debug_level()
@@ -5,12 +5,95 @@ subscription data. It converts Clash proxy configurations into standardized
 ParsedServer objects for consistent processing across different client formats.
 """
 
+import re
+
 import yaml
 
 from ..base_parser import BaseParser
 from ..models import ParsedServer
 from ..registry import register
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Payloads above this size are rejected before YAML parsing
+MAX_CLASH_PAYLOAD_BYTES = 32 * 1024 * 1024
+
+# Upper bound on YAML nodes added by alias expansion, guarding against
+# alias expansion ("billion laughs") bombs
+MAX_CLASH_ALIAS_NODES = 100_000
+
+# Top-level keys holding the proxy list, in lookup order
+PROXY_SECTION_KEYS = (b"proxies", b"Proxy")
+
+_TOP_LEVEL_LINE = re.compile(rb"^(?![\s#\-]|\.\.\.|---)\S", re.M)
+
+
+class _ClashLoader(_YamlLoader):
+    """Safe YAML loader rejecting documents that expand too far.
+
+    Aliases share the anchored node in the composed graph, but every
+    reference becomes a separate copy once the data is dumped or
+    validated. The composed document is therefore checked for the number
+    of nodes its aliases add before any Python object is constructed.
+    """
+
+    max_alias_nodes = MAX_CLASH_ALIAS_NODES
+
+    def get_single_node(self):
+        """Compose the document and check its alias expansion."""
+        node = super().get_single_node()
+        if node is not None:
+            _check_alias_expansion(node, self.max_alias_nodes)
+        return node
+
+
+def _check_alias_expansion(root: yaml.Node, limit: int) -> None:
+    """Check how many nodes alias references add to a composed document.
+
+    Expanded subtree sizes are memoized per node, so the check is linear
+    in the number of distinct nodes however deep aliases are nested.
+
+    Args:
+        root: Root node of the composed document.
+        limit: Maximum number of nodes added by alias expansion.
+
+    Raises:
+        ValueError: If expansion adds more than ``limit`` nodes or an
+            alias refers to its own ancestor.
+
+    """
+    sizes = {}
+    stack = [(root, False)]
+    while stack:
+        node, done = stack.pop()
+        key = id(node)
+        if done:
+            sizes[key] = 1 + sum(sizes[id(child)] for child in _children(node))
+            continue
+        if key in sizes:
+            if sizes[key] is None:
+                raise ValueError("recursive YAML alias")
+            continue
+        sizes[key] = None
+        stack.append((node, True))
+        stack.extend((child, False) for child in _children(node))
+
+    added = sizes[id(root)] - len(sizes)
+    if added > limit:
+        raise ValueError(f"YAML aliases expand to {added} extra nodes (limit {limit})")
+
+
+def _children(node: yaml.Node):
+    """Return the child nodes of a composed YAML node."""
+    if isinstance(node, yaml.MappingNode):
+        return [item for pair in node.value for item in pair]
+    if isinstance(node, yaml.SequenceNode):
+        return node.value
+    return []
+
 
 @register("clash")
 class ClashParser(BaseParser):
@@ -19,8 +102,27 @@ class ClashParser(BaseParser):
     This parser handles Clash-specific proxy configurations and converts them
     into standardized ParsedServer objects. It supports various Clash proxy
     types including shadowsocks, vmess, trojan, and others.
+
+    Only the proxy section is loaded when it can be located as a top-level
+    block, so large ``rules`` and ``rule-providers`` sections are skipped.
+    YAML is loaded with libyaml (``CSafeLoader``) when available.
     """
 
+    def __init__(
+        self,
+        max_bytes: int = MAX_CLASH_PAYLOAD_BYTES,
+        max_alias_nodes: int = MAX_CLASH_ALIAS_NODES,
+    ):
+        """Initialize the parser.
+
+        Args:
+            max_bytes: Maximum accepted payload size in bytes.
+            max_alias_nodes: Maximum YAML nodes added by alias expansion.
+
+        """
+        self.max_bytes = max_bytes
+        self.max_alias_nodes = max_alias_nodes
+
     def parse(self, raw: bytes):
         """Parse Clash YAML subscription data into ParsedServer objects.
 
@@ -35,34 +137,99 @@ class ClashParser(BaseParser):
             KeyError: If required configuration fields are missing.
 
         """
+        if len(raw) > self.max_bytes:
+            print(
+                f"[ClashParser] Payload too large: {len(raw)} bytes "
+                f"(limit {self.max_bytes})"
+            )
+            return []
         try:
-            data = yaml.safe_load(raw.decode("utf-8"))
+            proxies = self._load_proxy_section(raw)
+            data = self._load(raw) if proxies is None else None
         except Exception as e:
             print(f"[ClashParser] YAML parse error: {e}")
             return []
-        servers = []
-        proxies = []
-        # Если это список — возможно, это просто список прокси
-        if isinstance(data, list):
-            proxies = data
-        # Если это dict — ищем секцию proxies
-        elif isinstance(data, dict):
-            proxies = data.get("proxies") or data.get("Proxy") or []
-        else:
-            print(f"[ClashParser] Unexpected YAML root type: {type(data)}")
-            return []
+        if proxies is None:
+            # Если это список — возможно, это просто список прокси
+            if isinstance(data, list):
+                proxies = data
+            # Если это dict — ищем секцию proxies
+            elif isinstance(data, dict):
+                proxies = data.get("proxies") or data.get("Proxy") or []
+            else:
+                print(f"[ClashParser] Unexpected YAML root type: {type(data)}")
+                return []
         if not proxies:
             print("[ClashParser] No proxies section found or section is empty.")
             return []
-        for p in proxies:
-            servers.append(
-                ParsedServer(
-                    type=p.get("type", "unknown"),
-                    address=p.get("server", ""),
-                    port=int(p.get("port", 0)),
-                    security=p.get("cipher", None),
-                    meta=p,
-                )
-            )
         # Убираем безусловный print - логирование будет в manager.py
-        return servers
+        return [_proxy_to_server(p) for p in proxies]
+
+    def _load(self, raw: bytes):
+        """Load a YAML document within the alias expansion budget."""
+        loader = _ClashLoader(raw)
+        loader.max_alias_nodes = self.max_alias_nodes
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+
+    def _load_proxy_section(self, raw: bytes):
+        """Load only the top-level proxy block of a Clash document.
+
+        Returns:
+            The proxy list, or None if the section cannot be isolated and the
+            whole document has to be loaded.
+
+        Raises:
+            ValueError: If the section exceeds the alias expansion budget.
+
+        """
+        for key in PROXY_SECTION_KEYS:
+            match = re.search(rb"^" + key + rb":", raw, re.M)
+            if match is None:
+                continue
+            end = _TOP_LEVEL_LINE.search(raw, match.end())
+            section = raw[match.start() : end.start() if end else len(raw)]
+            try:
+                data = self._load(section)
+            except yaml.YAMLError:
+                # e.g. aliases to anchors defined outside the section
+                return None
+            proxies = data.get(key.decode()) if isinstance(data, dict) else None
+            if proxies:
+                return proxies if isinstance(proxies, list) else None
+        return None
+
+
+def _proxy_to_server(proxy) -> ParsedServer:
+    """Build a ParsedServer from a Clash proxy mapping.
+
+    Well-formed entries skip model validation; anything else goes through
+    the validating constructor so malformed input still raises.
+    """
+    if isinstance(proxy, dict):
+        server_type = proxy.get("type", "unknown")
+        address = proxy.get("server", "")
+        port = proxy.get("port", 0)
+        cipher = proxy.get("cipher")
+        if (
+            type(server_type) is str
+            and type(address) is str
+            and type(port) is int
+            and (cipher is None or type(cipher) is str)
+        ):
+            return ParsedServer.model_construct(
+                type=server_type,
+                address=address,
+                port=port,
+                security=cipher,
+                meta=proxy,
+            )
+    return ParsedServer(
+        type=proxy.get("type", "unknown"),
+        address=proxy.get("server", ""),
+        port=int(proxy.get("port", 0)),
+        security=proxy.get("cipher", None),
+        meta=proxy,
+    )
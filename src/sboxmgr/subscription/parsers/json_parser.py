@@ -7,7 +7,6 @@ ParsedServer objects for consistent processing.
 """
 
 import json
-import re
 from typing import List, Tuple
 
 from sboxmgr.utils.env import get_debug_level
@@ -15,6 +14,7 @@ from sboxmgr.utils.env import get_debug_level
 from ..base_parser import BaseParser
 from ..models import ParsedServer
 from ..registry import register
+from .jsonc import strip_jsonc
 
 
 @register("json")
@@ -87,39 +87,7 @@ class TolerantJSONParser(BaseParser):
         return []
 
     def _strip_comments_and_validate(self, raw_data: str) -> Tuple[str, list]:
-        removed = []
-        # Удаляем leading комментарии и шум до первой { или [
-        lines = raw_data.splitlines()
-        clean_lines = []
-        found_json_start = False
-        for line in lines:
-            stripped_line = line.strip()
-            if not found_json_start:
-                if stripped_line.startswith("{") or stripped_line.startswith("["):
-                    found_json_start = True
-                    clean_lines.append(line)
-                else:
-                    removed.append(line)
-                continue
-            # После старта JSON — обычная очистка
-            if stripped_line.startswith("//") or stripped_line.startswith("#"):
-                removed.append(line)
-                continue
-            # Удаляем inline // и # комментарии
-            if "//" in line:
-                idx = line.index("//")
-                removed.append(line[idx:])
-                line = line[:idx]
-            if "#" in line and not line.lstrip().startswith("#"):
-                idx = line.index("#")
-                removed.append(line[idx:])
-                line = line[:idx]
-            clean_lines.append(line)
-        clean_json = "\n".join(clean_lines)
-        # Удаляем поля _comment и trailing commas
-        clean_json = re.sub(r'"_comment"\s*:\s*".*?",?', "", clean_json)
-        clean_json = re.sub(r",\s*([}\]])", r"\1", clean_json)
-        return clean_json, removed
+        return strip_jsonc(raw_data)
 
 
 @register("ssr_json")
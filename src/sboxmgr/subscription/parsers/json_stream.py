@@ -0,0 +1,187 @@
+"""Incremental reader for one array of a large JSON document.
+
+``iter_json_array`` consumes a JSON object chunk by chunk and yields the
+items of one top-level array (e.g. sing-box ``outbounds``) as they are read.
+Sections before the array are skipped without being decoded and reading
+stops at the end of the array, so the reader itself holds at most the
+largest item plus one chunk rather than the whole decoded document.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Strings and anything but brackets; bounded so one match stays cheap
+_SKIP_RUN = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*"){1,1024}')
+
+# Characters that may follow a number or literal
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+_DECODER = json.JSONDecoder()
+
+
+class _ChunkReader:
+    """Text buffer over an iterable of UTF-8 byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buf = ""
+        self.pos = 0
+        # Start of a value being read; kept in the buffer across refills
+        self.mark: Optional[int] = None
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer.
+
+        Returns:
+            False if the input is exhausted.
+
+        """
+        while not self.eof:
+            try:
+                text = self._decoder.decode(next(self._chunks))
+            except StopIteration:
+                self.eof = True
+                text = self._decoder.decode(b"", final=True)
+            if text:
+                keep = self.pos if self.mark is None else self.mark
+                self.buf = self.buf[keep:] + text
+                self.pos -= keep
+                if self.mark is not None:
+                    self.mark = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` after optional whitespace."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Expected {char!r} in JSON input, found {found or 'end of input'!r}"
+            )
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Read and decode the next JSON value."""
+        first = self.peek()
+        if first in ("{", "["):
+            try:
+                value, self.pos = _DECODER.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                # Cut off at the end of the buffer (or malformed): find the
+                # end of the value, reading more chunks, and decode it whole
+                pass
+            self.mark = self.pos
+            try:
+                self._skip_container()
+                return json.loads(self.buf[self.mark : self.pos])
+            finally:
+                self.mark = None
+        if first != '"':
+            # A number or literal may continue in the next chunk: read until
+            # a delimiter follows it or the input ends
+            while _SCALAR_END.search(self.buf, self.pos) is None and self.fill():
+                pass
+            value, self.pos = _DECODER.raw_decode(self.buf, self.pos)
+            return value
+        while True:
+            try:
+                value, self.pos = _DECODER.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                # Unterminated string: read the next chunk
+                if not self.fill():
+                    raise
+
+    def skip_value(self) -> None:
+        """Skip the next JSON value without decoding containers."""
+        if self.peek() in ("{", "["):
+            self._skip_container()
+        else:
+            self.read_value()
+
+    def _skip_container(self) -> None:
+        """Advance past the object or array starting at the current position."""
+        depth = 0
+        while True:
+            if self.pos >= len(self.buf):
+                if not self.fill():
+                    raise ValueError("Unexpected end of JSON input")
+                continue
+            char = self.buf[self.pos]
+            if char in "[{":
+                depth += 1
+                self.pos += 1
+            elif char in "]}":
+                depth -= 1
+                self.pos += 1
+                if depth == 0:
+                    return
+            else:
+                run = _SKIP_RUN.match(self.buf, self.pos)
+                if run is None:
+                    # String continues in the next chunk
+                    if not self.fill():
+                        raise ValueError("Unexpected end of JSON input")
+                    continue
+                self.pos = run.end()
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Yield the items of a top-level array of a JSON object.
+
+    Args:
+        chunks: UTF-8 encoded JSON document split into chunks of any size.
+        key: Name of the top-level array to read.
+
+    Yields:
+        Decoded array items; nothing if the key is missing.
+
+    Raises:
+        ValueError: If the input is not a JSON object or is malformed before
+            the end of the array (``json.JSONDecodeError`` for malformed
+            items).
+
+    """
+    reader = _ChunkReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        if reader.peek() != '"':
+            raise ValueError("Expected a property name in JSON input")
+        name = reader.read_value()
+        reader.expect(":")
+        if name == key:
+            break
+        reader.skip_value()
+        if reader.peek() == "}":
+            return
+        reader.expect(",")
+
+    if reader.peek() == "n":
+        reader.read_value()  # null
+        return
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.read_value()
+        if reader.peek() == "]":
+            return
+        reader.expect(",")
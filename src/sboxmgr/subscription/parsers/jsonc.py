@@ -0,0 +1,109 @@
+"""Single-pass JSONC cleaner shared by the JSON-based parsers.
+
+Subscriptions often ship sing-box JSON with comments, ``_comment`` fields and
+trailing commas. ``strip_jsonc`` tokenizes the document once with a regular
+expression that matches whole string literals, so ``//`` and ``#`` inside
+URLs or passwords are preserved, and produces text ``json.loads`` accepts.
+"""
+
+import re
+from typing import List, Tuple
+
+# Everything except comments and commas followed by a closing bracket, a
+# comment or a "_comment" field is copied as one "run" token, so plain JSON
+# passes through in few matches. Runs are bounded: one unbounded repeat over
+# a multi-megabyte document is an order of magnitude slower in ``re``.
+_RUN = r"""
+    (?:
+        "[^"\\]*(?:\\.[^"\\]*)*"
+        |[^"/\#,]+
+        |,(?!\s*(?:[}\]/\#]|"_comment"\s*:))
+    ){1,1024}
+"""
+_TOKEN_TEMPLATE = r"""
+    (?P<run>{run})
+    |(?P<comment>//[^\n]*|\#[^\n]*|/\*.*?\*/)
+    |(?P<comma>,)
+    |(?P<other>.)
+"""
+_TOKEN = re.compile(_TOKEN_TEMPLATE.format(run=_RUN), re.S | re.X)
+
+# Same tokens, but runs stop in front of "_comment" fields; only used once
+# a document contains one, since the lookahead makes every match slower
+_TOKEN_COMMENT_AWARE = re.compile(
+    _TOKEN_TEMPLATE.format(run=_RUN.replace('"[^', '(?!"_comment"\\s*:\\s*")"[^', 1)),
+    re.S | re.X,
+)
+
+_COMMENT_FIELD = re.compile(r'"_comment"\s*:\s*"(?:[^"\\]|\\.)*"\s*,?', re.S)
+
+_FIRST_SIGNIFICANT = re.compile(r"\s*(\S)")
+
+# First line opening the JSON document; anything above it is noise
+_JSON_START = re.compile(r"^[ \t]*[\[{]", re.M)
+
+
+def strip_jsonc(text: str) -> Tuple[str, List[str]]:
+    """Strip comments, ``_comment`` fields and trailing commas from JSON.
+
+    Lines before the first line starting with ``{`` or ``[`` are dropped.
+    ``//``, ``#`` and ``/* */`` comments outside string literals are removed
+    and a comma directly followed by ``}`` or ``]`` is dropped.
+
+    Args:
+        text: JSON or JSONC document.
+
+    Returns:
+        Tuple of JSON text and the list of removed fragments.
+
+    """
+    removed: List[str] = []
+    start = _JSON_START.search(text)
+    if start is None:
+        if text:
+            removed.extend(text.splitlines())
+        return "", removed
+    if start.start():
+        removed.extend(text[: start.start()].splitlines())
+
+    out: List[str] = []
+    append = out.append
+    pending_comma = False
+    pos = start.start()
+    end = len(text)
+    match = _TOKEN.match
+    comment_aware = _TOKEN_COMMENT_AWARE.match
+    while pos < end:
+        if text.startswith('"_comment"', pos):
+            field = _COMMENT_FIELD.match(text, pos)
+            if field:
+                removed.append(field.group())
+                pos = field.end()
+                continue
+        token = match(text, pos)
+        if match is not comment_aware and '"_comment"' in token.group():
+            # Switch for the rest of the document to keep the scan linear
+            match = comment_aware
+            token = match(text, pos)
+        kind = token.lastgroup
+        pos = token.end()
+        value = token.group()
+        if kind == "comment":
+            removed.append(value)
+            continue
+        if pending_comma:
+            significant = _FIRST_SIGNIFICANT.match(value)
+            if significant is None:
+                # Only whitespace so far, the next token decides
+                append(value)
+                continue
+            if significant.group(1) not in "}]":
+                append(",")
+            pending_comma = False
+        if kind == "comma":
+            pending_comma = True
+        else:
+            append(value)
+    if pending_comma:
+        append(",")
+    return "".join(out), removed
@@ -6,14 +6,21 @@ and converts them into standardized ParsedServer objects.
 """
 
 import json
-import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sboxmgr.utils.env import get_debug_level
 
 from ..base_parser import BaseParser
 from ..models import ParsedServer
 from ..registry import register
+from .json_stream import iter_json_array
+from .jsonc import strip_jsonc
+
+# Payloads above this size are parsed incrementally, one outbound at a time
+STREAM_PARSE_BYTES = 8 * 1024 * 1024
+
+# Slice size used to feed in-memory payloads to the incremental reader
+_STREAM_SLICE_BYTES = 1024 * 1024
 
 
 @register("singbox")
@@ -24,6 +31,11 @@ class SingBoxParser(BaseParser):
     server configurations from the outbounds section. It supports both
     modern and legacy sing-box syntax with safe field injection and
     fail-tolerance.
+
+    ``parse_stream`` reads outbounds incrementally from a chunk stream
+    without decoding the whole document; ``parse`` uses it for payloads
+    above ``STREAM_PARSE_BYTES``. The pipeline still fetches the raw
+    payload whole, so only the decoded document is saved.
     """
 
     def parse(self, raw: bytes) -> List[ParsedServer]:
@@ -41,13 +53,26 @@ class SingBoxParser(BaseParser):
         """
         debug_level = get_debug_level()
 
-        try:
-            # Clean and parse JSON
-            clean_json, removed = self._strip_comments_and_validate(raw.decode("utf-8"))
-            if removed and debug_level > 0:
-                print(f"[SingBoxParser] Removed comments/fields: {removed}")
+        if len(raw) > STREAM_PARSE_BYTES:
+            try:
+                return list(self.parse_stream(_slices(raw)))
+            except ValueError as e:
+                # JSONC or malformed JSON, handled by the full parse below
+                if debug_level > 0:
+                    print(f"[SingBoxParser] Incremental parse failed: {e}")
 
-            config = json.loads(clean_json)
+        try:
+            text = raw.decode("utf-8")
+            try:
+                # Plain JSON needs no cleaning
+                config = json.loads(text)
+            except json.JSONDecodeError:
+                # Clean and parse JSON
+                clean_json, removed = self._strip_comments_and_validate(text)
+                if removed and debug_level > 0:
+                    print(f"[SingBoxParser] Removed comments/fields: {removed}")
+
+                config = json.loads(clean_json)
 
             # Extract outbounds
             outbounds = config.get("outbounds", [])
@@ -79,57 +104,53 @@ class SingBoxParser(BaseParser):
                 print(f"[SingBoxParser] Parse error: {e}")
             raise
 
-    def _strip_comments_and_validate(self, raw_data: str) -> Tuple[str, list]:
-        """Strip comments and validate JSON data.
+    def parse_stream(self, chunks: Iterable[bytes]) -> Iterator[ParsedServer]:
+        """Parse servers from a sing-box JSON document read in chunks.
+
+        Outbounds are decoded one at a time as they are read and sections
+        other than ``outbounds`` are skipped, so beyond the input chunks
+        memory use is bounded by a single outbound. Comments and trailing
+        commas are not supported.
 
         Args:
-            raw_data: Raw JSON string with potential comments.
+            chunks: Raw JSON document split into byte chunks.
 
-        Returns:
-            Tuple[str, list]: Clean JSON string and list of removed items.
+        Yields:
+            ParsedServer: Parsed server configurations in document order.
 
-        """
-        removed = []
-
-        # Remove leading comments and noise before first { or [
-        lines = raw_data.splitlines()
-        clean_lines = []
-        found_json_start = False
-
-        for line in lines:
-            stripped_line = line.strip()
-            if not found_json_start:
-                if stripped_line.startswith("{") or stripped_line.startswith("["):
-                    found_json_start = True
-                    clean_lines.append(line)
-                else:
-                    removed.append(line)
-                continue
+        Raises:
+            ValueError: If the document is not valid JSON.
 
-            # After JSON start - normal cleaning
-            if stripped_line.startswith("//") or stripped_line.startswith("#"):
-                removed.append(line)
+        """
+        debug_level = get_debug_level()
+        count = 0
+        total = 0
+        for i, outbound in enumerate(iter_json_array(chunks, "outbounds")):
+            total += 1
+            try:
+                server = self._parse_outbound(outbound, i)
+            except Exception as e:
+                if debug_level > 0:
+                    print(f"[SingBoxParser] Failed to parse outbound {i}: {e}")
                 continue
+            if server:
+                count += 1
+                yield server
 
-            # Remove inline // and # comments
-            if "//" in line:
-                idx = line.index("//")
-                removed.append(line[idx:])
-                line = line[:idx]
-            if "#" in line and not line.lstrip().startswith("#"):
-                idx = line.index("#")
-                removed.append(line[idx:])
-                line = line[:idx]
+        if debug_level > 0:
+            print(f"[SingBoxParser] Parsed {count} servers from {total} outbounds")
 
-            clean_lines.append(line)
+    def _strip_comments_and_validate(self, raw_data: str) -> Tuple[str, list]:
+        """Strip comments and validate JSON data.
 
-        clean_json = "\n".join(clean_lines)
+        Args:
+            raw_data: Raw JSON string with potential comments.
 
-        # Remove _comment fields and trailing commas
-        clean_json = re.sub(r'"_comment"\s*:\s*".*?",?', "", clean_json)
-        clean_json = re.sub(r",\s*([}\]])", r"\1", clean_json)
+        Returns:
+            Tuple[str, list]: Clean JSON string and list of removed items.
 
-        return clean_json, removed
+        """
+        return strip_jsonc(raw_data)
 
     def _parse_outbound(self, outbound: dict, index: int = 0) -> Optional[ParsedServer]:
         """Parse a single outbound configuration into ParsedServer.
@@ -409,3 +430,10 @@ class SingBoxParser(BaseParser):
         return ParsedServer(
             type="socks", address=server, port=port, security="socks", meta=meta
         )
+
+
+def _slices(raw: bytes) -> Iterator[memoryview]:
+    """Split a payload into zero-copy slices for incremental parsing."""
+    view = memoryview(raw)
+    for start in range(0, len(view), _STREAM_SLICE_BYTES):
+        yield view[start : start + _STREAM_SLICE_BYTES]
@@ -8,7 +8,9 @@ transformations before final export.
 
 import inspect
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from sboxmgr.utils.id import fingerprint_server
 
 from .models import ParsedServer, PipelineContext
 
@@ -43,8 +45,84 @@ class BasePostProcessor(ABC):
         pass
 
 
+_ENDPOINT_IDENTITY = ("type", "address", "port")
+_CREDENTIAL_IDENTITY = _ENDPOINT_IDENTITY + (
+    "security",
+    "uuid",
+    "password",
+    "username",
+    "private_key",
+    "peer_public_key",
+    "meta.uuid",
+    "meta.id",
+    "meta.password",
+)
+_TRANSPORT_IDENTITY = _CREDENTIAL_IDENTITY + (
+    "meta.network",
+    "meta.net",
+    "meta.type",
+    "meta.path",
+    "meta.host",
+    "meta.serviceName",
+    "meta.sni",
+    "meta.security",
+    "meta.flow",
+)
+
+# Named identity definitions accepted by DedupPostProcessor
+DEDUP_IDENTITY_PRESETS = {
+    # Same endpoint, same tag: exact duplicates only
+    "exact": _ENDPOINT_IDENTITY + ("meta.tag",),
+    # Same endpoint regardless of credentials and transport
+    "endpoint": _ENDPOINT_IDENTITY,
+    # Same endpoint and credentials, any transport or tag
+    "credentials": _CREDENTIAL_IDENTITY,
+    # Same endpoint, credentials and transport, any tag
+    "transport": _TRANSPORT_IDENTITY,
+}
+
+
 class DedupPostProcessor(BasePostProcessor):
-    """Remove duplicate servers based on type, address, port, and tag."""
+    """Remove duplicate and near-duplicate servers.
+
+    Servers are bucketed by their fingerprint over the identity fields in a
+    single pass. From each bucket the best-scored variant is kept, at the
+    position of the first one: variants from a preferred source win, then
+    the lowest known ``meta["latency_ms"]``, then the earliest server.
+
+    Args:
+        identity_fields: Name of a ``DEDUP_IDENTITY_PRESETS`` entry or
+            fields identifying a server, see
+            ``sboxmgr.utils.id.fingerprint_server``.
+        source_priority: Sources (``meta["source"]``) from most to least
+            preferred.
+
+    """
+
+    DEFAULT_IDENTITY_FIELDS = DEDUP_IDENTITY_PRESETS["exact"]
+
+    def __init__(
+        self,
+        identity_fields: Union[str, Sequence[str]] = DEFAULT_IDENTITY_FIELDS,
+        source_priority: Optional[Sequence[str]] = None,
+    ):
+        """Initialize dedup postprocessor.
+
+        Args:
+            identity_fields: Identity preset name or fields identifying a server.
+            source_priority: Sources from most to least preferred.
+
+        Raises:
+            ValueError: If the identity preset is unknown.
+        """
+        if isinstance(identity_fields, str):
+            if identity_fields not in DEDUP_IDENTITY_PRESETS:
+                raise ValueError(f"Unknown dedup identity: {identity_fields}")
+            identity_fields = DEDUP_IDENTITY_PRESETS[identity_fields]
+        self.identity_fields = tuple(identity_fields)
+        self.source_priority = {
+            source: rank for rank, source in enumerate(source_priority or ())
+        }
 
     def process(
         self, servers: List[ParsedServer], context: PipelineContext | None = None
@@ -58,15 +136,36 @@ class DedupPostProcessor(BasePostProcessor):
         Returns:
             List[ParsedServer]: Deduplicated server list.
         """
-        seen = set()
-        result = []
+        slots: Dict[str, int] = {}
+        result: List[ParsedServer] = []
+        scores: Dict[int, Tuple[float, float]] = {}
         for s in servers:
-            key = (s.type, s.address, s.port, getattr(s, "meta", {}).get("tag"))
-            if key not in seen:
-                seen.add(key)
+            key = fingerprint_server(s, self.identity_fields)
+            slot = slots.get(key)
+            if slot is None:
+                slots[key] = len(result)
                 result.append(s)
+                continue
+
+            # Near-duplicate: keep the better variant in the existing slot
+            if slot not in scores:
+                scores[slot] = self._score(result[slot])
+            score = self._score(s)
+            if score < scores[slot]:
+                result[slot] = s
+                scores[slot] = score
         return result
 
+    def _score(self, server: ParsedServer) -> Tuple[float, float]:
+        """Score a server variant, lower is better."""
+        meta = getattr(server, "meta", None) or {}
+        rank = self.source_priority.get(meta.get("source"), len(self.source_priority))
+        try:
+            latency = float(meta["latency_ms"])
+        except (KeyError, TypeError, ValueError):
+            latency = float("inf")
+        return rank, latency
+
 
 class PostProcessorChain(BasePostProcessor):
     """Chain of postprocessor plugins called in sequence to process ParsedServer list.
@@ -59,7 +59,7 @@ class LatencySortPostProcessor(ChainablePostProcessor):
         self.fallback_latency = self.config.get("fallback_latency", 999999)
         self.remove_unreachable = self.config.get("remove_unreachable", False)
         self._latency_cache: Dict[
-            str, Tuple[float, float]
+            Tuple[str, int], Tuple[float, float]
         ] = {}  # server_key -> (latency, timestamp)
 
     def _do_process(
@@ -170,7 +170,7 @@ class LatencySortPostProcessor(ChainablePostProcessor):
             Latency in milliseconds
 
         """
-        server_key = f"{server.address}:{server.port}"
+        server_key = (server.address, server.port)
 
         # Check cache first
         if server_key in self._latency_cache:
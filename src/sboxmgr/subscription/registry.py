@@ -1,34 +1,119 @@
-"""Plugin registry for subscription parsers and exporters."""
+"""Plugin registry for subscription parsers and exporters.
 
+Plugins are registered by name. Classes decorated with ``@register`` are
+registered when their module is imported; built-in plugins and plugins from
+``sboxmgr.plugins`` entry points are registered lazily as ``module:attr``
+specs and imported on the first ``get_plugin`` call for their name.
+
+Entry points are read from a manifest cached in the cache directory (one
+per Python environment), so installed distributions' metadata is only
+scanned again when the set of installed distributions changes.
+"""
+
+import hashlib
+import importlib
+import json
 import logging
-from typing import Dict, Type
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Type
+
+from sboxmgr.utils.env import get_cache_dir
+from sboxmgr.utils.file import atomic_write_json
+
+ENTRY_POINT_GROUP = "sboxmgr.plugins"
+
+# Bump when the manifest file layout changes
+MANIFEST_FORMAT_VERSION = 1
 
 PLUGIN_REGISTRY: Dict[str, Type] = {}
 
+# Plugins registered by name but not imported yet: name -> "module:attr"
+_LAZY_PLUGINS: Dict[str, str] = {}
+
+_PACKAGE = "sboxmgr.subscription"
+
+BUILTIN_PLUGINS: Dict[str, str] = {
+    # Fetchers
+    "url": f"{_PACKAGE}.fetchers.url_fetcher:URLFetcher",
+    "url_base64": f"{_PACKAGE}.fetchers.url_fetcher:URLFetcher",
+    "uri_list": f"{_PACKAGE}.fetchers.url_fetcher:URLFetcher",
+    "url_json": f"{_PACKAGE}.fetchers.json_fetcher:JSONFetcher",
+    "file": f"{_PACKAGE}.fetchers.file_fetcher:FileFetcher",
+    "custom_fetcher": f"{_PACKAGE}.fetchers.apifetcher:ApiFetcher",
+    # Parsers
+    "base64": f"{_PACKAGE}.parsers.base64_parser:Base64Parser",
+    "clash": f"{_PACKAGE}.parsers.clash_parser:ClashParser",
+    "json": f"{_PACKAGE}.parsers.json_parser:JSONParser",
+    "tolerant_json": f"{_PACKAGE}.parsers.json_parser:TolerantJSONParser",
+    "ssr_json": f"{_PACKAGE}.parsers.json_parser:SSRJSONParser",
+    "singbox": f"{_PACKAGE}.parsers.singbox_parser:SingBoxParser",
+    "parser_uri_list": f"{_PACKAGE}.parsers.uri_list_parser:URIListParser",
+    "custom_parser": f"{_PACKAGE}.parsers.sfiparser:SfiParser",
+    # Exporters
+    "singbox_v2": f"{_PACKAGE}.exporters.singbox_exporter_v2.exporter:SingboxExporterV2",
+    # Middleware
+    "outbound_filter": f"{_PACKAGE}.middleware.outbound_filter:OutboundFilterMiddleware",
+    "route_config": f"{_PACKAGE}.middleware.route_config:RouteConfigMiddleware",
+    # Postprocessors
+    "postprocessor_chain": f"{_PACKAGE}.postprocessors.chain:PostProcessorChain",
+    "tag_filter": f"{_PACKAGE}.postprocessors.tag_filter:TagFilterPostProcessor",
+    "latency_sort": f"{_PACKAGE}.postprocessors.latency_sort:LatencySortPostProcessor",
+    "geo_filter": f"{_PACKAGE}.postprocessors.geo_filter:GeoFilterPostProcessor",
+}
+
+_entry_points_loaded = False
+_lock = threading.RLock()
+
 # Явная регистрация через декоратор
 
 
 def register(source_type: str):
     """Register a plugin class for a specific source type.
 
+    The class replaces a built-in plugin of the same name that has not been
+    imported yet; plugins from entry points still take precedence.
+
     Args:
         source_type: Type of subscription source
 
     """
 
     def wrapper(cls):
-        PLUGIN_REGISTRY[source_type] = cls
+        with _lock:
+            PLUGIN_REGISTRY[source_type] = cls
+            if _LAZY_PLUGINS.get(source_type) == BUILTIN_PLUGINS.get(source_type):
+                _LAZY_PLUGINS.pop(source_type, None)
         return cls
 
     return wrapper
 
 
+def register_lazy(source_type: str, spec: str) -> None:
+    """Register a plugin by import path without importing its module.
+
+    A lazy registration takes precedence over a class registered earlier
+    under the same name once ``get_plugin`` resolves it.
+
+    Args:
+        source_type: Type of subscription source
+        spec: Plugin location as ``"package.module:ClassName"``
+
+    """
+    with _lock:
+        _LAZY_PLUGINS[source_type] = spec
+
+
 # Получение класса по типу
 
 
 def get_plugin(source_type: str):
     """Get plugin class for a specific source type.
 
+    Lazily registered plugins are imported on the first call for their name.
+
     Args:
         source_type: Type of subscription source
 
@@ -36,18 +121,155 @@ def get_plugin(source_type: str):
         Plugin class or None if not found
 
     """
+    spec = _LAZY_PLUGINS.get(source_type)
+    if spec is not None:
+        with _lock:
+            spec = _LAZY_PLUGINS.get(source_type)
+            if spec is not None:
+                cls = _resolve(source_type, spec)
+                if cls is not None:
+                    PLUGIN_REGISTRY[source_type] = cls
+                _LAZY_PLUGINS.pop(source_type, None)
     return PLUGIN_REGISTRY.get(source_type)
 
 
+def _resolve(source_type: str, spec: str) -> Optional[Type]:
+    """Import the plugin class named by a ``module:attr`` spec."""
+    module_name, _, attr = spec.partition(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for part in filter(None, attr.split(".")):
+            obj = getattr(obj, part)
+    except Exception as e:
+        # Как и раньше: сломанный плагин не должен ронять менеджер
+        logging.debug(f"Failed to load plugin {source_type} from {spec}: {e}")
+        return None
+    return obj
+
+
+def _register_builtins() -> None:
+    """Register built-in plugins by name without importing them."""
+    for name, spec in BUILTIN_PLUGINS.items():
+        _LAZY_PLUGINS.setdefault(name, spec)
+
+
+_register_builtins()
+
+
 # Задел под entry points (setuptools)
-def load_entry_points():
-    """Load plugins from setuptools entry points."""
+def load_entry_points(refresh: bool = False):
+    """Register plugins from setuptools entry points.
+
+    Entry points are registered lazily and override plugins of the same
+    name. They are read once per process from a cached manifest, which is
+    rebuilt when the set of installed distributions changes.
+
+    Args:
+        refresh: Scan installed distributions even if already loaded
+
+    """
+    global _entry_points_loaded
+    with _lock:
+        if _entry_points_loaded and not refresh:
+            return
+        _entry_points_loaded = True
+        try:
+            entry_points = _entry_point_manifest(refresh)
+        except Exception as e:
+            # entry points optional, не критично для MVP
+            logging.debug(f"Failed to load entry points: {e}")
+            return
+        for name, spec in entry_points.items():
+            register_lazy(name, spec)
+
+
+def _entry_point_manifest(refresh: bool = False) -> Dict[str, str]:
+    """Return entry points of the plugin group, using the cached manifest.
+
+    Args:
+        refresh: Ignore the cached manifest
+
+    Returns:
+        Mapping of plugin names to ``module:attr`` specs
+
+    """
+    path = _manifest_path()
+    fingerprint = _distributions_fingerprint()
+    if not refresh:
+        cached = _read_manifest(path, fingerprint)
+        if cached is not None:
+            return cached
+
+    import importlib.metadata
+
+    entry_points = {
+        ep.name: ep.value
+        for ep in importlib.metadata.entry_points().select(group=ENTRY_POINT_GROUP)
+    }
     try:
-        import importlib.metadata
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(
+            {
+                "version": MANIFEST_FORMAT_VERSION,
+                "fingerprint": fingerprint,
+                "entry_points": entry_points,
+            },
+            str(path),
+        )
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Failed to save plugin manifest: {e}")
+    return entry_points
 
-        eps = importlib.metadata.entry_points()
-        for ep in eps.select(group="sboxmgr.plugins"):  # group name по соглашению
-            PLUGIN_REGISTRY[ep.name] = ep.load()
-    except Exception as e:
-        # entry points optional, не критично для MVP
-        logging.debug(f"Failed to load entry points: {e}")
+
+def _manifest_path() -> Path:
+    """Return the manifest path of the running Python environment."""
+    env = hashlib.blake2b(sys.prefix.encode(), digest_size=4).hexdigest()
+    return get_cache_dir() / f"plugin_manifest_{env}.json"
+
+
+def _read_manifest(path: Path, fingerprint: str) -> Optional[Dict[str, str]]:
+    """Read a cached manifest if it matches the installed distributions."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.debug(f"Ignoring unreadable plugin manifest {path}: {e}")
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MANIFEST_FORMAT_VERSION
+        or data.get("fingerprint") != fingerprint
+        or not isinstance(data.get("entry_points"), dict)
+    ):
+        return None
+    return data["entry_points"]
+
+
+def _distributions_fingerprint() -> str:
+    """Fingerprint the distributions installed on ``sys.path``.
+
+    Uses the names and modification times of ``*.dist-info`` and
+    ``*.egg-info`` entries, which change whenever a distribution is
+    installed, upgraded or removed, without reading their metadata.
+
+    Returns:
+        Hex digest of the installed distribution set
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as it:
+                names = sorted(
+                    (e.name, e.stat().st_mtime_ns)
+                    for e in it
+                    if e.name.endswith((".dist-info", ".egg-info"))
+                )
+        except OSError:
+            continue
+        digest.update(f"{entry}\0".encode())
+        for name, mtime in names:
+            digest.update(f"{name}\0{mtime}\0".encode())
+    return digest.hexdigest()
@@ -83,6 +83,7 @@ from .validators import (
     generate_protocol_schema,
     validate_outbound_config,
     validate_protocol_config,
+    validate_protocol_configs,
 )
 
 __all__ = [
@@ -133,6 +134,7 @@ __all__ = [
     "OutboundConfig",
     # Validators
     "validate_protocol_config",
+    "validate_protocol_configs",
     "generate_protocol_schema",
     "validate_outbound_config",
     "generate_outbound_schema",
@@ -4,7 +4,10 @@ This module provides utility functions for validating protocol configurations,
 generating schemas, and converting between different model types.
 """
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .outbound_models import (
     BlockOutbound,
@@ -31,6 +34,25 @@ from .protocol_configs import (
     WireGuardConfig,
 )
 
+PROTOCOL_CONFIG_MODELS: Dict[str, Type[BaseModel]] = {
+    "shadowsocks": ShadowsocksConfig,
+    "ss": ShadowsocksConfig,
+    "vmess": VmessConfig,
+    "vless": VlessConfig,
+    "trojan": TrojanConfig,
+    "wireguard": WireGuardConfig,
+    "wg": WireGuardConfig,
+}
+
+# Configs validated per adapter call; bounds the size of a single ValidationError
+VALIDATION_BATCH_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _config_list_adapter(config_class: Type[BaseModel]) -> TypeAdapter:
+    """Get the cached list TypeAdapter for a protocol config model."""
+    return TypeAdapter(List[config_class])
+
 
 def validate_protocol_config(config: Dict[str, Any], protocol: str) -> ProtocolConfig:
     """Validate protocol-specific configuration.
@@ -45,23 +67,86 @@ def validate_protocol_config(config: Dict[str, Any], protocol: str) -> ProtocolC
     Raises:
         ValueError: If configuration is invalid
     """
-    protocol_map = {
-        "shadowsocks": ShadowsocksConfig,
-        "ss": ShadowsocksConfig,
-        "vmess": VmessConfig,
-        "vless": VlessConfig,
-        "trojan": TrojanConfig,
-        "wireguard": WireGuardConfig,
-        "wg": WireGuardConfig,
-    }
-
-    if protocol not in protocol_map:
+    if protocol not in PROTOCOL_CONFIG_MODELS:
         raise ValueError(f"Unsupported protocol: {protocol}")
 
-    config_class = protocol_map[protocol]
+    config_class = PROTOCOL_CONFIG_MODELS[protocol]
     return config_class(**config)
 
 
+def validate_protocol_configs(
+    configs: List[Dict[str, Any]], protocol: str
+) -> Dict[int, str]:
+    """Validate many configurations of one protocol in a single call.
+
+    Configs are validated in chunks of ``VALIDATION_BATCH_SIZE`` by a cached
+    ``TypeAdapter(List[Model])``, so there is at most one exception per chunk
+    instead of one per invalid config; errors are mapped back to the index of
+    the offending configuration.
+
+    Args:
+        configs: Configuration dictionaries of the same protocol
+        protocol: Protocol type (shadowsocks, vmess, vless, trojan, wireguard)
+
+    Returns:
+        Mapping of config index to error message, empty if all are valid
+
+    Raises:
+        ValueError: If protocol is not supported
+    """
+    if protocol not in PROTOCOL_CONFIG_MODELS:
+        raise ValueError(f"Unsupported protocol: {protocol}")
+
+    config_class = PROTOCOL_CONFIG_MODELS[protocol]
+    adapter = _config_list_adapter(config_class)
+    errors: Dict[int, str] = {}
+    for start in range(0, len(configs), VALIDATION_BATCH_SIZE):
+        try:
+            adapter.validate_python(configs[start : start + VALIDATION_BATCH_SIZE])
+        except ValidationError as e:
+            for index, message in _index_validation_errors(
+                e, config_class.__name__
+            ).items():
+                errors[start + index] = message
+    return errors
+
+
+def _index_validation_errors(error: ValidationError, title: str) -> Dict[int, str]:
+    """Group list validation errors by item index into readable messages.
+
+    Errors arrive ordered by item, and servers from one subscription tend to
+    fail the same way, so messages are memoized per distinct set of problems.
+    """
+    runs: List[Tuple[int, List[Tuple[Any, str]]]] = []
+    current = None
+    problems: List[Tuple[Any, str]] = []
+    for item in error.errors(
+        include_url=False, include_context=False, include_input=False
+    ):
+        loc = item["loc"]
+        if loc[0] != current:
+            current = loc[0]
+            problems = []
+            runs.append((current, problems))
+        problems.append((loc[1:], item["msg"]))
+
+    messages: Dict[Tuple[Tuple[Any, str], ...], str] = {}
+    indexed: Dict[int, str] = {}
+    for index, problems in runs:
+        key = tuple(problems)
+        message = messages.get(key)
+        if message is None:
+            parts = [
+                f"{'.'.join(map(str, field))}: {msg}" if field else msg
+                for field, msg in problems
+            ]
+            noun = "error" if len(parts) == 1 else "errors"
+            message = f"{len(parts)} validation {noun} for {title}: {'; '.join(parts)}"
+            messages[key] = message
+        indexed[index] = message
+    return indexed
+
+
 def generate_protocol_schema(protocol: str) -> Dict[str, Any]:
     """Generate JSON schema for protocol configuration.
 
@@ -71,20 +156,10 @@ def generate_protocol_schema(protocol: str) -> Dict[str, Any]:
     Returns:
         JSON schema dictionary
     """
-    protocol_map = {
-        "shadowsocks": ShadowsocksConfig,
-        "ss": ShadowsocksConfig,
-        "vmess": VmessConfig,
-        "vless": VlessConfig,
-        "trojan": TrojanConfig,
-        "wireguard": WireGuardConfig,
-        "wg": WireGuardConfig,
-    }
-
-    if protocol not in protocol_map:
+    if protocol not in PROTOCOL_CONFIG_MODELS:
         raise ValueError(f"Unsupported protocol: {protocol}")
 
-    return protocol_map[protocol].model_json_schema()
+    return PROTOCOL_CONFIG_MODELS[protocol].model_json_schema()
 
 
 def validate_outbound_config(config: Dict[str, Any]) -> OutboundModel:
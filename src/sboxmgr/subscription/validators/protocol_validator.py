@@ -13,7 +13,12 @@ from typing import Any, Dict, List
 from sboxmgr.subscription.models import PipelineContext
 
 from .base import BaseParsedValidator, ValidationResult, register_parsed_validator
-from .protocol_models import generate_protocol_schema, validate_protocol_config
+from .protocol_models import (
+    generate_protocol_schema,
+    validate_protocol_config,
+    validate_protocol_configs,
+)
+from .protocol_models.validators import PROTOCOL_CONFIG_MODELS
 
 
 @register_parsed_validator("protocol_specific")
@@ -35,6 +40,10 @@ class ProtocolSpecificValidator(BaseParsedValidator):
     def validate(self, servers: list, context: PipelineContext) -> ValidationResult:
         """Validate server configurations using protocol-specific models.
 
+        Servers are grouped by protocol and each group is validated in a
+        single batched call; results keep the input order. If a batch raises
+        instead of reporting errors, its servers are validated one by one.
+
         Args:
             servers: List of ParsedServer objects to validate.
             context: Pipeline execution context.
@@ -43,42 +52,77 @@ class ProtocolSpecificValidator(BaseParsedValidator):
             ValidationResult: Contains validation errors and list of valid servers.
 
         """
-        errors = []
-        valid_servers = []
-
+        # Group servers by protocol; unknown servers are handled by other validators
+        groups: Dict[str, List[int]] = {}
         for idx, server in enumerate(servers):
+            server_type = getattr(server, "type", None)
+            if server_type != "unknown":
+                groups.setdefault(server_type, []).append(idx)
+
+        # Validate each protocol group in one call
+        server_errors: Dict[int, str] = {}
+        for protocol, indices in groups.items():
+            if protocol not in PROTOCOL_CONFIG_MODELS:
+                for idx in indices:
+                    server_errors[idx] = f"Unsupported protocol: {protocol}"
+                continue
             try:
-                # Skip unknown servers (they're handled by other validators)
-                if getattr(server, "type", None) == "unknown":
-                    valid_servers.append(server)
-                    continue
-
-                # Convert ParsedServer to dict for validation
-                server_dict = self._parsed_server_to_dict(server)
-
-                # Validate using protocol-specific models
-                validate_protocol_config(server_dict, server.type)
+                configs = [self._parsed_server_to_dict(servers[idx]) for idx in indices]
+                group_errors = validate_protocol_configs(configs, protocol)
+            except Exception:
+                # Batch failed as a whole; validate one by one to find the culprits
+                server_errors.update(self._validate_each(servers, indices, protocol))
+                continue
+            for position, message in group_errors.items():
+                server_errors[indices[position]] = message
 
-                # If validation passes, add to valid servers
+        errors = []
+        valid_servers = []
+        for idx, server in enumerate(servers):
+            message = server_errors.get(idx)
+            if message is None:
                 valid_servers.append(server)
+                continue
 
-            except Exception as e:
-                error_msg = (
-                    f"Server[{idx}] ({getattr(server, 'type', 'unknown')}): {str(e)}"
-                )
-                errors.append(error_msg)
+            errors.append(
+                f"Server[{idx}] ({getattr(server, 'type', 'unknown')}): {message}"
+            )
 
-                # In tolerant mode, still include the server but mark it as having errors
-                if context.mode == "tolerant":
-                    if not hasattr(server, "meta"):
-                        server.meta = {}
-                    server.meta["validation_errors"] = [str(e)]
-                    valid_servers.append(server)
+            # In tolerant mode, still include the server but mark it as having errors
+            if context.mode == "tolerant":
+                if not hasattr(server, "meta"):
+                    server.meta = {}
+                server.meta["validation_errors"] = [message]
+                valid_servers.append(server)
 
         return ValidationResult(
             valid=bool(valid_servers), errors=errors, valid_servers=valid_servers
         )
 
+    def _validate_each(
+        self, servers: list, indices: List[int], protocol: str
+    ) -> Dict[int, str]:
+        """Validate servers of one protocol individually.
+
+        Args:
+            servers: List of ParsedServer objects.
+            indices: Indices of the servers to validate.
+            protocol: Protocol type shared by the servers.
+
+        Returns:
+            Mapping of server index to error message.
+
+        """
+        errors: Dict[int, str] = {}
+        for idx in indices:
+            try:
+                validate_protocol_config(
+                    self._parsed_server_to_dict(servers[idx]), protocol
+                )
+            except Exception as e:
+                errors[idx] = str(e)
+        return errors
+
     def _parsed_server_to_dict(self, server) -> Dict[str, Any]:
         """Convert ParsedServer to dictionary for protocol validation.
 
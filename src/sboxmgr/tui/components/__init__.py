@@ -4,6 +4,7 @@ This module contains reusable UI components for the TUI application,
 including forms, dialogs, and other interactive widgets.
 """
 
-__all__ = ["SubscriptionForm", "ConfigGenerationForm"]
+__all__ = ["SubscriptionForm", "ConfigGenerationForm", "ServerListView"]
 
 from .forms import ConfigGenerationForm, SubscriptionForm
+from .server_list_view import ServerListView
@@ -8,11 +8,12 @@ import logging
 import subprocess
 from pathlib import Path
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Center, Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
+from textual.worker import get_current_worker
 
 from sboxmgr.tui.utils.validation import (
     validate_output_path,
@@ -284,12 +285,38 @@ class SubscriptionForm(ModalScreen[bool | str]):
                 tags_input.focus()
                 return
 
-        # Try to add subscription
+        # Fetch in a worker thread so the form stays responsive
+        self.query_one("#add_btn", Button).disabled = True
+        self._fetch_subscription(url)
+
+    @work(thread=True, exclusive=True, group="subscription-add", exit_on_error=False)
+    def _fetch_subscription(self, url: str) -> None:
+        """Fetch a subscription in a worker thread and finish adding it.
+
+        Args:
+            url: Validated subscription URL
+        """
+        logger.debug("Calling app_state.fetch_subscription...")
+        try:
+            servers = self.app.state.fetch_subscription(url)
+        except Exception as e:
+            # Re-enable the form via _finish_add instead of dying silently
+            logger.error(f"Subscription fetch failed: {e}")
+            servers = None
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._finish_add, url, servers)
+
+    def _finish_add(self, url: str, servers) -> None:
+        """Add a fetched subscription to the state and close the form.
+
+        Args:
+            url: Subscription URL
+            servers: Servers fetched for the subscription, or None on failure
+        """
         logger.debug("Calling app_state.add_subscription...")
-        app_state = self.app.state
-        success = app_state.add_subscription(
-            url, enabled=True
-        )  # Fixed: removed tags parameter
+        success = bool(servers) and self.app.state.add_subscription(
+            url, enabled=True, servers=servers
+        )
         logger.debug(f"add_subscription result: {success}")
 
         if success:
@@ -0,0 +1,192 @@
+"""Virtualized server list widget.
+
+``ServerListView`` draws a ``ServerListModel`` with Textual's line API: only
+the rows inside the viewport are rendered, and a cursor move or exclusion
+toggle repaints just the affected lines, so the widget cost does not grow
+with the number of servers.
+"""
+
+from typing import Optional
+
+from rich.segment import Segment
+from textual.binding import Binding
+from textual.events import Click
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from sboxmgr.tui.state.server_list_model import ServerListModel
+
+
+class ServerListView(ScrollView, can_focus=True):
+    """Scrollable list of servers with an exclusion toggle per row.
+
+    Up/down, page keys and home/end move the cursor; space, enter or a
+    click toggles the server under it.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("space,enter", "toggle", "Toggle"),
+    ]
+
+    COMPONENT_CLASSES = {
+        "server-list-view--cursor",
+        "server-list-view--excluded",
+    }
+
+    DEFAULT_CSS = """
+    ServerListView {
+        height: 1fr;
+        overflow-x: hidden;
+    }
+
+    ServerListView > .server-list-view--cursor {
+        background: $primary-darken-2;
+        text-style: bold;
+    }
+
+    ServerListView:focus > .server-list-view--cursor {
+        background: $accent;
+    }
+
+    ServerListView > .server-list-view--excluded {
+        color: $text-muted;
+        text-style: strike;
+    }
+    """
+
+    cursor = reactive(0, always_update=True, repaint=False)
+
+    class Toggled(Message):
+        """Posted when the exclusion of a server is toggled."""
+
+        def __init__(self, index: int, excluded: bool):
+            """Initialize the message.
+
+            Args:
+                index: Server index in the model.
+                excluded: Whether the server is now excluded.
+            """
+            super().__init__()
+            self.index = index
+            self.excluded = excluded
+
+    def __init__(self, model: Optional[ServerListModel] = None, **kwargs):
+        """Initialize the view.
+
+        Args:
+            model: Model to display; empty until set with ``set_model``.
+            **kwargs: Additional arguments passed to ScrollView
+        """
+        super().__init__(**kwargs)
+        self.model = model or ServerListModel([], set(), str, str)
+
+    def set_model(self, model: ServerListModel) -> None:
+        """Display a new model, keeping the cursor position when possible."""
+        self.model = model
+        self.rows_changed()
+
+    def rows_changed(self) -> None:
+        """Update the view after the model rows changed (e.g. filtering)."""
+        self.virtual_size = Size(self.scrollable_content_region.width, len(self.model))
+        self.cursor = self.cursor
+        self.refresh()
+
+    def refresh_server(self, index: int) -> None:
+        """Repaint the rows of every server sharing the ID of a server."""
+        for other in self.model.indices_for(self.model.ids[index]):
+            row = self.model.row_of(other)
+            if row is not None:
+                self._refresh_row(row)
+
+    def validate_cursor(self, cursor: int) -> int:
+        """Clamp the cursor to the rows."""
+        return max(0, min(cursor, len(self.model) - 1))
+
+    def watch_cursor(self, previous: int, cursor: int) -> None:
+        """Repaint the old and new cursor rows and keep the cursor visible."""
+        self._refresh_row(previous)
+        self._refresh_row(cursor)
+        self.scroll_to_region(
+            Region(0, cursor, 1, 1), animate=False, force=True, immediate=True
+        )
+
+    def render_line(self, y: int) -> Strip:
+        """Render one line of the viewport."""
+        scroll_x, scroll_y = self.scroll_offset
+        row = scroll_y + y
+        width = self.scrollable_content_region.width
+        base = self.rich_style
+        if row >= len(self.model):
+            return Strip.blank(width, base)
+
+        index = self.model.server_index(row)
+        excluded = self.model.is_excluded(index)
+        style = base
+        if excluded:
+            style += self.get_component_rich_style("server-list-view--excluded")
+        if row == self.cursor:
+            style += self.get_component_rich_style("server-list-view--cursor")
+        mark = "[ ]" if excluded else "[x]"
+        text = f" {mark} {self.model.label(index)}"
+        return Strip([Segment(text, style)]).crop_extend(
+            scroll_x, scroll_x + width, style
+        )
+
+    def on_click(self, event: Click) -> None:
+        """Move the cursor to the clicked row and toggle it."""
+        row = self.scroll_offset.y + event.y
+        if 0 <= row < len(self.model):
+            self.cursor = row
+            self.action_toggle()
+
+    def action_cursor_up(self) -> None:
+        """Move the cursor up."""
+        self.cursor -= 1
+
+    def action_cursor_down(self) -> None:
+        """Move the cursor down."""
+        self.cursor += 1
+
+    def action_page_up(self) -> None:
+        """Move the cursor one page up."""
+        self.cursor -= max(1, self.scrollable_content_region.height)
+
+    def action_page_down(self) -> None:
+        """Move the cursor one page down."""
+        self.cursor += max(1, self.scrollable_content_region.height)
+
+    def action_first(self) -> None:
+        """Move the cursor to the first row."""
+        self.cursor = 0
+
+    def action_last(self) -> None:
+        """Move the cursor to the last row."""
+        self.cursor = len(self.model) - 1
+
+    def action_toggle(self) -> None:
+        """Toggle the exclusion of the server under the cursor."""
+        if not len(self.model):
+            return
+        index = self.model.server_index(self.cursor)
+        excluded = self.model.toggle(index)
+        self.refresh_server(index)
+        self.post_message(self.Toggled(index, excluded))
+
+    def _refresh_row(self, row: int) -> None:
+        """Repaint a row if it is inside the viewport."""
+        y = row - self.scroll_offset.y
+        if 0 <= y < self.scrollable_content_region.height:
+            self.refresh(Region(0, y, self.size.width, 1))
+
+    def on_resize(self) -> None:
+        """Keep the virtual width in line with the viewport."""
+        self.virtual_size = Size(self.scrollable_content_region.width, len(self.model))
@@ -1,17 +1,25 @@
 """Server list screen with exclusion management.
 
 This module implements the server list screen that displays available
-servers with checkboxes for inclusion/exclusion management.
+servers with a toggle per server for inclusion/exclusion management.
+The list is virtualized (see ``ServerListView``), so large subscriptions
+mount instantly and only visible rows are rendered. Subscriptions are
+refreshed in a worker thread and their servers appear as they arrive.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
-from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
-from textual.widgets import Button, Checkbox, Footer, Header, Static
+from textual.widgets import Button, Footer, Header, Input, Static
+from textual.worker import get_current_worker
 
+from sboxmgr.tui.components.server_list_view import ServerListView
+from sboxmgr.tui.state.server_list_model import ServerListModel
+from sboxmgr.tui.state.tui_state import SubscriptionRefresh
 from sboxmgr.tui.utils.formatting import format_server_info
 
 
@@ -19,13 +27,18 @@ class ServerListScreen(Screen):
     """Server list screen with exclusion management.
 
     This screen displays all available servers from subscriptions
-    with checkboxes to include/exclude servers. It provides visual
-    feedback about server status and allows batch operations.
+    with a toggle to include/exclude each server. It provides visual
+    feedback about server status, filtering and batch operations.
 
     The screen implements the context-aware UI principle by showing
     server-specific information and exclusion controls.
     """
 
+    BINDINGS = [
+        Binding("ctrl+r", "refresh_servers", "Refresh"),
+        Binding("ctrl+x", "cancel_refresh", "Cancel refresh"),
+    ]
+
     CSS = """
     ServerListScreen {
         layout: vertical;
@@ -52,55 +65,16 @@ class ServerListScreen(Screen):
         margin-bottom: 1;
     }
 
-    .server-list-scroll {
-        height: 1fr;
-        border: solid $primary;
-        padding: 1;
-    }
-
-    .server-item {
-        layout: horizontal;
-        height: 4;
-        padding: 0 1;
+    .server-filter {
         margin-bottom: 1;
-        border: solid $primary;
-        background: $surface;
-        align: center middle;
-    }
-
-    .server-item:hover {
-        background: $primary-darken-3;
-        border: solid $accent;
-    }
-
-    .server-item.excluded {
-        background: $error-darken-3;
-        color: $text-muted;
-        border: solid $error;
     }
 
-    .server-checkbox {
-        width: 4;
-        height: 2;
-        margin-right: 1;
-        align: center middle;
-    }
-
-    .server-info {
-        width: 1fr;
-        height: 4;
-        content-align: left middle;
+    .server-list-scroll {
+        height: 1fr;
+        border: solid $primary;
         padding: 0 1;
     }
 
-    .server-stats {
-        color: $text-muted;
-        text-align: right;
-        margin-right: 1;
-        align: center middle;
-        width: 20;
-    }
-
     .action-buttons {
         layout: horizontal;
         height: 3;
@@ -130,6 +104,11 @@ class ServerListScreen(Screen):
         super().__init__(**kwargs)
         self._servers: List = []
         self._excluded_servers: set = set()
+        self._model: Optional[ServerListModel] = None
+        # (completed, total) subscriptions while a background refresh runs
+        self._refresh_progress: Optional[Tuple[int, int]] = None
+        # Incremented to discard results of superseded or cancelled refreshes
+        self._refresh_generation = 0
 
     def compose(self) -> ComposeResult:
         """Compose the server list screen layout.
@@ -146,15 +125,17 @@ class ServerListScreen(Screen):
             with Vertical(classes="server-list-info"):
                 yield Static(self._create_info_panel())
 
-            # Server list or empty state
-            if self._servers:
-                with VerticalScroll(classes="server-list-scroll"):
-                    yield from self._create_server_items()
-            else:
-                with Vertical(classes="empty-state"):
-                    yield Static(
-                        "No servers available.\nAdd a subscription to see servers here."
-                    )
+            # Server list or empty state, switched in _update_server_layout
+            yield Input(
+                placeholder="Filter servers (name, country, address)...",
+                id="server_filter",
+                classes="server-filter",
+            )
+            yield ServerListView(id="server_list", classes="server-list-scroll")
+            with Vertical(classes="empty-state"):
+                yield Static(
+                    "No servers available.\nAdd a subscription to see servers here."
+                )
 
             # Action buttons
             with Horizontal(classes="action-buttons"):
@@ -168,13 +149,87 @@ class ServerListScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount event."""
+        self._load_exclusions()
         # Always refresh servers from orchestrator/state
-        if hasattr(self.app.state, "refresh_servers"):
-            self.app.state.refresh_servers()
+        self._start_refresh()
+        if self._servers:
+            self.query_one(ServerListView).focus()
+
+    def _start_refresh(self) -> None:
+        """Reload servers, in a worker thread when the state supports it."""
+        app_state = self.app.state
+        if not hasattr(app_state, "iter_refresh"):
+            if hasattr(app_state, "refresh_servers"):
+                app_state.refresh_servers()
+            self._load_servers()
+            # Обновляем layout с новыми данными
+            self._update_server_layout()
+            return
+
+        self._refresh_generation += 1
+        total = len(app_state.subscriptions)
+        self._refresh_progress = (0, total) if total else None
+        app_state.servers.clear()
         self._load_servers()
-        self._load_exclusions()
-        # Обновляем layout с новыми данными
         self._update_server_layout()
+        if total:
+            self._refresh_in_background(self._refresh_generation)
+
+    @work(thread=True, exclusive=True, group="server-refresh", exit_on_error=False)
+    def _refresh_in_background(self, generation: int) -> None:
+        """Fetch subscriptions in a worker thread, streaming results to the UI.
+
+        Args:
+            generation: Refresh generation the results belong to
+        """
+        worker = get_current_worker()
+        events = self.app.state.iter_refresh()
+        try:
+            for event in events:
+                if worker.is_cancelled:
+                    break
+                self.app.call_from_thread(self._apply_refresh, generation, event)
+        finally:
+            # Drops fetches that have not started yet
+            events.close()
+
+    def _apply_refresh(self, generation: int, event: SubscriptionRefresh) -> None:
+        """Add the servers of a refreshed subscription to the state and list.
+
+        Args:
+            generation: Refresh generation the event belongs to
+            event: Refresh progress event
+        """
+        if generation != self._refresh_generation:
+            return
+        done = event.completed >= event.total
+        self._refresh_progress = None if done else (event.completed, event.total)
+        self.app.state.servers.extend(event.servers)
+        if event.error:
+            self.app.notify(
+                f"Failed to refresh {event.source.url}: {event.error}",
+                severity="warning",
+            )
+        if self._model is not None and self._model.sync():
+            self.query_one(ServerListView).rows_changed()
+        self._update_visibility()
+        self._update_info_panel()
+        if done:
+            self.app.notify("Servers refreshed", severity="info")
+
+    def action_refresh_servers(self) -> None:
+        """Reload servers from all subscriptions."""
+        self._start_refresh()
+
+    def action_cancel_refresh(self) -> None:
+        """Stop a running background refresh, keeping servers loaded so far."""
+        if self._refresh_progress is None:
+            return
+        self.workers.cancel_group(self, "server-refresh")
+        self._refresh_generation += 1
+        self._refresh_progress = None
+        self._update_info_panel()
+        self.app.notify("Refresh cancelled", severity="warning")
 
     def _create_info_panel(self) -> str:
         """Create the information panel.
@@ -183,10 +238,13 @@ class ServerListScreen(Screen):
             String with server statistics
         """
         if not self._servers:
+            if self._refresh_progress is not None:
+                completed, total = self._refresh_progress
+                return f"Refreshing: {completed}/{total} subscriptions"
             return "No servers loaded"
 
         total_servers = len(self._servers)
-        excluded_count = len(self._excluded_servers)
+        excluded_count = self._count_excluded()
         included_count = total_servers - excluded_count
 
         info_text = (
@@ -194,35 +252,46 @@ class ServerListScreen(Screen):
             f"Included: {included_count}\n"
             f"Excluded: {excluded_count}"
         )
+        if self._model is not None and self._model.filtered:
+            info_text += f"\nShowing: {len(self._model)}"
+        if self._refresh_progress is not None:
+            completed, total = self._refresh_progress
+            info_text += f"\nRefreshing: {completed}/{total} subscriptions"
 
         return info_text
 
-    def _create_server_items(self) -> List:
-        """Create server item widgets.
+    def _count_excluded(self) -> int:
+        """Count listed servers whose ID is excluded."""
+        if self._model is None:
+            return len(self._excluded_servers)
+        excluded = self._excluded_servers
+        return sum(1 for server_id in self._model.ids if server_id in excluded)
+
+    def _create_model(self) -> ServerListModel:
+        """Create the list model for the current servers and exclusions.
 
         Returns:
-            List of server item widgets
+            Model sharing this screen's exclusion set
         """
-        items = []
-        for i, server in enumerate(self._servers):
-            server_id = self._get_server_id(server)
-            is_excluded = server_id in self._excluded_servers
-            item_classes = "server-item"
-            if is_excluded:
-                item_classes += " excluded"
-            checkbox = Checkbox(
-                value=not is_excluded, id=f"server_{i}", classes="server-checkbox"
-            )
-            server_info = self._format_server_display(server)
-            info_widget = Static(server_info, classes="server-info")
-            children = [checkbox, info_widget]
-            stats = self._get_server_stats(server)
-            if stats:
-                stats_widget = Static(stats, classes="server-stats")
-                children.append(stats_widget)
-            server_item = Horizontal(*children, classes=item_classes)
-            items.append(server_item)
-        return items
+        return ServerListModel(
+            self._servers,
+            self._excluded_servers,
+            key=self._get_server_id,
+            describe=self._describe_server,
+        )
+
+    def _describe_server(self, server) -> str:
+        """Build the list label of a server.
+
+        Args:
+            server: Server object or dict
+
+        Returns:
+            Server display text followed by its statistics, if any
+        """
+        label = self._format_server_display(server)
+        stats = self._get_server_stats(server)
+        return f"{label} | {stats}" if stats else label
 
     def _load_servers(self) -> None:
         """Load servers from the application state."""
@@ -230,7 +299,9 @@ class ServerListScreen(Screen):
             app_state = self.app.state
             # Get servers from active subscription
             if hasattr(app_state, "servers"):
-                self._servers = app_state.servers or []
+                # Keep a reference: a background refresh appends to this list
+                servers = app_state.servers
+                self._servers = servers if servers is not None else []
             elif hasattr(app_state, "get_servers"):
                 self._servers = app_state.get_servers() or []
             else:
@@ -341,81 +412,60 @@ class ServerListScreen(Screen):
 
         return " | ".join(stats) if stats else None
 
-    @on(Checkbox.Changed)
-    def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
-        """Handle checkbox state changes.
+    @on(ServerListView.Toggled)
+    def on_server_toggled(self, event: ServerListView.Toggled) -> None:
+        """Handle a server exclusion toggle.
 
         Args:
-            event: The checkbox changed event
+            event: The toggle event
         """
-        checkbox_id = event.checkbox.id
-        if not checkbox_id or not checkbox_id.startswith("server_"):
-            return
-        try:
-            server_index = int(checkbox_id.replace("server_", ""))
-            if 0 <= server_index < len(self._servers):
-                server = self._servers[server_index]
-                server_id = self._get_server_id(server)
-                if event.value:
-                    self._excluded_servers.discard(server_id)
-                else:
-                    self._excluded_servers.add(server_id)
-                # Сохраняем exclusions в app.state
-                if hasattr(self.app.state, "set_exclusions"):
-                    self.app.state.set_exclusions(list(self._excluded_servers))
-                self._update_server_item_visual(server_index, not event.value)
-                info_panel = self.query_one(".server-list-info Static")
-                if info_panel:
-                    info_panel.update(self._create_info_panel())
-        except (ValueError, IndexError):
-            pass
-
-    def _update_server_item_visual(self, server_index: int, is_excluded: bool) -> None:
-        """Update visual state of a server item.
+        # Сохраняем exclusions в app.state
+        if hasattr(self.app.state, "set_exclusions"):
+            self.app.state.set_exclusions(list(self._excluded_servers))
+        self._update_info_panel()
+
+    @on(Input.Changed, "#server_filter")
+    def on_filter_changed(self, event: Input.Changed) -> None:
+        """Filter the server list as the query is typed.
 
         Args:
-            server_index: Index of the server
-            is_excluded: Whether the server is excluded
+            event: The input changed event
         """
-        try:
-            checkbox = self.query_one(f"#server_{server_index}", Checkbox)
-            server_item = checkbox.parent
-            if server_item:
-                if is_excluded:
-                    server_item.add_class("excluded")
-                else:
-                    server_item.remove_class("excluded")
-                server_item.refresh()
-        except Exception:
-            self.refresh()
+        if self._model is not None and self._model.set_filter(event.value):
+            self.query_one(ServerListView).rows_changed()
+            self._update_info_panel()
 
     @on(Button.Pressed, "#select_all")
     def on_select_all_pressed(self) -> None:
         """Handle select all button press."""
-        # Clear all exclusions
-        self._excluded_servers.clear()
-
-        # Update all checkboxes
-        for i in range(len(self._servers)):
-            checkbox = self.query_one(f"#server_{i}", Checkbox)
-            checkbox.value = True
-
+        # Clear exclusions of all servers matching the filter
+        self._set_all_excluded(False)
         self.app.notify("All servers selected", severity="info")
 
     @on(Button.Pressed, "#select_none")
     def on_select_none_pressed(self) -> None:
         """Handle select none button press."""
-        # Add all servers to exclusions
-        for server in self._servers:
-            server_id = self._get_server_id(server)
-            self._excluded_servers.add(server_id)
+        # Exclude all servers matching the filter
+        self._set_all_excluded(True)
+        self.app.notify("All servers deselected", severity="info")
 
-        # Update all checkboxes
-        for i in range(len(self._servers)):
-            checkbox = self.query_one(f"#server_{i}", Checkbox)
-            checkbox.value = False
+    def _set_all_excluded(self, excluded: bool) -> None:
+        """Exclude or include every listed server and repaint the list.
 
-        self.app.notify("All servers deselected", severity="info")
+        Args:
+            excluded: True to exclude, False to include
+        """
+        if self._model is None:
+            if excluded:
+                self._excluded_servers.update(
+                    self._get_server_id(server) for server in self._servers
+                )
+            else:
+                self._excluded_servers.clear()
+            return
+        self._model.set_visible_excluded(excluded)
+        self.query_one(ServerListView).refresh()
+        self._update_info_panel()
 
     @on(Button.Pressed, "#apply_changes")
     def on_apply_changes_pressed(self) -> None:
@@ -446,96 +496,33 @@ class ServerListScreen(Screen):
     @on(Button.Pressed, "#refresh_servers")
     def on_refresh_servers_pressed(self) -> None:
         """Handle refresh servers button press."""
-        if hasattr(self.app.state, "refresh_servers"):
-            self.app.state.refresh_servers()
-        self._load_servers()
-        # Обновляем layout с новыми данными
-        self._update_server_layout()
-        self.app.notify("Servers refreshed", severity="info")
-
-    def on_key(self, event) -> None:
-        """Handle arrow key navigation and space key for checkboxes."""
-        if not self._servers:
-            return
-        if event.key == "space":
-            # Найти чекбокс с фокусом
-            focused_checkbox = None
-            for i in range(len(self._servers)):
-                try:
-                    checkbox = self.query_one(f"#server_{i}", Checkbox)
-                    if checkbox.has_focus:
-                        focused_checkbox = checkbox
-                        break
-                except Exception:
-                    continue
-            if focused_checkbox:
-                # Переключить состояние чекбокса
-                focused_checkbox.value = not focused_checkbox.value
-                return
-            else:
-                # Если ни один чекбокс не в фокусе, сфокусироваться на первом
-                try:
-                    first_checkbox = self.query_one("#server_0", Checkbox)
-                    first_checkbox.focus()
-                except Exception:
-                    pass
-                return
-        # стрелки — как раньше
-        current_index = None
-        for i in range(len(self._servers)):
-            try:
-                checkbox = self.query_one(f"#server_{i}", Checkbox)
-            except Exception:
-                continue
-            if checkbox.has_focus:
-                current_index = i
-                break
-        if event.key == "down":
-            next_index = (current_index + 1) if current_index is not None else 0
-            if next_index < len(self._servers):
-                try:
-                    self.query_one(f"#server_{next_index}", Checkbox).focus()
-                except Exception:
-                    pass
-        elif event.key == "up":
-            prev_index = (
-                (current_index - 1)
-                if current_index is not None
-                else len(self._servers) - 1
-            )
-            if prev_index >= 0:
-                try:
-                    self.query_one(f"#server_{prev_index}", Checkbox).focus()
-                except Exception:
-                    pass
+        self._start_refresh()
+        if self._refresh_progress is None:
+            self.app.notify("Servers refreshed", severity="info")
 
     def _update_server_layout(self) -> None:
         """Update server list layout after data changes."""
-        # Удаляем старый контент
-        server_container = self.query_one(".server-list-container")
-        if server_container:
-            # Удаляем старые виджеты серверов
-            for child in server_container.children:
-                if hasattr(child, "classes") and "server-list-scroll" in child.classes:
-                    child.remove()
-                elif hasattr(child, "classes") and "empty-state" in child.classes:
-                    child.remove()
-
-            # Добавляем новый контент
-            if self._servers:
-                scroll = VerticalScroll(classes="server-list-scroll")
-                server_container.mount(scroll)
-                scroll.mount_all(self._create_server_items())
-            else:
-                empty_state = Vertical(classes="empty-state")
-                server_container.mount(empty_state)
-                empty_state.mount(
-                    Static(
-                        "No servers available.\nAdd a subscription to see servers here."
-                    )
-                )
+        self._model = self._create_model()
+        query = self.query_one("#server_filter", Input).value
+        self._model.set_filter(query)
+
+        self.query_one(ServerListView).set_model(self._model)
+        self._update_visibility()
 
         # Обновляем info panel
-        info_panel = self.query_one(".server-list-info Static")
-        if info_panel:
-            info_panel.update(self._create_info_panel())
+        self._update_info_panel()
+
+    def _update_visibility(self) -> None:
+        """Show the list while it has servers or is being refreshed."""
+        has_servers = bool(self._servers) or self._refresh_progress is not None
+        server_list = self.query_one(ServerListView)
+        if has_servers and not server_list.display and self.focused is None:
+            self.call_after_refresh(server_list.focus)
+        server_list.display = has_servers
+        self.query_one("#server_filter", Input).display = has_servers
+        self.query_one(".empty-state").display = not has_servers
+
+    def _update_info_panel(self) -> None:
+        """Refresh the statistics shown in the info panel."""
+        info_panel = self.query_one(".server-list-info Static", Static)
+        info_panel.update(self._create_info_panel())
@@ -4,6 +4,7 @@ This module handles the internal state of the TUI application,
 including subscription management, server lists, and UI state.
 """
 
-__all__ = ["TUIState"]
+__all__ = ["TUIState", "ServerListModel"]
 
+from .server_list_model import ServerListModel
 from .tui_state import TUIState
@@ -0,0 +1,201 @@
+"""Lazy data model behind the server list screen.
+
+The model keeps the full server list, the set of excluded server IDs and
+the subset of servers matching the current filter. Display labels and
+search text are computed on first use, so only rows that are actually
+rendered or searched are formatted.
+"""
+
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+
+class ServerListModel:
+    """Filterable server list with exclusions keyed by server ID.
+
+    Rows are positions in the filtered list; indices are positions in the
+    full server list. Several servers may share an ID (same address and
+    port), so toggling one row changes every server with that ID.
+
+    Attributes:
+        servers: All servers, in display order.
+        excluded: Excluded server IDs; shared with the owner and updated in place.
+        ids: Server ID of each server.
+        query: Current filter text, lowercased.
+    """
+
+    def __init__(
+        self,
+        servers: Sequence[Any],
+        excluded: Set[str],
+        key: Callable[[Any], str],
+        describe: Callable[[Any], str],
+    ):
+        """Initialize the model.
+
+        Args:
+            servers: Servers to list.
+            excluded: Set of excluded server IDs, modified in place.
+            key: Returns the ID of a server.
+            describe: Returns the display label of a server.
+        """
+        self.servers = servers
+        self.excluded = excluded
+        self.ids: List[str] = [key(server) for server in servers]
+        self.query = ""
+        self._key = key
+        self._describe = describe
+        self._labels: Dict[int, str] = {}
+        self._haystacks: Optional[List[str]] = None
+        self._indices_by_id: Optional[Dict[str, List[int]]] = None
+        self._visible: Sequence[int] = range(len(servers))
+
+    def __len__(self) -> int:
+        """Return the number of rows matching the filter."""
+        return len(self._visible)
+
+    @property
+    def filtered(self) -> bool:
+        """Whether a filter is active."""
+        return bool(self.query)
+
+    def server_index(self, row: int) -> int:
+        """Return the server index shown at a row."""
+        return self._visible[row]
+
+    def row_of(self, index: int) -> Optional[int]:
+        """Return the row showing a server, or None if it is filtered out."""
+        row = bisect_left(self._visible, index)
+        if row < len(self._visible) and self._visible[row] == index:
+            return row
+        return None
+
+    def label(self, index: int) -> str:
+        """Return the display label of a server, formatting it on first use."""
+        label = self._labels.get(index)
+        if label is None:
+            label = self._labels[index] = self._describe(self.servers[index])
+        return label
+
+    def is_excluded(self, index: int) -> bool:
+        """Return whether a server is excluded."""
+        return self.ids[index] in self.excluded
+
+    def indices_for(self, server_id: str) -> List[int]:
+        """Return the indices of all servers with an ID."""
+        if self._indices_by_id is None:
+            indices: Dict[str, List[int]] = {}
+            for index, item_id in enumerate(self.ids):
+                indices.setdefault(item_id, []).append(index)
+            self._indices_by_id = indices
+        return self._indices_by_id.get(server_id, [])
+
+    def toggle(self, index: int) -> bool:
+        """Toggle the exclusion of a server.
+
+        Args:
+            index: Server index.
+
+        Returns:
+            True if the server is now excluded.
+        """
+        server_id = self.ids[index]
+        if server_id in self.excluded:
+            self.excluded.discard(server_id)
+            return False
+        self.excluded.add(server_id)
+        return True
+
+    def sync(self) -> int:
+        """Index servers appended to ``servers`` since the model was built.
+
+        Lets results be added to the shared server list while it is shown
+        (e.g. during a background refresh) without rebuilding the model.
+
+        Returns:
+            Number of new servers.
+        """
+        start = len(self.ids)
+        new_ids = [self._key(server) for server in self.servers[start:]]
+        if not new_ids:
+            return 0
+        self.ids.extend(new_ids)
+        if self._indices_by_id is not None:
+            for index, server_id in enumerate(new_ids, start):
+                self._indices_by_id.setdefault(server_id, []).append(index)
+        if self._haystacks is not None:
+            self._haystacks.extend(
+                f"{self.label(index)} {self.ids[index]}".lower()
+                for index in range(start, len(self.ids))
+            )
+        if not self.filtered:
+            self._visible = range(len(self.ids))
+        else:
+            terms = self.query.split()
+            self._visible = list(self._visible) + [
+                index
+                for index in range(start, len(self.ids))
+                if all(term in self._haystacks[index] for term in terms)
+            ]
+        return len(new_ids)
+
+    def set_visible_excluded(self, excluded: bool) -> None:
+        """Exclude or include every server matching the filter.
+
+        Without a filter, including clears all exclusions, also those of
+        servers that are not listed.
+
+        Args:
+            excluded: True to exclude, False to include.
+        """
+        if not self.filtered:
+            if excluded:
+                self.excluded.update(self.ids)
+            else:
+                self.excluded.clear()
+            return
+        ids = {self.ids[index] for index in self._visible}
+        if excluded:
+            self.excluded.update(ids)
+        else:
+            self.excluded.difference_update(ids)
+
+    def set_filter(self, query: str) -> bool:
+        """Show only servers whose label or ID contains every word of query.
+
+        A query extending the previous one only searches the rows matching
+        the previous query.
+
+        Args:
+            query: Filter text, case-insensitive; empty to show all servers.
+
+        Returns:
+            True if the visible rows may have changed.
+        """
+        query = query.strip().lower()
+        if query == self.query:
+            return False
+        previous, self.query = self.query, query
+        if not query:
+            self._visible = range(len(self.ids))
+            return True
+        haystacks = self._search_text()
+        candidates = self._visible if previous and query.startswith(previous) else None
+        if candidates is None:
+            candidates = range(len(self.ids))
+        terms = query.split()
+        self._visible = [
+            index
+            for index in candidates
+            if all(term in haystacks[index] for term in terms)
+        ]
+        return True
+
+    def _search_text(self) -> List[str]:
+        """Return the lowercased search text of every server."""
+        if self._haystacks is None:
+            self._haystacks = [
+                f"{self.label(index)} {server_id}".lower()
+                for index, server_id in enumerate(self.ids)
+            ]
+        return self._haystacks
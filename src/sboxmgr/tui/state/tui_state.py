@@ -6,9 +6,10 @@ Integrated with the profile system for persistent storage.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 
 from sboxmgr.core.orchestrator import Orchestrator
 from sboxmgr.subscription.models import ParsedServer, SubscriptionSource
@@ -54,6 +55,28 @@ def setup_tui_logging():
 
 logger = setup_tui_logging()
 
+# Subscriptions fetched in parallel during a refresh
+REFRESH_WORKERS = 4
+
+
+@dataclass
+class SubscriptionRefresh:
+    """Progress event of a server refresh, emitted once per subscription.
+
+    Attributes:
+        source: Subscription that finished
+        servers: Servers fetched from it, empty on failure
+        error: Error message if the fetch failed
+        completed: Number of subscriptions finished so far
+        total: Number of subscriptions being refreshed
+    """
+
+    source: SubscriptionSource
+    servers: List[ParsedServer]
+    error: Optional[str]
+    completed: int
+    total: int
+
 
 @dataclass
 class TUIState:
@@ -154,12 +177,19 @@ class TUIState:
             self.config_manager = None
             self.active_config = None
 
-    def add_subscription(self, url: str, enabled: bool = True) -> bool:
+    def add_subscription(
+        self,
+        url: str,
+        enabled: bool = True,
+        servers: Optional[List[ParsedServer]] = None,
+    ) -> bool:
         """Add a new subscription and save to profile.
 
         Args:
             url: Subscription URL to add
             enabled: Whether subscription is enabled
+            servers: Servers already fetched with ``fetch_subscription``
+                (e.g. in a worker thread); fetched here if None
 
         Returns:
             bool: True if subscription was added successfully
@@ -172,25 +202,9 @@ class TUIState:
         logger.debug(f"[DEBUG] Active config: {self.active_config}")
 
         try:
-            logger.debug("[DEBUG] Calling orchestrator.get_subscription_servers...")
-            # Validate URL with orchestrator
-            result = self.orchestrator.get_subscription_servers(
-                url=url, source_type="url"
-            )
-
-            logger.debug(f"[DEBUG] Orchestrator result - success: {result.success}")
-            logger.debug(
-                f"[DEBUG] Orchestrator result - config: {result.config is not None}"
-            )
-            if result.config:
-                logger.debug(f"[DEBUG] Server count: {len(result.config)}")
-            if hasattr(result, "errors") and result.errors:
-                logger.debug(f"[DEBUG] Orchestrator errors: {result.errors}")
-
-            if not result.success or not result.config:
-                logger.error("[ERROR] Failed to get servers from subscription")
-                if hasattr(result, "errors"):
-                    logger.error(f"[ERROR] Errors: {result.errors}")
+            if servers is None:
+                servers = self.fetch_subscription(url)
+            if not servers:
                 return False
 
             logger.debug("[DEBUG] Creating subscription source...")
@@ -201,8 +215,8 @@ class TUIState:
             logger.debug("[DEBUG] Adding to local state...")
             # Add to local state
             self.subscriptions.append(source)
-            self.servers.extend(result.config)
-            logger.debug(f"[DEBUG] Added {len(result.config)} servers to local state")
+            self.servers.extend(servers)
+            logger.debug(f"[DEBUG] Added {len(servers)} servers to local state")
             logger.debug(f"[DEBUG] Total subscriptions now: {len(self.subscriptions)}")
             logger.debug(f"[DEBUG] Total servers now: {len(self.servers)}")
 
@@ -226,6 +240,42 @@ class TUIState:
             traceback.print_exc()
             return False
 
+    def fetch_subscription(
+        self, url: str, source_type: str = "url"
+    ) -> Optional[List[ParsedServer]]:
+        """Fetch and parse the servers of a subscription URL.
+
+        Does not modify the state, so it can run in a worker thread.
+
+        Args:
+            url: Subscription URL
+            source_type: Subscription source type
+
+        Returns:
+            Parsed servers, or None if the subscription could not be loaded
+        """
+        logger.debug("[DEBUG] Calling orchestrator.get_subscription_servers...")
+        # Validate URL with orchestrator
+        result = self.orchestrator.get_subscription_servers(
+            url=url, source_type=source_type
+        )
+
+        logger.debug(f"[DEBUG] Orchestrator result - success: {result.success}")
+        logger.debug(
+            f"[DEBUG] Orchestrator result - config: {result.config is not None}"
+        )
+        if result.config:
+            logger.debug(f"[DEBUG] Server count: {len(result.config)}")
+        if hasattr(result, "errors") and result.errors:
+            logger.debug(f"[DEBUG] Orchestrator errors: {result.errors}")
+
+        if not result.success or not result.config:
+            logger.error("[ERROR] Failed to get servers from subscription")
+            if hasattr(result, "errors"):
+                logger.error(f"[ERROR] Errors: {result.errors}")
+            return None
+        return list(result.config)
+
     def _save_subscription_to_profile(self, url: str, enabled: bool = True) -> None:
         """Save subscription to active profile.
 
@@ -377,17 +427,7 @@ class TUIState:
 
     def _reload_servers(self) -> None:
         """Reload servers from all subscriptions."""
-        self.servers.clear()
-
-        for subscription in self.subscriptions:
-            try:
-                result = self.orchestrator.get_subscription_servers(
-                    url=subscription.url, source_type=subscription.source_type or "url"
-                )
-                if result.success and result.config:
-                    self.servers.extend(result.config)
-            except Exception as e:
-                logger.error(f"Error reloading servers from {subscription.url}: {e}")
+        self.refresh_servers()
 
     def _load_existing_data(self) -> None:
         """Load existing subscriptions and data from profile."""
@@ -750,16 +790,71 @@ class TUIState:
         }
 
     def refresh_servers(self) -> None:
-        """Refresh servers from the active subscription."""
+        """Refresh servers from all subscriptions.
+
+        Subscriptions are fetched in parallel; servers are kept in
+        subscription order. Blocks until all fetches finish, use
+        ``iter_refresh`` to process results as they arrive.
+        """
+        fetched = {id(event.source): event.servers for event in self.iter_refresh()}
         self.servers.clear()
-        if not self.subscriptions:
-            return
         for subscription in self.subscriptions:
-            try:
-                result = self.orchestrator.get_subscription_servers(
-                    url=subscription.url, source_type=subscription.source_type or "url"
+            self.servers.extend(fetched.get(id(subscription), []))
+
+    def iter_refresh(
+        self, max_workers: int = REFRESH_WORKERS
+    ) -> Iterator[SubscriptionRefresh]:
+        """Fetch all subscriptions in parallel, yielding each as it completes.
+
+        The state is not modified, so the iterator can be consumed in a
+        worker thread while results are applied on the UI thread. Closing
+        the iterator early cancels fetches that have not started yet.
+
+        Args:
+            max_workers: Maximum concurrent fetches
+
+        Yields:
+            SubscriptionRefresh: One event per subscription, in completion order
+        """
+        subscriptions = list(self.subscriptions)
+        total = len(subscriptions)
+        if not total:
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, total), thread_name_prefix="tui-refresh"
+        )
+        try:
+            futures = {
+                executor.submit(self._fetch_servers, subscription): subscription
+                for subscription in subscriptions
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                servers, error = future.result()
+                yield SubscriptionRefresh(
+                    futures[future], servers, error, completed, total
                 )
-                if result.success and result.config:
-                    self.servers.extend(result.config)
-            except Exception as e:
-                logger.error(f"Error refreshing servers from {subscription.url}: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_servers(
+        self, subscription: SubscriptionSource
+    ) -> Tuple[List[ParsedServer], Optional[str]]:
+        """Fetch the servers of a subscription, capturing any error.
+
+        Args:
+            subscription: Subscription to fetch
+
+        Returns:
+            Tuple of fetched servers and error message (None on success)
+        """
+        try:
+            result = self.orchestrator.get_subscription_servers(
+                url=subscription.url, source_type=subscription.source_type or "url"
+            )
+        except Exception as e:
+            logger.error(f"Error refreshing servers from {subscription.url}: {e}")
+            return [], str(e)
+        if result.success and result.config:
+            return list(result.config), None
+        errors = getattr(result, "errors", None)
+        return [], str(errors) if errors else "No servers received"
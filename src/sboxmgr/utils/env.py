@@ -12,6 +12,9 @@ Supported environment variables:
 - SBOXMGR_URL: Subscription URL (alias: SINGBOX_URL, TEST_URL)
 - SBOXMGR_FETCH_TIMEOUT: HTTP request timeout in seconds (default: 30)
 - SBOXMGR_FETCH_SIZE_LIMIT: Maximum fetch size in bytes (default: 2MB)
+- SBOXMGR_CACHE_DIR: Directory for persistent caches
+- SBOXMGR_DAEMON_SOCKET: Control socket of the sboxmgr daemon
+- SBOXMGR_NO_DAEMON: Set to bypass a running daemon in CLI commands
 """
 
 import os
@@ -48,6 +51,54 @@ def get_log_file():
         return "./sboxmgr.log"
 
 
+def get_cache_dir():
+    """Get directory for persistent caches.
+
+    Priority:
+    1. SBOXMGR_CACHE_DIR environment variable (explicit path)
+    2. $XDG_CACHE_HOME/sboxmgr
+    3. ~/.cache/sboxmgr
+
+    The directory is not created; callers create it when writing.
+
+    Returns:
+        Path: Cache directory path
+
+    """
+    if os.getenv("SBOXMGR_CACHE_DIR"):
+        return Path(os.getenv("SBOXMGR_CACHE_DIR"))
+
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "sboxmgr"
+
+
+def get_daemon_socket_path():
+    """Get control socket path of the sboxmgr daemon.
+
+    Priority:
+    1. SBOXMGR_DAEMON_SOCKET environment variable (explicit path)
+    2. $XDG_RUNTIME_DIR/sboxmgr/daemon.sock
+    3. <temp dir>/sboxmgr-<uid>/daemon.sock
+
+    The daemon and its clients refuse a socket directory that is not owned
+    by the current user with mode 0700.
+
+    Returns:
+        Path: Socket path
+
+    """
+    if os.getenv("SBOXMGR_DAEMON_SOCKET"):
+        return Path(os.getenv("SBOXMGR_DAEMON_SOCKET"))
+
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "sboxmgr" / "daemon.sock"
+    import tempfile
+
+    return Path(tempfile.gettempdir()) / f"sboxmgr-{os.getuid()}" / "daemon.sock"
+
+
 def get_config_file():
     """Get sing-box configuration file path.
 
@@ -76,6 +76,60 @@ def atomic_write_json(data, path):
         raise
 
 
+def atomic_write_many(outputs):
+    """Write a set of files, each atomically, after staging all of them.
+
+    Every file is first written to a temporary sibling; targets are only
+    replaced once all temporary files were written successfully, so a
+    serialization or I/O error while staging leaves every existing target
+    untouched. Targets are then replaced one at a time with ``os.replace``:
+    each file is always complete, but the set is not atomic as a whole. A
+    failure while replacing (e.g. a read-only target) can leave a mix of
+    old and new files.
+
+    Args:
+        outputs: Mapping of target path to content. String content is
+            written verbatim, anything else is serialized as JSON.
+
+    Returns:
+        List of written target paths, in input order.
+
+    Raises:
+        Exception: For JSON serialization errors or file I/O failures.
+
+    Note:
+        Temporary files are automatically cleaned up on failure.
+
+    """
+    staged = []
+    try:
+        for path, content in outputs.items():
+            temp_path = f"{path}.tmp"
+            staged.append((temp_path, path))
+            with open(temp_path, "w", encoding="utf-8") as f:
+                if isinstance(content, str):
+                    f.write(content)
+                else:
+                    json.dump(content, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        logging.error(f"Failed to stage {len(outputs)} files for atomic write: {e}")
+        for temp_path, _ in staged:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+
+    try:
+        for temp_path, path in staged:
+            os.replace(temp_path, path)
+    except Exception as e:
+        logging.error(f"Failed to replace {path} during multi-file write: {e}")
+        for temp_path, _ in staged:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    return [path for _, path in staged]
+
+
 def atomic_remove(path):
     """Safely remove file with error handling and logging.
 
@@ -1,6 +1,15 @@
 """ID generation utilities for SBoxMgr."""
 
 import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+# Identity of a server as a proxy endpoint definition
+SERVER_IDENTITY_FIELDS = ("type", "address", "port", "tag")
+
+# Identity of the network endpoint only (latency, performance, etc.)
+ENDPOINT_FIELDS = ("address", "port")
 
 
 def generate_server_id(server):
@@ -24,3 +33,86 @@ def generate_server_id(server):
     """
     identifier = f"{server.get('tag', '')}{server.get('type', '')}{server.get('server_port', '')}"
     return hashlib.sha256(identifier.encode()).hexdigest()
+
+
+def fingerprint_server(
+    server: Any, fields: Optional[Sequence[str]] = SERVER_IDENTITY_FIELDS
+) -> str:
+    """Compute the canonical fingerprint of a server.
+
+    Field fingerprints hash the values of ``fields`` with BLAKE2b. Fields
+    are attribute names (or keys for dictionaries); ``"meta.tag"`` reads a
+    key of a dictionary attribute. The digest is not memoized: hashing a
+    few fields is cheaper than validating a memo, so hot in-memory caches
+    should key on plain field tuples instead.
+
+    With ``fields=None`` the full server content is hashed instead.
+
+    Args:
+        server: ParsedServer, dictionary, or other server object.
+        fields: Identity fields, or None for all server attributes.
+
+    Returns:
+        Hex digest identifying the server.
+
+    """
+    if fields is None:
+        return _digest(_stable_json(_server_content(server)))
+
+    return _digest(repr(_values_getter(tuple(fields))(server)))
+
+
+def _server_content(server: Any) -> Any:
+    """Get all attributes of a server as JSON-compatible data."""
+    if hasattr(server, "model_dump"):
+        return server.model_dump(mode="json")
+    if isinstance(server, dict):
+        return server
+    if hasattr(server, "__dict__"):
+        return vars(server)
+    return repr(server)
+
+
+@lru_cache(maxsize=None)
+def _values_getter(fields: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build a function extracting identity field values from a server."""
+    getters = [_field_getter(field) for field in fields]
+
+    def get_values(server: Any) -> Tuple[Any, ...]:
+        return tuple([getter(server) for getter in getters])
+
+    return get_values
+
+
+def _field_getter(field: str) -> Callable[[Any], Any]:
+    """Build a getter for one attribute, dictionary key, or ``a.b`` path."""
+    name, _, key = field.partition(".")
+
+    def get_field(server: Any) -> Any:
+        if isinstance(server, dict):
+            value = server.get(name)
+        else:
+            value = getattr(server, name, None)
+        if key:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    return get_field
+
+
+def _stable_json(value: Any) -> str:
+    """Serialize a value deterministically for hashing."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_encode)
+
+
+def _encode(value: Any) -> Any:
+    """Encode values json does not support natively."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return repr(value)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
@@ -0,0 +1,70 @@
+"""Tests for caching of agent validations."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sboxmgr.agent import AgentBridge, ClientType, ValidationCache
+
+
+class TestAgentValidationCache:
+    """Test caching of agent validations."""
+
+    @pytest.fixture
+    def bridge(self, tmp_path):
+        """Create a bridge with a fake agent and an on-disk cache."""
+        agent = tmp_path / "sbox-agent"
+        agent.write_text("#!/bin/sh\n")
+        cache = ValidationCache(tmp_path / "cache" / "validations.json")
+        bridge = AgentBridge(agent_path=str(agent), validation_cache=cache)
+        bridge._available = True
+        return bridge
+
+    @staticmethod
+    def _response(success=True):
+        return {
+            "success": success,
+            "message": "ok",
+            "errors": [] if success else ["bad"],
+        }
+
+    def test_unchanged_config_skips_agent(self, bridge, tmp_path):
+        """Test a config that passed is not sent to the agent again."""
+        config = tmp_path / "config.json"
+        config.write_text('{"outbounds": []}')
+
+        with patch.object(bridge, "_call_agent", return_value=self._response()) as call:
+            assert bridge.validate(config, ClientType.SING_BOX).success
+            assert bridge.validate(config, ClientType.SING_BOX).success
+            assert call.call_count == 1
+
+            # Content, client type and the agent binary are part of the key
+            bridge.validate(config, ClientType.XRAY)
+            config.write_text('{"outbounds": [{"type": "direct"}]}')
+            bridge.validate(config, ClientType.SING_BOX)
+            assert call.call_count == 3
+            Path(bridge.agent_path).write_text("#!/bin/sh\n# upgraded\n")
+            bridge.validate(config, ClientType.SING_BOX)
+            assert call.call_count == 4
+
+        # Persisted for the next process
+        reloaded = AgentBridge(
+            agent_path=bridge.agent_path,
+            validation_cache=ValidationCache(bridge.validation_cache.path),
+        )
+        with patch.object(reloaded, "_call_agent") as call:
+            assert reloaded.validate(config, ClientType.SING_BOX).success
+            call.assert_not_called()
+
+    def test_failures_are_not_cached(self, bridge, tmp_path):
+        """Test failed validations are always repeated."""
+        config = tmp_path / "config.json"
+        config.write_text("{}")
+
+        with patch.object(
+            bridge, "_call_agent", return_value=self._response(success=False)
+        ) as call:
+            assert not bridge.validate(config).success
+            assert not bridge.validate(config).success
+            assert call.call_count == 2
@@ -0,0 +1,63 @@
+"""Tests for Clash export and fast YAML serialization."""
+
+import yaml
+
+from sboxmgr.subscription.exporters.clashexporter import clash_export, dump_clash_yaml
+from sboxmgr.subscription.models import ParsedServer
+
+
+def _servers():
+    return [
+        ParsedServer(
+            type="ss",
+            address="1.2.3.4",
+            port=8388,
+            tag='🇩🇪 Берлин: #1 "q"\x85 ',
+            meta={
+                "password": "pass",
+                "method": "aes-256-gcm",
+            },  # pragma: allowlist secret
+        ),
+        ParsedServer(
+            type="vless",
+            address="example.com",
+            port=443,
+            tag="no: yes",
+            meta={"uuid": "0000", "tls": True, "alpn": ["h2"]},
+        ),
+        ParsedServer(type="trojan", address="t.example.com", port=443),
+    ]
+
+
+def test_clash_export_builds_proxy_group_in_same_order():
+    """Test the Proxy group lists every exported proxy in export order."""
+    config = clash_export(_servers())
+
+    names = [proxy["name"] for proxy in config["proxies"]]
+    assert names[1:] == ["no: yes", "trojan-t.example.com"]
+    assert config["proxy-groups"] == [
+        {"name": "Proxy", "type": "select", "proxies": names}
+    ]
+
+
+def test_dump_clash_yaml_round_trips():
+    """Test streamed sections stay one line per item and parse back unchanged."""
+    config = clash_export(_servers())
+    output = dump_clash_yaml(config)
+
+    assert yaml.safe_load(output) == config
+    assert sum(line.startswith("- {") for line in output.splitlines()) == 4
+    assert output.startswith("port: 7890\n")
+
+
+def test_dump_clash_yaml_empty_sections_and_stream(tmp_path):
+    """Test empty lists and writing to a stream."""
+    config = clash_export([])
+    path = tmp_path / "clash.yaml"
+    with open(path, "w", encoding="utf-8") as f:
+        assert dump_clash_yaml(config, f) is None
+
+    text = path.read_text(encoding="utf-8")
+    assert "proxies: []\n" in text
+    assert yaml.safe_load(text) == config
+
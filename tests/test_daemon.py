@@ -0,0 +1,192 @@
+"""Tests for the sboxmgr daemon and its client."""
+
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("sbox_common")
+
+from sboxmgr.daemon import (
+    DaemonClient,
+    DaemonCommand,
+    DaemonError,
+    DaemonUnavailableError,
+    SboxmgrDaemon,
+    connect_to_daemon,
+)
+from sboxmgr.subscription.models import PipelineContext, PipelineResult
+
+
+def _fake_manager(source):
+    """Create a SubscriptionManager stand-in for a source."""
+    manager = MagicMock()
+    manager.source = source
+    manager.export_config.return_value = PipelineResult(
+        config={"outbounds": [{"type": "vless", "tag": source.url}]},
+        context=PipelineContext(),
+        errors=[],
+        success=True,
+    )
+    return manager
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon on a temporary socket with fake subscription managers."""
+    with patch(
+        "sboxmgr.subscription.manager.SubscriptionManager", side_effect=_fake_manager
+    ) as factory, patch("sboxmgr.server.exclusions.load_exclusions", return_value=[]):
+        daemon = SboxmgrDaemon(tmp_path / "daemon.sock", refresh_interval=0)
+        daemon.start()
+        daemon.factory = factory
+        yield daemon
+        daemon.stop()
+
+
+def test_requests_reuse_warm_manager(daemon):
+    """Test repeated requests for a source share one subscription manager."""
+    client = DaemonClient(daemon.socket_path, timeout=5)
+
+    result = client.list_servers("https://example.com/sub")
+    assert result["success"] is True
+    assert result["config"]["outbounds"][0]["tag"] == "https://example.com/sub"
+    client.list_servers("https://example.com/sub")
+    client.list_servers("https://example.com/sub", user_agent="")
+    assert daemon.factory.call_count == 2
+
+    status = client.ping()
+    assert status["pong"] is True
+    assert len(status["sources"]) == 2
+
+
+def test_refresh_refetches_and_reports_failures(daemon):
+    """Test refresh re-fetches sources and keeps failing ones."""
+    client = DaemonClient(daemon.socket_path, timeout=5)
+    client.list_servers("https://a.example.com")
+    client.list_servers("https://b.example.com")
+    managers = {call.args[0].url: call for call in daemon.factory.call_args_list}
+    assert set(managers) == {"https://a.example.com", "https://b.example.com"}
+    failing = next(
+        s.manager for k, s in daemon._sources.items() if k[0] == "https://b.example.com"
+    )
+    failing.fetcher.fetch.side_effect = OSError("timeout")
+
+    result = client.refresh()
+
+    assert result["refreshed"] == ["https://a.example.com"]
+    assert result["failed"] == {"https://b.example.com": "timeout"}
+    failing.cache_manager.clear_cache.assert_not_called()
+    assert len(daemon._sources) == 2
+
+
+def test_scheduled_refresh_drops_idle_sources(daemon):
+    """Test the scheduler refreshes used sources and forgets idle ones."""
+    client = DaemonClient(daemon.socket_path, timeout=5)
+    client.list_servers("https://a.example.com")
+    client.list_servers("https://b.example.com")
+    idle = next(
+        s for k, s in daemon._sources.items() if k[0] == "https://b.example.com"
+    )
+    idle.last_used -= daemon.idle_ttl + 1
+
+    outcomes = daemon.scheduler.refresh_now()
+
+    assert [o.source.url for o in outcomes] == ["https://a.example.com"]
+    assert [k[0] for k in daemon._sources] == ["https://a.example.com"]
+    assert [job["url"] for job in daemon.scheduler.status()] == [
+        "https://a.example.com"
+    ]
+
+
+def test_errors_are_reported_to_client(daemon):
+    """Test failed commands raise DaemonError on the client side."""
+    client = DaemonClient(daemon.socket_path, timeout=5)
+
+    with pytest.raises(DaemonError) as error:
+        client.request(DaemonCommand.LIST)
+    assert error.value.code == "bad_request"
+
+
+def test_second_daemon_refuses_to_start(daemon):
+    """Test a running daemon keeps its socket."""
+    with pytest.raises(DaemonError):
+        SboxmgrDaemon(daemon.socket_path, refresh_interval=0).start()
+
+
+def test_shutdown_request_stops_daemon(tmp_path):
+    """Test serve_forever returns after a shutdown request."""
+    daemon = SboxmgrDaemon(tmp_path / "daemon.sock", refresh_interval=0)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+
+    DaemonClient(daemon.socket_path, timeout=5).shutdown()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert not daemon.socket_path.exists()
+
+
+def test_connect_to_daemon_without_daemon(tmp_path, monkeypatch):
+    """Test the CLI falls back when no daemon is listening."""
+    socket_path = tmp_path / "daemon.sock"
+    assert connect_to_daemon(socket_path) is None
+
+    socket_path.touch()  # left behind by a crashed daemon
+    client = connect_to_daemon(socket_path)
+    with pytest.raises(DaemonUnavailableError):
+        client.ping()
+
+    monkeypatch.setenv("SBOXMGR_NO_DAEMON", "1")
+    assert connect_to_daemon(socket_path) is None
+
+
+def test_file_sources_are_not_served_by_daemon(daemon):
+    """Test local file subscriptions stay in-process."""
+    client = DaemonClient(daemon.socket_path, timeout=5)
+
+    with pytest.raises(DaemonError) as error:
+        client.export("file://config.json")
+    assert error.value.code == "local_source"
+
+    with pytest.raises(DaemonError) as error:
+        client.request(DaemonCommand.LIST, url="file:///tmp/config.json")
+    assert error.value.code == "bad_request"
+    daemon.factory.assert_not_called()
+
+
+def test_insecure_socket_directory_is_refused(tmp_path):
+    """Test a socket directory open to other users is not used."""
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    shared.chmod(0o755)
+    with pytest.raises(DaemonError) as error:
+        SboxmgrDaemon(shared / "daemon.sock", refresh_interval=0).start()
+    assert error.value.code == "insecure_socket"
+
+    (shared / "daemon.sock").touch()
+    assert connect_to_daemon(shared / "daemon.sock") is None
+
+    private = tmp_path / "private"
+    private.mkdir(mode=0o700)
+    link = tmp_path / "link"
+    link.symlink_to(private)
+    with pytest.raises(DaemonError):
+        SboxmgrDaemon(link / "daemon.sock", refresh_interval=0).start()
+
+
+def test_peers_of_other_users_are_rejected(daemon):
+    """Test client and daemon drop connections from other users."""
+    client = DaemonClient(daemon.socket_path, timeout=5)
+
+    with patch("sboxmgr.daemon.client.peer_uid", return_value=os.getuid() + 1):
+        with pytest.raises(DaemonUnavailableError):
+            client.ping()
+
+    with patch("sboxmgr.daemon.server.peer_uid", return_value=os.getuid() + 1):
+        with pytest.raises(DaemonUnavailableError):
+            client.ping()
+
+    assert client.ping()["pong"] is True
@@ -8,6 +8,8 @@ from src.sboxmgr.events import (
     EventManager,
     EventPriority,
     EventType,
+    HandlerRoute,
+    SourceFilter,
     TypeFilter,
     emit_event,
     get_event_manager,
@@ -132,6 +134,139 @@ class TestEventFilters:
         assert filter_obj.matches(agent_event) is False
 
 
+class RoutedTestHandler(TestEventHandler):
+    """Test handler exposing a declarative route."""
+
+    def __init__(self, route, event_types=None):
+        super().__init__(event_types)
+        self.route = route
+        self.can_handle_calls = 0
+
+    def can_handle(self, event_data: EventData) -> bool:
+        self.can_handle_calls += 1
+        return super().can_handle(event_data)
+
+    def get_route(self):
+        return self.route
+
+
+class TestEventRouting:
+    """Test indexed handler routing."""
+
+    def test_filter_routes(self):
+        """Test route metadata derived from filters."""
+        assert TypeFilter(EventType.CONFIG_UPDATED).to_route() == HandlerRoute(
+            event_types=frozenset({EventType.CONFIG_UPDATED})
+        )
+        assert SourceFilter("cli").to_route() == HandlerRoute(
+            sources=frozenset({"cli"})
+        )
+        assert SourceFilter("^plugin\\.", exact_match=False).to_route() == (
+            HandlerRoute(source_prefixes=frozenset({"plugin"}), exact=False)
+        )
+        assert SourceFilter("^plugin", exact_match=False).to_route().exact is True
+        assert SourceFilter("plugin", exact_match=False).to_route() is None
+
+    def test_alternation_source_filter_is_not_prefix_routed(self):
+        """Test a top-level alternation falls back to can_handle."""
+        assert SourceFilter("^abc|xyz", exact_match=False).to_route() is None
+        assert SourceFilter("^a\\|b", exact_match=False).to_route() == (
+            HandlerRoute(source_prefixes=frozenset({"a"}), exact=False)
+        )
+        assert SourceFilter("^(a|b)c", exact_match=False).to_route() == (
+            HandlerRoute(source_prefixes=frozenset({""}), exact=False)
+        )
+        assert SourceFilter("^a[|]", exact_match=False).to_route().exact is False
+
+        class SourceHandler(TestEventHandler):
+            def __init__(self, event_filter):
+                super().__init__()
+                self.filter = event_filter
+
+            def can_handle(self, event_data: EventData) -> bool:
+                return self.filter.matches(event_data)
+
+        manager = EventManager()
+        handler = SourceHandler(SourceFilter("^abc|xyz", exact_match=False))
+        manager.register_handler(handler)
+
+        manager.emit(EventType.CONFIG_UPDATED, {}, source="fooxyz")
+        manager.emit(EventType.CONFIG_UPDATED, {}, source="abcd")
+        manager.emit(EventType.CONFIG_UPDATED, {}, source="other")
+
+        assert [e.source for e in handler.handled_events] == ["fooxyz", "abcd"]
+
+    def test_exact_route_skips_can_handle(self):
+        """Test that exact routes dispatch without calling can_handle."""
+        manager = EventManager()
+        routed = RoutedTestHandler(
+            HandlerRoute(event_types=frozenset({EventType.CONFIG_UPDATED}))
+        )
+        other = RoutedTestHandler(
+            HandlerRoute(event_types=frozenset({EventType.ERROR_OCCURRED}))
+        )
+        manager.register_handler(routed)
+        manager.register_handler(other)
+
+        manager.emit(EventType.CONFIG_UPDATED, {}, source="test")
+
+        assert len(routed.handled_events) == 1
+        assert routed.can_handle_calls == 0
+        assert other.handled_events == []
+        assert other.can_handle_calls == 0
+
+    def test_source_prefix_and_opaque_handlers(self):
+        """Test prefix routing, opaque fallback and registration order."""
+        manager = EventManager()
+        opaque = TestEventHandler({EventType.CONFIG_UPDATED})
+        prefixed = RoutedTestHandler(
+            HandlerRoute(source_prefixes=frozenset({"plugin."}), exact=False),
+            {EventType.CONFIG_UPDATED},
+        )
+        manager.register_handler(prefixed)
+        manager.register_handler(opaque)
+
+        manager.emit(EventType.CONFIG_UPDATED, {}, source="cli")
+        assert prefixed.can_handle_calls == 0
+        assert len(opaque.handled_events) == 1
+
+        event = manager.emit(EventType.CONFIG_UPDATED, {}, source="plugin.geo")
+        assert prefixed.can_handle_calls == 1
+        assert len(prefixed.handled_events) == 1
+        assert event.results == ["handled_config.updated"] * 2
+
+        assert manager.get_handlers(EventType.CONFIG_UPDATED) == [opaque]
+        manager.unregister_handler(opaque)
+        assert manager.get_handlers(EventType.CONFIG_UPDATED) == []
+
+
+    def test_filter_handler_is_indexed(self):
+        """Test handlers with a TypeFilter are routed by the filter."""
+
+        class FilteredHandler(TestEventHandler):
+            def __init__(self, event_filter):
+                super().__init__()
+                self.filter = event_filter
+                self.can_handle_calls = 0
+
+            def can_handle(self, event_data: EventData) -> bool:
+                self.can_handle_calls += 1
+                return self.filter.matches(event_data)
+
+        manager = EventManager()
+        handler = FilteredHandler(TypeFilter(EventType.CONFIG_UPDATED))
+        manager.register_handler(handler)
+
+        assert handler.get_route() == HandlerRoute(
+            event_types=frozenset({EventType.CONFIG_UPDATED}), exact=False
+        )
+        manager.emit(EventType.ERROR_OCCURRED, {}, source="test")
+        assert handler.can_handle_calls == 0
+        manager.emit(EventType.CONFIG_UPDATED, {}, source="test")
+        assert handler.can_handle_calls == 1
+        assert len(handler.handled_events) == 1
+
+
 class TestGlobalEventManager:
     """Test global event manager functions."""
 
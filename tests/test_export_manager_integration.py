@@ -1,5 +1,10 @@
 """Tests for ExportManager integration with middleware."""
 
+import json
+from unittest.mock import Mock
+
+import pytest
+
 from src.sboxmgr.export.export_manager import ExportManager
 from src.sboxmgr.export.routing.default_router import DefaultRouter
 from src.sboxmgr.subscription.models import ClientProfile, ParsedServer, PipelineContext
@@ -293,3 +298,71 @@ class TestExportManagerMiddlewareIntegration:
         ]
         assert "vless" not in outbound_types  # Manual middleware excluded vless
         assert "vmess" in outbound_types  # Client_profile exclude was overridden
+
+
+class TestExportManagerExportMany:
+    """Test multi-format export from one processed server set."""
+
+    def _servers(self):
+        return [
+            ParsedServer(
+                type="vmess",
+                address=f"10.0.0.{i}",
+                port=443,
+                meta={"uuid": "test-uuid"},
+                tag=f"vmess-{i}",
+            )
+            for i in range(3)
+        ]
+
+    def test_export_many_runs_pipeline_once(self):
+        """Test that middleware runs once for all requested formats."""
+        middleware = Mock()
+        middleware.process.side_effect = lambda servers, context, profile: servers
+        export_mgr = ExportManager(middleware_chain=[middleware])
+
+        results = export_mgr.export_many(
+            self._servers(), ["singbox", "clash", "json:singbox"]
+        )
+
+        assert middleware.process.call_count == 1
+        assert list(results) == ["singbox", "clash", "json:singbox"]
+        assert len(results["clash"]["proxies"]) == 3
+        assert results["json:singbox"]["client"] == "sing-box"
+        assert results["json:singbox"]["config"] is results["singbox"]
+
+    def test_export_many_rejects_unrequested_output_paths(self, tmp_path):
+        """Test output paths for formats not requested raise ValueError."""
+        with pytest.raises(ValueError, match="clash"):
+            ExportManager().export_many(
+                self._servers(),
+                ["singbox"],
+                output_paths={"clash": tmp_path / "clash.yaml"},
+            )
+
+    def test_export_many_matches_single_export(self):
+        """Test that each format matches a dedicated export call."""
+        servers = self._servers()
+        export_mgr = ExportManager()
+
+        results = export_mgr.export_many(servers, ["singbox"], max_workers=2)
+
+        assert results["singbox"] == export_mgr.export(servers)
+
+    def test_export_many_writes_outputs(self, tmp_path):
+        """Test that all outputs are written when paths are given."""
+        export_mgr = ExportManager()
+        output_paths = {
+            "singbox": tmp_path / "config.json",
+            "clash": tmp_path / "clash.json",
+        }
+
+        results = export_mgr.export_many(
+            self._servers(),
+            ["singbox", "clash"],
+            output_paths=output_paths,
+            max_workers=2,
+        )
+
+        for fmt, path in output_paths.items():
+            assert json.loads(path.read_text()) == results[fmt]
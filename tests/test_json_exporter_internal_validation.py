@@ -1,6 +1,7 @@
 """Test JSON exporter with internal validation."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -165,3 +166,34 @@ class TestJSONExporterInternalValidation:
 
         with pytest.raises(ConfigValidationError, match="must be a dictionary"):
             exporter._validate_client_config("clash", config_data)
+
+    def test_checksum_matches_canonical_dump(self):
+        """Test incremental checksum equals the hash of the canonical dump."""
+        import hashlib
+
+        exporter = JSONExporter(validate=False)
+        result = exporter.export_config(
+            "sing-box", {"outbounds": [{"type": "direct", "tag": "тест"}]}
+        )
+        metadata = dict(result["metadata"])
+        checksum = metadata.pop("checksum")
+        canonical = json.dumps(
+            {**result, "metadata": metadata}, sort_keys=True, ensure_ascii=False
+        )
+
+        expected = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        assert checksum == f"sha256:{expected}"
+        assert exporter._calculate_checksum(result) == checksum
+        assert result["metadata"]["checksum"] == checksum
+
+    def test_export_config_outbounds_validated(self):
+        """Test prevalidated outbounds are not checked again."""
+        exporter = JSONExporter(validate=True)
+        config_data = {"outbounds": [{"type": "shadowsocks"}]}
+
+        with patch(
+            "sboxmgr.config.config_validator.validate_outbound_config"
+        ) as validate_outbound:
+            exporter.export_config("sing-box", config_data, outbounds_validated=True)
+
+        validate_outbound.assert_not_called()
@@ -1,9 +1,11 @@
+import json
 import os
 from unittest.mock import patch
 
 import pytest
 
 from sboxmgr.subscription.parsers.json_parser import JSONParser, TolerantJSONParser
+from sboxmgr.subscription.parsers.jsonc import strip_jsonc
 
 
 def test_json_parser():
@@ -139,3 +141,35 @@ def test_tolerant_json_parser_no_comments():
             assert isinstance(servers, list)
             # Should not print anything since no comments were removed
             mock_print.assert_not_called()
+
+
+def test_strip_jsonc_respects_string_literals():
+    """Test comment markers inside strings survive while comments are removed."""
+    text = """// header
+    {
+        "url": "https://example.com/#frag", // inline
+        "password": "p#ss//w*rd", # hash comment
+        "list": [1, 2, /* block */ 3,],
+        "nested": {"a": 1, "_comment": "dropped \\" quote"},
+    }
+    """
+    clean, removed = strip_jsonc(text)
+
+    assert json.loads(clean) == {
+        "url": "https://example.com/#frag",
+        "password": "p#ss//w*rd",
+        "list": [1, 2, 3],
+        "nested": {"a": 1},
+    }
+    assert removed == [
+        "// header",
+        "// inline",
+        "# hash comment",
+        "/* block */",
+        '"_comment": "dropped \\" quote"',
+    ]
+
+
+def test_strip_jsonc_without_json_start():
+    """Test text without a JSON document is removed entirely."""
+    assert strip_jsonc("just text\nmore") == ("", ["just text", "more"])
@@ -0,0 +1,86 @@
+"""Tests for debug log sampling and rate limiting filters."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from sboxmgr.config.models import LoggingConfig
+from sboxmgr.logging import LoggingCore, RateLimitFilter, SamplingFilter
+
+
+def _record(level=logging.DEBUG, name="sboxmgr.test"):
+    return logging.LogRecord(name, level, "", 0, "message", (), None)
+
+
+class TestSamplingFilter:
+    """Test deterministic sampling."""
+
+    def test_keeps_fraction_of_debug_records(self):
+        """Test that exactly the configured fraction is kept."""
+        sampling = SamplingFilter(rate=0.25)
+
+        kept = sum(sampling.filter(_record()) for _ in range(100))
+
+        assert kept == 25
+        assert sampling.dropped == 75
+
+    def test_higher_levels_always_pass(self):
+        """Test that records above max_level are never sampled."""
+        sampling = SamplingFilter(rate=0.0)
+
+        assert sampling.filter(_record(logging.INFO)) is True
+        assert sampling.filter(_record(logging.DEBUG)) is False
+
+    def test_decision_shared_between_handlers(self):
+        """Test that re-evaluating the same record gives the same verdict."""
+        sampling = SamplingFilter(rate=0.5)
+        record = _record()
+
+        first = sampling.filter(record)
+
+        assert sampling.filter(record) is first
+        assert sampling.dropped == (0 if first else 1)
+
+    def test_invalid_rate(self):
+        """Test rate validation."""
+        with pytest.raises(ValueError):
+            SamplingFilter(rate=1.5)
+
+
+class TestRateLimitFilter:
+    """Test per-logger rate limiting."""
+
+    def test_limits_per_logger_per_second(self):
+        """Test that each logger gets its own budget per window."""
+        limiter = RateLimitFilter(max_per_second=2)
+
+        with patch("sboxmgr.logging.filters.time.monotonic", return_value=10.0):
+            assert [limiter.filter(_record()) for _ in range(3)] == [
+                True,
+                True,
+                False,
+            ]
+            assert limiter.filter(_record(name="sboxmgr.other")) is True
+
+        with patch("sboxmgr.logging.filters.time.monotonic", return_value=11.2):
+            assert limiter.filter(_record()) is True
+
+        assert limiter.dropped == 1
+
+
+class TestLoggingCoreVolumeFilters:
+    """Test LoggingConfig wiring of volume filters."""
+
+    def test_filters_attached_to_sinks(self):
+        """Test that configured filters are attached to every sink handler."""
+        config = LoggingConfig(
+            sinks=["stdout"], debug_sample_rate=0.5, debug_rate_limit=10
+        )
+        core = LoggingCore(config)
+        core.configure()
+
+        handler = logging.getLogger("sboxmgr").handlers[0]
+        filter_types = {type(f) for f in handler.filters}
+
+        assert filter_types == {SamplingFilter, RateLimitFilter}
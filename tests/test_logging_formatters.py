@@ -202,3 +202,72 @@ class TestCreateFormatter:
             create_formatter("unknown", component="test")
 
         assert "Unknown formatter type 'unknown'" in str(exc_info.value)
+
+
+class TestJSONFormatterFastPath:
+    """Test cached fields and serializer selection in JSONFormatter."""
+
+    def _record(self, created=1640995200.123456, name="sboxmgr.module.fetch"):
+        record = logging.LogRecord(
+            name=name,
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="Server %s",
+            args=("node1",),
+            exc_info=None,
+        )
+        record.created = created
+        record.server_type = "vless"
+        return record
+
+    @pytest.mark.parametrize(
+        "created", [1640995200.0, 1640995200.5, 1640995200.9999997, 1700000000.000001]
+    )
+    def test_cached_timestamp_matches_isoformat(self, created):
+        """Test cached timestamp formatting matches datetime.isoformat()."""
+        from datetime import datetime, timezone
+
+        formatter = StructuredFormatter()
+        expected = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+
+        assert formatter._format_timestamp(created) == expected
+        assert formatter._format_timestamp(created) == expected
+
+    def test_operation_memoized_per_logger(self):
+        """Test operation is derived once per logger name."""
+        formatter = StructuredFormatter()
+
+        with patch.object(
+            formatter, "_extract_operation", wraps=formatter._extract_operation
+        ) as extract:
+            for _ in range(3):
+                formatter._add_structured_fields(self._record())
+
+        assert extract.call_count == 1
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_serializers_produce_same_fields(self, use_orjson):
+        """Test stdlib and orjson output decode to the same object."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        formatter = JSONFormatter(component="test-app", use_orjson=use_orjson)
+
+        log_data = json.loads(formatter.format(self._record()))
+
+        assert log_data["component"] == "test-app"
+        assert log_data["pid"] == formatter.pid
+        assert log_data["message"] == "Server node1"
+        assert log_data["op"] == "fetch"
+        assert log_data["logger"] == "sboxmgr.module.fetch"
+        assert log_data["server_type"] == "vless"
+
+    def test_non_serializable_extra(self):
+        """Test extras that JSON can't encode are stringified."""
+        formatter = JSONFormatter(use_orjson=False)
+        record = self._record()
+        record.path = object()
+
+        log_data = json.loads(formatter.format(record))
+
+        assert log_data["path"].startswith("<object object")
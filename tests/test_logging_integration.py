@@ -2,6 +2,7 @@
 
 import json
 import logging
+import logging.handlers
 from io import StringIO
 
 from sboxmgr.config.models import LoggingConfig
@@ -57,3 +58,35 @@ class TestLoggingIntegration:
         finally:
             # Restore original stream
             handler.stream = original_stream
+
+    def test_async_mode_routes_through_queue(self, tmp_path):
+        """Test async mode writes records from the listener thread."""
+        log_file = tmp_path / "async.log"
+        config = LoggingConfig(
+            level="DEBUG",
+            sinks=["file"],
+            format="json",
+            file_path=str(log_file),
+            async_mode=True,
+        )
+        core = LoggingCore(config)
+        core.configure()
+
+        try:
+            root_logger = logging.getLogger("sboxmgr")
+            assert len(root_logger.handlers) == 1
+            assert isinstance(root_logger.handlers[0], logging.handlers.QueueHandler)
+
+            set_trace_id("async123")
+            logger = core.get_logger("sboxmgr.test")
+            for i in range(10):
+                logger.debug("record %d", i)
+        finally:
+            core.shutdown()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 10
+        first = json.loads(lines[0])
+        assert first["message"] == "record 0"
+        assert first["trace_id"] == "async123"
+        assert core.get_queue_stats()["dropped"] == 0
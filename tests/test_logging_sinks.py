@@ -1,13 +1,17 @@
 """Tests for logging sinks detection and handler creation."""
 
 import logging
+import queue
 import sys
 from unittest.mock import patch
 
 import pytest
 
+from sboxmgr.config.detection import JOURNALD_SOCKET, probe_environment
 from sboxmgr.config.models import LoggingConfig
 from sboxmgr.logging.sinks import (
+    BatchingRotatingFileHandler,
+    BoundedQueueHandler,
     LogSink,
     _create_file_handler,
     _is_journald_available,
@@ -79,51 +83,67 @@ class TestDetectAvailableSinks:
 class TestJournaldDetection:
     """Test journald availability detection."""
 
-    @patch("sboxmgr.logging.sinks.detect_systemd_environment")
-    def test_journald_not_available_no_systemd(self, mock_systemd):
-        """Test journald detection when systemd not available."""
-        mock_systemd.return_value = False
+    @pytest.fixture(autouse=True)
+    def fresh_probe(self, monkeypatch):
+        """Reset the memoized environment probe around each test."""
+        monkeypatch.setattr("sboxmgr.config.detection._environment_probe", None)
+        monkeypatch.delenv("INVOCATION_ID", raising=False)
+        monkeypatch.delenv("SYSTEMD_EXEC_PID", raising=False)
+
+    @staticmethod
+    def _existing(*paths):
+        """Return an os.path.exists replacement accepting only paths."""
+        return lambda path: path in paths
 
-        result = _is_journald_available()
+    @patch("subprocess.run")
+    def test_journald_not_available_no_systemd(self, mock_run):
+        """Test journald detection when systemd not available."""
+        with patch("os.path.exists", self._existing(JOURNALD_SOCKET)):
+            result = _is_journald_available()
 
         assert result is False
+        mock_run.assert_not_called()
 
-    @patch("sboxmgr.logging.sinks.detect_systemd_environment")
     @patch("subprocess.run")
-    def test_journald_available_with_systemd_cat(self, mock_run, mock_systemd):
+    @patch("shutil.which", return_value="/usr/bin/systemd-cat")
+    def test_journald_available_with_systemd_cat(self, mock_which, mock_run):
         """Test journald detection when systemd-cat is available."""
-        mock_systemd.return_value = True
-        mock_run.return_value.returncode = 0
-
-        result = _is_journald_available()
+        with patch(
+            "os.path.exists", self._existing("/run/systemd/system", JOURNALD_SOCKET)
+        ), patch("importlib.util.find_spec", return_value=None):
+            result = _is_journald_available()
 
         assert result is True
-        mock_run.assert_called_once_with(
-            ["systemd-cat", "--version"], capture_output=True, timeout=2
-        )
-
-    @patch("sboxmgr.logging.sinks.detect_systemd_environment")
-    @patch("subprocess.run")
-    def test_journald_not_available_systemd_cat_fails(self, mock_run, mock_systemd):
-        """Test journald detection when systemd-cat fails."""
-        mock_systemd.return_value = True
-        mock_run.return_value.returncode = 1
+        mock_which.assert_called_once_with("systemd-cat")
+        mock_run.assert_not_called()
 
-        result = _is_journald_available()
+    @patch("shutil.which", return_value=None)
+    def test_journald_not_available_without_writer(self, mock_which):
+        """Test journald detection without python-systemd and systemd-cat."""
+        with patch(
+            "os.path.exists", self._existing("/run/systemd/system", JOURNALD_SOCKET)
+        ), patch("importlib.util.find_spec", return_value=None):
+            result = _is_journald_available()
 
         assert result is False
 
-    @patch("sboxmgr.logging.sinks.detect_systemd_environment")
-    @patch("subprocess.run")
-    def test_journald_not_available_exception(self, mock_run, mock_systemd):
-        """Test journald detection when subprocess raises exception."""
-        mock_systemd.return_value = True
-        mock_run.side_effect = FileNotFoundError()
-
-        result = _is_journald_available()
+    def test_journald_not_available_without_socket(self):
+        """Test journald detection when the journal socket is missing."""
+        with patch("os.path.exists", self._existing("/run/systemd/system")):
+            result = _is_journald_available()
 
         assert result is False
 
+    def test_journald_detection_is_memoized(self):
+        """Test the environment is probed once per process."""
+        with patch(
+            "os.path.exists", self._existing("/run/systemd/system", JOURNALD_SOCKET)
+        ), patch("shutil.which", return_value="/usr/bin/systemd-cat"):
+            assert _is_journald_available() is True
+        with patch("os.path.exists", self._existing()):
+            assert _is_journald_available() is True
+            assert probe_environment(refresh=True).journald is False
+
 
 class TestSyslogDetection:
     """Test syslog availability detection."""
@@ -310,3 +330,51 @@ class TestHandlerIntegration:
         assert handler1.level == logging.INFO
         assert handler2.level == logging.ERROR
         assert handler1 is not handler2
+
+
+class TestAsyncSinks:
+    """Test queue-based async sink helpers."""
+
+    def _record(self, level=logging.INFO, msg="message"):
+        return logging.LogRecord("sboxmgr.test", level, "", 0, msg, (), None)
+
+    def test_bounded_queue_handler_drops_on_overflow(self):
+        """Test that overflow is dropped and counted per level."""
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+
+        handler.handle(self._record())
+        handler.handle(self._record(logging.DEBUG))
+        handler.handle(self._record(logging.DEBUG))
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 2
+        assert handler.dropped_by_level == {"DEBUG": 2}
+
+    def test_bounded_queue_handler_captures_trace_id(self):
+        """Test that the trace ID is captured on the emitting thread."""
+        handler = BoundedQueueHandler(queue.Queue())
+
+        with patch("sboxmgr.logging.sinks.get_trace_id", return_value="abc12345"):
+            handler.handle(self._record())
+
+        assert handler.queue.get_nowait().trace_id == "abc12345"
+
+    def test_async_mode_uses_batching_file_handler(self, tmp_path):
+        """Test file sink batches flushes in async mode."""
+        log_file = tmp_path / "test.log"
+        config = LoggingConfig(
+            file_path=str(log_file), async_mode=True, file_batch_size=3
+        )
+
+        handler = _create_file_handler(config)
+        assert isinstance(handler, BatchingRotatingFileHandler)
+
+        with patch.object(handler, "flush", wraps=handler.flush) as flush:
+            for _ in range(5):
+                handler.handle(self._record())
+            assert flush.call_count == 1
+            handler.handle(self._record(logging.ERROR))
+            assert flush.call_count == 2
+
+        handler.close()
+        assert len(log_file.read_text().splitlines()) == 6
@@ -0,0 +1,51 @@
+"""Tests for prefix-based subscription parser detection."""
+
+import base64
+
+from sboxmgr.subscription.manager import detect_parser, sniff_parser
+from sboxmgr.subscription.manager.parser_detector import SNIFF_BYTES
+from sboxmgr.subscription.parsers.base64_parser import Base64Parser
+from sboxmgr.subscription.parsers.clash_parser import ClashParser
+from sboxmgr.subscription.parsers.singbox_parser import SingBoxParser
+from sboxmgr.subscription.parsers.uri_list_parser import URIListParser
+
+SS_URI = (
+    "ss://YWVzLTI1Ni1nY206cGFzc0BleGFtcGxlLmNvbTo4Mzg4#node"  # pragma: allowlist secret
+)
+
+
+def test_detects_formats_from_prefix():
+    """Test JSON, Clash and URI list payloads are detected by content."""
+    assert isinstance(detect_parser(b'  // c\n{"outbounds": []}', "url"), SingBoxParser)
+    assert isinstance(detect_parser(b"\xef\xbb\xbf{}", "url"), SingBoxParser)
+    assert isinstance(detect_parser(b"port: 7890\nproxies: []\n", "url"), ClashParser)
+    assert isinstance(detect_parser(f"{SS_URI}\n".encode(), "url"), URIListParser)
+
+
+def test_explicit_source_type_wins():
+    """Test explicit source types skip content sniffing."""
+    assert isinstance(detect_parser(b"proxies: []", "url_json"), SingBoxParser)
+
+
+def test_small_base64_feed_reuses_decoded_payload():
+    """Test payloads within the sniff window are decoded only once."""
+    plain = "\n".join([SS_URI] * 3).encode()
+    raw = base64.b64encode(plain)
+
+    result = sniff_parser(raw, "url")
+
+    assert isinstance(result.parser, Base64Parser)
+    assert result.decoded == plain
+    assert result.parser.parse_decoded(result.decoded) == result.parser.parse(raw)
+
+
+def test_large_base64_feed_samples_prefix():
+    """Test large feeds are detected from a sample without full decoding."""
+    plain = "\n".join([SS_URI] * 500).encode()
+    raw = base64.encodebytes(plain)
+    assert len(raw) > SNIFF_BYTES
+
+    result = sniff_parser(raw + b"not base64 beyond the sniff window", "url")
+
+    assert isinstance(result.parser, Base64Parser)
+    assert result.decoded is None
@@ -1,9 +1,12 @@
+import json
 import os
 
 import pytest
 
 from sboxmgr.subscription.parsers.base64_parser import Base64Parser
+from sboxmgr.subscription.parsers.clash_parser import ClashParser
 from sboxmgr.subscription.parsers.json_parser import JSONParser
+from sboxmgr.subscription.parsers.json_stream import iter_json_array
 from sboxmgr.subscription.parsers.singbox_parser import SingBoxParser
 from sboxmgr.subscription.parsers.uri_list_parser import URIListParser
 
@@ -319,3 +322,129 @@ def test_singbox_parser_protocol_specific_fields():
     assert hysteria_server.meta["up_mbps"] == 100
     assert hysteria_server.meta["down_mbps"] == 100
     assert hysteria_server.security == "udp"
+
+
+CLASH_CONFIG = b"""port: 7890
+x-defaults: &defaults
+  udp: true
+proxies:
+  - {name: ss-1, type: ss, server: 1.1.1.1, port: 8388, cipher: aes-256-gcm}
+  - name: vmess-1
+    type: vmess
+    server: vm.example.com
+    port: "443"
+proxy-groups:
+  - {name: Proxy, type: select, proxies: [ss-1, vmess-1]}
+rules:
+  - this is: [not, valid
+"""
+
+
+def test_clash_parser_loads_only_proxy_section():
+    """Test the proxy block is parsed on its own; broken rules are skipped."""
+    servers = ClashParser().parse(CLASH_CONFIG)
+
+    assert [(s.type, s.address, s.port) for s in servers] == [
+        ("ss", "1.1.1.1", 8388),
+        ("vmess", "vm.example.com", 443),
+    ]
+    assert servers[0].security == "aes-256-gcm"
+    assert servers[1].meta["name"] == "vmess-1"
+
+
+def test_clash_parser_falls_back_to_full_document():
+    """Test aliases into other sections and bare proxy lists still parse."""
+    with_alias = b"x: &base {udp: true}\nproxies:\n  - {type: ss, server: s, port: 1, <<: *base}\n"
+    servers = ClashParser().parse(with_alias)
+    assert servers[0].meta["udp"] is True
+
+    bare_list = b"- {type: trojan, server: t, port: 443}\n"
+    assert ClashParser().parse(bare_list)[0].type == "trojan"
+
+
+def test_clash_parser_limits():
+    """Test oversized payloads and alias bombs are rejected."""
+    assert ClashParser(max_bytes=16).parse(CLASH_CONFIG) == []
+
+    bomb = b"a: &a [x, x]\nproxies:\n" + b"  - *a\n" * 20
+    assert ClashParser(max_alias_nodes=10).parse(bomb) == []
+
+    # Few aliases, nested: expands to millions of nodes
+    levels = [b"l0: &l0 [x, x, x, x, x, x, x, x, x, x]"]
+    for i in range(1, 7):
+        refs = b", ".join([b"*l%d" % (i - 1)] * 10)
+        levels.append(b"l%d: &l%d [%s]" % (i, i, refs))
+    nested = b"\n".join(levels) + b"\nproxies:\n  - {type: ss, server: s, port: 1, x: *l6}\n"
+    assert ClashParser().parse(nested) == []
+
+    recursive = b"a: &a [*a]\nproxies:\n  - {type: ss, server: s, port: 1, x: *a}\n"
+    assert ClashParser().parse(recursive) == []
+
+    # Wildcard rules are not aliases
+    rules = b"proxies:\n  - {type: ss, server: s, port: 1}\nrules:\n" + (
+        b"  - DOMAIN-SUFFIX,*.example.com,DIRECT\n" * 20
+    )
+    assert len(ClashParser(max_alias_nodes=0).parse(rules)) == 1
+
+
+def test_singbox_parser_keeps_comment_markers_in_strings():
+    """Test // and # inside values are not treated as comments."""
+    raw = b"""{
+      "outbounds": [
+        {
+          "type": "shadowsocks",
+          "server": "ss.example.com",
+          "server_port": 8388,
+          "method": "aes-256-gcm", // method
+          "password": "p#ss//word",
+          "tag": "ss-#1",
+        },
+      ],
+    }"""
+    servers = SingBoxParser().parse(raw)
+
+    assert len(servers) == 1
+    assert servers[0].meta["password"] == "p#ss//word"  # pragma: allowlist secret
+    assert servers[0].meta["tag"] == "ss-#1"
+
+
+def test_iter_json_array_any_chunk_size():
+    """Test values split at any chunk boundary decode like json.loads."""
+    raw = (
+        b'{"n": -12.5e-3, "t": true, "s": "a\\"b\\u00e9", "x": null, '
+        b'"outbounds": [1, -2.5e10, 3, true, null, "s\\\\", {"a": [0.5]}, -0],'
+        b' "after": 1}'
+    )
+    expected = json.loads(raw)["outbounds"]
+    for size in range(1, len(raw) + 1):
+        chunks = [raw[i : i + size] for i in range(0, len(raw), size)]
+        assert list(iter_json_array(chunks, "outbounds")) == expected, size
+
+    split = [b'{"outbounds": [1, -2.', b"5e10, 3]}"]
+    assert list(iter_json_array(split, "outbounds")) == [1, -2.5e10, 3]
+
+
+def test_singbox_parser_parse_stream_matches_parse():
+    """Test incremental parsing yields the same servers for any chunking."""
+    raw = b'{"log": {"level": "warn"}, ' + SINGBOX_BASIC.strip()[1:].encode()
+    expected = SingBoxParser().parse(raw)
+
+    for size in (1, 7, len(raw)):
+        chunks = [raw[i : i + size] for i in range(0, len(raw), size)]
+        assert list(SingBoxParser().parse_stream(chunks)) == expected
+    assert [s.type for s in expected] == ["ss", "vmess"]
+
+    with pytest.raises(ValueError):
+        list(SingBoxParser().parse_stream([SINGBOX_WITH_COMMENTS.encode()]))
+
+
+def test_singbox_parser_large_payload_streams(monkeypatch):
+    """Test payloads above STREAM_PARSE_BYTES parse incrementally, JSONC too."""
+    from sboxmgr.subscription.parsers import singbox_parser
+
+    monkeypatch.setattr(singbox_parser, "STREAM_PARSE_BYTES", 16)
+    monkeypatch.setattr(singbox_parser, "_STREAM_SLICE_BYTES", 5)
+
+    assert len(SingBoxParser().parse(SINGBOX_BASIC.encode())) == 2
+    # Incremental parsing rejects comments; the full parse handles them
+    assert len(SingBoxParser().parse(SINGBOX_WITH_COMMENTS.encode())) == 1
@@ -0,0 +1,153 @@
+"""Tests for the persistent policy decision cache."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sboxmgr.subscription.models import ParsedServer
+from sboxmgr.policies.cache import (
+    PolicyDecisionCache,
+    policy_config_hash,
+    server_fingerprint,
+)
+from sboxmgr.policies.engine import PolicyEngine
+from sboxmgr.policies.security_policy import ProtocolPolicy
+
+
+def _servers():
+    return [
+        SimpleNamespace(address="a.com", port=443, type="vless"),
+        SimpleNamespace(address="b.com", port=443, type="http"),
+        SimpleNamespace(address="c.com", port=443, type="vless"),
+    ]
+
+
+def _engine(path, policy=None):
+    engine = PolicyEngine(decision_cache=PolicyDecisionCache(path))
+    engine.register(policy or ProtocolPolicy())
+    return engine
+
+
+class TestFingerprints:
+    """Test server fingerprints and policy config hashes."""
+
+    def test_server_fingerprint_tracks_attributes(self):
+        """Test fingerprints are stable and change with any attribute."""
+        server = ParsedServer(type="vless", address="a.com", port=443)
+
+        assert server_fingerprint(server) == server_fingerprint(
+            ParsedServer(type="vless", address="a.com", port=443)
+        )
+        assert server_fingerprint(server) != server_fingerprint(
+            ParsedServer(type="vless", address="a.com", port=8443)
+        )
+        assert server_fingerprint({"b": 1, "a": 2}) == server_fingerprint(
+            {"a": 2, "b": 1}
+        )
+
+    def test_policy_config_hash_ignores_enabled(self):
+        """Test config hash changes with configuration but not enabled state."""
+        policy = ProtocolPolicy()
+        original = policy_config_hash(policy)
+
+        policy.enabled = False
+        assert policy_config_hash(policy) == original
+        assert policy_config_hash(ProtocolPolicy(mode="blacklist")) != original
+
+
+class TestPolicyDecisionCache:
+    """Test PolicyEngine.evaluate_batch with a decision cache."""
+
+    def test_unchanged_servers_skip_evaluation_across_runs(self, tmp_path):
+        """Test a second run rebuilds results from the persisted cache."""
+        path = tmp_path / "policy_decisions.json"
+        first = _engine(path).evaluate_batch(_servers())
+        assert path.exists()
+
+        engine = _engine(path)
+        with patch.object(
+            ProtocolPolicy, "evaluate_batch", side_effect=AssertionError
+        ) as evaluate:
+            second = engine.evaluate_batch(_servers())
+
+        evaluate.assert_not_called()
+        assert [e.is_allowed for e in second] == [e.is_allowed for e in first]
+        assert second[1].denials[0].reason == first[1].denials[0].reason
+        assert second[1].denials[0].policy_name == "ProtocolPolicy"
+
+    def test_only_changed_servers_are_evaluated(self, tmp_path):
+        """Test cache misses are evaluated and stored."""
+        engine = _engine(tmp_path / "cache.json")
+        engine.evaluate_batch(_servers())
+
+        servers = _servers() + [SimpleNamespace(address="d.com", port=1, type="x")]
+        with patch.object(
+            ProtocolPolicy, "evaluate_batch", wraps=engine.policies[0].evaluate_batch
+        ) as evaluate:
+            results = engine.evaluate_batch(servers)
+
+        assert len(evaluate.call_args.args[0]) == 1
+        assert [e.is_allowed for e in results] == [True, False, True, False]
+
+    def test_config_change_misses_cache(self, tmp_path):
+        """Test a reconfigured policy does not reuse old decisions."""
+        path = tmp_path / "cache.json"
+        _engine(path).evaluate_batch(_servers())
+
+        engine = _engine(path, ProtocolPolicy(allowed_protocols=["http"]))
+        results = engine.evaluate_batch(_servers())
+
+        assert [e.is_allowed for e in results] == [False, True, False]
+
+    def test_enable_disable_invalidates(self, tmp_path):
+        """Test toggling a policy drops its cached decisions."""
+        engine = _engine(tmp_path / "cache.json")
+        engine.evaluate_batch(_servers())
+        key = engine.decision_cache.policy_key(engine.policies[0])
+        assert engine.decision_cache.get_many(key, ["x"]) == [None]
+        fingerprints = [server_fingerprint(s) for s in _servers()]
+        assert None not in engine.decision_cache.get_many(key, fingerprints)
+
+        engine.disable("ProtocolPolicy")
+
+        assert engine.decision_cache.get_many(key, fingerprints) == [None] * 3
+
+    def test_unreadable_cache_is_ignored(self, tmp_path):
+        """Test a corrupt cache file does not break evaluation."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        results = _engine(path).evaluate_batch(_servers())
+
+        assert [e.is_allowed for e in results] == [True, False, True]
+
+    def test_expired_entries_pruned_on_save(self, tmp_path):
+        """Test entries unseen for longer than ttl are dropped."""
+        cache = PolicyDecisionCache(tmp_path / "cache.json", ttl=60)
+        engine = PolicyEngine(decision_cache=cache)
+        engine.register(ProtocolPolicy())
+        engine.evaluate_batch(_servers())
+
+        with patch("sboxmgr.policies.cache.time.time", return_value=10**12):
+            cache.save()
+
+        assert cache._entries == {}
+
+    def test_cache_hits_do_not_rewrite_file(self, tmp_path):
+        """Test recent hits leave the file alone and old hits refresh it."""
+        path = tmp_path / "cache.json"
+        _engine(path).evaluate_batch(_servers())
+        mtime = path.stat().st_mtime_ns
+
+        engine = _engine(path)
+        engine.evaluate_batch(_servers())
+        assert engine.decision_cache._dirty is False
+        assert path.stat().st_mtime_ns == mtime
+
+        cache = engine.decision_cache
+        key = cache.policy_key(engine.policies[0])
+        fingerprints = [server_fingerprint(s) for s in _servers()]
+        later = time.time() + cache.touch_interval + 1
+        with patch("sboxmgr.policies.cache.time.time", return_value=later):
+            cache.get_many(key, fingerprints)
+        assert cache._dirty is True
@@ -1,5 +1,6 @@
 """Enhanced tests for policy engine with evaluate_all() and PolicyEvaluationResult."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from sboxmgr.policies.base import (
@@ -189,6 +190,70 @@ class TestPolicyEngineEnhanced:
         assert "Policy evaluation error" in denial.reason
         assert denial.metadata.get("error_type") == "policy_exception"
 
+    def test_evaluate_batch_matches_evaluate_all(self):
+        """Test evaluate_batch gives per-server results in input order."""
+        from sboxmgr.policies.geo_policy import CountryPolicy
+        from sboxmgr.policies.security_policy import ProtocolPolicy
+
+        self.engine.register(ProtocolPolicy())
+        self.engine.register(CountryPolicy(allowed_countries=["DE"]))
+        servers = [
+            {"address": "a.com", "type": "vless", "meta": {"country": "de"}},
+            {"address": "b.com", "type": "http", "meta": {"country": "DE"}},
+            {"address": "c.com", "type": "vless", "meta": {"country": "US"}},
+            {"address": "d.com", "type": "vless"},
+        ]
+
+        batch = self.engine.evaluate_batch(servers)
+
+        expected = [
+            self.engine.evaluate_all(PolicyContext(server=s)).is_allowed
+            for s in servers
+        ]
+        assert [r.is_allowed for r in batch] == expected == [True, False, False, True]
+        assert [r.server_identifier for r in batch] == [
+            "a.com",
+            "b.com",
+            "c.com",
+            "d.com",
+        ]
+        assert batch[1].denials[0].policy_name == "ProtocolPolicy"
+        assert set(self.engine.last_batch_timings) == {
+            "ProtocolPolicy",
+            "CountryPolicy",
+        }
+
+    def test_evaluate_batch_decides_each_value_once(self):
+        """Test value-keyed batch policies reuse decisions for equal values."""
+        from sboxmgr.policies.security_policy import ProtocolPolicy
+
+        policy = ProtocolPolicy()
+        servers = [{"type": "vless"}, {"type": "trojan"}, {"type": "vless"}]
+
+        with patch.object(policy, "_decide", wraps=policy._decide) as decide:
+            results = policy.evaluate_batch(servers)
+
+        assert decide.call_count == 2
+        assert results[0] is results[2]
+
+    def test_evaluate_batch_default_and_exception_fallback(self):
+        """Test default batch path and per-server fail-secure fallback."""
+
+        class FlakyPolicy(MockPolicy):
+            def evaluate(self, context):
+                if context.server["address"] == "bad.com":
+                    raise ValueError("boom")
+                return PolicyResult.allow("ok")
+
+        self.engine.register(FlakyPolicy("FlakyPolicy"))
+        servers = [{"address": "ok.com"}, {"address": "bad.com"}]
+
+        results = self.engine.evaluate_batch(servers)
+
+        assert results[0].is_allowed is True
+        assert results[1].is_allowed is False
+        assert results[1].denials[0].metadata["error_type"] == "policy_exception"
+
     def test_get_policies_filtering(self):
         """Test get_policies with filtering."""
         self.engine.register(MockPolicy("Policy1", group="security"))
@@ -297,50 +362,86 @@ class TestPolicyContextEnhanced:
 class TestIntegrationWithSubscriptionManager:
     """Test integration with SubscriptionManager policy application."""
 
-    def test_apply_policies_with_evaluate_all(self):
-        """Test that policy application uses evaluate_all() correctly."""
-        from sboxmgr.subscription.manager import SubscriptionManager
+    def test_apply_policies_with_evaluate_batch(self):
+        """Test that policy application uses the engine's evaluate_batch()."""
+        from sboxmgr.subscription.manager import PipelineCoordinator
         from sboxmgr.subscription.models import PipelineContext
 
-        # Mock the policy registry - patch the import path used in the method
-        with patch("sboxmgr.policies.policy_registry") as mock_registry:
-            # Create mock evaluation result
-            mock_result = Mock()
-            mock_result.has_denials = False
-            mock_result.has_warnings = True
-            mock_result.is_allowed = True
-            mock_result.denials = []
-            mock_result.warnings = [
-                Mock(policy_name="TestPolicy", reason="Test warning", metadata={})
-            ]
-            mock_result.info_results = []
-            mock_result.server_identifier = "test.com"
-
-            mock_registry.evaluate_all.return_value = mock_result
-
-            # Create mock context
-            context = PipelineContext()
-            context.metadata = {}
-
-            # Create mock servers
-            servers = [Mock(address="test.com", type="vmess")]
-
-            # Test policy application through pipeline coordinator
-            from sboxmgr.subscription.manager import PipelineCoordinator
-            coordinator = PipelineCoordinator(
-                middleware_chain=Mock(),
-                postprocessor=Mock(),
-                selector=Mock(),
-                error_handler=Mock()
-            )
+        engine = PolicyEngine()
+        engine.register(
+            MockPolicy("TestPolicy", result=PolicyResult.warning("Test warning"))
+        )
+        engine.register(MockPolicy("TestPolicy2", result=PolicyResult.allow("ok")))
+
+        context = PipelineContext()
+        servers = [Mock(address="test.com", type="vmess")]
+
+        coordinator = PipelineCoordinator(
+            middleware_chain=Mock(),
+            postprocessor=Mock(),
+            selector=Mock(),
+            error_handler=Mock(),
+            policy_engine=engine,
+        )
 
+        with patch.object(
+            engine, "evaluate_batch", wraps=engine.evaluate_batch
+        ) as batch:
             result = coordinator.apply_policies(servers, context)
 
-            # Verify evaluate_all was called
-            mock_registry.evaluate_all.assert_called_once()
+        batch.assert_called_once()
+        assert len(result) == 1
+        assert len(context.metadata["policy_warnings"]) == 1
+        assert context.metadata["policy_warnings"][0]["server"] == "test.com"
+        assert set(context.metadata["policy_timings"]) == {"TestPolicy", "TestPolicy2"}
+
+    def test_apply_policies_drops_denied_servers(self):
+        """Test denied servers are removed and recorded as violations."""
+        from sboxmgr.policies.security_policy import ProtocolPolicy
+        from sboxmgr.subscription.manager import PipelineCoordinator
+        from sboxmgr.subscription.models import PipelineContext
+
+        engine = PolicyEngine()
+        engine.register(ProtocolPolicy())
+        coordinator = PipelineCoordinator(policy_engine=engine)
+        context = PipelineContext()
+        servers = [
+            SimpleNamespace(address="a.com", type="vless"),
+            SimpleNamespace(address="b.com", type="http"),
+        ]
+
+        result = coordinator.apply_policies(servers, context)
+
+        assert result == [servers[0]]
+        assert context.metadata["policy_violations"][0]["server"] == "b.com"
+
+    def test_apply_policies_without_engine_passes_through(self):
+        """Test the policy stage is a no-op without a policy engine."""
+        from sboxmgr.subscription.manager import PipelineCoordinator
+        from sboxmgr.subscription.models import PipelineContext
+
+        servers = [Mock(address="a.com", type="http")]
+
+        assert (
+            PipelineCoordinator().apply_policies(servers, PipelineContext()) == servers
+        )
+
+    def test_subscription_manager_passes_policy_engine(self):
+        """Test SubscriptionManager hands its policy engine to the pipeline."""
+        from sboxmgr.policies.security_policy import ProtocolPolicy
+        from sboxmgr.subscription.manager import SubscriptionManager
+        from sboxmgr.subscription.models import PipelineContext, SubscriptionSource
+
+        engine = PolicyEngine()
+        engine.register(ProtocolPolicy())
+        manager = SubscriptionManager(
+            SubscriptionSource(url="file:///dev/null", source_type="file"),
+            policy_engine=engine,
+        )
+        servers = [SimpleNamespace(address="b.com", type="http")]
 
-            # Verify results were processed
-            assert len(result) == 1
-            assert "policy_warnings" in context.metadata
-            assert len(context.metadata["policy_warnings"]) == 1
-            assert context.metadata["policy_warnings"][0]["server"] == "test.com"
+        coordinator = manager.pipeline_coordinator
+        assert coordinator.policy_engine is engine
+        assert coordinator.apply_policies(servers, PipelineContext()) == []
+        skipped = PipelineContext(skip_policies=True)
+        assert coordinator.apply_policies(servers, skipped) == servers
@@ -1,8 +1,14 @@
 """Tests for protocol-specific validators."""
 
+from unittest.mock import patch
+
 import pytest
 
 from sboxmgr.subscription.models import ParsedServer, PipelineContext
+from sboxmgr.subscription.validators.protocol_models import validate_protocol_configs
+from sboxmgr.subscription.validators.protocol_models.validators import (
+    VALIDATION_BATCH_SIZE,
+)
 from sboxmgr.subscription.validators.protocol_validator import (
     EnhancedRequiredFieldsValidator,
     ProtocolSpecificValidator,
@@ -107,6 +113,109 @@ def test_validate_single_protocol_config():
         validate_single_protocol_config(invalid_config, "shadowsocks")
 
 
+def test_validate_protocol_configs_maps_errors_to_indices():
+    """Test batched validation reports errors by config index."""
+    valid = {
+        "server": "example.com",
+        "server_port": 8388,
+        "password": "test_password",  # pragma: allowlist secret
+        "method": "aes-256-gcm",
+    }
+    invalid = {"server": "example.com", "server_port": 8388, "method": "aes-256-gcm"}
+
+    # Span several adapter batches
+    configs = [valid] * (VALIDATION_BATCH_SIZE + 5)
+    configs[3] = invalid
+    configs[VALIDATION_BATCH_SIZE + 2] = invalid
+
+    errors = validate_protocol_configs(configs, "shadowsocks")
+
+    assert sorted(errors) == [3, VALIDATION_BATCH_SIZE + 2]
+    assert "password" in errors[3]
+    assert errors[3].startswith("1 validation error for ShadowsocksConfig")
+    assert validate_protocol_configs([valid, valid], "ss") == {}
+
+    with pytest.raises(ValueError):
+        validate_protocol_configs([valid], "unsupported_protocol")
+
+
+def test_protocol_specific_validator_keeps_order():
+    """Test grouped validation keeps input order and error indices."""
+    validator = ProtocolSpecificValidator()
+    context = PipelineContext(mode="strict")
+
+    servers = [
+        ParsedServer(
+            type="ss",
+            address="a.example.com",
+            port=8388,
+            security="aes-256-gcm",
+            meta={"password": "test_password"},  # pragma: allowlist secret
+        ),
+        ParsedServer(type="unknown", address="b.example.com", port=1),
+        ParsedServer(type="hysteria2", address="c.example.com", port=443),
+        ParsedServer(
+            type="ss",
+            address="d.example.com",
+            port=8388,
+            security="aes-256-gcm",
+            meta={},
+        ),
+        ParsedServer(
+            type="ss",
+            address="e.example.com",
+            port=8388,
+            security="aes-256-gcm",
+            meta={"password": "test_password"},  # pragma: allowlist secret
+        ),
+    ]
+
+    result = validator.validate(servers, context)
+
+    assert [s.address for s in result.valid_servers] == [
+        "a.example.com",
+        "b.example.com",
+        "e.example.com",
+    ]
+    assert len(result.errors) == 2
+    assert result.errors[0] == "Server[2] (hysteria2): Unsupported protocol: hysteria2"
+    assert result.errors[1].startswith("Server[3] (ss):")
+
+
+def test_protocol_specific_validator_falls_back_when_batch_raises():
+    """Test a raising batch is revalidated per server with correct indices."""
+    validator = ProtocolSpecificValidator()
+    context = PipelineContext(mode="strict")
+
+    servers = [
+        ParsedServer(
+            type="ss",
+            address="a.example.com",
+            port=8388,
+            security="aes-256-gcm",
+            meta={"password": "test_password"},  # pragma: allowlist secret
+        ),
+        ParsedServer(
+            type="ss",
+            address="b.example.com",
+            port=8388,
+            security="aes-256-gcm",
+            meta={},
+        ),
+    ]
+
+    with patch(
+        "sboxmgr.subscription.validators.protocol_validator.validate_protocol_configs",
+        side_effect=RuntimeError("batch failed"),
+    ):
+        result = validator.validate(servers, context)
+
+    assert [s.address for s in result.valid_servers] == ["a.example.com"]
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("Server[1] (ss):")
+    assert "batch failed" not in result.errors[0]
+
+
 def test_get_protocol_schema():
     """Test protocol schema generation."""
     # Test Shadowsocks schema
@@ -131,9 +240,7 @@ def test_protocol_validator_with_real_data():
 ss://aes-256-gcm:password@example.com:8388#TestSS  # pragma: allowlist secret
 vless://uuid@host:443?encryption=none#TestVLESS
 vmess://eyJ2IjoiMiIsInBzIjoiVGVzdCIsImFkZCI6IjEyNy4wLjAuMSIsInBvcnQiOiI0NDMiLCJpZCI6InV1aWQiLCJhaWQiOiIwIiwibmV0IjoidGNwIiwidHlwZSI6Im5vbmUiLCJob3N0IjoiIiwicGF0aCI6IiIsInRscyI6IiJ9
-""".encode(
-        "utf-8"
-    )
+""".encode("utf-8")
 
     # Parse servers
     parser = URIListParser()
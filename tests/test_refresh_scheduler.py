@@ -0,0 +1,234 @@
+"""Tests for the subscription refresh scheduler."""
+
+import random
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from sboxmgr.core.scheduler import (
+    RefreshError,
+    RefreshScheduler,
+    parse_max_age,
+    parse_retry_after,
+    provider_delay,
+)
+from sboxmgr.events import EventType
+from sboxmgr.subscription.errors import ErrorType
+from sboxmgr.subscription.models import SubscriptionSource
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def events():
+    """Capture emitted scheduler events."""
+    with patch("sboxmgr.core.scheduler.emit_event") as emit:
+        yield emit
+
+
+def _source(url="https://example.com/sub", **kwargs):
+    return SubscriptionSource(url=url, source_type="url", **kwargs)
+
+
+def _scheduler(refresh, clock, **kwargs):
+    kwargs.setdefault("jitter", 0.0)
+    return RefreshScheduler(
+        refresh, default_interval=600, clock=clock, rng=random.Random(1), **kwargs
+    )
+
+
+def test_start_times_are_spread_within_interval(clock):
+    """Test sources added together get different first refresh times."""
+    scheduler = _scheduler(MagicMock(return_value=None), clock)
+    for i in range(5):
+        scheduler.add(_source(f"https://{i}.example.com"))
+
+    due = [job["next_refresh_at"] for job in scheduler.status()]
+    assert len(set(due)) == 5
+    assert all(clock.now <= d <= clock.now + 600 for d in due)
+
+
+def test_per_source_interval(clock):
+    """Test a source's refresh_interval overrides the default interval."""
+    refresh = MagicMock(return_value=None)
+    scheduler = _scheduler(refresh, clock)
+    scheduler.add(_source(refresh_interval=60), delay=0)
+    scheduler.add(_source("https://other.example.com"), delay=0)
+
+    outcomes = scheduler.run_pending()
+
+    assert [o.success for o in outcomes] == [True, True]
+    assert [o.next_refresh_at - clock.now for o in outcomes] == [60, 600]
+    clock.now += 60
+    assert [o.source.refresh_interval for o in scheduler.run_pending()] == [60]
+
+
+def test_explicit_delay_is_jittered(clock):
+    """Test an explicit first delay varies by up to the jitter fraction."""
+    scheduler = _scheduler(MagicMock(), clock, jitter=0.1)
+    scheduler.add(_source(), delay=1000)
+
+    assert 900 <= scheduler.next_due() - clock.now <= 1100
+
+
+def test_fetch_failures_back_off_exponentially(clock):
+    """Test repeated fetch errors double the delay up to max_backoff."""
+    refresh = MagicMock(side_effect=requests.ConnectionError("down"))
+    scheduler = _scheduler(refresh, clock, max_backoff=300)
+    scheduler.add(_source(), delay=0)
+
+    delays = []
+    for _ in range(4):
+        clock.now = scheduler.next_due()
+        (outcome,) = scheduler.run_pending()
+        assert outcome.error_type is ErrorType.FETCH
+        delays.append(outcome.next_refresh_at - clock.now)
+    assert delays == [60, 120, 240, 300]
+
+    refresh.side_effect = None
+    clock.now = scheduler.next_due()
+    (outcome,) = scheduler.run_pending()
+    assert outcome.success and outcome.failures == 0
+    assert outcome.next_refresh_at - clock.now == 600
+
+
+def test_backoff_after_many_failures_stays_capped(clock):
+    """Test a source failing for a very long time keeps the capped delay."""
+    refresh = MagicMock(side_effect=requests.ConnectionError("down"))
+    scheduler = _scheduler(refresh, clock, max_backoff=300)
+    scheduler.add(_source(), delay=0)
+    scheduler._jobs[next(iter(scheduler._jobs))].failures = 5000
+
+    (outcome,) = scheduler.run_pending()
+
+    assert outcome.failures == 5001
+    assert outcome.next_refresh_at - clock.now == 300
+
+
+def test_parse_failures_back_off_from_interval(clock):
+    """Test parse errors wait at least the regular interval before retrying."""
+    refresh = MagicMock(side_effect=RefreshError("bad data", ErrorType.PARSE))
+    scheduler = _scheduler(refresh, clock)
+    scheduler.add(_source(), delay=0)
+
+    (outcome,) = scheduler.run_pending()
+
+    assert outcome.error == "bad data"
+    assert outcome.next_refresh_at - clock.now == 600
+
+
+def test_retry_after_from_http_error_is_honored(clock):
+    """Test Retry-After of a failed response delays the retry."""
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["Retry-After"] = "3600"
+    refresh = MagicMock(side_effect=requests.HTTPError(response=response))
+    scheduler = _scheduler(refresh, clock)
+    scheduler.add(_source(), delay=0)
+
+    (outcome,) = scheduler.run_pending()
+
+    assert outcome.next_refresh_at - clock.now == 3600
+
+
+def test_cache_control_extends_interval(clock):
+    """Test max-age longer than the interval postpones the next refresh."""
+    refresh = MagicMock(return_value={"Cache-Control": "public, max-age=7200"})
+    scheduler = _scheduler(refresh, clock)
+    scheduler.add(_source(), delay=0)
+
+    (outcome,) = scheduler.run_pending()
+
+    assert outcome.next_refresh_at - clock.now == 7200
+
+
+def test_completion_event_is_emitted(clock, events):
+    """Test each refresh emits a SUBSCRIPTION_REFRESHED event."""
+    scheduler = _scheduler(MagicMock(side_effect=OSError("timeout")), clock)
+    scheduler.add(_source(), delay=0)
+
+    scheduler.run_pending()
+
+    events.assert_called_once()
+    event_type, payload = events.call_args.args
+    assert event_type is EventType.SUBSCRIPTION_REFRESHED
+    assert payload["success"] is False
+    assert payload["error_type"] == "fetch"
+    assert payload["failures"] == 1
+
+
+def test_source_removed_during_refresh_is_dropped(clock, events):
+    """Test a source removed by the refresh function is not rescheduled."""
+    scheduler = _scheduler(None, clock)
+    scheduler._refresh = lambda source: scheduler.remove(source)
+    scheduler.add(_source(), delay=0)
+
+    assert scheduler.run_pending() == []
+    assert scheduler.next_due() is None
+    events.assert_not_called()
+
+
+def test_refresh_now_reschedules(clock):
+    """Test an immediate refresh replaces the pending schedule."""
+    refresh = MagicMock(return_value=None)
+    scheduler = _scheduler(refresh, clock)
+    scheduler.add(_source(), delay=30)
+    scheduler.add(_source("https://other.example.com"), delay=30)
+
+    outcomes = scheduler.refresh_now(lambda s: s.url == "https://example.com/sub")
+
+    assert [o.source.url for o in outcomes] == ["https://example.com/sub"]
+    clock.now += 30
+    assert [o.source.url for o in scheduler.run_pending()] == [
+        "https://other.example.com"
+    ]
+
+
+def test_background_thread_runs_due_refreshes():
+    """Test start() refreshes sources as they become due."""
+    refreshed = threading.Event()
+    scheduler = RefreshScheduler(lambda source: refreshed.set(), jitter=0)
+    scheduler.start()
+    try:
+        scheduler.add(_source(), delay=0.05)
+        assert refreshed.wait(5)
+    finally:
+        scheduler.stop()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("120", 120.0),
+        ("Thu, 01 Jan 1970 00:20:00 GMT", 200.0),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    """Test Retry-After accepts delay seconds and HTTP dates."""
+    assert parse_retry_after(value, now=1000.0) == expected
+
+
+def test_parse_max_age():
+    """Test max-age is extracted from Cache-Control."""
+    assert parse_max_age("no-transform, max-age=300") == 300
+    assert parse_max_age("no-cache") is None
+    assert provider_delay({"retry-after": "10", "cache-control": "max-age=5"}) == 10
+    assert provider_delay({"Retry-After": str(10**9)}) == 24 * 3600
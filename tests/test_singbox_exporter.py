@@ -1,8 +1,17 @@
 import json
 
+import pytest
+
+from sboxmgr.config.config_validator import validate_singbox_config_structure
+from sboxmgr.config.validation import ConfigValidationError
 from sboxmgr.subscription.exporters.singbox_exporter import (
+    OutboundGrouping,
+    export_outbounds,
     export_tuic,
     export_wireguard,
+    get_dispatch_table,
+    process_single_server,
+    register_protocol_converter,
     singbox_export,
 )
 from sboxmgr.subscription.models import ParsedServer
@@ -287,3 +296,124 @@ class TestSingboxExporterMetaHandling:
         # mtu and keepalive should not be present
         assert "mtu" not in result
         assert "keepalive" not in result
+
+
+def test_singbox_export_validates_outbounds_while_building():
+    """Test validate=True checks each outbound as it is produced."""
+    valid = ParsedServer(
+        type="ss",
+        address="127.0.0.1",
+        port=8388,
+        security="aes-256-gcm",
+        meta={"password": "pass"},  # pragma: allowlist secret
+    )
+    config = singbox_export([valid], routes=[], validate=True)
+    validate_singbox_config_structure(config)
+
+    invalid = ParsedServer(type="trojan", address="example.com", port=443)
+    with pytest.raises(ConfigValidationError, match="Trojan outbound 2"):
+        singbox_export([valid, invalid], routes=[], validate=True)
+
+
+def test_export_outbounds_matches_per_server_dispatch():
+    """Test batch export matches per-server dispatch and keeps input order."""
+    servers = [
+        ParsedServer(
+            type="ss",
+            address=f"10.0.0.{i}",
+            port=8388,
+            security="aes-256-gcm",
+            meta={"password": "pass"},  # pragma: allowlist secret
+        )
+        if i % 2
+        else ParsedServer(
+            type="vless", address=f"10.0.0.{i}", port=443, meta={"uuid": "0000"}
+        )
+        for i in range(6)
+    ]
+    servers.insert(2, ParsedServer(type="unknown", address="skip", port=1))
+
+    outbounds = export_outbounds(servers)
+
+    assert outbounds == [
+        o for o in (process_single_server(s) for s in servers) if o is not None
+    ]
+    assert [o["server"] for o in outbounds] == [f"10.0.0.{i}" for i in range(6)]
+    assert {o["type"] for o in outbounds} == {"shadowsocks", "vless"}
+
+
+def test_register_protocol_converter():
+    """Test custom converters are picked up by the dispatch table."""
+    table = get_dispatch_table()
+    original = table.get("custom")
+    register_protocol_converter("custom", lambda s: {"type": "direct", "tag": "c"})
+    try:
+        server = ParsedServer(type="custom", address="1.1.1.1", port=1)
+        assert process_single_server(server) == {"type": "direct", "tag": "c"}
+    finally:
+        if original is None:
+            table.pop("custom", None)
+
+
+def _grouping_servers():
+    """Six Shadowsocks servers across two countries with known latencies."""
+    countries = ["DE", "DE", "NL", "DE", "NL", None]
+    latencies = [50, 10, 30, None, 20, 40]
+    return [
+        ParsedServer(
+            type="ss",
+            address=f"10.0.1.{i}",
+            port=8388,
+            security="aes-256-gcm",
+            tag=f"node-{i}",
+            meta={
+                "password": "pass",  # pragma: allowlist secret
+                "geo": {"country": country} if country else {},
+                "latency_ms": latency,
+            },
+        )
+        for i, (country, latency) in enumerate(zip(countries, latencies))
+    ]
+
+
+def test_singbox_export_caps_outbounds_and_group_size():
+    """Test outbound and urltest member limits keep the best ranked servers."""
+    config = singbox_export(
+        _grouping_servers(),
+        routes=[],
+        grouping=OutboundGrouping(max_outbounds=4, max_group_size=2),
+    )
+    auto, *proxies = config["outbounds"]
+
+    # Input order is kept; the unranked node-3 and slowest node-0 are dropped
+    assert [o["tag"] for o in proxies] == ["node-1", "node-2", "node-4", "node-5"]
+    assert auto["tag"] == "auto"
+    assert auto["outbounds"] == ["node-1", "node-4"]
+    assert config["route"]["final"] == "auto"
+
+
+def test_singbox_export_shards_urltest_by_country():
+    """Test country sharding builds one urltest group per country under auto."""
+    config = singbox_export(
+        _grouping_servers(),
+        routes=[],
+        grouping=OutboundGrouping(shard_by="country", max_group_size=2),
+        validate=True,
+    )
+    groups = {o["tag"]: o for o in config["outbounds"] if o["type"] == "urltest"}
+
+    assert config["outbounds"][0]["tag"] == "auto"
+    assert groups["auto"]["outbounds"] == ["auto-de", "auto-nl", "auto-other"]
+    assert groups["auto-de"]["outbounds"] == ["node-0", "node-1"]
+    assert groups["auto-nl"]["outbounds"] == ["node-2", "node-4"]
+    assert groups["auto-other"]["outbounds"] == ["node-5"]
+    assert groups["auto-de"]["interval"] == "3m"
+    validate_singbox_config_structure(config)
+
+
+def test_outbound_grouping_rejects_invalid_options():
+    """Test unsupported shard keys and non-positive limits are rejected."""
+    with pytest.raises(ValueError, match="shard_by"):
+        OutboundGrouping(shard_by="asn")
+    with pytest.raises(ValueError, match="max_group_size"):
+        OutboundGrouping(max_group_size=0)
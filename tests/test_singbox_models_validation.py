@@ -345,6 +345,39 @@ class TestSingBoxModelsValidation:
         with pytest.raises(Exception):
             SingBoxConfig.model_validate(invalid_config)
 
+    def test_duplicate_outbounds_rejection(self):
+        """Test that duplicate tags and server/port pairs are rejected."""
+        outbound = {
+            "type": "shadowsocks",
+            "tag": "ss-out",
+            "server": "example.com",
+            "server_port": 8388,
+            "method": "aes-256-gcm",
+            "password": "secret",
+        }
+
+        with pytest.raises(Exception, match="Duplicate outbound tags"):
+            SingBoxConfig.model_validate(
+                {"outbounds": [outbound, {**outbound, "server_port": 8389}]}
+            )
+
+        with pytest.raises(Exception, match="Duplicate server/port"):
+            SingBoxConfig.model_validate(
+                {"outbounds": [outbound, {**outbound, "tag": "ss-out-2"}]}
+            )
+
+        # Tag duplicates take precedence over server/port duplicates
+        with pytest.raises(Exception, match="Duplicate outbound tags"):
+            SingBoxConfig.model_validate(
+                {
+                    "outbounds": [
+                        outbound,
+                        {**outbound, "tag": "ss-out-2"},
+                        {**outbound, "server_port": 8390},
+                    ]
+                }
+            )
+
     def test_model_serialization(self):
         """Test that models can be serialized to JSON."""
         config_dict = create_example_config()
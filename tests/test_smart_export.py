@@ -1,5 +1,6 @@
 """Tests for smart export functionality of sing-box models."""
 
+from src.sboxmgr.models.singbox.base import unsupported_fields
 from src.sboxmgr.models.singbox.common import TransportConfig
 from src.sboxmgr.models.singbox.inbounds import MixedInbound, SocksInbound, VmessInbound
 from src.sboxmgr.models.singbox.outbounds import (
@@ -148,3 +149,21 @@ class TestSmartExport:
         assert "multiplex" in smart_data_full  # Should be included even if None
         assert smart_data_full["tls"] is None
         assert smart_data_full["multiplex"] is None
+
+    def test_unsupported_fields_per_type(self):
+        """Test the cached per-type field sets used by smart export."""
+        assert unsupported_fields("vmess") == frozenset()
+        assert unsupported_fields("shadowsocks") == {"tls", "transport"}
+        assert unsupported_fields("direct") == {"tls", "transport"}
+        assert unsupported_fields("block") == {
+            "server",
+            "server_port",
+            "tls",
+            "transport",
+            "multiplex",
+        }
+        assert unsupported_fields("mixed") == {"tls", "transport"}
+        assert unsupported_fields("http") == {"transport"}
+        # Unknown types keep neither transport nor TLS
+        assert unsupported_fields("unknown") == {"tls", "transport"}
+        assert unsupported_fields("vmess") is unsupported_fields("vmess")
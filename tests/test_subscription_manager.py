@@ -675,3 +675,24 @@ def test_fetcher_caching(monkeypatch):
     data4 = fetcher2.fetch()
     assert data4 == b"data"
     assert calls["count"] == 3
+
+
+def test_get_servers_cache_key_covers_exclusions_and_routes(monkeypatch):
+    """Test cached results are not reused across exclusions or user routes."""
+    src = SubscriptionSource(url="https://example.com/sub", source_type="url_base64")
+    mgr = SubscriptionManager(src)
+    calls = []
+
+    def fake_pipeline(user_routes, exclusions, mode, context):
+        calls.append((list(user_routes), list(exclusions)))
+        return PipelineResult(config=[], context=context, errors=[], success=True)
+
+    monkeypatch.setattr(mgr, "_execute_pipeline", fake_pipeline)
+
+    mgr.get_servers()
+    mgr.get_servers()
+    assert len(calls) == 1
+
+    mgr.get_servers(exclusions=["abc"])
+    mgr.get_servers(user_routes=["US"])
+    assert calls[1:] == [([], ["abc"]), (["US"], [])]
@@ -0,0 +1,125 @@
+"""Tests for the lazy subscription plugin registry."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from sboxmgr.subscription import registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(tmp_path, monkeypatch):
+    """Restore registry state and keep the manifest in a temporary directory."""
+    monkeypatch.setenv("SBOXMGR_CACHE_DIR", str(tmp_path / "cache"))
+    plugins = dict(registry.PLUGIN_REGISTRY)
+    lazy = dict(registry._LAZY_PLUGINS)
+    loaded = registry._entry_points_loaded
+    registry._entry_points_loaded = False
+    yield
+    registry.PLUGIN_REGISTRY.clear()
+    registry.PLUGIN_REGISTRY.update(plugins)
+    registry._LAZY_PLUGINS.clear()
+    registry._LAZY_PLUGINS.update(lazy)
+    registry._entry_points_loaded = loaded
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """Create an importable plugin module and return its name."""
+    name = "sboxmgr_test_lazy_plugin"
+    (tmp_path / f"{name}.py").write_text("class Plugin:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def _entry_points(**specs):
+    """Build a stand-in for importlib.metadata.entry_points()."""
+    eps = [SimpleNamespace(name=name, value=value) for name, value in specs.items()]
+    return SimpleNamespace(select=lambda group: eps)
+
+
+def test_lazy_plugin_is_imported_on_first_lookup(plugin_module):
+    """Test a lazily registered plugin is imported only by get_plugin."""
+    registry.register_lazy("lazy_test", f"{plugin_module}:Plugin")
+    assert plugin_module not in sys.modules
+
+    cls = registry.get_plugin("lazy_test")
+
+    assert cls is sys.modules[plugin_module].Plugin
+    assert registry.get_plugin("lazy_test") is cls
+
+
+def test_builtin_fetcher_resolves_by_name():
+    """Test built-in fetchers are available without importing the package."""
+    from sboxmgr.subscription.fetchers.url_fetcher import URLFetcher
+
+    assert registry.get_plugin("url_base64") is URLFetcher
+    assert registry.get_plugin("no_such_plugin") is None
+
+
+def test_decorated_class_replaces_pending_builtin():
+    """Test @register overrides a built-in plugin not imported yet."""
+    registry._LAZY_PLUGINS["url"] = registry.BUILTIN_PLUGINS["url"]
+
+    @registry.register("url")
+    class CustomFetcher:
+        pass
+
+    assert registry.get_plugin("url") is CustomFetcher
+
+
+def test_broken_plugin_spec_is_ignored():
+    """Test a plugin that fails to import is reported as missing."""
+    registry.register_lazy("broken", "sboxmgr_missing_module:Plugin")
+
+    assert registry.get_plugin("broken") is None
+
+
+def test_entry_points_are_loaded_once_and_cached(plugin_module):
+    """Test entry points are scanned once and then read from the manifest."""
+    with patch(
+        "importlib.metadata.entry_points",
+        return_value=_entry_points(ep_test=f"{plugin_module}:Plugin"),
+    ) as entry_points:
+        registry.load_entry_points()
+        registry.load_entry_points()
+        assert entry_points.call_count == 1
+
+        # A new process reads the manifest instead of scanning metadata
+        registry._entry_points_loaded = False
+        registry._LAZY_PLUGINS.pop("ep_test")
+        registry.load_entry_points()
+        assert entry_points.call_count == 1
+
+    assert plugin_module not in sys.modules
+    assert registry.get_plugin("ep_test") is sys.modules[plugin_module].Plugin
+
+
+def test_manifest_is_rebuilt_when_distributions_change(plugin_module):
+    """Test a changed installed-distribution set invalidates the manifest."""
+    with patch(
+        "importlib.metadata.entry_points",
+        return_value=_entry_points(ep_test=f"{plugin_module}:Plugin"),
+    ) as entry_points:
+        registry.load_entry_points()
+        registry._entry_points_loaded = False
+        with patch.object(
+            registry, "_distributions_fingerprint", return_value="changed"
+        ):
+            registry.load_entry_points()
+
+    assert entry_points.call_count == 2
+
+
+def test_entry_point_overrides_builtin(plugin_module):
+    """Test an entry point plugin replaces a built-in of the same name."""
+    with patch(
+        "importlib.metadata.entry_points",
+        return_value=_entry_points(url=f"{plugin_module}:Plugin"),
+    ):
+        registry.load_entry_points()
+
+    assert registry.get_plugin("url") is sys.modules[plugin_module].Plugin
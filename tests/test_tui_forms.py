@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 from sboxmgr.tui.components.forms import SubscriptionForm, ConfigGenerationForm
 
@@ -131,6 +131,25 @@ class TestSubscriptionForm:
             assert not is_valid
             assert error == "Invalid URL format"
 
+    def test_subscription_form_fetch_error_finishes_add(self):
+        """Test a raising fetch still finishes the add with no servers."""
+        form = SubscriptionForm()
+        app = Mock()
+        app.state.fetch_subscription.side_effect = RuntimeError("boom")
+
+        with patch.object(SubscriptionForm, "app", new_callable=PropertyMock) as mock_app, \
+             patch('sboxmgr.tui.components.forms.get_current_worker') as mock_worker:
+            mock_app.return_value = app
+            mock_worker.return_value.is_cancelled = False
+
+            SubscriptionForm._fetch_subscription.__wrapped__(
+                form, "https://example.com/subscription"
+            )
+
+        app.call_from_thread.assert_called_once_with(
+            form._finish_add, "https://example.com/subscription", None
+        )
+
     def test_subscription_form_cancel(self):
         """Test subscription form cancellation."""
         form = SubscriptionForm()
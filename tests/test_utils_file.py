@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ import pytest
 from sboxmgr.utils.file import (
     atomic_remove,
     atomic_write_json,
+    atomic_write_many,
     file_exists,
     handle_temp_file,
     read_json,
@@ -142,6 +144,61 @@ class TestAtomicWriteJson:
         assert not temp_path.exists()
 
 
+class TestAtomicWriteMany:
+    """Test atomic_write_many function."""
+
+    def test_atomic_write_many_success(self, tmp_path):
+        """Test writing JSON and text outputs together."""
+        json_path = tmp_path / "config.json"
+        text_path = tmp_path / "config.yaml"
+
+        result = atomic_write_many(
+            {str(json_path): {"key": "value"}, str(text_path): "proxies: []\n"}
+        )
+
+        assert result == [str(json_path), str(text_path)]
+        assert json.loads(json_path.read_text()) == {"key": "value"}
+        assert text_path.read_text() == "proxies: []\n"
+
+    def test_atomic_write_many_staging_failure(self, tmp_path):
+        """Test that a failure while staging leaves every target untouched."""
+        first_path = tmp_path / "first.json"
+        second_path = tmp_path / "second.json"
+        first_path.write_text("old")
+
+        class NonSerializable:
+            pass
+
+        with pytest.raises(TypeError):
+            atomic_write_many(
+                {
+                    str(first_path): {"new": True},
+                    str(second_path): {"obj": NonSerializable()},
+                }
+            )
+
+        assert first_path.read_text() == "old"
+        assert not second_path.exists()
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_atomic_write_many_replace_failure_cleans_up(self, tmp_path):
+        """Test that a failing replace removes leftover temporary files."""
+        paths = [str(tmp_path / "first.json"), str(tmp_path / "second.json")]
+        real_replace = os.replace
+
+        def replace(src, dst):
+            if dst == paths[1]:
+                raise OSError("read-only")
+            real_replace(src, dst)
+
+        with patch("sboxmgr.utils.file.os.replace", side_effect=replace):
+            with pytest.raises(OSError):
+                atomic_write_many({path: {"new": True} for path in paths})
+
+        assert json.loads((tmp_path / "first.json").read_text()) == {"new": True}
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
 class TestAtomicRemove:
     """Test atomic_remove function."""
 
@@ -173,9 +230,10 @@ class TestAtomicRemove:
         test_file = tmp_path / "test.txt"
         test_file.write_text("test content")
 
-        with patch(
-            "os.remove", side_effect=PermissionError("Permission denied")
-        ), patch("logging.error") as mock_log:
+        with (
+            patch("os.remove", side_effect=PermissionError("Permission denied")),
+            patch("logging.error") as mock_log,
+        ):
             with pytest.raises(PermissionError):
                 atomic_remove(str(test_file))
 
@@ -233,9 +291,10 @@ class TestHandleTempFileAdvanced:
         target_path = tmp_path / "test.json"
         content = {"test": "data"}
 
-        with patch("shutil.move", side_effect=OSError("Move failed")), patch(
-            "logging.error"
-        ) as mock_log:
+        with (
+            patch("shutil.move", side_effect=OSError("Move failed")),
+            patch("logging.error") as mock_log,
+        ):
             with pytest.raises(OSError):
                 handle_temp_file(content, str(target_path))
 
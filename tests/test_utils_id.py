@@ -0,0 +1,63 @@
+"""Tests for server identifier and fingerprint utilities."""
+
+from sboxmgr.subscription.models import ParsedServer
+from sboxmgr.utils.id import ENDPOINT_FIELDS, fingerprint_server, generate_server_id
+
+
+def _server(**kwargs):
+    data = {"type": "vless", "address": "a.example.com", "port": 443, "tag": "A"}
+    data.update(kwargs)
+    return ParsedServer(**data)
+
+
+class TestFingerprintServer:
+    """Test canonical server fingerprints."""
+
+    def test_fingerprint_depends_on_identity_fields(self):
+        """Test equal identities match and other fields are ignored."""
+        server = _server()
+
+        assert fingerprint_server(server) == fingerprint_server(_server())
+        assert fingerprint_server(server) == fingerprint_server(
+            _server(password="secret")  # pragma: allowlist secret
+        )
+        assert fingerprint_server(server) != fingerprint_server(_server(tag="B"))
+        assert fingerprint_server(server, ENDPOINT_FIELDS) == fingerprint_server(
+            _server(type="trojan", tag="B"), ENDPOINT_FIELDS
+        )
+
+    def test_fingerprint_supports_dicts_and_meta_paths(self):
+        """Test dictionary servers and ``meta.key`` fields."""
+        server = _server(meta={"tag": "from-meta"})
+        data = {"type": "vless", "address": "a.example.com", "port": 443, "tag": "A"}
+
+        assert fingerprint_server(data) == fingerprint_server(server)
+        assert fingerprint_server(server, ("meta.tag",)) != fingerprint_server(
+            _server(), ("meta.tag",)
+        )
+
+    def test_fingerprint_tracks_changes(self):
+        """Test fingerprints follow changes of identity fields."""
+        server = _server()
+        original = fingerprint_server(server)
+
+        server.port = 8443
+        changed = fingerprint_server(server)
+
+        assert changed != original
+        assert changed == fingerprint_server(_server(port=8443))
+
+    def test_full_content_fingerprint(self):
+        """Test full-content fingerprints see every attribute."""
+        assert fingerprint_server(_server(), fields=None) != fingerprint_server(
+            _server(meta={"country": "DE"}), fields=None
+        )
+        assert fingerprint_server({"b": 1, "a": 2}, fields=None) == (
+            fingerprint_server({"a": 2, "b": 1}, fields=None)
+        )
+
+
+def test_generate_server_id_unchanged():
+    """Test persisted server IDs keep their SHA-256 format."""
+    server_id = generate_server_id({"tag": "A", "type": "vless", "server_port": 443})
+    assert len(server_id) == 64
@@ -1,9 +1,16 @@
 """Tests for ServerListScreen."""
 
+import asyncio
+import threading
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, patch
+from textual.app import App
 
+from sboxmgr.tui.components.server_list_view import ServerListView
 from sboxmgr.tui.screens.server_list import ServerListScreen
+from sboxmgr.tui.state.tui_state import SubscriptionRefresh
 
 
 class TestServerListScreen:
@@ -92,79 +99,45 @@ class TestServerListScreen:
         assert stats is None or isinstance(stats, str)
 
     @patch.object(ServerListScreen, 'app')
-    def test_checkbox_change_handling(self, mock_app, screen):
-        """Test checkbox change handling."""
-        # Setup a server
+    def test_toggle_handling(self, mock_app, screen):
+        """Test a row toggle persists exclusions."""
         screen._servers = [{"protocol": "vmess", "address": "test.com", "port": 443}]
+        screen._excluded_servers = {"test.com:443"}
+        screen._update_info_panel = Mock()
 
-        # Mock checkbox event
-        mock_checkbox = Mock()
-        mock_checkbox.id = "server_0"
-        mock_checkbox.value = False  # Unchecked means excluded
-
-        mock_event = Mock()
-        mock_event.checkbox = mock_checkbox
+        screen.on_server_toggled(ServerListView.Toggled(0, True))
 
-        screen.on_checkbox_changed(mock_event)
-
-        # Should call toggle_server_exclusion
-        mock_app.state.toggle_server_exclusion.assert_called_once()
+        mock_app.state.set_exclusions.assert_called_once_with(["test.com:443"])
+        screen._update_info_panel.assert_called_once()
 
     @patch.object(ServerListScreen, 'app')
     def test_select_all_functionality(self, mock_app, screen):
         """Test select all button functionality."""
-        # Setup servers
         screen._servers = [
             {"protocol": "vmess", "address": "test1.com", "port": 443},
             {"protocol": "vless", "address": "test2.com", "port": 80}
         ]
-
-        # Mock the screen's query_one method
-        mock_checkboxes = [Mock(), Mock()]
-        for i, cb in enumerate(mock_checkboxes):
-            cb.id = f"server_{i}"
-            cb.value = False
-
-        def mock_query_one(selector, widget_type=None):
-            # Extract index from selector like "#server_0"
-            index = int(selector.split('_')[1])
-            return mock_checkboxes[index]
-
-        screen.query_one = Mock(side_effect=mock_query_one)
+        screen._excluded_servers = {"test1.com:443", "test2.com:80"}
 
         screen.on_select_all_pressed()
 
-        # Should set all checkboxes to True
-        for cb in mock_checkboxes:
-            assert cb.value is True
+        # Should include all servers
+        assert screen._excluded_servers == set()
+        mock_app.notify.assert_called_once()
 
     @patch.object(ServerListScreen, 'app')
     def test_select_none_functionality(self, mock_app, screen):
         """Test select none button functionality."""
-        # Setup servers
         screen._servers = [
             {"protocol": "vmess", "address": "test1.com", "port": 443},
             {"protocol": "vless", "address": "test2.com", "port": 80}
         ]
 
-        # Mock the screen's query_one method
-        mock_checkboxes = [Mock(), Mock()]
-        for i, cb in enumerate(mock_checkboxes):
-            cb.id = f"server_{i}"
-            cb.value = True
-
-        def mock_query_one(selector, widget_type=None):
-            # Extract index from selector like "#server_0"
-            index = int(selector.split('_')[1])
-            return mock_checkboxes[index]
-
-        screen.query_one = Mock(side_effect=mock_query_one)
-
         screen.on_select_none_pressed()
 
-        # Should set all checkboxes to False
-        for cb in mock_checkboxes:
-            assert cb.value is False
+        # Should exclude all servers
+        assert screen._excluded_servers == {"test1.com:443", "test2.com:80"}
+        mock_app.notify.assert_called_once()
 
     @patch.object(ServerListScreen, 'app')
     def test_apply_changes_functionality(self, mock_app, screen):
@@ -204,3 +177,97 @@ class TestServerListScreen:
 
         # Should create static widget with no servers message
         assert info_panel is not None
+
+
+class _ServerListApp(App):
+    """Minimal app exposing the state read by ServerListScreen."""
+
+    def __init__(self, servers):
+        super().__init__()
+        self.saved = []
+        self.state = SimpleNamespace(
+            servers=servers, excluded_servers=[], set_exclusions=self.saved.append
+        )
+
+
+def test_server_list_pilot_toggle_filter_and_select():
+    """Test keyboard toggling, filtering and batch selection headlessly."""
+    servers = [
+        {"type": "vless", "address": f"{country}{i}.example.com", "port": 443}
+        for i, country in enumerate(["de", "nl", "de", "us"] * 50)
+    ]
+    app = _ServerListApp(servers)
+
+    async def run():
+        async with app.run_test(size=(100, 30)) as pilot:
+            screen = ServerListScreen()
+            await app.push_screen(screen)
+            await pilot.pause()
+            view = screen.query_one(ServerListView)
+            assert view.has_focus
+            assert len(view.model) == 200
+
+            await pilot.press("down", "space")
+            assert screen._excluded_servers == {"nl1.example.com:443"}
+            assert app.saved[-1] == ["nl1.example.com:443"]
+
+            await pilot.press("end")
+            assert view.cursor == 199
+            assert view.scroll_offset.y > 0
+
+            screen.query_one("#server_filter").value = "de"
+            await pilot.pause()
+            assert len(view.model) == 100
+            screen.query_one("#select_none").press()
+            await pilot.pause()
+            assert len(screen._excluded_servers) == 101
+            assert "us3.example.com:443" not in screen._excluded_servers
+
+            screen.query_one("#server_filter").value = ""
+            await pilot.pause()
+            screen.query_one("#select_all").press()
+            await pilot.pause()
+            assert screen._excluded_servers == set()
+
+    asyncio.run(run())
+
+
+def test_server_list_streams_background_refresh():
+    """Test servers of each refreshed subscription appear as they arrive."""
+    servers = [
+        {"type": "vless", "address": f"s{i}.example.com", "port": 443}
+        for i in range(4)
+    ]
+    sources = [SimpleNamespace(url=f"https://sub{i}.example.com") for i in range(2)]
+    release = threading.Event()
+
+    def iter_refresh():
+        yield SubscriptionRefresh(sources[0], servers[:2], None, 1, 2)
+        release.wait(5)
+        yield SubscriptionRefresh(sources[1], servers[2:], "timeout", 2, 2)
+
+    app = _ServerListApp([])
+    app.state.subscriptions = sources
+    app.state.iter_refresh = iter_refresh
+
+    async def run():
+        async with app.run_test(size=(100, 30)) as pilot:
+            screen = ServerListScreen()
+            await app.push_screen(screen)
+            view = screen.query_one(ServerListView)
+            for _ in range(50):
+                await pilot.pause(0.01)
+                if len(view.model) == 2:
+                    break
+            assert len(view.model) == 2
+            assert screen._refresh_progress == (1, 2)
+            assert "Refreshing: 1/2" in screen._create_info_panel()
+
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert len(view.model) == 4
+            assert app.state.servers == servers
+            assert screen._refresh_progress is None
+
+    asyncio.run(run())
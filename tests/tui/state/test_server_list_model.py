@@ -0,0 +1,102 @@
+"""Tests for ServerListModel."""
+
+from sboxmgr.tui.state.server_list_model import ServerListModel
+
+
+def _model(servers, excluded=None):
+    calls = []
+
+    def describe(server):
+        calls.append(server)
+        return server["name"]
+
+    model = ServerListModel(
+        servers,
+        excluded if excluded is not None else set(),
+        key=lambda server: f"{server['address']}:{server['port']}",
+        describe=describe,
+    )
+    return model, calls
+
+
+SERVERS = [
+    {"name": "Germany 1", "address": "a.example.com", "port": 443},
+    {"name": "Netherlands", "address": "b.example.com", "port": 443},
+    {"name": "Germany 2", "address": "c.example.com", "port": 8443},
+    {"name": "Germany 1 backup", "address": "a.example.com", "port": 443},
+]
+
+
+def test_labels_are_formatted_lazily():
+    """Test only requested rows are formatted, once."""
+    model, calls = _model(SERVERS)
+
+    assert len(model) == 4
+    assert calls == []
+    assert model.label(model.server_index(2)) == "Germany 2"
+    model.label(2)
+    assert calls == [SERVERS[2]]
+
+
+def test_toggle_is_keyed_by_server_id():
+    """Test servers sharing an ID share exclusion state."""
+    excluded = set()
+    model, _ = _model(SERVERS, excluded)
+
+    assert model.toggle(0) is True
+    assert excluded == {"a.example.com:443"}
+    assert model.is_excluded(3)
+    assert model.indices_for("a.example.com:443") == [0, 3]
+    assert model.toggle(3) is False
+    assert not model.is_excluded(0)
+
+
+def test_filter_narrows_incrementally():
+    """Test filtering by words, refinement and clearing."""
+    model, _ = _model(SERVERS)
+
+    assert model.set_filter("germ")
+    assert [model.server_index(row) for row in range(len(model))] == [0, 2, 3]
+    assert model.set_filter("germany 1")
+    assert [model.server_index(row) for row in range(len(model))] == [0, 3]
+    assert model.row_of(3) == 1
+    assert model.row_of(1) is None
+    assert not model.set_filter(" Germany 1 ")
+    assert model.set_filter("8443")
+    assert len(model) == 1
+    assert model.set_filter("")
+    assert not model.filtered
+    assert len(model) == 4
+
+
+def test_set_visible_excluded_respects_filter():
+    """Test batch selection applies to rows matching the filter."""
+    excluded = {"unlisted:1"}
+    model, _ = _model(SERVERS, excluded)
+
+    model.set_filter("netherlands")
+    model.set_visible_excluded(True)
+    assert excluded == {"unlisted:1", "b.example.com:443"}
+
+    model.set_filter("")
+    model.set_visible_excluded(True)
+    assert len(excluded) == 4
+    model.set_visible_excluded(False)
+    assert excluded == set()
+
+
+def test_sync_indexes_appended_servers():
+    """Test servers appended to the shared list show up after sync."""
+    servers = list(SERVERS[:2])
+    model, _ = _model(servers)
+    model.set_filter("germany")
+    assert len(model) == 1
+
+    servers.extend(SERVERS[2:])
+    assert model.sync() == 2
+    assert [model.server_index(row) for row in range(len(model))] == [0, 2, 3]
+    assert model.indices_for(model.ids[3]) == [0, 3]
+    assert model.sync() == 0
+
+    model.set_filter("")
+    assert len(model) == 4
@@ -200,3 +200,64 @@ class TestTUIState:
 
         state.set_advanced_mode(False)
         assert state.show_advanced is False
+
+
+class TestTUIStateRefresh:
+    """Test cases for background subscription refresh."""
+
+    @staticmethod
+    def _state(results):
+        """Create a state whose orchestrator returns results keyed by URL."""
+        state = TUIState()
+        state.subscriptions = [SubscriptionSource(url=url, source_type="url") for url in results]
+
+        def get_servers(url, source_type):
+            value = results[url]
+            if isinstance(value, Exception):
+                raise value
+            return Mock(success=True, config=value, errors=[])
+
+        state.orchestrator = Mock()
+        state.orchestrator.get_subscription_servers.side_effect = get_servers
+        return state
+
+    def test_iter_refresh_reports_progress_and_errors(self):
+        """Test one event per subscription with progress counters."""
+        server = ParsedServer(type="vless", address="a.example.com", port=443)
+        state = self._state(
+            {"https://a.example.com": [server], "https://b.example.com": RuntimeError("boom")}
+        )
+
+        events = list(state.iter_refresh())
+
+        assert [event.completed for event in events] == [1, 2]
+        assert all(event.total == 2 for event in events)
+        by_url = {event.source.url: event for event in events}
+        assert by_url["https://a.example.com"].servers == [server]
+        assert by_url["https://a.example.com"].error is None
+        assert by_url["https://b.example.com"].servers == []
+        assert by_url["https://b.example.com"].error == "boom"
+        # The state itself is left untouched
+        assert state.servers == []
+
+    def test_refresh_servers_keeps_subscription_order(self):
+        """Test refreshed servers follow subscription order and list identity."""
+        first = ParsedServer(type="vless", address="a.example.com", port=443)
+        second = ParsedServer(type="trojan", address="b.example.com", port=443)
+        state = self._state({"https://a.example.com": [first], "https://b.example.com": [second]})
+        servers = state.servers
+
+        state.refresh_servers()
+
+        assert state.servers is servers
+        assert state.servers == [first, second]
+
+    def test_fetch_subscription_does_not_modify_state(self):
+        """Test fetching a subscription leaves subscriptions and servers alone."""
+        server = ParsedServer(type="vless", address="a.example.com", port=443)
+        state = self._state({"https://a.example.com": [server]})
+        state.subscriptions = []
+
+        assert state.fetch_subscription("https://a.example.com") == [server]
+        assert state.subscriptions == []
+        assert state.servers == []
@@ -1,3 +1,5 @@
+import pytest
+
 from sboxmgr.subscription.models import ParsedServer, PipelineContext
 from sboxmgr.subscription.postprocessor_base import (
     DedupPostProcessor,
@@ -36,6 +38,56 @@ def test_postprocessor_chain_dedup():
     assert len(processed_no_ctx) == 2
 
 
+def test_dedup_custom_identity_fields():
+    servers = [_server("a"), _server("b"), _server("a")]
+
+    # Default identity includes meta tag, endpoint-only identity does not
+    assert len(DedupPostProcessor().process(list(servers))) == 2
+    deduped = DedupPostProcessor(identity_fields=("address", "port")).process(
+        list(servers)
+    )
+    assert [s.meta["tag"] for s in deduped] == ["a"]
+
+
+def test_dedup_near_duplicates_keep_best_variant():
+    def variant(tag, **meta):
+        return ParsedServer(
+            type="vless",
+            address="example.com",
+            port=443,
+            uuid="uuid-1",
+            tag=tag,
+            meta={"tag": tag, **meta},
+        )
+
+    other = ParsedServer(type="trojan", address="other.com", port=443)
+    servers = [
+        variant("provider-a", source="a", latency_ms=180),
+        other,
+        variant("provider-b", source="b", latency_ms=90),
+        variant("provider-c", source="c"),
+    ]
+
+    # Lowest latency wins, kept at the position of the first variant
+    deduped = DedupPostProcessor("credentials").process(list(servers))
+    assert [s.tag for s in deduped] == ["provider-b", None]
+
+    # Source priority outranks latency
+    deduped = DedupPostProcessor("credentials", source_priority=["c", "a"]).process(
+        list(servers)
+    )
+    assert [s.tag for s in deduped] == ["provider-c", None]
+
+    # Different credentials are not merged
+    servers.append(variant("provider-d").model_copy(update={"uuid": "uuid-2"}))
+    assert len(DedupPostProcessor("credentials").process(list(servers))) == 3
+
+
+def test_dedup_unknown_identity_preset():
+    with pytest.raises(ValueError):
+        DedupPostProcessor("unknown")
+
+
 def test_postprocessor_chain_custom_three_param():
     """Test that custom postprocessors with 3 params but no context work correctly."""
     servers = [_server("a"), _server("b")]
@@ -11,7 +11,9 @@ from sboxmgr.subscription.exporters.singbox_exporter_v2 import (
     SingboxExporterV2,
     convert_client_profile_to_inbounds,
     convert_parsed_server_to_outbound,
+    convert_parsed_servers_to_outbounds,
 )
+from sboxmgr.subscription.exporters.singbox_exporter import OutboundGrouping
 from sboxmgr.subscription.models import ClientProfile, InboundProfile, ParsedServer
 
 
@@ -397,3 +399,61 @@ class TestSingboxExporterV2:
 
         # Should only have default outbounds
         assert len(config["outbounds"]) == 2  # direct + block
+
+    def test_batch_conversion_matches_per_server(self):
+        """Test batch conversion keeps input order and results."""
+        servers = [
+            ParsedServer(
+                type="ss",
+                address=f"10.0.0.{i}",
+                port=8388,
+                password="test_password",
+                security="aes-256-gcm",
+            )
+            if i % 2
+            else ParsedServer(
+                type="trojan", address=f"10.0.0.{i}", port=443, password="secret"
+            )
+            for i in range(6)
+        ]
+        servers.insert(3, ParsedServer(type="unsupported", address="x", port=1))
+
+        batch = convert_parsed_servers_to_outbounds(servers)
+        single = [convert_parsed_server_to_outbound(s) for s in servers]
+
+        assert [o.smart_dump() for o in batch] == [
+            o.smart_dump() for o in single if o is not None
+        ]
+        assert [o.server for o in batch] == [f"10.0.0.{i}" for i in range(6)]
+
+    def test_export_with_provider_sharding(self):
+        """Test provider sharding and outbound limits in the v2 exporter."""
+        servers = [
+            ParsedServer(
+                type="ss",
+                address=f"10.0.2.{i}",
+                port=8388,
+                password="test_password",
+                security="aes-256-gcm",
+                tag=f"node-{i}",
+                meta={"source": source, "latency_ms": 10 * (i + 1)},
+            )
+            for i, source in enumerate(["alpha", "beta", "alpha", "beta"])
+        ]
+        exporter = SingboxExporterV2(
+            grouping=OutboundGrouping(shard_by="provider", max_outbounds=3)
+        )
+        config = json.loads(exporter.export(servers))
+        groups = {
+            o["tag"]: o["outbounds"]
+            for o in config["outbounds"]
+            if o["type"] == "urltest"
+        }
+
+        assert groups == {
+            "auto": ["auto-alpha", "auto-beta"],
+            "auto-alpha": ["node-0", "node-2"],
+            "auto-beta": ["node-1"],
+        }
+        assert "node-3" not in {o["tag"] for o in config["outbounds"]}
+        assert config["route"]["final"] == "auto"